@@ -9,49 +9,57 @@ Package structure:
 
 __version__ = "3.1.1"
 
-# Re-export commonly used items for convenience
-from ontos.core.context import SessionContext, FileOperation, PendingWrite
-from ontos.core.frontmatter import parse_frontmatter, normalize_depends_on, normalize_type
-from ontos.core.staleness import (
-    ModifiedSource,
-    normalize_describes,
-    parse_describes_verified,
-    validate_describes_field,
-    detect_describes_cycles,
-    check_staleness,
-    get_file_modification_date,
-    clear_git_cache,
-    DescribesValidationError,
-    DescribesWarning,
-    StalenessInfo,
-)
-from ontos.core.history import (
-    ParsedLog,
-    parse_log_for_history,
-    sort_logs_deterministically,
-    generate_decision_history,
-    get_log_date,
-)
-from ontos.core.paths import (
-    resolve_config,
-    get_logs_dir,
-    get_log_count,
-    get_logs_older_than,
-    get_archive_dir,
-    get_decision_history_path,
-    get_proposals_dir,
-    get_archive_logs_dir,
-    get_archive_proposals_dir,
-    get_concepts_path,
-    find_last_session_date,
-)
-from ontos.core.config import (
-    BLOCKED_BRANCH_NAMES,
-    get_source,
-    get_git_last_modified,
-)
-from ontos.core.proposals import (
-    load_decision_history_entries,
-    find_draft_proposals,
-)
-from ontos.ui.output import OutputHandler
+# Re-export commonly used items for convenience. They are resolved on first
+# access (see ontos._lazy) so that `import ontos` stays cheap.
+from ontos._lazy import exported_names as _exported_names, lazy_exports as _lazy_exports
+
+_EXPORTS = {
+    "ontos.core.context": ("SessionContext", "FileOperation", "PendingWrite"),
+    "ontos.core.frontmatter": ("parse_frontmatter", "normalize_depends_on", "normalize_type"),
+    "ontos.core.staleness": (
+        "ModifiedSource",
+        "normalize_describes",
+        "parse_describes_verified",
+        "validate_describes_field",
+        "detect_describes_cycles",
+        "check_staleness",
+        "get_file_modification_date",
+        "clear_git_cache",
+        "DescribesValidationError",
+        "DescribesWarning",
+        "StalenessInfo",
+    ),
+    "ontos.core.history": (
+        "ParsedLog",
+        "parse_log_for_history",
+        "sort_logs_deterministically",
+        "generate_decision_history",
+        "get_log_date",
+    ),
+    "ontos.core.paths": (
+        "resolve_config",
+        "get_logs_dir",
+        "get_log_count",
+        "get_logs_older_than",
+        "get_archive_dir",
+        "get_decision_history_path",
+        "get_proposals_dir",
+        "get_archive_logs_dir",
+        "get_archive_proposals_dir",
+        "get_concepts_path",
+        "find_last_session_date",
+    ),
+    "ontos.core.config": (
+        "BLOCKED_BRANCH_NAMES",
+        "get_source",
+        "get_git_last_modified",
+    ),
+    "ontos.core.proposals": (
+        "load_decision_history_entries",
+        "find_draft_proposals",
+    ),
+    "ontos.ui.output": ("OutputHandler",),
+}
+
+__getattr__, __dir__ = _lazy_exports(__name__, _EXPORTS)
+__all__ = _exported_names(_EXPORTS)
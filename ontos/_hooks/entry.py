@@ -0,0 +1,170 @@
+"""
+Fast entry point for git hooks.
+
+Hook shims run on every commit and push, so this module stays clear of the
+CLI: no argument parser, no config machinery, no TOML library. It reads
+only the [hooks] table of .ontos.toml and returns at once when the hook is
+disabled; otherwise it hands over to ontos.commands.hook, which loads the
+full configuration and does the actual work.
+
+Only modules that the interpreter loads at startup (os, sys) are imported
+up front.
+
+Usage:
+    python -m ontos._hooks.entry pre-push [git args...]
+"""
+
+import os
+import sys
+
+# Same as ontos.io.config.CONFIG_FILENAME (not imported, to stay cheap)
+CONFIG_FILENAME = ".ontos.toml"
+
+# Hook type -> key in the [hooks] table
+HOOK_KEYS = {"pre-commit": "pre_commit", "pre-push": "pre_push"}
+
+# Hooks that have no checks yet (see ontos.commands.hook.run_pre_commit_hook)
+NO_WORK_HOOKS = frozenset({"pre-commit"})
+
+_HOOKS_FIELDS = frozenset({"pre_commit", "pre_push", "strict"})
+_BOOLEANS = {"true": True, "false": False}
+
+
+def find_config(start=None):
+    """Path of the nearest .ontos.toml at or above ``start`` (default: cwd), or None."""
+    path = os.path.abspath(start or os.getcwd())
+    while True:
+        candidate = os.path.join(path, CONFIG_FILENAME)
+        if os.path.exists(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _code(line: str):
+    """Split a TOML line into its code (comment removed) and bracket balance."""
+    depth = 0
+    quote = None
+    i = 0
+    while i < len(line):
+        ch = line[i]
+        if quote:
+            if ch == "\\" and quote == '"':
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "#":
+            return line[:i].strip(), depth
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        i += 1
+    return line.strip(), depth
+
+
+def read_hooks_table(text: str):
+    """Parse the [hooks] table of a .ontos.toml.
+
+    Only the form that ontos writes is understood: ``key = true|false``
+    lines (with optional comments) under a ``[hooks]`` header. Anything
+    else that could affect the table (dotted keys, inline tables, quoted
+    names, multi-line strings, unknown or repeated keys) makes this return
+    None, and the caller falls back to the full config loader.
+
+    Args:
+        text: Contents of .ontos.toml
+
+    Returns:
+        Dict of the [hooks] keys present (possibly empty), or None
+    """
+    if "'''" in text or '"""' in text:
+        return None
+
+    hooks = {}
+    seen = False
+    table = ""
+    open_brackets = 0  # > 0 while inside a multi-line array
+    for raw in text.splitlines():
+        line, depth = _code(raw)
+        if open_brackets:
+            open_brackets += depth
+            continue
+        if not line:
+            continue
+
+        if line.startswith("["):
+            name = line.strip("[] ")
+            if "hooks" in name and (name != "hooks" or line.startswith("[[") or seen):
+                return None
+            seen = seen or name == "hooks"
+            table = name
+            continue
+
+        key, sep, value = line.partition("=")
+        if not sep:
+            return None  # Not TOML we understand
+        key, value = key.strip(), value.strip()
+        open_brackets = depth
+        if table == "":
+            # Root table: `hooks.pre_push = false` or `hooks = {...}`
+            if key.split(".")[0].strip("\"' ") == "hooks":
+                return None
+        elif table == "hooks":
+            if key not in _HOOKS_FIELDS or key in hooks or value not in _BOOLEANS:
+                return None
+            hooks[key] = _BOOLEANS[value]
+    return hooks
+
+
+def hook_enabled(hook_type: str, start=None):
+    """Whether a hook is enabled in the project's .ontos.toml.
+
+    Returns:
+        True or False, or None if only the full config loader can tell
+    """
+    key = HOOK_KEYS.get(hook_type)
+    if key is None:
+        return None
+    config_path = find_config(start)
+    if config_path is None:
+        return True  # No config: HooksConfig defaults
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            hooks = read_hooks_table(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+    if hooks is None:
+        return None
+    return hooks.get(key, True)
+
+
+def run(hook_type: str, args) -> int:
+    """Run a hook, loading ontos.commands.hook only if there is work to do.
+
+    Returns:
+        Exit code for git (0 allows the operation)
+    """
+    if hook_type in NO_WORK_HOOKS or hook_enabled(hook_type) is False:
+        return 0
+
+    from ontos.commands.hook import HookOptions, hook_command
+
+    return hook_command(HookOptions(hook_type=hook_type, args=list(args)))
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m ontos._hooks.entry <pre-commit|pre-push> [args...]",
+              file=sys.stderr)
+        return 0  # Fail open, like the hooks themselves
+    return run(argv[0], argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
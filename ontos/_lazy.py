@@ -0,0 +1,56 @@
+"""
+Lazy re-exports for package ``__init__`` modules.
+
+The ontos packages re-export names from their submodules for convenience.
+Importing those eagerly means that ``import ontos.core.types`` (and hence
+``ontos --version`` or a git hook) loads every submodule of every package.
+Instead each package declares its exports and resolves them on first
+attribute access through a module ``__getattr__`` (PEP 562).
+
+Only modules that the interpreter loads at startup are imported here, so
+``import ontos`` itself costs next to nothing (see ontos._hooks.entry).
+"""
+
+import importlib
+import sys
+
+
+def lazy_exports(package: str, exports: dict) -> tuple:
+    """Build ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Submodule name -> exported names. An entry may rename the
+            attribute with import syntax, e.g. ``"validate as validate_v2"``.
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    targets = {}
+    for module, names in exports.items():
+        for entry in names:
+            attr, _, alias = entry.partition(" as ")
+            targets[alias or attr] = (module, attr)
+
+    def __getattr__(name: str) -> object:
+        target = targets.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(target[0]), target[1])
+        # Cache on the package so __getattr__ is not consulted again
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[package])) | set(targets))
+
+    return __getattr__, __dir__
+
+
+def exported_names(exports: dict) -> list:
+    """Public names declared in an exports table (for ``__all__``)."""
+    return [
+        entry.partition(" as ")[2] or entry
+        for names in exports.values()
+        for entry in names
+    ]
@@ -0,0 +1 @@
+"""Bundled BPE vocabulary for ontos.core.tokens (see tests/perf/build_bpe_vocabulary.py)."""
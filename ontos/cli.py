@@ -6,44 +6,11 @@ Full argparse implementation per Spec v1.1 Section 4.1.
 """
 
 import argparse
-import os
-import subprocess
 import sys
 from pathlib import Path
 from typing import List, Optional
 
 import ontos
-from ontos.ui.json_output import emit_json, emit_error, validate_json_output
-from ontos.commands.map import CompactMode
-
-
-def _get_subprocess_env() -> dict:
-    """Get environment for subprocess calls.
-
-    Sets:
-    - ONTOS_PROJECT_ROOT: User's current working directory (for legacy script compatibility)
-    - PYTHONPATH: Includes both user's project root (for config imports) and
-                  package installation root (for ontos.core imports)
-    """
-    env = os.environ.copy()
-    # Use user's CWD as project root, not package installation directory
-    try:
-        project_root = str(Path.cwd())
-    except OSError:
-        # CWD deleted or inaccessible; subprocess will fail gracefully
-        project_root = "/"
-    env.setdefault('ONTOS_PROJECT_ROOT', project_root)
-    
-    # Package installation root (needed for legacy scripts to import ontos.core)
-    package_root = str(Path(__file__).parent.parent)
-    
-    # Build PYTHONPATH: project_root + package_root + existing
-    existing_pythonpath = env.get('PYTHONPATH', '')
-    path_parts = [project_root, package_root]
-    if existing_pythonpath:
-        path_parts.append(existing_pythonpath)
-    env['PYTHONPATH'] = os.pathsep.join(path_parts)
-    return env
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -93,6 +60,8 @@ def create_parser() -> argparse.ArgumentParser:
     _register_promote(subparsers, global_parser)
     _register_scaffold(subparsers, global_parser)
     _register_stub(subparsers, global_parser)
+    _register_serve(subparsers, global_parser)
+    _register_mcp(subparsers, global_parser)
 
     return parser
 
@@ -119,6 +88,25 @@ def _register_init(subparsers, parent):
     p.set_defaults(func=_cmd_init)
 
 
+def _add_format_argument(p):
+    """Add --format for commands that can stream NDJSON records."""
+    p.add_argument("--format", choices=["text", "ndjson"], default="text",
+                   help="Output format: 'text' (default) or 'ndjson' "
+                        "(one JSON record per line, printed as produced; "
+                        "not combinable with --json)")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _register_map(subparsers, parent):
     """Register map command."""
     p = subparsers.add_parser("map", help="Generate context map", parents=[parent])
@@ -128,13 +116,26 @@ def _register_map(subparsers, parent):
                    help="Output path (default: Ontos_Context_Map.md)")
     p.add_argument("--obsidian", action="store_true",
                    help="Enable Obsidian-compatible output (wikilinks, tags)")
-    p.add_argument("--compact", nargs="?", const="basic", default="off",
-                   choices=["basic", "rich"],
-                   help="Compact output: 'basic' (default) or 'rich' (with summaries)")
+    size_group = p.add_mutually_exclusive_group()
+    size_group.add_argument("--compact", nargs="?", const="basic", default="off",
+                            choices=["basic", "rich"],
+                            help="Compact output: 'basic' (default) or 'rich' (with summaries)")
+    size_group.add_argument("--budget", type=int, metavar="N",
+                            help="Keep the map under about N tokens: list the most important "
+                                 "documents first, then add their contents while room remains")
     p.add_argument("--filter", "-f", metavar="EXPR",
                    help="Filter documents by expression (e.g., 'type:strategy')")
     p.add_argument("--no-cache", action="store_true",
-                   help="Bypass document cache (for debugging)")
+                   help="Bypass the persistent document cache in .ontos/cache/")
+    p.add_argument("--jobs", "-j", type=_positive_int, metavar="N",
+                   help="Parser processes (default: based on CPU count; 1 disables parallel parsing)")
+    p.add_argument("--watch", "-w", action="store_true",
+                   help="Keep running and regenerate the map when documents change")
+    p.add_argument("--watch-backend", choices=["auto", "inotify", "poll"], default="auto",
+                   help="File watching backend for --watch (default: inotify if available, else polling)")
+    p.add_argument("--debounce", type=float, default=0.2, metavar="SECONDS",
+                   help="Quiet period that ends a burst of changes in --watch mode (default: 0.2)")
+    _add_format_argument(p)
     p.set_defaults(func=_cmd_map)
 
 
@@ -219,6 +220,7 @@ def _register_verify(subparsers, parent):
         "--date", "-d",
         help="Verification date (YYYY-MM-DD, default: today)"
     )
+    _add_format_argument(p)
     p.set_defaults(func=_cmd_verify)
 
 
@@ -236,6 +238,8 @@ def _register_query(subparsers, parent):
                        help="What documents depend on this one?")
     group.add_argument("--concept", metavar="TAG",
                        help="Find all documents with this concept")
+    group.add_argument("--text", metavar="QUERY",
+                       help='Full-text search: words, "phrases" and prefix*')
     group.add_argument("--stale", metavar="DAYS", type=int,
                        help="Find documents not updated in N days")
     group.add_argument("--health", action="store_true",
@@ -243,8 +247,15 @@ def _register_query(subparsers, parent):
     group.add_argument("--list-ids", action="store_true",
                        help="List all document IDs")
     
+    p.add_argument("--transitive", action="store_true",
+                   help="With --depends-on/--depended-by: include indirect relations")
+    p.add_argument("--max-depth", type=int, metavar="N",
+                   help="Follow at most N levels (implies --transitive)")
+    p.add_argument("--limit", type=int, metavar="N",
+                   help="With --text: show at most N results (default 20)")
     p.add_argument("--dir", type=Path,
                    help="Documentation directory to scan")
+    _add_format_argument(p)
     p.set_defaults(func=_cmd_query)
 
 
@@ -360,6 +371,33 @@ def _register_stub(subparsers, parent):
     p.set_defaults(func=_cmd_stub)
 
 
+def _register_serve(subparsers, parent):
+    """Register serve command."""
+    p = subparsers.add_parser(
+        "serve",
+        help="Run a daemon that answers map/query from an in-memory index",
+        parents=[parent]
+    )
+    group = p.add_mutually_exclusive_group()
+    group.add_argument("--status", action="store_true",
+                       help="Show whether a daemon is running for this project")
+    group.add_argument("--stop", action="store_true",
+                       help="Stop the running daemon")
+    p.add_argument("--watch-backend", choices=["auto", "inotify", "poll"], default="auto",
+                   help="How the daemon notices file changes (poll: re-stat on each request)")
+    p.set_defaults(func=_cmd_serve)
+
+
+def _register_mcp(subparsers, parent):
+    """Register mcp command."""
+    p = subparsers.add_parser(
+        "mcp",
+        help="Run the MCP server on stdio (requires: pip install 'ontos[mcp]')",
+        parents=[parent]
+    )
+    p.set_defaults(func=_cmd_mcp)
+
+
 # ============================================================================
 # Command handlers
 # ============================================================================
@@ -367,6 +405,7 @@ def _register_stub(subparsers, parent):
 def _cmd_init(args) -> int:
     """Handle init command."""
     from ontos.commands.init import init_command, InitOptions
+    from ontos.ui.json_output import emit_json
 
     options = InitOptions(
         path=Path.cwd(),
@@ -392,17 +431,23 @@ def _cmd_init(args) -> int:
 
 def _cmd_map(args) -> int:
     """Handle map command."""
-    from ontos.commands.map import map_command, MapOptions
+    from ontos.commands.map import CompactMode, map_command, MapOptions
 
     options = MapOptions(
         output=args.output,
         strict=args.strict,
         json_output=args.json,
+        ndjson=getattr(args, 'format', "text") == "ndjson",
         quiet=args.quiet,
         obsidian=args.obsidian,
         compact=CompactMode(args.compact) if args.compact != "off" else CompactMode.OFF,
         filter_expr=getattr(args, 'filter', None),
+        budget=getattr(args, 'budget', None),
         no_cache=getattr(args, 'no_cache', False),
+        jobs=getattr(args, 'jobs', None),
+        watch=getattr(args, 'watch', False),
+        watch_backend=getattr(args, 'watch_backend', "auto"),
+        debounce=getattr(args, 'debounce', 0.2),
     )
 
     return map_command(options)
@@ -429,7 +474,7 @@ def _cmd_log(args) -> int:
 def _cmd_doctor(args) -> int:
     """Handle doctor command."""
     from ontos.commands.doctor import doctor_command, DoctorOptions, format_doctor_output
-    from ontos.ui.json_output import to_json
+    from ontos.ui.json_output import emit_json, to_json
 
     options = DoctorOptions(
         verbose=args.verbose,
@@ -457,6 +502,7 @@ def _cmd_doctor(args) -> int:
 def _cmd_agents(args) -> int:
     """Handle agents command."""
     from ontos.commands.agents import agents_command, AgentsOptions
+    from ontos.ui.json_output import emit_json
 
     options = AgentsOptions(
         output_path=args.output,
@@ -485,6 +531,7 @@ def _cmd_export(args) -> int:
     print("Warning: 'ontos export' is deprecated. Use 'ontos agents' instead.", file=sys.stderr)
     
     from ontos.commands.agents import agents_command, AgentsOptions
+    from ontos.ui.json_output import emit_json
 
     options = AgentsOptions(
         output_path=args.output,
@@ -577,6 +624,35 @@ def _cmd_promote(args) -> int:
     return exit_code
 
 
+def _cmd_serve(args) -> int:
+    """Handle serve command."""
+    from ontos.commands.serve import ServeOptions, serve_command
+
+    options = ServeOptions(
+        stop=args.stop,
+        status=args.status,
+        watch_backend=args.watch_backend,
+        quiet=args.quiet,
+        json_output=args.json,
+    )
+    return serve_command(options)
+
+
+def _cmd_mcp(args) -> int:
+    """Handle mcp command."""
+    from ontos.ui.json_output import emit_error
+
+    try:
+        from ontos.mcp import serve_stdio
+    except ImportError as e:
+        if args.json:
+            emit_error(str(e), "E_MISSING_DEPENDENCY")
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return serve_stdio()
+
+
 def _cmd_query(args) -> int:
     """Handle query command."""
     from ontos.commands.query import QueryOptions, query_command
@@ -585,12 +661,17 @@ def _cmd_query(args) -> int:
         depends_on=args.depends_on,
         depended_by=args.depended_by,
         concept=args.concept,
+        text=args.text,
         stale=args.stale,
         health=args.health,
         list_ids=args.list_ids,
+        transitive=args.transitive,
+        max_depth=args.max_depth,
+        limit=args.limit,
         directory=args.dir,
         quiet=args.quiet,
         json_output=args.json,
+        ndjson=args.format == "ndjson",
     )
     exit_code, message = query_command(options)
     return exit_code
@@ -606,6 +687,7 @@ def _cmd_verify(args) -> int:
         date=args.date,
         quiet=args.quiet,
         json_output=args.json,
+        ndjson=args.format == "ndjson",
     )
     exit_code, message = verify_command(options)
     return exit_code
@@ -638,97 +720,43 @@ def _cmd_hook(args) -> int:
     return hook_command(options)
 
 
-def _cmd_wrapper(args) -> int:
-    """
-    Handle wrapper commands that delegate to legacy scripts.
-
-    Per Decision: Option A with JSON validation fallback.
-    """
-    wrapper_name = args.wrapper_name
-
-    # Find the legacy script
-    scripts_dir = Path(__file__).parent / "_scripts"
-    script_map = {
-        "verify": "ontos_verify.py",
-        "query": "ontos_query.py",
-        "consolidate": "ontos_consolidate.py",
-        "promote": "ontos_promote.py",
-    }
-
-    script_name = script_map.get(wrapper_name)
-    if not script_name:
-        if args.json:
-            emit_error(f"Unknown wrapper command: {wrapper_name}", "E_UNKNOWN_CMD")
-        else:
-            print(f"Error: Unknown wrapper command: {wrapper_name}", file=sys.stderr)
-        return 5
-
-    script_path = scripts_dir / script_name
-    if not script_path.exists():
-        if args.json:
-            emit_error(f"Script not found: {script_name}", "E_NOT_FOUND")
-        else:
-            print(f"Error: Script not found: {script_path}", file=sys.stderr)
-        return 5
-
-    # Build command
-    cmd = [sys.executable, str(script_path)]
-
-    # Pass through JSON flag if requested
-    if args.json:
-        cmd.append("--json")
-
-    # Run the wrapper
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, env=_get_subprocess_env())
-
-        # JSON validation per Decision
-        if args.json:
-            if validate_json_output(result.stdout):
-                print(result.stdout, end="")
-            else:
-                emit_error(
-                    message=f"Command '{wrapper_name}' does not support JSON output",
-                    code="E_JSON_UNSUPPORTED",
-                    details=result.stdout[:500] if result.stdout else result.stderr[:500]
-                )
-        else:
-            if result.stdout:
-                print(result.stdout, end="")
-            if result.stderr:
-                print(result.stderr, file=sys.stderr, end="")
+# ============================================================================
+# Main entry point
+# ============================================================================
 
-        return result.returncode
+def main(argv: Optional[List[str]] = None, forward: bool = True) -> int:
+    """Main entry point for CLI.
 
-    except Exception as e:
-        if args.json:
-            emit_error(f"Wrapper execution failed: {e}", "E_EXEC_FAIL")
-        else:
-            print(f"Error: {e}", file=sys.stderr)
-        return 5
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+        forward: Hand read-only commands to a running `ontos serve` daemon
+    """
+    if argv is None:
+        argv = sys.argv[1:]
 
+    # Git hooks run on every commit and push: skip building the parser
+    if len(argv) >= 2 and argv[0] == "hook" and not any(a.startswith("-") for a in argv[1:]):
+        from ontos._hooks.entry import HOOK_KEYS, run
 
-# ============================================================================
-# Main entry point
-# ============================================================================
+        if argv[1] in HOOK_KEYS:
+            return run(argv[1], argv[2:])
 
-def main() -> int:
-    """Main entry point for CLI."""
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Workaround for argparse parent inheritance issue:
     # When --json is before the command, it's consumed by parent parser
-    # but not propagated to subparser namespace. Check sys.argv as fallback.
-    if '--json' in sys.argv and not args.json:
+    # but not propagated to subparser namespace. Check argv as fallback.
+    if '--json' in argv and not args.json:
         args.json = True
-    if '-q' in sys.argv or '--quiet' in sys.argv:
+    if '-q' in argv or '--quiet' in argv:
         if not getattr(args, 'quiet', False):
             args.quiet = True
 
     # Handle --version
     if args.version:
         if args.json:
+            from ontos.ui.json_output import emit_json
             emit_json({"version": ontos.__version__})
         else:
             print(f"ontos {ontos.__version__}")
@@ -737,25 +765,64 @@ def main() -> int:
     # No command specified
     if not args.command:
         if args.json:
+            from ontos.ui.json_output import emit_error
             emit_error("No command specified", "E_NO_CMD")
         else:
             parser.print_help()
         return 0
 
+    # NDJSON records are JSON already; there is no single document to wrap
+    if args.json and getattr(args, 'format', None) == "ndjson":
+        from ontos.ui.json_output import emit_error
+        emit_error("--json cannot be combined with --format ndjson", "E_FORMAT_CONFLICT")
+        return 2
+
+    # A running daemon answers from its in-memory index (but returns the
+    # output at once, so streamed NDJSON runs in-process)
+    streaming = getattr(args, 'watch', False) or getattr(args, 'format', None) == "ndjson"
+    if forward and not streaming:
+        from ontos.commands.serve import forward_to_daemon
+
+        response = forward_to_daemon(args.command, argv)
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            return response["exit_code"]
+
     # Route to command handler
     try:
         return args.func(args)
+    except BrokenPipeError:
+        if not streaming:
+            raise
+        # The reader stopped early (e.g. `ontos map --format ndjson | head`)
+        _silence_stdout()
+        return 141  # 128 + SIGPIPE, like a process killed by the signal
     except KeyboardInterrupt:
         if not args.quiet:
             print("\nInterrupted", file=sys.stderr)
         return 130
     except Exception as e:
         if args.json:
+            from ontos.ui.json_output import emit_error
             emit_error(f"Internal error: {e}", "E_INTERNAL")
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 5
 
 
+def _silence_stdout() -> None:
+    """Point stdout at /dev/null so the final flush cannot fail again."""
+    import os
+
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return  # Not a real file (e.g. captured output)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, fd)
+    os.close(devnull)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -22,98 +22,113 @@ Note: Wrapper modules delegate to bundled scripts for behavioral parity.
 Full native implementations will be completed in Phase 4.
 """
 
-# Primary orchestration modules (Phase 2 native)
-from ontos.commands.map import (
-    GenerateMapOptions,
-    generate_context_map,
-)
-
-from ontos.commands.log import (
-    EndSessionOptions,
-    create_session_log,
-    suggest_session_impacts,
-    validate_session_concepts,
-)
-
-# Phase 3: Init command
-from ontos.commands.init import (
-    InitOptions,
-    init_command,
-    ONTOS_HOOK_MARKER,
-)
-
-# Phase 4: New commands
-from ontos.commands.doctor import (
-    DoctorOptions,
-    DoctorResult,
-    CheckResult,
-    doctor_command,
-    format_doctor_output,
-)
-
-from ontos.commands.hook import (
-    HookOptions,
-    hook_command,
-)
-
-from ontos.commands.export import (
-    ExportOptions,
-    export_command,
-)
-
-# Wrapper modules (delegate to bundled scripts)
-# These provide the new module API while maintaining behavioral parity
-
-# verify - Document verification
-from ontos.commands.verify import (
-    verify_command,
-    VerifyOptions,
-    verify_document,
-    find_stale_documents_list,
-)
-
-# query - Document query
-from ontos.commands.query import (
-    query_command,
-    QueryOptions,
-    scan_docs_for_query,
-)
-
-# migrate - Schema migration
-from ontos.commands.migrate import (
-    migrate_command,
-    MigrateOptions,
-)
-
-# consolidate - Log consolidation
-from ontos.commands.consolidate import (
-    consolidate_command,
-    ConsolidateOptions,
-)
-
-# promote - Proposal promotion
-from ontos.commands.promote import (
-    promote_command,
-    PromoteOptions,
-)
-
-# scaffold - Document scaffolding
-from ontos.commands.scaffold import (
-    scaffold_command,
-    ScaffoldOptions,
-    find_untagged_files,
-)
-
-# stub - Document scaffolding
-from ontos.commands.stub import (
-    stub_command,
-    StubOptions,
-)
+from ontos._lazy import lazy_exports as _lazy_exports
+
+# Re-exports, resolved on first access (see ontos._lazy)
+_EXPORTS = {
+    # Primary orchestration modules (Phase 2 native)
+    "ontos.commands.map": (
+        "GenerateMapOptions",
+        "generate_context_map",
+        "iter_context_map",
+    ),
+
+    "ontos.commands.log": (
+        "EndSessionOptions",
+        "create_session_log",
+        "suggest_session_impacts",
+        "validate_session_concepts",
+    ),
+
+    # Phase 3: Init command
+    "ontos.commands.init": (
+        "InitOptions",
+        "init_command",
+        "ONTOS_HOOK_MARKER",
+    ),
+
+    # Phase 4: New commands
+    "ontos.commands.doctor": (
+        "DoctorOptions",
+        "DoctorResult",
+        "CheckResult",
+        "doctor_command",
+        "format_doctor_output",
+    ),
+
+    "ontos.commands.hook": (
+        "HookOptions",
+        "hook_command",
+    ),
+
+    "ontos.commands.export": (
+        "ExportOptions",
+        "export_command",
+    ),
+
+    # Wrapper modules (delegate to bundled scripts)
+    # These provide the new module API while maintaining behavioral parity
+
+    # verify - Document verification
+    "ontos.commands.verify": (
+        "verify_command",
+        "VerifyOptions",
+        "verify_document",
+        "find_stale_documents_list",
+    ),
+
+    # query - Document query
+    "ontos.commands.query": (
+        "query_command",
+        "QueryOptions",
+        "scan_docs_for_query",
+    ),
+
+    # migrate - Schema migration
+    "ontos.commands.migrate": (
+        "migrate_command",
+        "MigrateOptions",
+    ),
+
+    # consolidate - Log consolidation
+    "ontos.commands.consolidate": (
+        "consolidate_command",
+        "ConsolidateOptions",
+    ),
+
+    # promote - Proposal promotion
+    "ontos.commands.promote": (
+        "promote_command",
+        "PromoteOptions",
+    ),
+
+    # scaffold - Document scaffolding
+    "ontos.commands.scaffold": (
+        "scaffold_command",
+        "ScaffoldOptions",
+        "find_untagged_files",
+    ),
+
+    # stub - Document scaffolding
+    "ontos.commands.stub": (
+        "stub_command",
+        "StubOptions",
+    ),
+
+    # serve - Daemon answering map/query from memory
+    "ontos.commands.serve": (
+        "serve_command",
+        "ServeOptions",
+    ),
+}
+
+__getattr__, __dir__ = _lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Native orchestration (Phase 2)
     "GenerateMapOptions",
     "generate_context_map",
+    "iter_context_map",
     "EndSessionOptions",
     "create_session_log",
     "suggest_session_impacts",
@@ -150,5 +165,7 @@ __all__ = [
     "find_untagged_files",
     "stub_command",
     "StubOptions",
+    "serve_command",
+    "ServeOptions",
 ]
 
@@ -137,16 +137,12 @@ def gather_stats(repo_root: Path) -> Tuple[str, str]:
             except Exception:
                 pass  # Keep defaults
         
-        # Count .md files (cap at 5000)
-        count = 0
+        # Count .md files (cap display at 5000)
         if docs_dir.exists():
-            for _ in docs_dir.rglob("*.md"):
-                count += 1
-                if count >= 5000:
-                    doc_count = "5000+"
-                    break
-            else:
-                doc_count = str(count)
+            from ontos.io.index import load_document_index
+            index = load_document_index(repo_root, dirs=[docs_dir])
+            count = len(index.paths_under(docs_dir))
+            doc_count = "5000+" if count >= 5000 else str(count)
         
         # Find max mtime
         mtimes = []
@@ -13,6 +13,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from ontos.core.index import DocumentIndex
+
 
 @dataclass
 class CheckResult:
@@ -208,14 +210,30 @@ def check_python_version() -> CheckResult:
         )
 
 
-def check_docs_directory() -> CheckResult:
-    """Check 4: Docs directory exists and contains .md files."""
+def _get_docs_dir() -> Path:
+    """Docs directory from config, or ./docs if config cannot be loaded."""
     try:
         from ontos.io.config import load_project_config
         config = load_project_config()
-        docs_dir = Path.cwd() / config.paths.docs_dir
+        return Path.cwd() / config.paths.docs_dir
     except Exception:
-        docs_dir = Path.cwd() / "docs"
+        return Path.cwd() / "docs"
+
+
+def _load_docs_index(docs_dir: Path) -> Optional[DocumentIndex]:
+    """Document index of the docs directory, shared by the document checks."""
+    if not docs_dir.exists():
+        return None
+    try:
+        from ontos.io.index import load_document_index
+        return load_document_index(Path.cwd(), dirs=[docs_dir])
+    except Exception:
+        return None
+
+
+def check_docs_directory(index: Optional[DocumentIndex] = None) -> CheckResult:
+    """Check 4: Docs directory exists and contains .md files."""
+    docs_dir = _get_docs_dir()
 
     if not docs_dir.exists():
         return CheckResult(
@@ -225,7 +243,9 @@ def check_docs_directory() -> CheckResult:
             details="Create the docs directory or update .ontos.toml"
         )
 
-    md_files = list(docs_dir.rglob("*.md"))
+    if index is None:
+        index = _load_docs_index(docs_dir)
+    md_files = index.paths_under(docs_dir) if index is not None else []
     if not md_files:
         return CheckResult(
             name="docs_directory",
@@ -282,12 +302,10 @@ def check_context_map() -> CheckResult:
         )
 
 
-def check_validation() -> CheckResult:
+def check_validation(index: Optional[DocumentIndex] = None) -> CheckResult:
     """Check 6: No validation errors in current documents."""
     try:
-        from ontos.io.config import load_project_config
-        config = load_project_config()
-        docs_dir = Path.cwd() / config.paths.docs_dir
+        docs_dir = _get_docs_dir()
 
         if not docs_dir.exists():
             return CheckResult(
@@ -296,15 +314,19 @@ def check_validation() -> CheckResult:
                 message="Cannot validate (no docs directory)"
             )
 
-        md_files = list(docs_dir.rglob("*.md"))
-        issues = 0
+        if index is None:
+            index = _load_docs_index(docs_dir)
+        if index is None:
+            raise RuntimeError(f"Could not scan {docs_dir}")
 
-        for md_file in md_files[:50]:  # Check first 50 to avoid slowness
-            try:
-                content = md_file.read_text()
-                if content.strip() and not content.startswith("---"):
-                    issues += 1
-            except Exception:
+        # Unreadable files and non-empty files without frontmatter
+        issues = 0
+        for path, doc, error in index.results:
+            if docs_dir not in path.parents:
+                continue
+            if error is not None:
+                issues += 1
+            elif not doc.frontmatter and doc.content.strip():
                 issues += 1
 
         if issues > 0:
@@ -508,8 +530,15 @@ def doctor_command(options: DoctorOptions) -> Tuple[int, DoctorResult]:
         check_agents_staleness,
     ]
 
+    # Document checks share one index so each file is parsed once
+    docs_index = _load_docs_index(_get_docs_dir())
+    index_checks = (check_docs_directory, check_validation)
+
     for check_fn in checks:
-        check_result = check_fn()
+        if check_fn in index_checks:
+            check_result = check_fn(index=docs_index)
+        else:
+            check_result = check_fn()
         result.checks.append(check_result)
 
         if check_result.status == "pass":
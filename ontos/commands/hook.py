@@ -106,6 +106,10 @@ def run_pre_commit_hook(args: List[str]) -> int:
     """
     Pre-commit hook: Check documentation status before commit.
 
+    Has no checks yet, so the hook shims skip it without loading ontos
+    (NO_WORK_HOOKS in ontos._hooks.entry); remove it from there when
+    adding some.
+
     Returns:
         0 = Always (pre-commit doesn't block by default)
     """
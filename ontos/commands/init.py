@@ -479,37 +479,52 @@ def _write_shim_hook(path: Path, hook_type: str) -> None:
     """
     Write minimal shim hook with marker.
     
-    Per Spec v1.1 Section 4.6: Python-based shim hooks with 3-method fallback:
-    1. PATH lookup (preferred)
-    2. sys.executable -m ontos
-    3. Graceful degradation (allow operation, warn)
+    Per Spec v1.1 Section 4.6: Python-based shim hooks with fallback:
+    1. In-process via ontos._hooks.entry, only when the hook runs in the
+       Python environment that ran ``ontos init`` (recorded in the shim),
+       so another ontos importable by python3 is never picked up
+    2. PATH lookup
+    3. sys.executable -m ontos
+    4. Graceful degradation (allow operation, warn)
     """
     import os
     import stat
     
     shim = f'''#!/usr/bin/env python3
 {ONTOS_HOOK_MARKER}
-"""Ontos {hook_type} hook. Delegates to ontos CLI."""
-import subprocess
+"""Ontos {hook_type} hook. Delegates to ontos."""
 import sys
 
+# Environment that installed this hook; only it may run ontos in-process
+ONTOS_PREFIX = {sys.prefix!r}
+
 def run_hook():
     """Try multiple methods to invoke ontos hook."""
+    # Method 1: fast in-process entry (reads only [hooks] from .ontos.toml)
+    if sys.prefix == ONTOS_PREFIX:
+        try:
+            from ontos._hooks.entry import run
+        except ImportError:
+            pass
+        else:
+            return run("{hook_type}", sys.argv[1:])
+
+    import subprocess
     args = ["hook", "{hook_type}"] + sys.argv[1:]
 
-    # Method 1: PATH lookup (preferred)
+    # Method 2: PATH lookup
     try:
         return subprocess.call(["ontos"] + args)
     except FileNotFoundError:
         pass
 
-    # Method 2: sys.executable -m ontos
+    # Method 3: sys.executable -m ontos
     try:
         return subprocess.call([sys.executable, "-m", "ontos"] + args)
     except Exception:
         pass
 
-    # Method 3: Graceful degradation
+    # Method 4: Graceful degradation
     print("Warning: ontos not found. Skipping hook.", file=sys.stderr)
     return 0
 
@@ -8,16 +8,22 @@ Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.10
 """
 
 from __future__ import annotations
+import hashlib
 import json
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 
+from ontos.core.frontmatter import normalize_concept
+from ontos.core.index import concept_keys
+from ontos.core.pack import ContextPack, PackEstimate, estimate_documents, iter_pack, pack_documents, rank_documents
 from ontos.core.validation import ValidationOrchestrator
-from ontos.core.tokens import estimate_tokens, format_token_count
+from ontos.core.tokens import TokenCounter, estimate_tokens, format_token_count
 from ontos.core.types import DocumentData, ValidationResult
+from ontos.ui.json_output import JsonOutputHandler
 
 
 class CompactMode(Enum):
@@ -41,12 +47,27 @@ class GenerateMapOptions:
     quiet: bool = False  # Phase 4: Quiet mode
     obsidian: bool = False
     compact: CompactMode = CompactMode.OFF
+    budget: Optional[int] = None  # Token budget for generate_context_pack()
+
+
+def _validate(
+    docs: Dict[str, DocumentData],
+    config: Dict[str, Any],
+    options: GenerateMapOptions,
+    graph: Optional[Tuple[Any, List[Any]]],
+) -> ValidationResult:
+    validator = ValidationOrchestrator(docs, {
+        "max_dependency_depth": options.max_dependency_depth,
+        "allowed_orphan_types": config.get("allowed_orphan_types", ["atom", "log"]),
+    }, graph=graph)
+    return validator.validate_all()
 
 
 def generate_context_map(
     docs: Dict[str, DocumentData],
     config: Dict[str, Any],
-    options: GenerateMapOptions = None
+    options: GenerateMapOptions = None,
+    graph: Optional[Tuple[Any, List[Any]]] = None,
 ) -> Tuple[str, ValidationResult]:
     """Generate the context map markdown content.
 
@@ -54,59 +75,161 @@ def generate_context_map(
         docs: Dictionary of parsed documents
         config: Configuration dictionary
         options: Generation options
+        graph: Optional prebuilt build_graph(docs) result to reuse
 
     Returns:
         Tuple of (content string, validation result)
     """
+    chunks, result = iter_context_map(docs, config, options, graph)
+    return "".join(chunks), result
+
+
+def iter_context_map(
+    docs: Dict[str, DocumentData],
+    config: Dict[str, Any],
+    options: GenerateMapOptions = None,
+    graph: Optional[Tuple[Any, List[Any]]] = None,
+) -> Tuple[Iterator[str], ValidationResult]:
+    """Validate, then generate the context map lazily, in chunks.
+
+    Sections are produced one at a time as the chunks are consumed, and
+    the sections that grow with the project (document table, validation
+    messages, compact listing) one line at a time, so a caller writing
+    chunks as they come never holds the whole map. Document bodies are
+    not read.
+
+    Args:
+        docs: Dictionary of parsed documents
+        config: Configuration dictionary
+        options: Generation options
+        graph: Optional prebuilt build_graph(docs) result to reuse
+
+    Returns:
+        Tuple of (chunks, validation result); the chunks concatenate to
+        the content generate_context_map() returns
+    """
     options = options or GenerateMapOptions()
 
     # Run validation
-    validator = ValidationOrchestrator(docs, {
-        "max_dependency_depth": options.max_dependency_depth,
-        "allowed_orphan_types": config.get("allowed_orphan_types", ["atom", "log"]),
-    })
-    result = validator.validate_all()
-
-    # Generate content sections
-    sections = []
+    result = _validate(docs, config, options, graph)
+    return _join_sections(_map_sections(docs, config, options, result)), result
 
-    # Header with provenance
-    sections.append(_generate_header(config))
 
+def _map_sections(
+    docs: Dict[str, DocumentData],
+    config: Dict[str, Any],
+    options: GenerateMapOptions,
+    result: ValidationResult,
+) -> Iterator[Iterable[str]]:
+    """Sections of the map in order, each as an iterable of chunks."""
     # Compact output (if enabled)
     if options.compact != CompactMode.OFF:
-        return _generate_compact_output(docs, options.compact), result
+        yield _iter_compact_output(docs, options.compact)
+        return
+
+    # Header with provenance
+    yield (_generate_header(config),)
 
     # Document table
-    sections.append(_generate_document_table(docs, options.obsidian))
+    yield _iter_document_table(docs, options.obsidian)
 
     # Validation messages (if any)
     if result.errors or result.warnings:
-        sections.append(_generate_validation_section(result))
+        yield _iter_validation_section(result)
 
     # Dependency tree
-    sections.append(_generate_dependency_tree(docs))
+    yield (_generate_dependency_tree(docs),)
 
     # Timeline (if enabled)
     if options.include_timeline:
-        sections.append(_generate_timeline(docs))
+        yield (_generate_timeline(docs),)
 
     # Staleness section (if enabled)
     if options.include_staleness:
-        staleness_section = _generate_staleness_section(docs)
-        if staleness_section:
-            sections.append(staleness_section)
+        yield (_generate_staleness_section(docs),)
 
     # Lint section (if enabled)
     if options.include_lint:
-        lint_section = _generate_lint_section(docs, result)
-        if lint_section:
-            sections.append(lint_section)
+        yield (_generate_lint_section(docs, result),)
+
+
+def _join_sections(sections: Iterable[Iterable[str]]) -> Iterator[str]:
+    """Chunks of the sections separated by blank lines; empty sections are skipped."""
+    first = True
+    for section in sections:
+        started = False
+        for chunk in section:
+            if not chunk:
+                continue
+            if not started:
+                if not first:
+                    yield "\n\n"
+                started, first = True, False
+            yield chunk
+
+
+def generate_context_pack(
+    docs: Dict[str, DocumentData],
+    config: Dict[str, Any],
+    options: GenerateMapOptions,
+    estimates: Optional[Dict[str, PackEstimate]] = None,
+    recency: Optional[Dict[str, float]] = None,
+    graph: Optional[Tuple[Any, List[Any]]] = None,
+    counter: Optional[TokenCounter] = None,
+) -> Tuple[str, ValidationResult, ContextPack]:
+    """Generate a context map that fits in ``options.budget`` tokens.
 
-    # Assemble content
-    content = "\n\n".join(filter(None, sections))
+    Documents are ranked and packed by ontos.core.pack: an entry line for
+    as many documents as fit, then document bodies while room remains.
 
-    return content, result
+    Args:
+        docs: Dictionary of parsed documents
+        config: Configuration dictionary
+        options: Generation options (``budget`` must be set)
+        estimates: PackEstimate by id (measured here when missing)
+        recency: Modification time by id, for ranking
+        graph: Optional prebuilt build_graph(docs) result to reuse
+        counter: Token counter (default: ~4 characters per token)
+
+    Returns:
+        Tuple of (content string, validation result, chosen pack)
+    """
+    chunks, result, pack = iter_context_pack(
+        docs, config, options,
+        estimates=estimates, recency=recency, graph=graph, counter=counter,
+    )
+    return "".join(chunks), result, pack
+
+
+def iter_context_pack(
+    docs: Dict[str, DocumentData],
+    config: Dict[str, Any],
+    options: GenerateMapOptions,
+    estimates: Optional[Dict[str, PackEstimate]] = None,
+    recency: Optional[Dict[str, float]] = None,
+    graph: Optional[Tuple[Any, List[Any]]] = None,
+    counter: Optional[TokenCounter] = None,
+) -> Tuple[Iterator[str], ValidationResult, ContextPack]:
+    """Choose a pack now and render it lazily, in chunks.
+
+    Bodies are read one at a time as the chunks are consumed and released
+    again (see ontos.core.pack.iter_pack). Arguments are those of
+    generate_context_pack().
+
+    Returns:
+        Tuple of (chunks, validation result, chosen pack)
+    """
+    result = _validate(docs, config, options, graph)
+    estimates = dict(estimates or {})
+    missing = [doc for doc_id, doc in docs.items() if doc_id not in estimates]
+    for doc, size in zip(missing, estimate_documents(missing, counter)):
+        estimates[doc.id] = size
+
+    header = _generate_header(config)
+    pack = pack_documents(
+        rank_documents(docs, recency), estimates, options.budget, header, counter=counter
+    )
+    return iter_pack(header, docs, pack), result, pack
 
 
 def _generate_header(config: Dict[str, Any]) -> str:
@@ -148,15 +271,16 @@ def _escape_markdown_table_cell(value: str) -> str:
 
 def _generate_document_table(docs: Dict[str, DocumentData], obsidian_mode: bool = False) -> str:
     """Generate document listing table."""
+    return "".join(_iter_document_table(docs, obsidian_mode))
+
+
+def _iter_document_table(docs: Dict[str, DocumentData], obsidian_mode: bool = False) -> Iterator[str]:
+    """Document listing table, one row at a time."""
     if not docs:
-        return "## Documents\n\nNo documents found."
+        yield "## Documents\n\nNo documents found."
+        return
 
-    lines = [
-        "## Documents",
-        "",
-        "| Path | ID | Type | Status |",
-        "|------|-----|------|--------|",
-    ]
+    yield "## Documents\n\n| Path | ID | Type | Status |\n|------|-----|------|--------|"
 
     # Sort docs by path
     sorted_docs = sorted(docs.values(), key=lambda d: str(d.filepath))
@@ -167,28 +291,27 @@ def _generate_document_table(docs: Dict[str, DocumentData], obsidian_mode: bool
         # Escape special characters to prevent table breakage
         filepath = _escape_markdown_table_cell(str(doc.filepath))
         doc_id_link = _format_doc_link(doc.id, doc.filepath, obsidian_mode)
-        lines.append(f"| {filepath} | {doc_id_link} | {doc_type} | {doc_status} |")
-
-    return "\n".join(lines)
+        yield f"\n| {filepath} | {doc_id_link} | {doc_type} | {doc_status} |"
 
 
 def _generate_validation_section(result: ValidationResult) -> str:
     """Generate validation messages section."""
-    lines = ["## Validation"]
+    return "".join(_iter_validation_section(result))
+
+
+def _iter_validation_section(result: ValidationResult) -> Iterator[str]:
+    """Validation messages section, one message at a time."""
+    yield "## Validation"
     
     if result.errors:
-        lines.append("")
-        lines.append("### Errors")
+        yield "\n\n### Errors"
         for error in result.errors:
-            lines.append(f"- ❌ **{error.doc_id}**: {error.message}")
+            yield f"\n- ❌ **{error.doc_id}**: {error.message}"
     
     if result.warnings:
-        lines.append("")
-        lines.append("### Warnings")
+        yield "\n\n### Warnings"
         for warning in result.warnings:
-            lines.append(f"- ⚠️ **{warning.doc_id}**: {warning.message}")
-    
-    return "\n".join(lines)
+            yield f"\n- ⚠️ **{warning.doc_id}**: {warning.message}"
 
 
 def _generate_dependency_tree(docs: Dict[str, DocumentData]) -> str:
@@ -312,10 +435,15 @@ def _generate_compact_output(docs: Dict[str, Any], mode: CompactMode) -> str:
     Returns:
         Compact format string, one doc per line.
     """
+    return "".join(_iter_compact_output(docs, mode))
+
+
+def _iter_compact_output(docs: Dict[str, Any], mode: CompactMode) -> Iterator[str]:
+    """Compact format, one line at a time (see _generate_compact_output)."""
     if mode == CompactMode.OFF:
-        return ""
+        return
 
-    lines = []
+    separator = ""
     for doc_id, doc in sorted(docs.items()):
         doc_type = doc.type.value if hasattr(doc.type, 'value') else str(doc.type)
         doc_status = doc.status.value if hasattr(doc.status, 'value') else str(doc.status)
@@ -328,13 +456,13 @@ def _generate_compact_output(docs: Dict[str, Any], mode: CompactMode) -> str:
                     .replace('\\', '\\\\')
                     .replace('"', '\\"')
                     .replace('\n', '\\n'))
-                lines.append(f'{doc_id}:{doc_type}:{doc_status}:"{summary_safe}"')
+                line = f'{doc_id}:{doc_type}:{doc_status}:"{summary_safe}"'
             else:
-                lines.append(f'{doc_id}:{doc_type}:{doc_status}')
+                line = f'{doc_id}:{doc_type}:{doc_status}'
         else:
-            lines.append(f'{doc_id}:{doc_type}:{doc_status}')
-
-    return '\n'.join(lines)
+            line = f'{doc_id}:{doc_type}:{doc_status}'
+        yield separator + line
+        separator = '\n'
 
 
 def _format_doc_link(doc_id: str, doc_path: Path, obsidian_mode: bool) -> str:
@@ -364,6 +492,14 @@ class FilterExpression:
     """Single filter expression."""
     field: str
     values: list
+    # Values as matched: concepts normalized like the concept index, others lowercased
+    keys: list = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.field == 'concept':
+            self.keys = [normalize_concept(v) for v in self.values]
+        else:
+            self.keys = [v.lower() for v in self.values]
 
 
 def parse_filter(expr: str) -> list:
@@ -413,17 +549,16 @@ def matches_filter(doc: Any, filters: list) -> bool:
         doc_status = doc.status.value if hasattr(doc.status, 'value') else str(doc.status)
 
         if f.field == 'type':
-            if doc_type.lower() not in [v.lower() for v in f.values]:
+            if doc_type.lower() not in f.keys:
                 return False
         elif f.field == 'status':
-            if doc_status.lower() not in [v.lower() for v in f.values]:
+            if doc_status.lower() not in f.keys:
                 return False
         elif f.field == 'concept':
-            concepts = doc.frontmatter.get('concepts', [])
-            if not any(c.lower() in [v.lower() for v in f.values] for c in concepts):
+            if not any(c in f.keys for c in concept_keys(doc)):
                 return False
         elif f.field == 'id':
-            if not any(fnmatch.fnmatch(doc.id.lower(), v.lower()) for v in f.values):
+            if not any(fnmatch.fnmatch(doc.id.lower(), v) for v in f.keys):
                 return False
         # Unknown fields: ignore (per CA guidance)
 
@@ -436,11 +571,266 @@ class MapOptions:
     output: Optional[Path] = None
     strict: bool = False
     json_output: bool = False
+    ndjson: bool = False  # Stream NDJSON records instead of a summary
     quiet: bool = False
     obsidian: bool = False
     compact: CompactMode = CompactMode.OFF
     filter_expr: Optional[str] = None
-    no_cache: bool = False
+    budget: Optional[int] = None  # Token budget for a ranked pack (None = full map)
+    no_cache: bool = False  # Bypass the persistent document cache
+    jobs: Optional[int] = None  # Parser processes (None = based on CPU count)
+    watch: bool = False  # Keep running and regenerate on file changes
+    watch_backend: str = "auto"  # "auto", "inotify" or "poll"
+    debounce: float = 0.2  # Seconds of quiet that end a burst of changes
+
+
+# Lines of the header that change on every render
+_TIMESTAMP_LINE = re.compile(r"^(generated_at: |> Last updated: ).*$", re.MULTILINE)
+
+
+def _without_timestamp(content: str) -> str:
+    """Map content with the generation timestamp blanked out."""
+    return _TIMESTAMP_LINE.sub(r"\1", content)
+
+
+class MapSession:
+    """Renders the context map from a DocumentIndex and keeps it current.
+
+    Used once by ``ontos map``; ``ontos map --watch`` calls apply() for
+    every batch of file changes, which re-parses only the changed files
+    and rewrites the output only if its content (ignoring the timestamp)
+    changed.
+
+    The map is written as it is generated (render_chunks()), through a
+    temporary file renamed over the output, so neither the whole map nor
+    more than one document body at a time is held in memory; only a hash
+    of the last output is kept for the comparison.
+
+    With ``options.ndjson``, every render streams a "document" record per
+    mapped document id (files sharing an id are one document, as in the
+    map) and an "edge" record per dependency once the index has loaded
+    (duplicates are only known then), then an "issue" record per
+    validation error or warning; report() ends the run with a "summary"
+    record whose "documents" count matches the "document" records.
+    """
+
+    def __init__(self, project_root: Path, config, options: MapOptions, index):
+        self.project_root = project_root
+        self.config = config
+        self.options = options
+        self.index = index
+        self.output_path = options.output or (project_root / config.paths.context_map)
+        self.filters = parse_filter(options.filter_expr)
+        self.docs: Dict[str, DocumentData] = {}
+        self.result: Optional[ValidationResult] = None
+        self.pack: Optional[ContextPack] = None
+        self._written: Optional[str] = None  # Hash of the last output, without timestamp
+        self.stream = JsonOutputHandler() if options.ndjson else None
+
+    def render(self) -> str:
+        """Generate the map from the current index contents."""
+        return "".join(self.render_chunks())
+
+    def render_chunks(self) -> Iterator[str]:
+        """Select and validate documents now; generate the map lazily.
+
+        ``docs``, ``result`` and ``pack`` are set on return; the returned
+        chunks concatenate to the map and should be consumed before the
+        index changes.
+        """
+        docs: Dict[str, DocumentData] = {}
+        # Concept filters are answered from the index: AND of ORs of lookups
+        allowed = None
+        for f in self.filters:
+            if f.field == 'concept':
+                ids = self.index.ids_with_concepts(f.keys)
+                allowed = ids if allowed is None else allowed & ids
+        stream = self.stream
+        for path, doc, error in self.index.results:
+            if error is not None:
+                if stream is not None:
+                    stream.record("error", {"path": str(path), "message": str(error)})
+                elif not self.options.quiet:
+                    print(f"Warning: Failed to load {path}: {error}")
+                continue
+            if allowed is not None and doc.id not in allowed:
+                continue
+            if matches_filter(doc, self.filters):
+                docs[doc.id] = doc  # Later duplicates win
+        if stream is not None:
+            for doc in docs.values():
+                stream.record("document", {
+                    "id": doc.id,
+                    "type": doc.type,
+                    "status": doc.status,
+                    "path": str(doc.filepath),
+                })
+                for dep in doc.depends_on:
+                    stream.record("edge", {"from": doc.id, "to": dep})
+
+        # Build config dict for generation
+        gen_config = {
+            "project_name": self.project_root.name,
+            "version": self.config.ontos.version,
+            "allowed_orphan_types": self.config.validation.allowed_orphan_types,
+        }
+
+        # Generate context map
+        gen_options = GenerateMapOptions(
+            output_path=self.output_path,
+            strict=self.options.strict,
+            max_dependency_depth=self.config.validation.max_dependency_depth,
+            obsidian=self.options.obsidian,
+            compact=self.options.compact,
+            budget=self.options.budget,
+        )
+
+        # Unfiltered, the map covers the whole index and can reuse its graph
+        graph = None if self.filters else self.index.graph
+        if self.options.budget is not None:
+            chunks, self.result, self.pack = self._render_pack(docs, gen_config, gen_options, graph)
+        else:
+            chunks, self.result = iter_context_map(docs, gen_config, gen_options, graph=graph)
+        if stream is not None:
+            for issue in self.result.errors + self.result.warnings:
+                stream.record("issue", issue)
+        self.docs = docs
+        return chunks
+
+    def _render_pack(self, docs, gen_config, gen_options, graph):
+        from ontos.io.pack import refresh_pack_estimates
+        from ontos.io.tokens import load_token_counter, save_token_counter
+
+        use_cache = not self.options.no_cache
+        counter = load_token_counter(self.project_root, self.config, use_cache=use_cache)
+        estimates = refresh_pack_estimates(
+            self.project_root, self.index, docs.values(), use_cache=use_cache, counter=counter
+        )
+        recency = {}
+        for doc in docs.values():
+            stat = self.index.stat(doc.filepath)
+            if stat is not None:
+                recency[doc.id] = stat[0]
+        rendered = iter_context_pack(
+            docs, gen_config, gen_options,
+            estimates=estimates, recency=recency, graph=graph, counter=counter,
+        )
+        if use_cache:
+            save_token_counter(self.project_root, counter)
+        return rendered
+
+    def write(self, content: Union[str, Iterable[str]]) -> bool:
+        """Write the map unless only its timestamp would change.
+
+        Args:
+            content: The map, or its chunks as from render_chunks()
+
+        Returns:
+            True if the file was written
+        """
+        from ontos.io.files import write_text_atomic
+
+        if isinstance(content, str):
+            content = (content,)
+        digest = hashlib.blake2b(digest_size=16)
+
+        def hashed() -> Iterator[str]:
+            for chunk in content:
+                # The timestamp lines are whole lines of the header chunk
+                digest.update(_without_timestamp(chunk).encode("utf-8"))
+                yield chunk
+
+        written = write_text_atomic(
+            self.output_path, hashed(),
+            replace=lambda: digest.hexdigest() != self._written,
+        )
+        if written:
+            self._written = digest.hexdigest()
+        return written
+
+    def apply(self, batch) -> Optional[bool]:
+        """Apply a batch of file changes (an ontos.io.watch.WatchBatch).
+
+        Returns:
+            None if no document changed, otherwise whether the map was
+            rewritten
+        """
+        from ontos.io.index import scan_project_documents
+
+        paths = scan_project_documents(self.project_root, self.config)
+        changed = self.index.paths if batch.overflow else batch.paths
+        if not self.index.update(paths, changed):
+            return None
+        return self.write(self.render_chunks())
+
+    @property
+    def over_budget(self) -> bool:
+        """True if the map header alone does not fit in ``--budget``."""
+        return self.pack is not None and self.pack.tokens > self.pack.budget
+
+    @property
+    def exit_code(self) -> int:
+        """0 for success, 1 for errors (or a budget smaller than the map
+        header), 2 for warnings in strict mode."""
+        if self.result.errors or self.over_budget:
+            return 1
+        if self.options.strict and self.result.warnings:
+            return 2
+        return 0
+
+    def report(self, verb: str = "generated") -> None:
+        """Print the result summary."""
+        result = self.result
+        pack = self.pack
+        if self.options.json_output or self.stream is not None:
+            data = {
+                "status": "success" if self.exit_code == 0 else "error",
+                "path": str(self.output_path),
+                "documents": len(self.docs),
+                "errors": len(result.errors),
+                "warnings": len(result.warnings),
+            }
+            if pack is not None:
+                data["pack"] = {
+                    "budget": pack.budget,
+                    "tokens": pack.tokens,
+                    "listed": len(pack.listed),
+                    "expanded": len(pack.expanded),
+                    "omitted": pack.omitted,
+                }
+            if self.over_budget:
+                data["message"] = self._over_budget_message()
+            if self.stream is not None:
+                self.stream.record("summary", data)
+            else:
+                print(json.dumps(data))
+        elif not self.options.quiet:
+            print(f"Context map {verb}: {self.output_path}")
+            print(f"  Documents: {len(self.docs)}")
+            if pack is not None:
+                print(f"  Packed: {len(pack.listed)} listed, {len(pack.expanded)} with contents, "
+                      f"{format_token_count(pack.tokens)} of {pack.budget}")
+            if self.over_budget:
+                print(f"  Error: {self._over_budget_message()}")
+            if result.errors:
+                print(f"  Errors: {len(result.errors)}")
+            if result.warnings:
+                print(f"  Warnings: {len(result.warnings)}")
+
+
+    def _over_budget_message(self) -> str:
+        return (f"--budget {self.pack.budget} is smaller than the map header "
+                f"({format_token_count(self.pack.tokens)}); no documents fit")
+
+
+def _report_error(options: MapOptions, message: str, prefix: str = "") -> None:
+    """Print an error that stops the command in the requested format."""
+    if options.ndjson:
+        JsonOutputHandler().record("error", {"message": message})
+    elif options.json_output:
+        print(json.dumps({"status": "error", "message": message}))
+    elif not options.quiet:
+        print(f"{prefix}{message}")
 
 
 def map_command(options: MapOptions) -> int:
@@ -454,114 +844,82 @@ def map_command(options: MapOptions) -> int:
     Returns:
         Exit code (0 for success, 1 for errors, 2 for warnings in strict mode)
     """
-    from ontos.io.files import find_project_root, scan_documents, load_document, load_document_from_content
+    from ontos.io.files import find_project_root
     from ontos.io.config import load_project_config
-    from ontos.io.yaml import parse_frontmatter_content
-    from ontos.io.obsidian import read_file_lenient
-    from ontos.core.cache import DocumentCache
+    from ontos.io.index import load_document_index
+
+    if options.budget is not None and options.budget < 1:
+        _report_error(options, "--budget must be at least 1", "Error: ")
+        return 1
 
     # Find project root
     try:
         project_root = find_project_root()
     except FileNotFoundError as e:
-        if options.json_output:
-            print(json.dumps({"status": "error", "message": str(e)}))
-        elif not options.quiet:
-            print(f"Error: {e}")
+        _report_error(options, str(e), "Error: ")
         return 1
 
     # Load config
     try:
         config = load_project_config(repo_root=project_root)
     except Exception as e:
-        if options.json_output:
-            print(json.dumps({"status": "error", "message": f"Config error: {e}"}))
-        elif not options.quiet:
-            print(f"Config error: {e}")
+        _report_error(options, f"Config error: {e}")
         return 1
 
-    # Determine paths
-    docs_dir = project_root / config.paths.docs_dir
-    output_path = options.output or (project_root / config.paths.context_map)
-
-    # Scan for documents
-    doc_paths = scan_documents(
-        [docs_dir, project_root],
-        skip_patterns=config.scanning.skip_patterns
+    # Scan and load documents (overlapping roots are walked once; unchanged
+    # files come from the persistent cache)
+    index = load_document_index(
+        project_root,
+        config=config,
+        use_cache=not options.no_cache,
+        jobs=options.jobs,
     )
 
-    # Load documents with filter and cache
-    docs: Dict[str, DocumentData] = {}
-    cache = DocumentCache() if not options.no_cache else None
-    filters = parse_filter(options.filter_expr)
-
-    for path in doc_paths:
-        try:
-            mtime = path.stat().st_mtime
-            doc = None
-
-            if cache:
-                doc = cache.get(path, mtime)
-
-            if doc is None:
-                content = read_file_lenient(path)
-                doc = load_document_from_content(path, content, parse_frontmatter_content)
-                
-                if cache:
-                    cache.set(path, doc, mtime)
-
-            if matches_filter(doc, filters):
-                docs[doc.id] = doc
-
-        except Exception as e:
-            if not options.quiet:
-                print(f"Warning: Failed to load {path}: {e}")
-
-    # Build config dict for generation
-    gen_config = {
-        "project_name": project_root.name,
-        "version": config.ontos.version,
-        "allowed_orphan_types": config.validation.allowed_orphan_types,
-    }
-
-    # Generate context map
-    gen_options = GenerateMapOptions(
-        output_path=output_path,
-        strict=options.strict,
-        max_dependency_depth=config.validation.max_dependency_depth,
-        obsidian=options.obsidian,
-        compact=options.compact,
-    )
+    session = MapSession(project_root, config, options, index)
+    session.write(session.render_chunks())
+    session.report()
 
-    content, result = generate_context_map(docs, gen_config, gen_options)
+    if options.watch:
+        return watch_map(session)
+    return session.exit_code
 
-    # Write output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
 
-    # Determine exit code
-    exit_code = 0
-    if result.errors:
-        exit_code = 1
-    elif options.strict and result.warnings:
-        exit_code = 2
-
-    # Output result
-    if options.json_output:
-        print(json.dumps({
-            "status": "success" if exit_code == 0 else "error",
-            "path": str(output_path),
-            "documents": len(docs),
-            "errors": len(result.errors),
-            "warnings": len(result.warnings),
-        }))
-    elif not options.quiet:
-        print(f"Context map generated: {output_path}")
-        print(f"  Documents: {len(docs)}")
-        if result.errors:
-            print(f"  Errors: {len(result.errors)}")
-        if result.warnings:
-            print(f"  Warnings: {len(result.warnings)}")
+def watch_map(session: MapSession, watcher=None, max_batches: Optional[int] = None) -> int:
+    """Regenerate the map whenever documents change, until interrupted.
 
-    return exit_code
+    Args:
+        session: MapSession that has already rendered once
+        watcher: ontos.io.watch.Watcher to use (created from the project
+            config if None)
+        max_batches: Stop after this many batches (None runs until Ctrl-C)
 
+    Returns:
+        Exit code of the last render
+    """
+    from ontos.io.files import DEFAULT_IGNORES
+    from ontos.io.watch import create_watcher
+
+    options = session.options
+    if watcher is None:
+        project_root = session.project_root
+        watcher = create_watcher(
+            [project_root / session.config.paths.docs_dir, project_root],
+            ignore_dirs=DEFAULT_IGNORES,
+            # Watched paths are absolute; a relative --output must match them
+            exclude=[session.output_path.resolve()],
+            backend=options.watch_backend,
+        )
+    if not options.quiet and not options.json_output and not options.ndjson:
+        print(f"Watching for changes ({type(watcher).__name__}). Press Ctrl-C to stop.")
+
+    batches = 0
+    try:
+        with watcher:
+            while max_batches is None or batches < max_batches:
+                batch = watcher.next_batch(debounce=options.debounce)
+                batches += 1
+                if session.apply(batch):
+                    session.report("updated")
+    except KeyboardInterrupt:
+        pass
+    return session.exit_code
@@ -11,6 +11,7 @@ from ontos.core.schema import (
 )
 from ontos.core.frontmatter import parse_frontmatter
 from ontos.core.context import SessionContext
+from ontos.io.config import load_scan_backend
 from ontos.io.files import find_project_root, scan_documents
 from ontos.ui.output import OutputHandler
 
@@ -65,7 +66,9 @@ def migrate_command(options: MigrateOptions) -> Tuple[int, str]:
 
     from ontos.core.curation import load_ontosignore
     ignore_patterns = load_ontosignore(root)
-    files = scan_documents(search_dirs, skip_patterns=ignore_patterns) # Filter by .md only
+    files = scan_documents(
+        search_dirs, skip_patterns=ignore_patterns, backend=load_scan_backend(root)
+    ) # Filter by .md only
     files = [f for f in files if f.suffix == ".md"]
 
     needs_migration = []
@@ -14,6 +14,7 @@ from ontos.core.curation import (
     level_marker,
 )
 from ontos.core.context import SessionContext
+from ontos.io.config import load_scan_backend
 from ontos.io.files import find_project_root, scan_documents
 from ontos.ui.output import OutputHandler
 
@@ -159,7 +160,7 @@ def promote_command(options: PromoteOptions) -> Tuple[int, str]:
             dirs = [root]
         from ontos.core.curation import load_ontosignore
         ignore_patterns = load_ontosignore(root)
-        files = scan_documents(dirs, skip_patterns=ignore_patterns)
+        files = scan_documents(dirs, skip_patterns=ignore_patterns, backend=load_scan_backend(root))
         files = [f for f in files if f.suffix == ".md"]
 
     # 2. Extract info and filter promotable
@@ -5,40 +5,67 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 
-from ontos.core.frontmatter import parse_frontmatter, normalize_depends_on, normalize_type
+from ontos.core.frontmatter import normalize_depends_on, normalize_type
 from ontos.core.config import get_git_last_modified
-from ontos.io.git import get_file_mtime as git_mtime_provider
-from ontos.io.files import find_project_root, scan_documents
+from ontos.core.index import DocumentIndex
+from ontos.core.reachability import build_reachability, within_depth
+from ontos.io.git import BulkGitMtimeProvider
+from ontos.io.files import find_project_root
+from ontos.io.index import load_document_index
+from ontos.io.reachability import load_reachability_index
+from ontos.io.search import refresh_search_index
+from ontos.ui.json_output import JsonOutputHandler, NdjsonOutputHandler
 from ontos.ui.output import OutputHandler
 
 
+# Results shown for --text without --limit
+DEFAULT_TEXT_LIMIT = 20
+
+
 @dataclass
 class QueryOptions:
     """Options for query command."""
     depends_on: Optional[str] = None
     depended_by: Optional[str] = None
     concept: Optional[str] = None
+    text: Optional[str] = None
     stale: Optional[int] = None
     health: bool = False
     list_ids: bool = False
+    transitive: bool = False
+    max_depth: Optional[int] = None
+    limit: Optional[int] = None
     directory: Optional[Path] = None
     quiet: bool = False
     json_output: bool = False
+    ndjson: bool = False  # Stream NDJSON records instead of text
 
 
-def scan_docs_for_query(root: Path) -> Dict[str, dict]:
-    """Scan documentation files for query operations."""
-    from ontos.core.curation import load_ontosignore
-    
-    ignore_patterns = load_ontosignore(root)
-    files = scan_documents([root], skip_patterns=ignore_patterns)
-    
+def scan_docs_for_query(root: Path, index: Optional[DocumentIndex] = None) -> Dict[str, dict]:
+    """Scan documentation files for query operations.
+
+    Args:
+        root: Directory to scan
+        index: Existing document index to read from instead of scanning
+
+    Returns:
+        Query records keyed by document id
+    """
+    if index is None:
+        try:
+            project_root = find_project_root(root)
+        except FileNotFoundError:
+            project_root = root
+        index = load_document_index(project_root, dirs=[root])
+
     files_data = {}
-    for f in files:
+    for f, doc, _ in index.results:
+        if doc is None:
+            continue
         try:
-            fm = parse_frontmatter(str(f))
+            fm = doc.frontmatter
             if fm and fm.get('id'):
                 doc_id = str(fm['id']).strip()
                 files_data[doc_id] = {
@@ -69,10 +96,81 @@ def build_graph(files_data: Dict[str, dict]) -> Tuple[Dict[str, List[str]], Dict
     return dict(depends_on), dict(depended_by)
 
 
-def query_stale(files_data: Dict[str, dict], days: int) -> List[Tuple[str, int]]:
-    """Find documents not updated in N days."""
-    stale = []
+def query_transitive(
+    files_data: Dict[str, dict],
+    doc_id: str,
+    dependents: bool = False,
+    max_depth: Optional[int] = None,
+    project_root: Optional[Path] = None,
+    documents: Optional[DocumentIndex] = None,
+) -> List[str]:
+    """Everything a document depends on (or that depends on it), transitively.
+
+    Unlimited queries are answered from the reachability index, which is
+    persisted in .ontos/cache/ when ``project_root`` and ``documents`` are
+    given; a depth limit walks the graph breadth-first instead.
+
+    Args:
+        files_data: Query records from scan_docs_for_query
+        doc_id: Document to start from
+        dependents: Follow dependents instead of dependencies
+        max_depth: Only follow this many levels
+        project_root: Enables the persistent index in .ontos/cache/
+        documents: Full-scan document index ``files_data`` was read from;
+            its saved document cache identifies the graph
+
+    Returns:
+        Ids sorted by distance when depth-limited, otherwise by id
+    """
+    def edges():
+        return {i: data.get('depends_on', []) for i, data in files_data.items()}
+
+    if max_depth is not None:
+        graph = build_graph(files_data)[1] if dependents else edges()
+        return [i for i, _ in within_depth(graph, doc_id, max_depth)]
+
+    if project_root is None or documents is None:
+        index = build_reachability(edges())
+    else:
+        index = load_reachability_index(project_root, documents, edges)
+    related = index.depended_by(doc_id) if dependents else index.depends_on(doc_id)
+    return sorted(related)
+
+
+def query_stale(
+    files_data: Dict[str, dict],
+    days: int,
+    project_root: Optional[Path] = None,
+) -> List[Tuple[str, int]]:
+    """Find documents not updated in N days.
+
+    Args:
+        files_data: Query records from scan_docs_for_query
+        days: Age threshold in days
+        project_root: Enables the persistent git-date store in .ontos/cache/
+
+    Returns:
+        (id, age in days) pairs, oldest first
+    """
+    return sorted(iter_stale(files_data, days, project_root), key=lambda x: -x[1])
+
+
+def iter_stale(
+    files_data: Dict[str, dict],
+    days: int,
+    project_root: Optional[Path] = None,
+) -> Iterator[Tuple[str, int]]:
+    """Yield (id, age in days) of documents not updated in N days.
+
+    Documents are yielded in scan order as soon as their age is known;
+    see query_stale() for arguments.
+    """
     today = datetime.now()
+    # One git log pass for all documents instead of one subprocess each
+    git_mtime_provider = BulkGitMtimeProvider(
+        (data['filepath'] for data in files_data.values() if data.get('filepath')),
+        project_root=project_root,
+    )
     
     for doc_id, data in files_data.items():
         filepath = data.get('filepath', '')
@@ -97,9 +195,7 @@ def query_stale(files_data: Dict[str, dict], days: int) -> List[Tuple[str, int]]
                 last_modified = last_modified.replace(tzinfo=None)
             age = (today - last_modified).days
             if age > days:
-                stale.append((doc_id, age))
-    
-    return sorted(stale, key=lambda x: -x[1])
+                yield doc_id, age
 
 
 def query_health(files_data: Dict[str, dict]) -> dict:
@@ -180,46 +276,134 @@ def format_health(health: dict) -> str:
 
 
 def query_command(options: QueryOptions) -> Tuple[int, str]:
-    """Execute query command."""
-    output = OutputHandler(quiet=options.quiet)
+    """Execute query command.
+
+    With ``options.ndjson``, results are streamed as NDJSON records as they
+    are found instead of printed as text: "edge" records ({"from", "to",
+    "direct"}) for --depends-on/--depended-by, "document" records for
+    --concept, --text (with a score) and --list-ids (with a type), "stale"
+    records for --stale and one "health" record for --health, followed by
+    a "summary" record. Errors become "error" records.
+    """
+    stream = JsonOutputHandler() if options.ndjson else None
+    output = NdjsonOutputHandler(stream) if stream is not None else OutputHandler(quiet=options.quiet)
+    if (options.transitive or options.max_depth is not None) and not (
+        options.depends_on or options.depended_by
+    ):
+        output.error("--transitive and --max-depth apply to --depends-on and --depended-by")
+        return 1, "Invalid options"
+    if options.max_depth is not None and options.max_depth < 1:
+        output.error("--max-depth must be at least 1")
+        return 1, "Invalid options"
+    if options.limit is not None and not options.text:
+        output.error("--limit applies to --text")
+        return 1, "Invalid options"
+    if options.limit is not None and options.limit < 1:
+        output.error("--limit must be at least 1")
+        return 1, "Invalid options"
+
     root = find_project_root()
     search_dir = options.directory if options.directory else root
     
-    files_data = scan_docs_for_query(search_dir)
+    if options.directory:
+        index = load_document_index(root, dirs=[search_dir])
+    else:
+        index = load_document_index(root)
+    files_data = scan_docs_for_query(search_dir, index=index)
     if not files_data:
         output.error(f"No documents found in {search_dir}")
         return 1, "No documents found"
 
+    transitive = options.transitive or options.max_depth is not None
+    # A --dir scan sees only part of the graph; don't persist its index
+    full_index = None if options.directory else index
+    scope = ""
+    if options.max_depth is not None:
+        scope = f" (within {options.max_depth} levels)"
+    elif transitive:
+        scope = " (transitively)"
+
+    count = 0
     if options.depends_on:
-        results = files_data.get(options.depends_on, {}).get('depends_on', [])
-        if results:
-            output.info(f"{options.depends_on} depends on:")
+        if transitive:
+            results = query_transitive(
+                files_data, options.depends_on, max_depth=options.max_depth,
+                project_root=root, documents=full_index,
+            )
+        else:
+            results = files_data.get(options.depends_on, {}).get('depends_on', [])
+        count = len(results)
+        if stream is not None:
+            for r in results:
+                stream.record("edge", {"from": options.depends_on, "to": r, "direct": not transitive})
+        elif results:
+            output.info(f"{options.depends_on} depends on{scope}:")
             for r in results:
                 output.detail(f"→ {r}")
         else:
             output.warning(f"{options.depends_on} has no dependencies (or doesn't exist)")
             
     elif options.depended_by:
-        _, depended_by = build_graph(files_data)
-        results = depended_by.get(options.depended_by, [])
-        if results:
-            output.info(f"Documents that depend on {options.depended_by}:")
+        if transitive:
+            results = query_transitive(
+                files_data, options.depended_by, dependents=True,
+                max_depth=options.max_depth, project_root=root, documents=full_index,
+            )
+        else:
+            _, depended_by = build_graph(files_data)
+            results = depended_by.get(options.depended_by, [])
+        count = len(results)
+        if stream is not None:
+            for r in results:
+                stream.record("edge", {"from": r, "to": options.depended_by, "direct": not transitive})
+        elif results:
+            output.info(f"Documents that depend on {options.depended_by}{scope}:")
             for r in results:
                 output.detail(f"← {r}")
         else:
             output.warning(f"Nothing depends on {options.depended_by}")
             
     elif options.concept:
-        results = [doc_id for doc_id, data in files_data.items() if options.concept in data.get('concepts', [])]
-        if results:
+        # Like files_data, skip documents without a frontmatter id
+        results = [
+            doc.id for doc in index.with_concept(options.concept) if doc.frontmatter.get('id')
+        ]
+        count = len(results)
+        if stream is not None:
+            for r in results:
+                stream.record("document", {"id": r})
+        elif results:
             output.info(f"Documents with concept '{options.concept}':")
             for r in results:
                 output.detail(f"• {r}")
         else:
             output.warning(f"No documents tagged with '{options.concept}'")
+
+    elif options.text:
+        # A --dir scan sees only part of the project; keep its index in memory
+        search = refresh_search_index(root, index, use_cache=not options.directory)
+        limit = options.limit or DEFAULT_TEXT_LIMIT
+        results = search.search(options.text, limit=limit + 1)
+        count = min(len(results), limit)
+        if stream is not None:
+            for doc_id, score in results[:limit]:
+                stream.record("document", {"id": doc_id, "score": round(score, 4)})
+        elif results:
+            output.info(f"Documents matching '{options.text}':")
+            for doc_id, score in results[:limit]:
+                output.detail(f"• {doc_id} ({score:.2f})")
+            if len(results) > limit:
+                output.detail(f"(showing the best {limit}; use --limit for more)")
+        else:
+            output.warning(f"No documents match '{options.text}'")
             
+    elif options.stale is not None and stream is not None:
+        for doc_id, age in iter_stale(files_data, options.stale, project_root=root):
+            stream.record("stale", {"id": doc_id, "age_days": age})
+            count += 1
+
     elif options.stale is not None:
-        results = query_stale(files_data, options.stale)
+        results = query_stale(files_data, options.stale, project_root=root)
         if results:
             output.info(f"Documents not updated in {options.stale}+ days:")
             for doc_id, age in results:
@@ -229,12 +413,22 @@ def query_command(options: QueryOptions) -> Tuple[int, str]:
             
     elif options.health:
         health = query_health(files_data)
-        output.plain(format_health(health))
+        count = 1
+        if stream is not None:
+            stream.record("health", health)
+        else:
+            output.plain(format_health(health))
         
     elif options.list_ids:
         output.info("Document IDs:")
         for doc_id in sorted(files_data.keys()):
             doc_type = files_data[doc_id].get('type', '?')
-            output.detail(f"{doc_id} ({doc_type})")
-            
+            count += 1
+            if stream is not None:
+                stream.record("document", {"id": doc_id, "type": doc_type})
+            else:
+                output.detail(f"{doc_id} ({doc_type})")
+
+    if stream is not None:
+        stream.record("summary", {"status": "success", "results": count})
     return 0, "Query complete"
@@ -8,18 +8,10 @@ from ontos.core.frontmatter import parse_frontmatter
 from ontos.core.curation import create_scaffold, load_ontosignore, should_ignore
 from ontos.core.schema import serialize_frontmatter
 from ontos.core.context import SessionContext
-from ontos.io.files import find_project_root, scan_documents
+from ontos.io.config import load_scan_backend
+from ontos.io.files import DEFAULT_IGNORES, find_project_root, scan_documents
 from ontos.ui.output import OutputHandler
 
-# Hardcoded exclusion patterns for dependency directories.
-# These are always skipped regardless of .ontosignore presence.
-# Mirrors legacy _scripts/ontos_scaffold.py behavior.
-DEFAULT_IGNORES = [
-    'node_modules', '.venv', 'venv', 'vendor',
-    '__pycache__', '.pytest_cache', '.mypy_cache',
-    'dist', 'build', '.tox', '.eggs',
-]
-
 
 @dataclass
 class ScaffoldOptions:
@@ -42,6 +34,7 @@ def find_untagged_files(paths: Optional[List[Path]] = None, root: Optional[Path]
         List of paths needing scaffolding
     """
     root = root or find_project_root()
+    backend = load_scan_backend(root)
     if paths:
         # Filter only existing markdown files from provided paths
         search_paths = []
@@ -51,13 +44,18 @@ def find_untagged_files(paths: Optional[List[Path]] = None, root: Optional[Path]
             if p.is_file() and p.suffix == ".md":
                 search_paths.append(p)
             elif p.is_dir():
-                search_paths.extend(scan_documents([p], skip_patterns=load_ontosignore(root)))
+                search_paths.extend(scan_documents(
+                    [p], skip_patterns=load_ontosignore(root), ignore_dirs=DEFAULT_IGNORES,
+                    backend=backend,
+                ))
         # Deduplicate and sort
         files = sorted(list(set(search_paths)))
     else:
         # Default scan from root
         ignore_patterns = load_ontosignore(root)
-        files = scan_documents([root], skip_patterns=ignore_patterns)
+        files = scan_documents(
+            [root], skip_patterns=ignore_patterns, ignore_dirs=DEFAULT_IGNORES, backend=backend
+        )
 
     untagged = []
     for f in files:
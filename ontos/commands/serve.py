@@ -0,0 +1,204 @@
+"""
+Long-running `ontos serve` daemon.
+
+Keeps the project's document index (and its dependency graph) in memory
+and answers forwarded CLI invocations over a Unix domain socket, so
+repeated `ontos map` / `ontos query` calls skip config loading, scanning
+and parsing. The index is kept current by ontos.io.index.WarmIndex.
+
+The CLI forwards FORWARDED_COMMANDS to a running daemon automatically and
+runs them in-process when no daemon answers (or ONTOS_NO_DAEMON is set).
+"""
+
+import io
+import json
+import os
+import signal
+import threading
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ontos.ui.output import OutputHandler
+
+# Read-only commands that are answered by the daemon when one is running
+FORWARDED_COMMANDS = frozenset({"map", "query"})
+
+# Set to any non-empty value to always run commands in-process
+NO_DAEMON_ENV = "ONTOS_NO_DAEMON"
+
+
+@dataclass
+class ServeOptions:
+    """Options for serve command."""
+    stop: bool = False
+    status: bool = False
+    watch_backend: str = "auto"
+    quiet: bool = False
+    json_output: bool = False
+
+
+class ServeHandler:
+    """Answers daemon requests for one project.
+
+    Request kinds:
+        {"ping": true}: status of the daemon
+        {"shutdown": true}: stop serving
+        {"argv": [...], "cwd": "...", "root": "..."}: run an ontos command
+    """
+
+    def __init__(self, project_root: Path, warm):
+        self.project_root = project_root.resolve()
+        self.warm = warm
+        self.server = None
+        self.started = time.time()
+        self.requests = 0
+
+    def __call__(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if request.get("ping"):
+            return self.status()
+        if request.get("shutdown"):
+            if self.server is not None:
+                self.server.stop()
+            return {"status": "stopping"}
+        if "argv" in request:
+            return self.run(request)
+        return {"error": "Unknown request"}
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "status": "running",
+            "pid": os.getpid(),
+            "root": str(self.project_root),
+            "documents": len(self.warm.index.paths),
+            "requests": self.requests,
+            "uptime": round(time.time() - self.started, 1),
+        }
+
+    def run(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a forwarded CLI invocation with stdout/stderr captured."""
+        from ontos import cli
+
+        if Path(request.get("root", "")).resolve() != self.project_root:
+            return {"error": "Request is for a different project"}
+        argv = request["argv"]
+
+        self.requests += 1
+        stdout, stderr = io.StringIO(), io.StringIO()
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(request.get("cwd") or self.project_root)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    exit_code = cli.main(argv, forward=False)
+                except SystemExit as e:  # argparse errors and --help
+                    exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        finally:
+            os.chdir(previous_cwd)
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+
+def forward_to_daemon(command: Optional[str], argv: List[str]) -> Optional[Dict[str, Any]]:
+    """Run a CLI invocation on this project's daemon, if one is running.
+
+    Args:
+        command: Parsed subcommand name
+        argv: Arguments as given on the command line (without the program)
+
+    Returns:
+        Response with exit_code/stdout/stderr, or None to run in-process
+    """
+    if command not in FORWARDED_COMMANDS or os.environ.get(NO_DAEMON_ENV):
+        return None
+
+    from ontos.io.daemon import send_request, socket_path
+    from ontos.io.files import find_project_root
+
+    try:
+        root = find_project_root()
+    except FileNotFoundError:
+        return None
+    path = socket_path(root)
+    if not path.exists():
+        return None
+
+    response = send_request(path, {"argv": argv, "cwd": os.getcwd(), "root": str(root)})
+    if response is None or "exit_code" not in response:
+        return None
+    return response
+
+
+def serve_command(options: ServeOptions) -> int:
+    """Execute serve command.
+
+    Runs the daemon in the foreground until interrupted, or talks to a
+    running one (--status, --stop).
+
+    Returns:
+        Exit code (0 success, 1 error or no daemon running)
+    """
+    from ontos.io.daemon import DaemonServer, send_request, socket_path
+    from ontos.io.files import find_project_root
+    from ontos.io.index import WarmIndex
+
+    output = OutputHandler(quiet=options.quiet)
+    try:
+        root = find_project_root()
+    except FileNotFoundError as e:
+        output.error(str(e))
+        return 1
+    path = socket_path(root)
+
+    if options.status or options.stop:
+        request = {"shutdown": True} if options.stop else {"ping": True}
+        response = send_request(path, request, timeout=5)
+        if response is None:
+            if options.json_output:
+                print(json.dumps({"status": "not running"}))
+            else:
+                output.warning("No daemon running for this project")
+            return 1
+        if options.json_output:
+            print(json.dumps(response))
+        elif options.stop:
+            output.success("Daemon stopped")
+        else:
+            output.info(f"Daemon running (pid {response['pid']}) for {response['root']}")
+            output.detail(f"Documents: {response['documents']}")
+            output.detail(f"Requests served: {response['requests']}")
+        return 0
+
+    started = time.perf_counter()
+    warm = WarmIndex(root, watch_backend=options.watch_backend)
+    handler = ServeHandler(root, warm)
+    try:
+        server = DaemonServer(path, handler)
+    except (FileExistsError, OSError) as e:
+        warm.close()
+        output.error(f"Cannot start daemon: {e}")
+        return 1
+    handler.server = server
+    warm.register()
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: server.stop())
+
+    output.success(
+        f"Serving {len(warm.index.paths)} documents on {path} "
+        f"(loaded in {time.perf_counter() - started:.2f}s)"
+    )
+    output.detail("Press Ctrl-C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        warm.close()
+    return 0
@@ -4,15 +4,19 @@ import re
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Iterator, Optional, Tuple, List
 
 from ontos.core.frontmatter import parse_frontmatter
 from ontos.core.staleness import (
     normalize_describes,
+    parse_describes_verified,
     check_staleness,
 )
 from ontos.core.context import SessionContext
-from ontos.io.files import find_project_root, scan_documents
+from ontos.core.index import DocumentIndex
+from ontos.io.files import find_project_root
+from ontos.io.index import load_document_index
+from ontos.ui.json_output import JsonOutputHandler, NdjsonOutputHandler
 from ontos.ui.output import OutputHandler
 
 
@@ -24,40 +28,45 @@ class VerifyOptions:
     date: Optional[str] = None  # YYYY-MM-DD format
     quiet: bool = False
     json_output: bool = False
+    ndjson: bool = False  # Stream NDJSON records instead of prompting
 
 
-def find_stale_documents_list() -> List[dict]:
-    """Find all documents with stale describes fields using new architecture symbols."""
-    from ontos.core.curation import load_ontosignore
-    
-    root = find_project_root()
-    ignore_patterns = load_ontosignore(root)
-    files = scan_documents([root], skip_patterns=ignore_patterns) # Should probably use a more targeted scan if possible
-    
+def find_stale_documents_list(index: Optional[DocumentIndex] = None) -> List[dict]:
+    """Find all documents with stale describes fields.
+
+    Args:
+        index: Existing document index; the project is scanned if None
+
+    Returns:
+        List of dicts with doc_id, filepath and staleness info
+    """
+    return list(iter_stale_documents(index))
+
+
+def iter_stale_documents(index: Optional[DocumentIndex] = None) -> Iterator[dict]:
+    """Yield documents with stale describes fields as they are checked.
+
+    See find_stale_documents_list() for arguments and items.
+    """
+    if index is None:
+        index = load_document_index(find_project_root())
+
     # Build ID to path mapping and gather data
     files_data = {}
     id_to_path = {}
-    
-    for f in files:
-        try:
-            # We need raw frontmatter for fields
-            # Better to use a unified document loader if available, 
-            # but for now we'll match legacy script logic.
-            fm = parse_frontmatter(str(f))
-            if not fm:
-                continue
-            
-            doc_id = fm.get('id', f.stem)
-            id_to_path[doc_id] = str(f)
-            files_data[doc_id] = {
-                'filepath': str(f),
-                'describes': normalize_describes(fm.get('describes')),
-                'describes_verified': fm.get('describes_verified')
-            }
-        except Exception:
+
+    for f, doc, _ in index.results:
+        if doc is None or not doc.frontmatter:
             continue
-            
-    stale_docs = []
+        fm = doc.frontmatter
+        doc_id = fm.get('id', f.stem)
+        id_to_path[doc_id] = str(f)
+        files_data[doc_id] = {
+            'filepath': str(f),
+            'describes': normalize_describes(fm.get('describes')),
+            'describes_verified': parse_describes_verified(fm.get('describes_verified'))
+        }
+
     for doc_id, data in files_data.items():
         if not data['describes']:
             continue
@@ -71,13 +80,11 @@ def find_stale_documents_list() -> List[dict]:
         )
         
         if staleness and staleness.is_stale():
-            stale_docs.append({
+            yield {
                 'doc_id': doc_id,
                 'filepath': data['filepath'],
                 'staleness': staleness
-            })
-            
-    return stale_docs
+            }
 
 
 def update_describes_verified(
@@ -201,9 +208,37 @@ def verify_all_interactive(verify_date: date, output: OutputHandler) -> int:
     return 0
 
 
+def stream_stale_documents(stream: JsonOutputHandler) -> int:
+    """Emit a "stale" record per stale document, then a "summary" record.
+
+    Returns:
+        Exit code (always 0)
+    """
+    count = 0
+    for doc in iter_stale_documents():
+        staleness = doc['staleness']
+        stream.record("stale", {
+            "id": doc['doc_id'],
+            "path": doc['filepath'],
+            "describes": staleness.describes,
+            "verified": staleness.verified_date,
+            "stale_atoms": [{"id": a, "changed": d} for a, d in staleness.stale_atoms],
+        })
+        count += 1
+    stream.record("summary", {"status": "success", "stale": count})
+    return 0
+
+
 def verify_command(options: VerifyOptions) -> Tuple[int, str]:
-    """Execute verify command."""
-    output = OutputHandler(quiet=options.quiet)
+    """Execute verify command.
+
+    With ``options.ndjson``, verifying a path emits a "verified" record
+    and a "summary" record; without a path (with or without --all) stale
+    documents are streamed as "stale" records instead of prompted for.
+    Errors become "error" records.
+    """
+    stream = JsonOutputHandler() if options.ndjson else None
+    output = NdjsonOutputHandler(stream) if stream is not None else OutputHandler(quiet=options.quiet)
     
     # Parse date
     verify_date = date.today()
@@ -232,15 +267,24 @@ def verify_command(options: VerifyOptions) -> Tuple[int, str]:
         describes = normalize_describes(fm.get('describes'))
         if not describes:
             output.warning(f"{options.path} has no describes field, nothing to verify")
+            if stream is not None:
+                stream.record("summary", {"status": "success", "verified": 0})
             return 0, "Nothing to verify"
             
         if update_describes_verified(options.path, verify_date, ctx, output):
             ctx.commit()
             output.success(f"Updated describes_verified to {verify_date}")
+            if stream is not None:
+                stream.record("verified", {"path": str(options.path), "date": verify_date})
+                stream.record("summary", {"status": "success", "verified": 1})
             return 0, "Success"
         else:
             return 1, "Update failed"
 
+    elif stream is not None:
+        # Prompts cannot be answered from a stream: list stale documents
+        return stream_stale_documents(stream), "Stale documents listed"
+
     elif options.all:
         # Interactive all mode
         result = verify_all_interactive(verify_date, output)
@@ -1,12 +1,13 @@
-"""Document caching with mtime-based invalidation.
+"""Document caching with stat-based invalidation.
 
 PURE: This module contains no I/O operations. Callers must provide
-mtime values from their own file operations.
+mtime (and optionally size/inode) values from their own file operations.
+Persistence lives in ontos.io.cache.
 """
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 
 @dataclass
@@ -14,6 +15,18 @@ class CacheEntry:
     """Single cache entry with metadata."""
     mtime: float
     data: Any
+    size: Optional[int] = None
+    inode: Optional[int] = None
+
+    def matches(self, mtime: float, size: Optional[int] = None, inode: Optional[int] = None) -> bool:
+        """Check whether the entry is still valid for the given file stat."""
+        if mtime != self.mtime:
+            return False
+        if size is not None and self.size is not None and size != self.size:
+            return False
+        if inode is not None and self.inode is not None and inode != self.inode:
+            return False
+        return True
 
 
 @dataclass
@@ -31,17 +44,29 @@ class DocumentCache:
         data = parse_document(path)
         cache.set(path, data, current_mtime)
         return data
+
+    Size and inode are optional extra keys; when supplied on both ``set``
+    and ``get`` a mismatch invalidates the entry even if mtime is unchanged.
     """
     _entries: Dict[Path, CacheEntry] = field(default_factory=dict)
     _hits: int = 0
     _misses: int = 0
+    _dirty: bool = False
 
-    def get(self, path: Path, current_mtime: float) -> Optional[Any]:
-        """Get cached document if mtime unchanged.
+    def get(
+        self,
+        path: Path,
+        current_mtime: float,
+        size: Optional[int] = None,
+        inode: Optional[int] = None,
+    ) -> Optional[Any]:
+        """Get cached document if the file is unchanged.
 
         Args:
             path: Resolved file path.
             current_mtime: Current file modification time.
+            size: Current file size in bytes (optional).
+            inode: Current file inode number (optional).
 
         Returns:
             Cached data if valid, None if cache miss or invalidated.
@@ -53,37 +78,77 @@ class DocumentCache:
             return None
 
         entry = self._entries[path]
-        if current_mtime == entry.mtime:
+        if entry.matches(current_mtime, size, inode):
             self._hits += 1
             return entry.data
 
         # Invalidated
         del self._entries[path]
+        self._dirty = True
         self._misses += 1
         return None
 
-    def set(self, path: Path, data: Any, mtime: float) -> None:
+    def set(
+        self,
+        path: Path,
+        data: Any,
+        mtime: float,
+        size: Optional[int] = None,
+        inode: Optional[int] = None,
+    ) -> None:
         """Store document in cache.
 
         Args:
             path: Resolved file path.
             data: Parsed document data.
             mtime: File modification time at parse time.
+            size: File size in bytes at parse time (optional).
+            inode: File inode number at parse time (optional).
         """
         path = path.resolve()
-        self._entries[path] = CacheEntry(mtime=mtime, data=data)
+        self._entries[path] = CacheEntry(mtime=mtime, data=data, size=size, inode=inode)
+        self._dirty = True
 
     def invalidate(self, path: Path) -> None:
         """Remove specific path from cache."""
         path = path.resolve()
-        self._entries.pop(path, None)
+        if self._entries.pop(path, None) is not None:
+            self._dirty = True
+
+    def retain(self, paths: Iterable[Path]) -> None:
+        """Drop every entry whose path is not in ``paths``.
+
+        Used after a full scan so deleted files do not linger in a
+        persisted cache.
+        """
+        keep = {p.resolve() for p in paths}
+        stale = [p for p in self._entries if p not in keep]
+        for p in stale:
+            del self._entries[p]
+        if stale:
+            self._dirty = True
 
     def clear(self) -> None:
         """Clear entire cache."""
+        if self._entries:
+            self._dirty = True
         self._entries.clear()
         self._hits = 0
         self._misses = 0
 
+    def items(self):
+        """Iterate over (path, CacheEntry) pairs."""
+        return self._entries.items()
+
+    @property
+    def dirty(self) -> bool:
+        """True if entries changed since load (or the last ``mark_clean``)."""
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        """Reset the dirty flag after the cache has been persisted."""
+        self._dirty = False
+
     @property
     def stats(self) -> dict:
         """Return cache statistics."""
@@ -0,0 +1,388 @@
+"""
+Compact dependency graph for large repositories.
+
+CompactGraph holds the same relationships as DependencyGraph, with document
+ids interned to integer indices and both edge directions stored in CSR
+form (compressed sparse rows): an offsets array and a targets array of
+C ints (``array('i')``). Each id string is referenced once, and an edge
+costs 8 bytes (4 per direction) instead of two list slots plus a dict entry.
+
+It answers the same queries as DependencyGraph: ``nodes``, ``edges``,
+``reverse_edges`` and ``broken`` are read-only mappings, and cycles(),
+cycle_groups(), orphans(), depths() and upstream() work the same way, so
+the validators and renderers (and detect_cycles() etc. in
+ontos.core.graph) accept either. It is a snapshot: to apply incremental
+edits, keep a DependencyGraph.
+
+NumPy, when installed, builds the reverse adjacency in vectorized form;
+the stored arrays are ``array('i')`` either way.
+"""
+
+from __future__ import annotations
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ontos.core.graph import GraphNode, broken_link_errors
+from ontos.core.types import DocumentData, ValidationError
+
+
+def _numpy():
+    """The numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _reverse_csr(out_start: array, out_target: array, size: int) -> Tuple[array, array]:
+    """Reverse adjacency of a CSR graph, sources in ascending order."""
+    np = _numpy()
+    if np is not None and len(out_target):
+        return _reverse_csr_numpy(np, out_start, out_target, size)
+    return _reverse_csr_python(out_start, out_target, size)
+
+
+def _reverse_csr_python(out_start: array, out_target: array, size: int) -> Tuple[array, array]:
+    # Counting sort by target; sources are visited in order, so each
+    # target's sources stay in ascending order
+    in_start = array("i", bytes(4 * (size + 1)))
+    for target in out_target:
+        in_start[target + 1] += 1
+    for i in range(size):
+        in_start[i + 1] += in_start[i]
+    fill = array("i", in_start)
+    in_source = array("i", bytes(4 * len(out_target)))
+    for source in range(len(out_start) - 1):
+        for k in range(out_start[source], out_start[source + 1]):
+            target = out_target[k]
+            in_source[fill[target]] = source
+            fill[target] += 1
+    return in_start, in_source
+
+
+def _reverse_csr_numpy(np, out_start: array, out_target: array, size: int) -> Tuple[array, array]:
+    starts = np.frombuffer(out_start, dtype=np.intc)
+    targets = np.frombuffer(out_target, dtype=np.intc)
+    sources = np.repeat(np.arange(len(starts) - 1, dtype=np.intc), np.diff(starts))
+    order = np.argsort(targets, kind="stable")
+    in_start = np.zeros(size + 1, dtype=np.intc)
+    np.cumsum(np.bincount(targets, minlength=size), out=in_start[1:])
+    return array("i", in_start.tobytes()), array("i", sources[order].tobytes())
+
+
+class _NodesView(Mapping):
+    """doc_id -> GraphNode, built on access."""
+
+    def __init__(self, graph: CompactGraph):
+        self._graph = graph
+
+    def __getitem__(self, doc_id: str) -> GraphNode:
+        g = self._graph
+        i = g._node_index(doc_id)
+        if i is None:
+            raise KeyError(doc_id)
+        return GraphNode(doc_id, g.types[g.type_codes[i]], g.filepaths[i], g._deps(i))
+
+    def __contains__(self, doc_id: object) -> bool:
+        return self._graph._node_index(doc_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph.ids[:self._graph.node_count])
+
+    def __len__(self) -> int:
+        return self._graph.node_count
+
+
+class _EdgesView(_NodesView):
+    """doc_id -> depends_on (including missing ids), as in DependencyGraph.edges."""
+
+    def __getitem__(self, doc_id: str) -> List[str]:
+        i = self._graph._node_index(doc_id)
+        if i is None:
+            raise KeyError(doc_id)
+        return self._graph._deps(i)
+
+
+class _ReverseEdgesView(Mapping):
+    """id -> ids depending on it, for every referenced id (existing or not)."""
+
+    def __init__(self, graph: CompactGraph):
+        self._graph = graph
+
+    def __getitem__(self, doc_id: str) -> List[str]:
+        g = self._graph
+        i = g.index.get(doc_id)
+        if i is None or g.in_start[i] == g.in_start[i + 1]:
+            raise KeyError(doc_id)
+        return g._dependents(i)
+
+    def __iter__(self) -> Iterator[str]:
+        g = self._graph
+        start = g.in_start
+        return (doc_id for i, doc_id in enumerate(g.ids) if start[i] != start[i + 1])
+
+    def __len__(self) -> int:
+        start = self._graph.in_start
+        return sum(1 for i in range(len(start) - 1) if start[i] != start[i + 1])
+
+
+class CompactGraph:
+    """Read-only dependency graph stored as integer CSR arrays.
+
+    Indices ``0 .. node_count - 1`` are documents, in insertion order;
+    ids that are depended on but have no document follow them.
+
+    Attributes:
+        ids: Id for each index
+        index: Index for each id
+        node_count: Number of documents
+        types: Distinct document types; type_codes[i] indexes into it
+        filepaths: File path for each document
+        out_start, out_target: Forward CSR; the dependencies of document
+            ``i`` are ``out_target[out_start[i]:out_start[i + 1]]``
+        in_start, in_source: Reverse CSR over all ids; dependents are in
+            document order
+        broken: doc_id -> dependencies on ids that have no document
+    """
+
+    def __init__(self, nodes: Iterable[Tuple[str, str, str, List[str]]]):
+        """Build from ``(doc_id, doc_type, filepath, depends_on)`` tuples.
+
+        A repeated doc_id replaces the earlier entry, as in
+        DependencyGraph.add_node().
+        """
+        records: Dict[str, Tuple[str, str, List[str]]] = {}
+        for doc_id, doc_type, filepath, depends_on in nodes:
+            records[doc_id] = (doc_type, filepath, depends_on)
+
+        self.ids: List[str] = list(records)
+        self.index: Dict[str, int] = {doc_id: i for i, doc_id in enumerate(self.ids)}
+        self.node_count = len(self.ids)
+        self.types: List[str] = []
+        self.type_codes = array("H")
+        self.filepaths: List[str] = []
+        self.out_start = array("i", [0])
+        self.out_target = array("i")
+        self.broken: Dict[str, List[str]] = {}
+
+        type_code: Dict[str, int] = {}
+        for doc_id, (doc_type, filepath, depends_on) in records.items():
+            code = type_code.get(doc_type)
+            if code is None:
+                code = type_code[doc_type] = len(self.types)
+                self.types.append(doc_type)
+            self.type_codes.append(code)
+            self.filepaths.append(filepath)
+            for dep in depends_on:
+                j = self.index.get(dep)
+                if j is None:
+                    j = self.index[dep] = len(self.ids)
+                    self.ids.append(dep)
+                if j >= self.node_count:
+                    self.broken.setdefault(doc_id, []).append(dep)
+                self.out_target.append(j)
+            self.out_start.append(len(self.out_target))
+
+        self.in_start, self.in_source = _reverse_csr(self.out_start, self.out_target, len(self.ids))
+        self.nodes: Mapping = _NodesView(self)
+        self.edges: Mapping = _EdgesView(self)
+        self.reverse_edges: Mapping = _ReverseEdgesView(self)
+        self._cycles: Optional[List[List[int]]] = None
+        self._depths: Optional[array] = None
+
+    @classmethod
+    def from_graph(cls, graph) -> CompactGraph:
+        """Compact copy of a DependencyGraph."""
+        return cls(
+            (doc_id, node.doc_type, node.filepath, graph.edges.get(doc_id, ()))
+            for doc_id, node in graph.nodes.items()
+        )
+
+    # -------------------------------------------------------------------------
+    # Integer helpers
+    # -------------------------------------------------------------------------
+
+    def _node_index(self, doc_id: object) -> Optional[int]:
+        i = self.index.get(doc_id)  # type: ignore[arg-type]
+        return i if i is not None and i < self.node_count else None
+
+    def _deps(self, i: int) -> List[str]:
+        ids = self.ids
+        return [ids[j] for j in self.out_target[self.out_start[i]:self.out_start[i + 1]]]
+
+    def _dependents(self, i: int) -> List[str]:
+        ids = self.ids
+        return [ids[j] for j in self.in_source[self.in_start[i]:self.in_start[i + 1]]]
+
+    def _components(self) -> List[List[int]]:
+        """Strongly connected components over documents, dependencies first.
+
+        Same algorithm as ontos.core.graph.strongly_connected_components(),
+        on integer arrays.
+        """
+        n = self.node_count
+        start, target = self.out_start, self.out_target
+        done = n
+        index = array("i", [-1]) * n  # DFS number, or ``done`` once assigned
+        low = array("i", bytes(4 * n))
+        counter = 0
+        stack: List[int] = []
+        components: List[List[int]] = []
+
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            work = [(root, iter(target[start[root]:start[root + 1]]))]
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep >= n:
+                        continue
+                    i = index[dep]
+                    if i < 0:
+                        index[dep] = low[dep] = counter
+                        counter += 1
+                        stack.append(dep)
+                        work.append((dep, iter(target[start[dep]:start[dep + 1]])))
+                        break
+                    if i < low[node]:
+                        low[node] = i
+                else:
+                    work.pop()
+                    node_low = low[node]
+                    if work:
+                        parent = work[-1][0]
+                        if node_low < low[parent]:
+                            low[parent] = node_low
+                    if node_low != index[node]:
+                        continue
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        index[member] = done
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def _is_cycle(self, component: List[int]) -> bool:
+        node = component[0]
+        return len(component) > 1 or node in self.out_target[self.out_start[node]:self.out_start[node + 1]]
+
+    def _cycle_path(self, group: List[int]) -> List[int]:
+        """Shortest cycle from the group's first member back to itself."""
+        begin = group[0]
+        members = set(group)
+        start, target = self.out_start, self.out_target
+        parent: Dict[int, int] = {}
+        frontier = [begin]
+        while frontier:
+            following = []
+            for node in frontier:
+                for dep in target[start[node]:start[node + 1]]:
+                    if dep == begin:
+                        path = [node]
+                        while path[-1] != begin:
+                            path.append(parent[path[-1]])
+                        return path[::-1] + [begin]
+                    if dep in members and dep not in parent:
+                        parent[dep] = node
+                        following.append(dep)
+            frontier = following
+        return group + [begin]  # Unreachable for a strongly connected group
+
+    # -------------------------------------------------------------------------
+    # Queries (same results as DependencyGraph)
+    # -------------------------------------------------------------------------
+
+    def upstream(self, doc_id: str, include_self: bool = False) -> List[str]:
+        """Ids that depend on ``doc_id``, directly or transitively."""
+        root = self.index.get(doc_id)
+        if root is None:
+            return [doc_id] if include_self else []
+        start, source = self.in_start, self.in_source
+        seen = {root}
+        order = [root] if include_self else []
+        frontier = [root]
+        while frontier:
+            node = frontier.pop()
+            for dependent in source[start[node]:start[node + 1]]:
+                if dependent not in seen:
+                    seen.add(dependent)
+                    order.append(dependent)
+                    frontier.append(dependent)
+        return [self.ids[i] for i in order]
+
+    def cycle_groups(self) -> List[List[str]]:
+        """Every set of mutually dependent documents, members and groups in node order."""
+        if self._cycles is None:
+            groups = [sorted(c) for c in self._components() if self._is_cycle(c)]
+            self._cycles = sorted(groups)
+        return [[self.ids[i] for i in group] for group in self._cycles]
+
+    def cycles(self) -> List[List[str]]:
+        """One cycle per cycle group: a list of doc_ids ending where it starts."""
+        self.cycle_groups()
+        return [[self.ids[i] for i in self._cycle_path(group)] for group in self._cycles]
+
+    def orphans(self, allowed_orphan_types: Set[str]) -> List[str]:
+        """Documents nothing depends on, except those of allowed types."""
+        start = self.in_start
+        allowed = {code for code, t in enumerate(self.types) if t in allowed_orphan_types}
+        return [
+            self.ids[i] for i in range(self.node_count)
+            if start[i] == start[i + 1] and self.type_codes[i] not in allowed
+        ]
+
+    def depths(self) -> Dict[str, int]:
+        """Dependency depth of each node, in node order (see DependencyGraph.depths())."""
+        if self._depths is None:
+            n = self.node_count
+            start, target = self.out_start, self.out_target
+            depth = array("i", bytes(4 * n))
+            for component in self._components():
+                if len(component) == 1:
+                    node = component[0]
+                    s, e = start[node], start[node + 1]
+                    if s == e:
+                        continue  # Leaf: depth 0
+                    below = [depth[d] for d in target[s:e] if d < n and d != node]
+                    depth[node] = 1 + max(below, default=0)
+                    continue
+                members = set(component)
+                below = [
+                    depth[d] for node in component for d in target[start[node]:start[node + 1]]
+                    if d < n and d not in members
+                ]
+                value = 1 + max(below, default=0)
+                for node in component:
+                    depth[node] = value
+            self._depths = depth
+        return dict(zip(self.ids[:self.node_count], self._depths))
+
+
+def build_compact_graph(docs: Dict[str, DocumentData]) -> Tuple[CompactGraph, List[ValidationError]]:
+    """Build a CompactGraph from documents (see ontos.core.graph.build_graph()).
+
+    Args:
+        docs: Dictionary mapping doc_id to DocumentData
+
+    Returns:
+        Tuple of (graph, broken link errors)
+    """
+    graph = CompactGraph(
+        (
+            doc_id,
+            doc.type.value if hasattr(doc.type, 'value') else str(doc.type),
+            str(doc.filepath),
+            doc.depends_on if hasattr(doc, 'depends_on') else [],
+        )
+        for doc_id, doc in docs.items()
+    )
+    return graph, broken_link_errors(graph)
@@ -51,6 +51,7 @@ class PathsConfig:
 class ScanningConfig:
     """[scanning] section."""
     skip_patterns: List[str] = field(default_factory=lambda: ["_template.md", "archive/*"])
+    backend: str = "filesystem"  # "filesystem" or "git" (git index, filesystem fallback)
 
 
 @dataclass
@@ -77,6 +78,16 @@ class HooksConfig:
     strict: bool = False  # When True, hooks block on validation errors
 
 
+@dataclass
+class TokensConfig:
+    """[tokens] section."""
+    counter: str = "heuristic"  # "heuristic" (~4 characters per token) or "bpe"
+    # tiktoken-format rank file for "bpe", e.g. cl100k_base.tiktoken for counts
+    # that match that model's tokenizer; empty = the bundled vocabulary, which
+    # is trained on this repo and matches no model's tokenizer
+    vocabulary: str = ""
+
+
 @dataclass
 class OntosConfig:
     """Root configuration object."""
@@ -86,6 +97,7 @@ class OntosConfig:
     validation: ValidationConfig = field(default_factory=ValidationConfig)
     workflow: WorkflowConfig = field(default_factory=WorkflowConfig)
     hooks: HooksConfig = field(default_factory=HooksConfig)
+    tokens: TokensConfig = field(default_factory=TokensConfig)
 
 
 def default_config() -> OntosConfig:
@@ -117,6 +129,9 @@ def _validate_types(data: dict) -> None:
         ("workflow", "log_retention_count"): int,
         ("hooks", "pre_push"): bool,
         ("hooks", "pre_commit"): bool,
+        ("scanning", "backend"): str,
+        ("tokens", "counter"): str,
+        ("tokens", "vocabulary"): str,
     }
 
     for (section, key), expected_type in type_requirements.items():
@@ -128,6 +143,18 @@ def _validate_types(data: dict) -> None:
                     f"got {type(value).__name__}"
                 )
 
+    backend = data.get("scanning", {}).get("backend")
+    if backend is not None and backend not in ("filesystem", "git"):
+        raise ConfigError(
+            f"scanning.backend must be 'filesystem' or 'git', got '{backend}'"
+        )
+
+    counter = data.get("tokens", {}).get("counter")
+    if counter is not None and counter not in ("bpe", "heuristic"):
+        raise ConfigError(
+            f"tokens.counter must be 'bpe' or 'heuristic', got '{counter}'"
+        )
+
 
 def dict_to_config(data: dict, repo_root: Optional[Path] = None) -> OntosConfig:
     """Convert dict from TOML to config dataclass."""
@@ -151,6 +178,7 @@ def dict_to_config(data: dict, repo_root: Optional[Path] = None) -> OntosConfig:
     validation = ValidationConfig(**data.get("validation", {}))
     workflow = WorkflowConfig(**data.get("workflow", {}))
     hooks = HooksConfig(**data.get("hooks", {}))
+    tokens = TokensConfig(**data.get("tokens", {}))
 
     return OntosConfig(
         ontos=ontos,
@@ -159,6 +187,7 @@ def dict_to_config(data: dict, repo_root: Optional[Path] = None) -> OntosConfig:
         validation=validation,
         workflow=workflow,
         hooks=hooks,
+        tokens=tokens,
     )
 
 
@@ -229,6 +258,9 @@ def get_git_last_modified(
         from ontos.io.git import get_file_mtime
         modified = get_git_last_modified(path, git_mtime_provider=get_file_mtime)
 
+    When checking many files, pass ontos.io.git.BulkGitMtimeProvider(paths)
+    instead; it answers every path from a single git log pass.
+
     Args:
         filepath: Path to the file to check.
         git_mtime_provider: Optional callback that takes a Path and returns
@@ -5,6 +5,7 @@ YAML frontmatter in Ontos documents.
 
 PURE FUNCTIONS (Phase 2 refactor):
     - parse_frontmatter() - accepts optional yaml_parser callback
+    - parse_flat_yaml() - exact parser for flat frontmatter, no PyYAML
     - normalize_depends_on() - pure string/list normalization
     - normalize_type() - pure string normalization
     - load_common_concepts() - file reading only
@@ -17,7 +18,8 @@ The caller (commands layer) provides the IO callback.
 
 import os
 import re
-from typing import Optional, List, Dict, Any, Callable
+from datetime import date
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
 
 def parse_frontmatter(
@@ -43,8 +45,7 @@ def parse_frontmatter(
         Dictionary of frontmatter fields, or None if no valid frontmatter.
     """
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+        content = _read_frontmatter_block(filepath)
     except (IOError, OSError):
         return None
 
@@ -76,6 +77,246 @@ def parse_frontmatter(
         return None
 
 
+def _read_frontmatter_block(filepath: str) -> str:
+    """Read a file only as far as its closing frontmatter delimiter.
+
+    The result splits on '---' exactly like the full file would, so
+    callers only ever see the frontmatter, never a multi-megabyte body.
+    Files without leading frontmatter stop after the first chunk.
+
+    Args:
+        filepath: Path to the markdown file.
+
+    Returns:
+        File prefix containing the frontmatter block ("" if there is none),
+        or the whole file if the header could not be isolated cheaply.
+    """
+    from pathlib import Path
+    from ontos.io.files import read_frontmatter_header
+
+    try:
+        header = read_frontmatter_header(Path(filepath), lenient=False)
+    except UnicodeDecodeError:
+        header = None
+    if header is not None:
+        return header[0]
+    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+# =============================================================================
+# FLAT YAML
+# =============================================================================
+#
+# Ontos frontmatter is almost always flat: top-level ``key: scalar`` pairs,
+# single-line flow lists and block lists of scalars. parse_flat_yaml handles
+# exactly that subset, resolving scalars the way PyYAML's SafeLoader (YAML
+# 1.1) does, and returns None for anything else so the caller can hand the
+# text to a full YAML parser.
+
+_FLAT_KEY_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*) *:(?: +(.*))?')
+_FLAT_ITEM_RE = re.compile(r'( *)-(?: +(.*))?')
+_FLAT_INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9]*)')
+_FLAT_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+_FLAT_NULLS = frozenset({'~', 'null', 'Null', 'NULL'})
+_FLAT_BOOLS = {
+    **dict.fromkeys(('yes', 'Yes', 'YES', 'true', 'True', 'TRUE', 'on', 'On', 'ON'), True),
+    **dict.fromkeys(('no', 'No', 'NO', 'false', 'False', 'FALSE', 'off', 'Off', 'OFF'), False),
+}
+
+# Plain scalars starting with these may be numbers, timestamps, merge keys
+# or YAML syntax this parser does not implement.
+_FLAT_BAIL_START = frozenset('-+.0123456789<=?:,[]{}#&*!|>\'"%@`')
+
+# Characters PyYAML rejects, or treats as line breaks/markers (tabs, CR,
+# NEL, LS, PS, BOM); their presence sends the text to PyYAML.
+_FLAT_UNSUPPORTED_RE = re.compile(
+    '[^\n\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]'
+)
+
+
+class _NotFlat(Exception):
+    """Raised internally when content falls outside the flat subset."""
+
+
+def parse_flat_yaml(content: str) -> Optional[Dict[str, Any]]:
+    """Parse flat YAML frontmatter exactly as PyYAML's safe loader would.
+
+    Supported: ``key: scalar``, ``key: [a, b]`` on one line, and block
+    lists of scalars under an empty key. Scalars may be plain, single-quoted
+    or double-quoted without escapes; plain scalars resolve to None, bool,
+    int, date or str using the YAML 1.1 rules.
+
+    Args:
+        content: YAML content string.
+
+    Returns:
+        Dictionary identical to yaml.safe_load's result, or None if the
+        content uses anything outside the supported subset.
+    """
+    if _FLAT_UNSUPPORTED_RE.search(content):
+        return None
+    try:
+        return _parse_flat_lines(content.split('\n'))
+    except _NotFlat:
+        return None
+
+
+def _parse_flat_lines(lines: List[str]) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    list_key = None     # Key whose block list is being read
+    list_indent = None  # Indentation of its "- " items, once known
+
+    for line in lines:
+        stripped = line.lstrip(' ')
+        if not stripped.rstrip(' ') or stripped.startswith('#'):
+            continue
+
+        if list_key is not None:
+            m = _FLAT_ITEM_RE.fullmatch(line)
+            if m and list_indent in (None, len(m.group(1))):
+                list_indent = len(m.group(1))
+                result[list_key].append(_flat_block_scalar(m.group(2) or ''))
+                continue
+            if not result[list_key]:
+                result[list_key] = None
+            list_key = None
+
+        if line[0] == ' ' or line.startswith(('---', '...')):
+            raise _NotFlat  # Nesting, continuation lines or document markers
+
+        m = _FLAT_KEY_RE.fullmatch(line)
+        if not m:
+            raise _NotFlat
+        key = _flat_resolve_plain(m.group(1))
+        if not isinstance(key, str):
+            raise _NotFlat
+        value = (m.group(2) or '').rstrip(' ')
+
+        if not value or value[0] == '#':
+            result[key] = []
+            list_key, list_indent = key, None
+        elif value[0] == '[':
+            result[key] = _flat_flow_list(value)
+        else:
+            result[key] = _flat_block_scalar(value)
+
+    if list_key is not None and not result[list_key]:
+        result[list_key] = None
+    return result
+
+
+def _flat_block_scalar(text: str) -> Any:
+    """Parse a scalar that runs to the end of the line."""
+    if not text:
+        raise _NotFlat
+    if text[0] in '\'"':
+        value, end = _flat_quoted(text, 0)
+        _flat_expect_line_end(text[end:])
+        return value
+    comment = text.find(' #')
+    if comment != -1:
+        text = text[:comment]
+    text = text.rstrip(' ')
+    if ': ' in text or text.endswith(':'):
+        raise _NotFlat  # Nested mapping
+    return _flat_resolve_plain(text)
+
+
+def _flat_flow_list(text: str) -> List[Any]:
+    """Parse a single-line ``[a, 'b', c]`` list of scalars."""
+    items: List[Any] = []
+    n = len(text)
+    i = _flat_skip_spaces(text, 1)
+    if i < n and text[i] == ']':
+        _flat_expect_line_end(text[i + 1:])
+        return items
+
+    while True:
+        i = _flat_skip_spaces(text, i)
+        if i >= n:
+            raise _NotFlat  # Multi-line flow list
+        if text[i] in '\'"':
+            value, i = _flat_quoted(text, i)
+        else:
+            j = i
+            while j < n and text[j] not in ',]':
+                j += 1
+            token = text[i:j].rstrip(' ')
+            if not token or any(c in token for c in '[]{}:#'):
+                raise _NotFlat
+            value, i = _flat_resolve_plain(token), j
+        items.append(value)
+
+        i = _flat_skip_spaces(text, i)
+        if i >= n:
+            raise _NotFlat
+        if text[i] == ']':
+            _flat_expect_line_end(text[i + 1:])
+            return items
+        if text[i] != ',':
+            raise _NotFlat
+        i += 1
+
+
+def _flat_quoted(text: str, start: int) -> Tuple[str, int]:
+    """Parse a quoted scalar at ``start``; returns (value, index after it)."""
+    quote = text[start]
+    if quote == '"':
+        end = text.find('"', start + 1)
+        if end == -1 or '\\' in text[start + 1:end]:
+            raise _NotFlat  # Multi-line, or escape sequences
+        return text[start + 1:end], end + 1
+
+    parts = []
+    i = start + 1
+    while True:
+        end = text.find("'", i)
+        if end == -1:
+            raise _NotFlat
+        parts.append(text[i:end])
+        if text.startswith("''", end):
+            parts.append("'")
+            i = end + 2
+            continue
+        return ''.join(parts), end + 1
+
+
+def _flat_expect_line_end(rest: str) -> None:
+    """Allow only trailing spaces or a comment after a complete value."""
+    trimmed = rest.lstrip(' ')
+    if trimmed and not (trimmed[0] == '#' and len(trimmed) < len(rest)):
+        raise _NotFlat
+
+
+def _flat_skip_spaces(text: str, i: int) -> int:
+    while i < len(text) and text[i] == ' ':
+        i += 1
+    return i
+
+
+def _flat_resolve_plain(text: str) -> Any:
+    """Resolve a plain scalar using YAML 1.1 implicit types."""
+    if not text:
+        raise _NotFlat
+    if text in _FLAT_NULLS:
+        return None
+    if text in _FLAT_BOOLS:
+        return _FLAT_BOOLS[text]
+    if _FLAT_INT_RE.fullmatch(text):
+        return int(text)
+    m = _FLAT_DATE_RE.fullmatch(text)
+    if m:
+        try:
+            return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        except ValueError:
+            raise _NotFlat
+    if text[0] in _FLAT_BAIL_START:
+        raise _NotFlat
+    return text
+
+
 def _fallback_yaml_parse(content: str) -> Optional[Dict[str, Any]]:
     """Fallback YAML parser for simple key-value frontmatter.
     
@@ -239,6 +480,33 @@ def load_common_concepts(docs_dir: str = None) -> set:
     return concepts
 
 
+def normalize_concept(concept: str) -> str:
+    """Canonical form of a concept for matching: trimmed and case-folded."""
+    return concept.strip().casefold()
+
+
+def normalize_concepts(frontmatter: dict) -> list[str]:
+    """Extract concepts from frontmatter in canonical form.
+
+    A single string counts as one concept. Non-string entries, empty
+    values and duplicates are dropped; order is kept.
+
+    Args:
+        frontmatter: Parsed YAML frontmatter dictionary.
+
+    Returns:
+        List of normalized concepts (see normalize_concept).
+    """
+    value = frontmatter.get('concepts')
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, list):
+        return []
+    concepts = dict.fromkeys(normalize_concept(c) for c in value if isinstance(c, str))
+    concepts.pop('', None)
+    return list(concepts)
+
+
 def normalize_tags(frontmatter: dict) -> list[str]:
     """Extract tags from frontmatter, merging concepts + explicit tags.
 
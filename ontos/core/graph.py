@@ -2,7 +2,8 @@
 Dependency graph building and validation.
 
 Extracted from ontos_generate_context_map.py during Phase 2 decomposition.
-Implements O(V+E) DFS for cycle detection (NOT O(N²) path.index() pattern).
+Cycles and depths come from an iterative O(V+E) strongly connected
+components pass (Tarjan), so chains of any length work without recursion.
 
 Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.3
 """
@@ -25,19 +26,351 @@ class GraphNode:
 
 @dataclass
 class DependencyGraph:
-    """Represents document dependency relationships."""
+    """Represents document dependency relationships.
+
+    Mutate through add_node/update_node/remove_node, which keep ``edges``,
+    ``reverse_edges`` and ``broken`` consistent and update the cached
+    analyses (cycles(), orphans(), depths()) for the affected nodes only.
+    ``reverse_edges`` also lists references to ids that have no node.
+    """
     nodes: Dict[str, GraphNode] = field(default_factory=dict)
     edges: Dict[str, List[str]] = field(default_factory=dict)  # id -> depends_on
     reverse_edges: Dict[str, List[str]] = field(default_factory=dict)  # id -> depended_by
+    broken: Dict[str, List[str]] = field(default_factory=dict)  # id -> missing depends_on
+
+    # Incremental analysis state (see cycles(), orphans(), depths())
+    _unreferenced: Dict[str, None] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cycles: Optional[List[List[str]]] = field(default=None, init=False, repr=False, compare=False)
+    _depths: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._unreferenced = {n: None for n in self.nodes if not self.reverse_edges.get(n)}
+
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
 
     def add_node(self, doc_id: str, doc_type: str, filepath: str, depends_on: List[str]) -> None:
-        """Add a document node to the graph."""
+        """Add a document node to the graph (replacing one with the same id)."""
+        self.update_node(doc_id, doc_type, filepath, depends_on)
+
+    def update_node(self, doc_id: str, doc_type: str, filepath: str, depends_on: List[str]) -> None:
+        """Add a node, or replace an existing node's type, path and dependencies."""
+        depends_on = list(depends_on)
+        is_new = doc_id not in self.nodes
+        old_deps = [] if is_new else self.edges[doc_id]
         self.nodes[doc_id] = GraphNode(doc_id, doc_type, filepath, depends_on)
         self.edges[doc_id] = depends_on
+        if is_new or old_deps != depends_on:
+            self._unlink(doc_id, old_deps)
+            self._link(doc_id, depends_on)
+
+        if is_new:
+            if not self.reverse_edges.get(doc_id):
+                self._unreferenced[doc_id] = None
+            # References to this id are no longer broken
+            for source in dict.fromkeys(self.reverse_edges.get(doc_id, ())):
+                self._refresh_broken(source)
+        self._refresh_broken(doc_id)
+        if is_new or old_deps != depends_on:
+            self._changed(doc_id)
+
+    def remove_node(self, doc_id: str) -> None:
+        """Remove a node and its outgoing edges (no-op for unknown ids).
+
+        Edges from other nodes to ``doc_id`` stay, as broken links.
+        """
+        if doc_id not in self.nodes:
+            return
+        self._unlink(doc_id, self.edges.pop(doc_id))
+        del self.nodes[doc_id]
+        self.broken.pop(doc_id, None)
+        self._unreferenced.pop(doc_id, None)
+        for source in dict.fromkeys(self.reverse_edges.get(doc_id, ())):
+            self._refresh_broken(source)
+        self._changed(doc_id)
+
+    def reorder(self, order: List[str]) -> None:
+        """Put nodes (and derived tables) in ``order``, e.g. after updates.
+
+        Mutations append new nodes at the end; reordering makes iteration
+        order match a graph freshly built from the same documents.
+        """
+        position = {doc_id: i for i, doc_id in enumerate(order)}
+
+        def rank(doc_id: str) -> int:
+            return position.get(doc_id, len(position))
+
+        ranked = sorted(self.nodes, key=rank)
+        self.nodes = {n: self.nodes[n] for n in ranked}
+        self.edges = {n: self.edges[n] for n in ranked}
+        self.broken = {n: self.broken[n] for n in ranked if n in self.broken}
+        self._unreferenced = {n: None for n in ranked if n in self._unreferenced}
+        for sources in self.reverse_edges.values():
+            sources.sort(key=rank)
+
+    def _link(self, doc_id: str, depends_on: List[str]) -> None:
+        for dep in depends_on:
+            self.reverse_edges.setdefault(dep, []).append(doc_id)
+            self._unreferenced.pop(dep, None)
+
+    def _unlink(self, doc_id: str, depends_on: List[str]) -> None:
         for dep in depends_on:
-            if dep not in self.reverse_edges:
-                self.reverse_edges[dep] = []
-            self.reverse_edges[dep].append(doc_id)
+            sources = self.reverse_edges.get(dep)
+            if sources is None or doc_id not in sources:
+                continue
+            sources.remove(doc_id)
+            if not sources:
+                del self.reverse_edges[dep]
+                if dep in self.nodes:
+                    self._unreferenced[dep] = None
+
+    def _refresh_broken(self, doc_id: str) -> None:
+        missing = [d for d in self.edges.get(doc_id, ()) if d not in self.nodes]
+        if missing:
+            self.broken[doc_id] = missing
+        else:
+            self.broken.pop(doc_id, None)
+
+    def _changed(self, doc_id: str) -> None:
+        """Update cached analyses after doc_id or its dependencies changed."""
+        if self._depths is None and self._cycles is None:
+            return
+        # Only nodes that reach doc_id can see a different depth or join a
+        # cycle with it; everything downstream or unrelated is unaffected
+        upstream = self.upstream(doc_id, include_self=True)
+        if self._depths is not None:
+            for node in upstream:
+                self._depths.pop(node, None)
+        if self._cycles is not None:
+            self._update_cycle_groups(doc_id, upstream)
+
+    def _update_cycle_groups(self, doc_id: str, upstream: List[str]) -> None:
+        # A cycle that avoids doc_id uses none of its edges, so only the group
+        # that contained doc_id (which may split) and the group doc_id is in
+        # now (which may absorb others) need recomputing. Both lie within
+        # the old group plus the nodes upstream of doc_id.
+        old = [g for g in self._cycles if doc_id in g]
+        old_members = {m for g in old for m in g if m in self.nodes}
+        region = dict.fromkeys(n for n in upstream if n in self.nodes)
+        region.update(dict.fromkeys(old_members))
+
+        found = [
+            component for component in strongly_connected_components(self, within=region)
+            if self._is_cycle(component)
+            and (doc_id in component or old_members.issuperset(component))
+        ]
+        merged = {m for component in found for m in component}
+        self._cycles = [
+            g for g in self._cycles
+            if doc_id not in g and merged.isdisjoint(g)
+        ] + found
+
+    def _is_cycle(self, component: List[str]) -> bool:
+        node = component[0]
+        return len(component) > 1 or node in self.edges.get(node, ())
+
+    # -------------------------------------------------------------------------
+    # Traversal
+    # -------------------------------------------------------------------------
+
+    def upstream(self, doc_id: str, include_self: bool = False) -> List[str]:
+        """Ids that depend on ``doc_id``, directly or transitively."""
+        seen = {doc_id}
+        order = [doc_id] if include_self else []
+        frontier = [doc_id]
+        while frontier:
+            node = frontier.pop()
+            for source in self.reverse_edges.get(node, ()):
+                if source not in seen:
+                    seen.add(source)
+                    order.append(source)
+                    frontier.append(source)
+        return order
+
+    def _cycle_path(self, group: List[str]) -> List[str]:
+        """Shortest cycle from the group's first member back to itself."""
+        start = group[0]
+        members = set(group)
+        parent: Dict[str, str] = {}
+        frontier = [start]
+        while frontier:
+            following = []
+            for node in frontier:
+                for dep in self.edges.get(node, ()):
+                    if dep == start:
+                        path = [node]
+                        while path[-1] != start:
+                            path.append(parent[path[-1]])
+                        return path[::-1] + [start]
+                    if dep in members and dep not in parent:
+                        parent[dep] = node
+                        following.append(dep)
+            frontier = following
+        return group + [start]  # Unreachable for a strongly connected group
+
+    # -------------------------------------------------------------------------
+    # Analyses (computed once, then maintained by the mutation methods)
+    # -------------------------------------------------------------------------
+
+    def cycle_groups(self) -> List[List[str]]:
+        """Every set of mutually dependent documents (strongly connected
+        components with a cycle), members and groups in node order."""
+        if self._cycles is None:
+            self._cycles = [
+                c for c in strongly_connected_components(self) if self._is_cycle(c)
+            ]
+        if not self._cycles:
+            return []
+        position = {doc_id: i for i, doc_id in enumerate(self.nodes)}
+        groups = [sorted(g, key=position.__getitem__) for g in self._cycles]
+        return sorted(groups, key=lambda g: position[g[0]])
+
+    def cycles(self) -> List[List[str]]:
+        """One cycle per cycle group: a list of doc_ids ending where it starts."""
+        return [self._cycle_path(group) for group in self.cycle_groups()]
+
+    def orphans(self, allowed_orphan_types: Set[str]) -> List[str]:
+        """Documents nothing depends on, except those of allowed types."""
+        return [
+            doc_id for doc_id in self._unreferenced
+            if self.nodes[doc_id].doc_type not in allowed_orphan_types
+        ]
+
+    def depths(self) -> Dict[str, int]:
+        """Dependency depth of each node, in node order.
+
+        Depth is the longest path to a leaf over the condensed graph: the
+        members of a cycle group share one depth, one more than the
+        deepest group they depend on (dependencies on missing ids count
+        as leaves).
+        """
+        if self._depths is None:
+            self._depths = {}
+        cache = self._depths
+        missing = {doc_id: None for doc_id in self.nodes if doc_id not in cache}
+        # Components come out dependencies first, so every group outside a
+        # component already has its depth. The uncached nodes are always
+        # closed under "depends on something uncached" (see _changed).
+        nodes = self.nodes
+        edges = self.edges
+        for component in strongly_connected_components(self, within=missing):
+            if len(component) == 1:
+                node = component[0]
+                deps = edges.get(node)
+                if not deps:
+                    cache[node] = 0
+                    continue
+                below = [cache[d] for d in deps if d in nodes and d != node]
+                cache[node] = 1 + max(below, default=0)
+                continue
+            members = set(component)
+            below = [
+                cache[d] for node in component for d in edges.get(node, ())
+                if d in nodes and d not in members
+            ]
+            depth = 1 + max(below, default=0)
+            for node in component:
+                cache[node] = depth
+
+        return {doc_id: cache[doc_id] for doc_id in self.nodes}
+
+
+def strongly_connected_components(
+    graph: DependencyGraph, within: Optional[Dict[str, None]] = None
+) -> List[List[str]]:
+    """Strongly connected components of the graph, in O(V+E).
+
+    Iterative Tarjan, so arbitrarily long dependency chains are fine. Only
+    edges between existing nodes (or nodes in ``within``) are followed.
+
+    Args:
+        graph: DependencyGraph to analyze
+        within: Restrict the search to these nodes (default: all nodes)
+
+    Returns:
+        Components in reverse topological order: each component comes
+        after every component it depends on
+    """
+    nodes = graph.nodes if within is None else within
+    edges = graph.edges
+    no_deps: List[str] = []
+    # DFS number per node; members of finished components get ``done``
+    # (larger than any DFS number), which doubles as the "not on the
+    # stack" test and keeps them from lowering anyone's low-link
+    index: Dict[str, int] = {}
+    done = len(nodes)
+    low: List[int] = []  # Low-link per DFS number
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = len(low)
+        low.append(len(low))
+        stack.append(root)
+        work = [(root, iter(edges.get(root, no_deps)))]
+        while work:
+            node, deps = work[-1]
+            for dep in deps:
+                if dep not in nodes:
+                    continue
+                i = index.get(dep)
+                if i is None:
+                    index[dep] = len(low)
+                    low.append(len(low))
+                    stack.append(dep)
+                    work.append((dep, iter(edges.get(dep, no_deps))))
+                    break
+                n = index[node]
+                if i < low[n]:
+                    low[n] = i
+            else:
+                work.pop()
+                n = index[node]
+                node_low = low[n]
+                if work:
+                    parent = index[work[-1][0]]
+                    if node_low < low[parent]:
+                        low[parent] = node_low
+                if node_low != n:
+                    continue
+                if stack[-1] == node:
+                    # Common case: a component of one
+                    stack.pop()
+                    index[node] = done
+                    components.append([node])
+                    continue
+                component = []
+                while True:
+                    member = stack.pop()
+                    index[member] = done
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def _broken_link_error(graph: DependencyGraph, doc_id: str, dep_id: str) -> ValidationError:
+    return ValidationError(
+        error_type=ValidationErrorType.BROKEN_LINK,
+        doc_id=doc_id,
+        filepath=graph.nodes[doc_id].filepath,
+        message=f"Broken dependency: '{dep_id}' does not exist",
+        fix_suggestion=f"Remove '{dep_id}' from depends_on or create the missing document",
+        severity="error"
+    )
+
+
+def broken_link_errors(graph: DependencyGraph) -> List[ValidationError]:
+    """Errors for dependencies on ids that have no node."""
+    return [
+        _broken_link_error(graph, doc_id, dep_id)
+        for doc_id, missing in graph.broken.items()
+        for dep_id in missing
+    ]
 
 
 def build_graph(docs: Dict[str, DocumentData]) -> Tuple[DependencyGraph, List[ValidationError]]:
@@ -50,34 +383,25 @@ def build_graph(docs: Dict[str, DocumentData]) -> Tuple[DependencyGraph, List[Va
         Tuple of (DependencyGraph, list of broken link errors)
     """
     graph = DependencyGraph()
-    errors = []
-    existing_ids = set(docs.keys())
-
     for doc_id, doc in docs.items():
-        depends_on = doc.depends_on if hasattr(doc, 'depends_on') else []
-        # Handle enum types
-        doc_type = doc.type.value if hasattr(doc.type, 'value') else str(doc.type)
-        graph.add_node(doc_id, doc_type, str(doc.filepath), depends_on)
-
-        # Check for broken links
-        for dep_id in depends_on:
-            if dep_id not in existing_ids:
-                errors.append(ValidationError(
-                    error_type=ValidationErrorType.BROKEN_LINK,
-                    doc_id=doc_id,
-                    filepath=str(doc.filepath),
-                    message=f"Broken dependency: '{dep_id}' does not exist",
-                    fix_suggestion=f"Remove '{dep_id}' from depends_on or create the missing document",
-                    severity="error"
-                ))
-
-    return graph, errors
+        update_graph_node(graph, doc_id, doc)
+    return graph, broken_link_errors(graph)
+
+
+def update_graph_node(graph: DependencyGraph, doc_id: str, doc: DocumentData) -> None:
+    """Add or update the node for a document."""
+    depends_on = doc.depends_on if hasattr(doc, 'depends_on') else []
+    # Handle enum types
+    doc_type = doc.type.value if hasattr(doc.type, 'value') else str(doc.type)
+    graph.update_node(doc_id, doc_type, str(doc.filepath), depends_on)
 
 
 def detect_cycles(graph: DependencyGraph) -> List[List[str]]:
-    """Detect circular dependencies using DFS.
+    """Detect circular dependencies.
 
-    Uses O(V+E) algorithm with visited and in_stack sets.
+    Reports every cycle group (strongly connected component) once, as a
+    shortest cycle through its first member; see
+    DependencyGraph.cycle_groups() for all members.
 
     Args:
         graph: DependencyGraph to analyze
@@ -85,36 +409,7 @@ def detect_cycles(graph: DependencyGraph) -> List[List[str]]:
     Returns:
         List of cycles (each cycle is a list of doc_ids)
     """
-    visited: Set[str] = set()
-    in_stack: Set[str] = set()
-    cycles: List[List[str]] = []
-
-    def dfs(node: str, path: List[str]) -> None:
-        if node in in_stack:
-            # Found cycle - extract it from path
-            cycle_start = path.index(node)
-            cycles.append(path[cycle_start:] + [node])
-            return
-
-        if node in visited:
-            return
-
-        visited.add(node)
-        in_stack.add(node)
-        path.append(node)
-
-        for neighbor in graph.edges.get(node, []):
-            if neighbor in graph.nodes:  # Only follow valid edges
-                dfs(neighbor, path)
-
-        path.pop()
-        in_stack.remove(node)
-
-    for node in graph.nodes:
-        if node not in visited:
-            dfs(node, [])
-
-    return cycles
+    return graph.cycles()
 
 
 def detect_orphans(graph: DependencyGraph, allowed_orphan_types: Set[str]) -> List[str]:
@@ -127,13 +422,7 @@ def detect_orphans(graph: DependencyGraph, allowed_orphan_types: Set[str]) -> Li
     Returns:
         List of orphan doc_ids
     """
-    orphans = []
-    for doc_id, node in graph.nodes.items():
-        if node.doc_type in allowed_orphan_types:
-            continue
-        if doc_id not in graph.reverse_edges or not graph.reverse_edges[doc_id]:
-            orphans.append(doc_id)
-    return orphans
+    return graph.orphans(allowed_orphan_types)
 
 
 def calculate_depths(graph: DependencyGraph) -> Dict[str, int]:
@@ -145,31 +434,36 @@ def calculate_depths(graph: DependencyGraph) -> Dict[str, int]:
         graph: DependencyGraph to analyze
 
     Returns:
-        Dictionary mapping doc_id to depth
+        Dictionary mapping doc_id to depth, in depth-first post-order
+        (dependencies before their dependents, starting from each node in
+        node order), which is the order depth warnings are reported in
     """
-    depths: Dict[str, int] = {}
-    computing: Set[str] = set()  # Prevent infinite recursion on cycles
-
-    def get_depth(node: str) -> int:
-        if node in depths:
-            return depths[node]
-        if node in computing:
-            return 0  # Cycle detected, treat as leaf
-        if node not in graph.nodes:
-            return 0
-
-        computing.add(node)
-        deps = graph.edges.get(node, [])
-        if not deps:
-            depth = 0
-        else:
-            valid_deps = [d for d in deps if d in graph.nodes]
-            depth = 1 + max((get_depth(d) for d in valid_deps), default=0)
-        computing.remove(node)
-        depths[node] = depth
-        return depth
+    depths = graph.depths()
+    return {doc_id: depths[doc_id] for doc_id in _post_order(graph)}
+
 
-    for node in graph.nodes:
-        get_depth(node)
+def _post_order(graph: DependencyGraph) -> List[str]:
+    """Nodes in depth-first post-order, roots and dependencies in list order.
 
-    return depths
+    Iterative; a dependency already on the path (a cycle) is skipped.
+    """
+    nodes = graph.nodes
+    edges = graph.edges
+    order: List[str] = []
+    seen: Set[str] = set()
+    for root in nodes:
+        if root in seen:
+            continue
+        seen.add(root)
+        stack = [(root, iter(edges.get(root, ())))]
+        while stack:
+            node, deps = stack[-1]
+            for dep in deps:
+                if dep in nodes and dep not in seen:
+                    seen.add(dep)
+                    stack.append((dep, iter(edges.get(dep, ()))))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+    return order
@@ -0,0 +1,352 @@
+"""Unified document index.
+
+One DocumentIndex holds every scanned document of a project together with
+id/path/type/concept lookups, so a command (or several checks within one)
+parses each file at most once.
+
+PURE: This module contains no I/O operations. Reading and stat'ing files
+are supplied as callbacks; ontos.io.index.load_document_index provides the
+standard wiring (scan roots from config, persistent cache, parallel loader).
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from ontos.core.cache import DocumentCache
+from ontos.core.frontmatter import normalize_concept, normalize_concepts
+from ontos.core.graph import DependencyGraph, broken_link_errors, build_graph, update_graph_node
+from ontos.core.types import DocumentData, DocumentType, ValidationError
+
+# Result of loading one path: (path, document, error message)
+LoadResult = Tuple[Path, Optional[DocumentData], Optional[str]]
+
+# File identity used for cache validation: (mtime, size, inode)
+StatKey = Tuple[float, int, int]
+
+
+@dataclass
+class IndexChanges:
+    """Paths affected by DocumentIndex.update(), in scan order."""
+    added: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    updated: List[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.updated)
+
+
+class DocumentIndex:
+    """Scanned documents with lazy loading and lookup tables.
+
+    Usage:
+        index = DocumentIndex(paths, loader=load_documents, stat=stat_key)
+        doc = index.get("auth_flow")
+        for doc in index.of_type(DocumentType.KERNEL):
+            ...
+
+    Documents are loaded on first access to anything that needs them.
+    Unchanged files are served from ``cache`` when one is given; freshly
+    parsed documents are stored back into it.
+
+    Args:
+        paths: Scanned document paths, in scan order.
+        loader: Parses a batch of paths, returning LoadResults in the same
+            order (e.g. ontos.io.files.load_documents).
+        stat: Returns the StatKey for a path; may raise OSError.
+        cache: Optional DocumentCache consulted before parsing.
+        on_loaded: Optional callback run once after loading (e.g. to
+            persist the cache).
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        loader: Callable[[List[Path]], List[LoadResult]],
+        stat: Callable[[Path], StatKey],
+        cache: Optional[DocumentCache] = None,
+        on_loaded: Optional[Callable[["DocumentIndex"], None]] = None,
+    ):
+        self.paths: List[Path] = list(paths)
+        self.cache = cache
+        self._loader = loader
+        self._stat = stat
+        self._on_loaded = on_loaded
+        self._results: Optional[List[LoadResult]] = None
+        self._stats: Dict[Path, StatKey] = {}
+        self._by_id: Dict[str, DocumentData] = {}
+        self._by_path: Dict[Path, DocumentData] = {}
+        self._by_type: Dict[DocumentType, List[DocumentData]] = defaultdict(list)
+        self._by_concept: Dict[str, List[DocumentData]] = defaultdict(list)  # Normalized keys
+        self._graph: Optional[Tuple[DependencyGraph, List[ValidationError]]] = None
+        self.generation = 0  # Bumped whenever the loaded contents change
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    @property
+    def loaded(self) -> bool:
+        """True once documents have been loaded."""
+        return self._results is not None
+
+    def load(self) -> "DocumentIndex":
+        """Load every scanned document (no-op if already loaded).
+
+        Returns:
+            self, for chaining
+        """
+        if self._results is not None:
+            return self
+
+        cache = self.cache
+        loaded: Dict[Path, DocumentData] = {}
+        failures: Dict[Path, str] = {}
+        stats: Dict[Path, StatKey] = {}
+        to_parse: List[Path] = []
+
+        # Pass 1: stat every file and serve unchanged ones from the cache
+        for path in self.paths:
+            if path in stats or path in failures:
+                continue  # Overlapping scan roots yield duplicates
+            try:
+                key = self._stat(path)
+            except OSError as e:
+                failures[path] = str(e)
+                continue
+            stats[path] = key
+            doc = None
+            if cache is not None:
+                mtime, size, inode = key
+                doc = cache.get(path, mtime, size=size, inode=inode)
+            if doc is None:
+                to_parse.append(path)
+            else:
+                loaded[path] = doc
+
+        # Pass 2: parse cache misses
+        if to_parse:
+            for path, doc, error in self._loader(to_parse):
+                if error is not None:
+                    failures[path] = error
+                    continue
+                loaded[path] = doc
+                if cache is not None:
+                    mtime, size, inode = stats[path]
+                    cache.set(path, doc, mtime, size=size, inode=inode)
+
+        # Pass 3: results in scan order so output matches a serial run exactly
+        self._results = [
+            (path, loaded.get(path), failures.get(path)) for path in self.paths
+        ]
+        self._stats = stats
+        self._build_lookups()
+
+        if self._on_loaded is not None:
+            self._on_loaded(self)
+        return self
+
+    def update(
+        self, paths: Sequence[Path], changed: Iterable[Path] = ()
+    ) -> IndexChanges:
+        """Bring a loaded index up to date with a new scan.
+
+        Only new paths and ``changed`` paths whose stat key differs are
+        re-parsed; every other document is kept as is. The ``on_loaded``
+        callback runs again if anything changed.
+
+        Args:
+            paths: The complete new scan, in scan order.
+            changed: Paths that may have been modified since the last load
+                (e.g. reported by a file watcher). Unknown paths are ignored.
+
+        Returns:
+            IndexChanges describing what was added, removed and re-parsed
+        """
+        self.load()
+        cache = self.cache
+        previous = {path: (doc, error) for path, doc, error in self._results}
+        paths = list(paths)
+        current = set(paths)
+
+        changes = IndexChanges()
+        changes.removed = [p for p in previous if p not in current]
+        candidates = [p for p in dict.fromkeys(paths) if p not in previous]
+        changes.added = list(candidates)
+        candidates += [p for p in dict.fromkeys(changed) if p in previous and p in current]
+
+        entries = dict(previous)
+        for path in changes.removed:
+            del entries[path]
+            self._stats.pop(path, None)
+            if cache is not None:
+                cache.invalidate(path)
+
+        to_parse: List[Path] = []
+        for path in candidates:
+            try:
+                key = self._stat(path)
+            except OSError as e:
+                entries[path] = (None, str(e))
+                self._stats.pop(path, None)
+                if path in previous:
+                    changes.updated.append(path)
+                continue
+            if path in previous and self._stats.get(path) == key:
+                continue  # Event without a content change
+            self._stats[path] = key
+            to_parse.append(path)
+            if path in previous:
+                changes.updated.append(path)
+
+        if to_parse:
+            for path, doc, error in self._loader(to_parse):
+                entries[path] = (doc, error)
+                if cache is not None:
+                    if error is None:
+                        mtime, size, inode = self._stats[path]
+                        cache.set(path, doc, mtime, size=size, inode=inode)
+                    else:
+                        cache.invalidate(path)
+
+        if not changes and paths == self.paths:
+            return changes
+
+        self.paths = paths
+        self._results = [(path, *entries[path]) for path in paths]
+        self._build_lookups()
+
+        if self._on_loaded is not None:
+            self._on_loaded(self)
+        return changes
+
+    def _build_lookups(self) -> None:
+        previous = dict(self._by_id)
+        self._by_id.clear()
+        self._by_path.clear()
+        self._by_type.clear()
+        self._by_concept.clear()
+        self.generation += 1
+        for path, doc, _ in self._results:
+            if doc is None:
+                continue
+            self._by_path[path] = doc
+            self._by_id[doc.id] = doc  # Later duplicates win, as in the map
+
+        for doc in self._by_id.values():
+            self._by_type[doc.type].append(doc)
+            for concept in concept_keys(doc):
+                self._by_concept[concept].append(doc)
+
+        if self._graph is not None:
+            self._update_graph(previous)
+
+    def _update_graph(self, previous: Dict[str, DocumentData]) -> None:
+        """Apply document changes to the built graph instead of rebuilding it."""
+        graph, _ = self._graph
+        current = self._by_id
+        for doc_id in previous:
+            if doc_id not in current:
+                graph.remove_node(doc_id)
+        for doc_id, doc in current.items():
+            if previous.get(doc_id) is not doc:
+                update_graph_node(graph, doc_id, doc)
+        graph.reorder(list(current))
+        self._graph = (graph, broken_link_errors(graph))
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    @property
+    def results(self) -> List[LoadResult]:
+        """(path, document, error) for every scanned path, in scan order."""
+        return self.load()._results
+
+    @property
+    def documents(self) -> Dict[str, DocumentData]:
+        """Documents by id, in scan order."""
+        return self.load()._by_id
+
+    @property
+    def errors(self) -> List[Tuple[Path, str]]:
+        """(path, error message) for files that failed to load."""
+        return [(path, error) for path, _, error in self.results if error is not None]
+
+    @property
+    def graph(self) -> Tuple[DependencyGraph, List[ValidationError]]:
+        """Dependency graph of all documents and its broken-link errors.
+
+        Built on first access; update() then applies document changes to
+        it (and its cached analyses) incrementally.
+        """
+        if self._graph is None:
+            self._graph = build_graph(self.documents)
+        return self._graph
+
+    def get(self, doc_id: str) -> Optional[DocumentData]:
+        """Look up a document by id."""
+        return self.documents.get(doc_id)
+
+    def get_by_path(self, path: Path) -> Optional[DocumentData]:
+        """Look up a document by its scanned path."""
+        return self.load()._by_path.get(path)
+
+    def stat(self, path: Path) -> Optional[StatKey]:
+        """Stat key a scanned path was loaded at, or None if it failed to stat."""
+        return self.load()._stats.get(path)
+
+    def of_type(self, doc_type: DocumentType) -> List[DocumentData]:
+        """Documents of the given type, in scan order."""
+        return list(self.load()._by_type.get(doc_type, ()))
+
+    def with_concept(self, concept: str) -> List[DocumentData]:
+        """Documents listing ``concept`` in their frontmatter, in scan order.
+
+        Matching ignores case and surrounding whitespace.
+        """
+        return list(self.load()._by_concept.get(normalize_concept(concept), ()))
+
+    def ids_with_concepts(self, concepts: Iterable[str]) -> Set[str]:
+        """Ids of documents listing any of ``concepts`` (case-insensitive)."""
+        by_concept = self.load()._by_concept
+        ids: Set[str] = set()
+        for concept in concepts:
+            ids.update(doc.id for doc in by_concept.get(normalize_concept(concept), ()))
+        return ids
+
+    def paths_under(self, directory: Path) -> List[Path]:
+        """Scanned paths inside ``directory`` (does not load documents)."""
+        return [p for p in self.paths if directory in p.parents]
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __iter__(self) -> Iterator[DocumentData]:
+        return iter(self.documents.values())
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self.documents
+
+
+def concept_keys(doc: DocumentData) -> List[str]:
+    """Normalized concepts of a document, as used by the concept lookups.
+
+    Parsed documents carry them already (DocumentData.concepts); others
+    are normalized from their frontmatter.
+    """
+    concepts = getattr(doc, "concepts", None)
+    return concepts if concepts is not None else normalize_concepts(doc.frontmatter)
+
+
+def document_concepts(doc: DocumentData) -> List[str]:
+    """Concepts listed in a document's frontmatter."""
+    value = doc.frontmatter.get("concepts")
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [c for c in value if isinstance(c, str)]
+    return []
@@ -0,0 +1,235 @@
+"""
+Token-budgeted context packs.
+
+A pack lists as many documents as fit in a token budget, most important
+first, then adds the bodies of listed documents while room remains.
+Documents are ranked by:
+
+1. Type: kernel documents first.
+2. In-degree: documents more others depend on first.
+3. Recency: most recently modified first (then by id).
+
+Packing is greedy: a document whose entry does not fit is skipped, and
+smaller ones ranked after it may still be taken. Sizes come from
+estimate_documents(), which callers cache per file (ontos.io.pack), so
+packing for a different budget reads no bodies except the ones included.
+Lazily loaded bodies are released again once measured or rendered, so
+only a bounded number are in memory at a time.
+
+Every part is measured exactly as it is emitted, with one token of slack
+for rounding and for tokens merging across part boundaries, so the count
+of the rendered pack stays within the budget. Parts are counted with a
+ontos.core.tokens.TokenCounter (the ~4 characters per token heuristic if
+none is given).
+
+PURE: no I/O. Bodies are read through DocumentData.content.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ontos.core.tokens import HeuristicCounter, TokenCounter
+from ontos.core.types import DocumentData, DocumentType
+
+# Estimated tokens of a document's (entry line, body section)
+PackEstimate = Tuple[int, int]
+
+DOCUMENTS_HEADING = "## Documents\n\n"
+CONTENTS_HEADING = "\n## Contents\n\n"
+
+# Documents whose bodies estimate_documents() holds at once
+ESTIMATE_BATCH_SIZE = 256
+
+
+@dataclass
+class ContextPack:
+    """Documents chosen for a budget, in rank order."""
+    budget: int
+    listed: List[str] = field(default_factory=list)  # Ids with an entry line
+    expanded: List[str] = field(default_factory=list)  # Ids whose body is included
+    omitted: int = 0  # Ranked documents left out entirely
+    tokens: int = 0  # Estimated size of the rendered pack
+
+
+def measure(text: str, counter: Optional[TokenCounter] = None) -> int:
+    """Tokens of one emitted part, with slack (0 for an empty part)."""
+    return measure_batch([text], counter)[0]
+
+
+def measure_batch(texts: Sequence[str], counter: Optional[TokenCounter] = None) -> List[int]:
+    """measure() for many parts, counted in one call."""
+    counts = (counter or HeuristicCounter()).count_batch(texts)
+    return [n + 1 if text else 0 for text, n in zip(texts, counts)]
+
+
+def entry_line(doc: DocumentData) -> str:
+    """Listing line of a document: id:type:status[:"summary"]."""
+    doc_type = doc.type.value if hasattr(doc.type, 'value') else str(doc.type)
+    doc_status = doc.status.value if hasattr(doc.status, 'value') else str(doc.status)
+    line = f"{doc.id}:{doc_type}:{doc_status}"
+    summary = str(doc.frontmatter.get('summary') or '')
+    if summary:
+        summary = summary.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        line += f':"{summary}"'
+    return line + "\n"
+
+
+def body_section(doc: DocumentData) -> str:
+    """Contents section of a document, or "" if its body is empty."""
+    body = (doc.content or "").strip()
+    return f"### {doc.id}\n\n{body}\n\n" if body else ""
+
+
+def estimate_documents(
+    docs: Sequence[DocumentData], counter: Optional[TokenCounter] = None
+) -> List[PackEstimate]:
+    """Tokens of each document's entry line and body section.
+
+    Documents are counted in batches of ESTIMATE_BATCH_SIZE; bodies loaded
+    for a batch are released once it is counted.
+    """
+    estimates: List[PackEstimate] = []
+    for start in range(0, len(docs), ESTIMATE_BATCH_SIZE):
+        batch = docs[start:start + ESTIMATE_BATCH_SIZE]
+        loaded = [doc.content_loaded for doc in batch]
+        texts = []
+        for doc in batch:
+            texts += [entry_line(doc), body_section(doc)]
+        sizes = measure_batch(texts, counter)
+        estimates.extend(zip(sizes[0::2], sizes[1::2]))
+        del texts
+        for doc, was_loaded in zip(batch, loaded):
+            if not was_loaded:
+                doc.release_content()
+    return estimates
+
+
+def estimate_document(doc: DocumentData, counter: Optional[TokenCounter] = None) -> PackEstimate:
+    """Tokens of a document's entry line and body section."""
+    return estimate_documents([doc], counter)[0]
+
+
+def omitted_note(omitted: int, total: int, budget: int) -> str:
+    """Line noting how many documents were left out."""
+    return f"\n_{omitted} of {total} documents left out to stay within {budget} tokens._\n"
+
+
+def rank_documents(
+    docs: Dict[str, DocumentData],
+    recency: Optional[Dict[str, float]] = None,
+) -> List[str]:
+    """Document ids, most important first (see module docstring).
+
+    Args:
+        docs: Documents by id
+        recency: Modification time by id (missing ids rank as oldest)
+
+    Returns:
+        Every id in ``docs``, ranked
+    """
+    recency = recency or {}
+    in_degree = dict.fromkeys(docs, 0)
+    for doc in docs.values():
+        for dep in set(doc.depends_on):
+            if dep in in_degree and dep != doc.id:
+                in_degree[dep] += 1
+
+    def key(doc_id: str):
+        doc = docs[doc_id]
+        return (
+            doc.type != DocumentType.KERNEL,
+            -in_degree[doc_id],
+            -recency.get(doc_id, 0.0),
+            doc_id,
+        )
+
+    return sorted(docs, key=key)
+
+
+def pack_documents(
+    ranked: Iterable[str],
+    estimates: Dict[str, PackEstimate],
+    budget: int,
+    header: str = "",
+    counter: Optional[TokenCounter] = None,
+) -> ContextPack:
+    """Choose entries, then bodies, greedily in rank order.
+
+    Args:
+        ranked: Document ids, most important first
+        estimates: PackEstimate for every ranked id
+        budget: Maximum tokens of the rendered pack
+        header: Text rendered before the listing
+        counter: Counter the estimates were made with
+
+    Returns:
+        ContextPack for render_pack()
+    """
+    ranked = list(ranked)
+    pack = ContextPack(budget=budget)
+    # Worst case for the parts whose size depends on the outcome
+    reserved = sum(measure_batch([
+        header + "\n\n",
+        DOCUMENTS_HEADING,
+        omitted_note(len(ranked), len(ranked), budget),
+        CONTENTS_HEADING,
+    ], counter))
+    remaining = budget - reserved
+
+    for doc_id in ranked:
+        cost = estimates[doc_id][0]
+        if cost <= remaining:
+            pack.listed.append(doc_id)
+            remaining -= cost
+    for doc_id in pack.listed:
+        cost = estimates[doc_id][1]
+        if cost and cost <= remaining:
+            pack.expanded.append(doc_id)
+            remaining -= cost
+
+    pack.omitted = len(ranked) - len(pack.listed)
+    pack.tokens = budget - remaining  # Over budget only if the header alone is
+    return pack
+
+
+def render_pack(header: str, docs: Dict[str, DocumentData], pack: ContextPack) -> str:
+    """Render a pack chosen by pack_documents() with the same ``header``."""
+    return "".join(iter_pack(header, docs, pack))
+
+
+def iter_pack(header: str, docs: Dict[str, DocumentData], pack: ContextPack) -> Iterator[str]:
+    """render_pack() in parts, reading one body at a time.
+
+    Bodies loaded for the pack are released once yielded.
+    """
+    return _end_with_one_newline(_pack_parts(header, docs, pack))
+
+
+def _pack_parts(header: str, docs: Dict[str, DocumentData], pack: ContextPack) -> Iterator[str]:
+    yield header + "\n\n"
+    yield DOCUMENTS_HEADING
+    for doc_id in pack.listed:
+        yield entry_line(docs[doc_id])
+    if pack.omitted:
+        yield omitted_note(pack.omitted, len(pack.listed) + pack.omitted, pack.budget)
+    if pack.expanded:
+        yield CONTENTS_HEADING
+        for doc_id in pack.expanded:
+            doc = docs[doc_id]
+            was_loaded = doc.content_loaded
+            yield body_section(doc)
+            if not was_loaded:
+                doc.release_content()
+
+
+def _end_with_one_newline(parts: Iterable[str]) -> Iterator[str]:
+    """Parts with trailing newlines of the whole text replaced by one."""
+    pending = ""  # Newlines held back until more text follows
+    for part in parts:
+        text = part.rstrip("\n")
+        if text:
+            yield pending + text
+            pending = part[len(text):]
+        else:
+            pending += part
+    yield "\n"
@@ -0,0 +1,231 @@
+"""
+Transitive dependency queries over a precomputed reachability index.
+
+The graph is condensed into its strongly connected components (a cycle
+group becomes one component), numbered dependencies first. Each component
+then gets two bitsets, stored as Python ints: the components it depends on,
+directly or not, and the components that depend on it. Both are built
+in one pass each, in topological order.
+
+Once built, "does A depend on B?" is a single bit test, and listing
+everything that depends on a document costs time proportional to the
+answer. Bitsets grow with the number of components, so a pathological
+graph (one long chain) needs quadratic space; documentation graphs are
+shallow and stay small.
+
+PURE: no I/O. Persistence lives in ontos.io.reachability.
+"""
+
+import hashlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from ontos.core.graph import DependencyGraph, strongly_connected_components
+
+
+@dataclass
+class ReachabilityIndex:
+    """Transitive dependencies and dependents of every id.
+
+    Attributes:
+        components: Ids per component, dependencies first (a component
+            only depends on components with a lower number)
+        dependencies: Per component, bitset of the components it depends on
+        dependents: Per component, bitset of the components depending on it
+
+    A component's own bit is set in both bitsets when it is a cycle.
+    """
+    components: List[List[str]]
+    dependencies: List[int]
+    dependents: List[int]
+    component_of: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.component_of = {
+            doc_id: c for c, members in enumerate(self.components) for doc_id in members
+        }
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.component_of
+
+    def reaches(self, source: str, target: str) -> bool:
+        """True if ``source`` depends on ``target``, directly or transitively."""
+        c = self.component_of.get(source)
+        d = self.component_of.get(target)
+        if c is None or d is None:
+            return False
+        return bool(self.dependencies[c] >> d & 1)
+
+    def depends_on(self, doc_id: str) -> List[str]:
+        """Everything ``doc_id`` depends on, directly or transitively."""
+        return self._expand(self.dependencies, doc_id)
+
+    def depended_by(self, doc_id: str) -> List[str]:
+        """Everything that depends on ``doc_id``, directly or transitively."""
+        return self._expand(self.dependents, doc_id)
+
+    def _expand(self, bitsets: List[int], doc_id: str) -> List[str]:
+        c = self.component_of.get(doc_id)
+        if c is None:
+            return []
+        ids: List[str] = []
+        for d in _bit_positions(bitsets[c]):
+            ids.extend(self.components[d])
+        return [other for other in ids if other != doc_id]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe form (see _encode_bits)."""
+        return {
+            "components": self.components,
+            "dependencies": [_encode_bits(bits) for bits in self.dependencies],
+            "dependents": [_encode_bits(bits) for bits in self.dependents],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReachabilityIndex":
+        """Inverse of to_dict().
+
+        Raises:
+            KeyError, TypeError, ValueError: If ``data`` is malformed
+        """
+        components = [[str(doc_id) for doc_id in members] for members in data["components"]]
+        dependencies = [_decode_bits(bits) for bits in data["dependencies"]]
+        dependents = [_decode_bits(bits) for bits in data["dependents"]]
+        if not len(components) == len(dependencies) == len(dependents):
+            raise ValueError("reachability index tables differ in length")
+        return cls(components, dependencies, dependents)
+
+
+def _bit_positions(bits: int) -> List[int]:
+    """Positions of the set bits, highest first."""
+    # Scan the binary digits at C speed rather than shifting a big int
+    digits = format(bits, "b")
+    top = len(digits) - 1
+    positions = []
+    i = digits.find("1")
+    while i >= 0:
+        positions.append(top - i)
+        i = digits.find("1", i + 1)
+    return positions
+
+
+def _encode_bits(bits: int) -> Any:
+    """A bitset as a hex string, or as its bit positions when sparse.
+
+    Dependents of an early component sit at high bit positions, so their
+    hex form is mostly leading zeros.
+    """
+    hex_length = (bits.bit_length() + 3) // 4
+    if hex_length <= 16:
+        return format(bits, "x")
+    # Non-zero bytes stand in for the bit count (int.bit_count is 3.10+)
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    if (len(raw) - raw.count(0)) * 6 >= hex_length:
+        return format(bits, "x")
+    positions = []
+    while bits:
+        lowest = bits & -bits
+        positions.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return positions
+
+
+def _decode_bits(value: Any) -> int:
+    if isinstance(value, str):
+        return int(value, 16)
+    bits = 0
+    for position in value:
+        bits |= 1 << position
+    return bits
+
+
+def graph_signature(edges: Mapping[str, Sequence[str]]) -> str:
+    """Hash of an adjacency mapping, independent of key order.
+
+    A persisted index is valid for exactly the graph with this signature.
+    """
+    digest = hashlib.sha256()
+    for doc_id in sorted(edges):
+        digest.update(doc_id.encode("utf-8", "surrogatepass"))
+        for dep in edges[doc_id]:
+            digest.update(b"\x00")
+            digest.update(dep.encode("utf-8", "surrogatepass"))
+        digest.update(b"\x01")
+    return digest.hexdigest()
+
+
+def build_reachability(edges: Mapping[str, Sequence[str]]) -> ReachabilityIndex:
+    """Build the reachability index of a graph.
+
+    Args:
+        edges: doc_id -> ids it depends on. Ids that are only depended on
+            (missing documents) are included as leaves.
+
+    Returns:
+        ReachabilityIndex covering every id in the graph
+    """
+    ids: Dict[str, None] = dict.fromkeys(edges)
+    for deps in edges.values():
+        ids.update(dict.fromkeys(deps))
+    components = strongly_connected_components(DependencyGraph(edges=dict(edges)), within=ids)
+    component_of = {doc_id: c for c, members in enumerate(components) for doc_id in members}
+
+    # Components come out dependencies first, so every successor of c has
+    # its bitset by the time c is reached
+    count = len(components)
+    dependencies = [0] * count
+    parents: List[List[int]] = [[] for _ in range(count)]
+    cyclic = [len(members) > 1 for members in components]
+    for c, members in enumerate(components):
+        successors = {component_of[dep] for doc_id in members for dep in edges.get(doc_id, ())}
+        bits = 0
+        for d in successors:
+            if d == c:
+                cyclic[c] = True  # Self-reference
+                continue
+            bits |= dependencies[d] | 1 << d
+            parents[d].append(c)
+        if cyclic[c]:
+            bits |= 1 << c
+        dependencies[c] = bits
+
+    dependents = [0] * count
+    for c in range(count - 1, -1, -1):
+        bits = 1 << c if cyclic[c] else 0
+        for p in parents[c]:
+            bits |= dependents[p] | 1 << p
+        dependents[c] = bits
+
+    return ReachabilityIndex(components, dependencies, dependents)
+
+
+def within_depth(
+    edges: Mapping[str, Iterable[str]], doc_id: str, max_depth: int
+) -> List[Tuple[str, int]]:
+    """Ids reachable from ``doc_id`` in at most ``max_depth`` steps.
+
+    Breadth-first, so the cost is bounded by the answer and its edges.
+
+    Args:
+        edges: Adjacency to follow (depends_on, or the reverse for dependents)
+        doc_id: Starting id (not included in the result)
+        max_depth: Number of steps; 1 gives the direct neighbours
+
+    Returns:
+        (id, distance) pairs, nearest first
+    """
+    distance = {doc_id: 0}
+    found: List[Tuple[str, int]] = []
+    queue = deque([doc_id])
+    while queue:
+        node = queue.popleft()
+        depth = distance[node] + 1
+        if depth > max_depth:
+            break
+        for neighbour in edges.get(node, ()):
+            if neighbour not in distance:
+                distance[neighbour] = depth
+                found.append((neighbour, depth))
+                queue.append(neighbour)
+    return found
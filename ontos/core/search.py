@@ -0,0 +1,493 @@
+"""
+Full-text search over document bodies and frontmatter summaries.
+
+SearchIndex is an inverted index: term -> postings (document number and
+positions of the term). It is kept in two segments:
+
+- base: written in one go, split into SHARD_COUNT shards by the first two
+  characters of each term. A query loads only the shards of its own terms
+  (through a callback; ontos.io.search reads them from .ontos/cache/).
+- delta: documents indexed since the base was written. Stored with the
+  document table, so saving an edit rewrites only the table.
+
+Removing or re-indexing a document just retires its document number;
+postings of retired numbers are skipped at query time and dropped when
+the delta is merged into a new base, which happens once the delta and
+the retired documents outgrow a fraction of the index.
+
+Every document remembers the stat key and content hash it was indexed at.
+refresh() re-reads a document only when its stat key changed, and
+re-tokenizes it only when the content hash changed too.
+
+Queries match documents containing every part, ranked by BM25:
+
+    auth token        both words
+    "token refresh"   the exact phrase
+    auth*             any word starting with "auth"
+
+Postings are stored as strings ("num:p,d,d;num:p" with delta-encoded
+positions) and only the terms a query needs are split apart; term
+frequencies are counted without decoding positions at all.
+
+PURE: no I/O. The document body is read through DocumentData.content
+(loaded lazily by the caller's loader) only for changed documents.
+"""
+
+import hashlib
+import heapq
+import math
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import accumulate
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ontos.core.types import DocumentData
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+SHARD_COUNT = 64
+
+# Merge once the delta and retired documents exceed this share of the index
+MERGE_RATIO = 0.05
+MERGE_MINIMUM = 256
+
+_WORD = re.compile(r"\w+")
+_QUERY_PART = re.compile(r'"([^"]*)"?|(\S+)')
+
+# Postings of a shard or of the delta: term -> "num:p,d,d;num:p,..."
+Postings = Dict[str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into case-folded word tokens."""
+    return _WORD.findall(text.casefold())
+
+
+def shard_of(term: str) -> str:
+    """Base shard holding a term, chosen by its first two characters."""
+    return format(zlib.crc32(term[:2].encode("utf-8", "surrogatepass")) % SHARD_COUNT, "02x")
+
+
+def all_shards() -> List[str]:
+    """Names of every base shard."""
+    return [format(i, "02x") for i in range(SHARD_COUNT)]
+
+
+def document_text(doc: DocumentData) -> str:
+    """The searchable text of a document: frontmatter summary and body."""
+    summary = doc.frontmatter.get("summary") if isinstance(doc.frontmatter, dict) else None
+    parts = [str(summary) if summary else "", doc.content or ""]
+    return "\n".join(part for part in parts if part)
+
+
+def content_hash(text: str) -> str:
+    """Hash identifying indexed text."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=12).hexdigest()
+
+
+@dataclass
+class QueryPart:
+    """One part of a parsed query.
+
+    Attributes:
+        kind: "term", "prefix" or "phrase"
+        tokens: The term (or prefix) alone, or the words of the phrase
+    """
+    kind: str
+    tokens: List[str]
+
+
+def parse_query(query: str) -> List[QueryPart]:
+    """Split a query into words, "quoted phrases" and prefix* parts.
+
+    An unquoted word that tokenizes into several tokens (``auth-flow``)
+    is treated as a phrase; for ``auth-fl*`` the last token is the prefix.
+    """
+    parts: List[QueryPart] = []
+    for match in _QUERY_PART.finditer(query):
+        quoted, word = match.groups()
+        if quoted is not None:
+            tokens = tokenize(quoted)
+            if len(tokens) == 1:
+                parts.append(QueryPart("term", tokens))
+            elif tokens:
+                parts.append(QueryPart("phrase", tokens))
+            continue
+        prefix = word.endswith("*")
+        tokens = tokenize(word)
+        if not tokens:
+            continue
+        if prefix:
+            if len(tokens) > 1:
+                parts.append(QueryPart("phrase", tokens[:-1]))
+            parts.append(QueryPart("prefix", tokens[-1:]))
+        elif len(tokens) == 1:
+            parts.append(QueryPart("term", tokens))
+        else:
+            parts.append(QueryPart("phrase", tokens))
+    return parts
+
+
+@dataclass
+class SearchDoc:
+    """Index entry of one document file."""
+    doc_id: str
+    num: int  # Document number used in postings (never reused)
+    length: int  # Token count
+    content_hash: str
+    stat: Optional[str]  # Stat key when indexed (opaque; compared for equality)
+
+
+def _encode_positions(positions: List[int]) -> str:
+    if len(positions) == 1:
+        return str(positions[0])
+    deltas = [positions[0]] + [b - a for a, b in zip(positions, positions[1:])]
+    return ",".join(map(str, deltas))
+
+
+def _decode_positions(encoded: str) -> Iterator[int]:
+    return accumulate(map(int, encoded.split(",")))
+
+
+_num = attrgetter("num")
+
+
+def _live_entries(postings: str, live: Dict[str, SearchDoc]) -> List[str]:
+    return [entry for entry in postings.split(";") if entry[:entry.index(":")] in live]
+
+
+class SearchIndex:
+    """Inverted index over document text.
+
+    Args:
+        docs: Entries by file path
+        next_num: Next document number to assign
+        token: Names the stored base (its shard files)
+        base_limit: Document numbers below this are in the base
+        base_docs: Documents in the base when it was written
+        delta: Postings of documents indexed since
+        load_shard: Returns a stored base shard given (token, shard name),
+            or None
+    """
+
+    def __init__(
+        self,
+        docs: Optional[Dict[str, SearchDoc]] = None,
+        next_num: int = 0,
+        token: str = "",
+        base_limit: int = 0,
+        base_docs: int = 0,
+        delta: Optional[Postings] = None,
+        load_shard: Optional[Callable[[str, str], Optional[Postings]]] = None,
+    ):
+        self.docs: Dict[str, SearchDoc] = docs or {}
+        self.next_num = next_num
+        self.token = token
+        self.base_limit = base_limit
+        self.base_docs = base_docs
+        self.delta: Postings = delta or {}
+        self._added: Dict[str, List[str]] = defaultdict(list)  # Delta entries not yet joined
+        self._load_shard = load_shard
+        self._shards: Dict[str, Postings] = {}
+        self._merged = False
+        entries = self.docs.values()
+        self._by_num: Dict[str, SearchDoc] = dict(zip(map(str, map(_num, entries)), entries))
+        self._avg_length: Optional[float] = None
+        self.dirty = False
+
+    # -------------------------------------------------------------------------
+    # Postings
+    # -------------------------------------------------------------------------
+
+    def _shard(self, name: str) -> Postings:
+        shard = self._shards.get(name)
+        if shard is None:
+            shard = {}
+            if self.base_docs and self._load_shard is not None:
+                shard = self._load_shard(self.token, name) or {}
+            self._shards[name] = shard
+        return shard
+
+    def _join_added(self) -> None:
+        # Appending to the delta strings one document at a time would be
+        # quadratic in the number of documents sharing a term
+        delta = self.delta
+        for term, entries in self._added.items():
+            existing = delta.get(term)
+            delta[term] = ";".join([existing, *entries] if existing else entries)
+        self._added.clear()
+
+    def _postings(self, term: str) -> Dict[str, str]:
+        """{document number: encoded positions} of a term, live documents only."""
+        live = self._by_num
+        found = {}
+        for postings in (self._shard(shard_of(term)).get(term), self.delta.get(term)):
+            if postings:
+                for entry in postings.split(";"):
+                    num, _, positions = entry.partition(":")
+                    if num in live:
+                        found[num] = positions
+        return found
+
+    def _terms_with_prefix(self, prefix: str) -> List[str]:
+        shards = [shard_of(prefix)] if len(prefix) >= 2 else all_shards()
+        terms = {t for name in shards for t in self._shard(name) if t.startswith(prefix)}
+        terms.update(t for t in self.delta if t.startswith(prefix))
+        return sorted(terms)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def put(self, path: str, doc_id: str, text: str, stat: Optional[str] = None) -> None:
+        """Index (or re-index) a document's text."""
+        self.remove(path)
+        tokens = tokenize(text)
+        positions: Dict[str, List[int]] = defaultdict(list)
+        for i, term in enumerate(tokens):
+            positions[term].append(i)
+
+        num = str(self.next_num)
+        self.next_num += 1
+        added = self._added
+        for term, found in positions.items():
+            added[term].append(f"{num}:{_encode_positions(found)}")
+        entry = SearchDoc(doc_id, int(num), len(tokens), content_hash(text), stat)
+        self.docs[path] = entry
+        self._by_num[num] = entry
+        self._avg_length = None
+        self.dirty = True
+
+    def remove(self, path: str) -> None:
+        """Drop a document; its postings are skipped until the next merge."""
+        entry = self.docs.pop(path, None)
+        if entry is None:
+            return
+        del self._by_num[str(entry.num)]
+        self._avg_length = None
+        self.dirty = True
+
+    def refresh(
+        self,
+        documents: Iterable[Tuple[str, DocumentData, Optional[str]]],
+        text_of: Optional[Callable[[DocumentData], str]] = None,
+    ) -> int:
+        """Bring the index in line with the current documents.
+
+        Args:
+            documents: (path, document, stat key) for every document
+            text_of: Searchable text of a document (default: document_text)
+
+        Returns:
+            Number of documents (re-)tokenized
+        """
+        text_of = text_of or document_text
+        current = set()
+        indexed = 0
+        for path, doc, stat in documents:
+            current.add(path)
+            entry = self.docs.get(path)
+            if entry is not None and stat is not None and entry.stat == stat:
+                if entry.doc_id != doc.id:
+                    entry.doc_id = doc.id
+                    self.dirty = True
+                continue
+            text = text_of(doc)
+            if entry is not None and entry.content_hash == content_hash(text):
+                # Touched, not changed
+                entry.stat, entry.doc_id = stat, doc.id
+                self.dirty = True
+                continue
+            self.put(path, doc.id, text, stat)
+            indexed += 1
+        for path in [p for p in self.docs if p not in current]:
+            self.remove(path)
+        return indexed
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def _frequencies(self, part: QueryPart) -> Dict[str, int]:
+        """{document number: occurrences} of a query part."""
+        if part.kind == "term":
+            return {n: p.count(",") + 1 for n, p in self._postings(part.tokens[0]).items()}
+
+        if part.kind == "prefix":
+            counts: Dict[str, int] = defaultdict(int)
+            for term in self._terms_with_prefix(part.tokens[0]):
+                for n, p in self._postings(term).items():
+                    counts[n] += p.count(",") + 1
+            return dict(counts)
+
+        # Phrase: every token at consecutive positions
+        postings = [self._postings(token) for token in part.tokens]
+        smallest = min(postings, key=len)
+        counts = {}
+        for n in smallest:
+            if not all(n in p for p in postings):
+                continue
+            starts = set(_decode_positions(postings[0][n]))
+            for offset, p in enumerate(postings[1:], 1):
+                starts.intersection_update([q - offset for q in _decode_positions(p[n])])
+                if not starts:
+                    break
+            if starts:
+                counts[n] = len(starts)
+        return counts
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Documents matching every part of ``query``, best first.
+
+        Args:
+            query: Words, "phrases" and prefix* parts
+            limit: Maximum number of results
+
+        Returns:
+            (doc_id, BM25 score) pairs, one per id (files sharing an id
+            count as one document, scored as its best file); ties are
+            ordered by id
+        """
+        parts = parse_query(query)
+        live = self._by_num
+        if not parts or not live:
+            return []
+        self._join_added()
+        if self._avg_length is None:
+            self._avg_length = sum(e.length for e in live.values()) / len(live) or 1.0
+        count, avg_length = len(live), self._avg_length
+
+        scores: Optional[Dict[str, float]] = None
+        for part in parts:
+            frequencies = self._frequencies(part)
+            df = len(frequencies)
+            if scores is not None:
+                frequencies = {n: f for n, f in frequencies.items() if n in scores}
+            if not frequencies:
+                return []
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            part_scores = {
+                n: idf * f * (K1 + 1) / (f + K1 * (1 - B + B * live[n].length / avg_length))
+                for n, f in frequencies.items()
+            }
+            if scores is None:
+                scores = part_scores
+            else:
+                scores = {n: scores[n] + s for n, s in part_scores.items()}
+
+        best: Dict[str, float] = {}
+        for n, score in scores.items():
+            doc_id = live[n].doc_id
+            if score > best.get(doc_id, 0.0):
+                best[doc_id] = score
+
+        items: Iterable[Tuple[str, float]] = best.items()
+        if limit is not None and len(best) > limit:
+            # Only the best (and anything tied with the last of them) need sorting
+            cutoff = heapq.nlargest(limit, best.values())[-1]
+            items = [(doc_id, score) for doc_id, score in items if score >= cutoff]
+        return sorted(items, key=lambda item: (-item[1], item[0]))[:limit]
+
+    # -------------------------------------------------------------------------
+    # Merging and persistence (JSON-safe forms; ontos.io.search does the I/O)
+    # -------------------------------------------------------------------------
+
+    def needs_merge(self) -> bool:
+        """True once the delta and retired base documents are worth a rewrite."""
+        live_base = sum(1 for e in self.docs.values() if e.num < self.base_limit)
+        stale = (self.next_num - self.base_limit) + (self.base_docs - live_base)
+        return stale > max(MERGE_MINIMUM, len(self.docs) * MERGE_RATIO)
+
+    def merge(self, token: str) -> Dict[str, Postings]:
+        """Fold the delta into a new base without retired documents.
+
+        Args:
+            token: Name of the new base
+
+        Returns:
+            Every non-empty shard of the new base, by name
+        """
+        self._join_added()
+        live = self._by_num
+        shards: Dict[str, Postings] = {}
+        for name in all_shards():
+            shard: Postings = {}
+            for term, postings in self._shard(name).items():
+                kept = _live_entries(postings, live)
+                if kept:
+                    shard[term] = ";".join(kept)
+            shards[name] = shard
+        for term, postings in self.delta.items():
+            kept = _live_entries(postings, live)
+            if kept:
+                shard = shards[shard_of(term)]
+                existing = shard.get(term)
+                shard[term] = ";".join([existing, *kept] if existing else kept)
+
+        self._shards = shards
+        self._merged = True
+        self.token = token
+        self.base_limit = self.next_num
+        self.base_docs = len(self.docs)
+        self.delta = {}
+        self.dirty = True
+        return {name: shard for name, shard in shards.items() if shard}
+
+    def to_table(self) -> Dict[str, Any]:
+        """The document table, with the delta postings.
+
+        Columns rather than a record per document: flat lists of strings
+        and numbers parse several times faster.
+        """
+        self._join_added()
+        entries = list(self.docs.values())
+        return {
+            "token": self.token,
+            "next_num": self.next_num,
+            "base_limit": self.base_limit,
+            "base_docs": self.base_docs,
+            "paths": list(self.docs),
+            "ids": [e.doc_id for e in entries],
+            "nums": [e.num for e in entries],
+            "lengths": [e.length for e in entries],
+            "hashes": [e.content_hash for e in entries],
+            "stats": [e.stat for e in entries],
+            "delta": self.delta,
+        }
+
+    @classmethod
+    def from_table(
+        cls,
+        data: Dict[str, Any],
+        load_shard: Optional[Callable[[str, str], Optional[Postings]]] = None,
+    ) -> "SearchIndex":
+        """Inverse of to_table().
+
+        Raises:
+            KeyError, TypeError, ValueError: If ``data`` is malformed
+        """
+        columns = [data[name] for name in ("paths", "ids", "nums", "lengths", "hashes", "stats")]
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("search table columns differ in length")
+        paths, ids, nums, lengths, hashes, stats = columns
+        docs = dict(zip(paths, map(SearchDoc, ids, nums, lengths, hashes, stats)))
+        delta = data["delta"]
+        if not isinstance(delta, dict):
+            raise TypeError("search delta is not a mapping")
+        return cls(
+            docs, int(data["next_num"]), str(data["token"]),
+            int(data["base_limit"]), int(data["base_docs"]), delta, load_shard,
+        )
+
+    def saved(self) -> None:
+        """Record that the index was persisted."""
+        self.dirty = False
+        if self._merged and self._load_shard is not None:
+            # The merge held every shard in memory; read back on demand instead
+            self._shards = {}
+        self._merged = False
@@ -1,9 +1,47 @@
 """
-Token estimation utilities for context map generation.
+Token counting for context map generation.
 
 Extracted from ontos_generate_context_map.py lines 71-102 during Phase 2 decomposition.
+
+Counting is pluggable through TokenCounter:
+
+- HeuristicCounter: ~4 characters per token (estimate_tokens). The
+  default, and the fallback when a vocabulary cannot be read.
+- BPECounter: byte-level BPE over a vocabulary in tiktoken's rank file
+  format ("<base64 token> <rank>" per line). Opt-in: with a model's own
+  rank file (e.g. cl100k_base.tiktoken) counts match that model exactly.
+  ontos.io.tokens also bundles a small vocabulary trained on this repo,
+  whose counts approximate but match no real model's tokenizer.
+- CachedCounter: wraps another counter with a memo keyed by content
+  hash, which ontos.io.tokens persists in .ontos/cache/.
+
+Every counter has a batch API, count_batch(), for counting many
+documents in one call.
+
+PURE: no I/O. Vocabularies and memos are passed in.
 """
 
+import base64
+import hashlib
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional
+
+# Pre-tokenization: the cl100k_base split pattern, written for the re
+# module ([^\W\d_] stands in for \p{L} and \d for \p{N})
+_PIECE = re.compile(
+    r"'(?i:[sdmt]|ll|ve|re)"
+    r"|(?:[^\r\n\w]|_)?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+# Texts shorter than this are recounted rather than memoized
+MEMO_MIN_LENGTH = 256
+
 
 def estimate_tokens(content: str) -> int:
     """Estimate token count using character-based heuristic.
@@ -37,3 +75,187 @@ def format_token_count(tokens: int) -> str:
     else:
         k = tokens // 1000
         return f"~{k}k tokens"
+
+
+def content_key(text: str) -> str:
+    """Memo key of a text: a short hash of its content."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+class TokenCounter:
+    """Counts tokens in text.
+
+    ``name`` identifies the counter and its vocabulary; counts memoized
+    under one name are only reused by a counter of the same name.
+    """
+
+    name = "counter"
+
+    def count(self, text: str) -> int:
+        """Number of tokens in ``text``."""
+        raise NotImplementedError
+
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        """Token counts of many texts, in order."""
+        return [self.count(text) for text in texts]
+
+
+class HeuristicCounter(TokenCounter):
+    """Character-based estimate (see estimate_tokens)."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        return estimate_tokens(text)
+
+
+def parse_bpe_ranks(data: bytes) -> Dict[bytes, int]:
+    """Parse a vocabulary in tiktoken's rank file format.
+
+    Raises:
+        ValueError: If a line is malformed
+    """
+    ranks = {}
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        token, rank = line.split()
+        ranks[base64.b64decode(token, validate=True)] = int(rank)
+    return ranks
+
+
+class BPECounter(TokenCounter):
+    """Byte-level BPE token counts over a ranked vocabulary.
+
+    Text is split into pieces by the cl100k_base pattern, then each
+    piece's UTF-8 bytes are merged pairwise, lowest rank first, as long
+    as the merged bytes are in the vocabulary. Only the number of
+    resulting tokens is computed. Piece counts are cached, so repeated
+    words cost one dictionary lookup.
+
+    Args:
+        ranks: Token bytes -> rank (see parse_bpe_ranks); must contain
+            every single byte
+        name: Counter name, e.g. derived from the vocabulary file
+    """
+
+    # Piece counts kept in memory before the cache is cleared
+    PIECE_CACHE_SIZE = 200_000
+
+    def __init__(self, ranks: Dict[bytes, int], name: str = "bpe"):
+        self.ranks = ranks
+        self.name = name
+        self._pieces: Dict[str, int] = {}
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        pieces = self._pieces
+        if len(pieces) > self.PIECE_CACHE_SIZE:
+            pieces.clear()
+        total = 0
+        for piece in _PIECE.findall(text):
+            n = pieces.get(piece)
+            if n is None:
+                n = pieces[piece] = self._merge_count(piece.encode("utf-8"))
+            total += n
+        return total
+
+    def _merge_count(self, piece: bytes) -> int:
+        ranks = self.ranks
+        n = len(piece)
+        if n <= 1 or piece in ranks:
+            return n and 1
+        # Linked list of token start offsets; the heap holds candidate
+        # merges (rank, start, next start, end), lazily invalidated
+        nxt = list(range(1, n + 1))
+        prv = list(range(-1, n - 1))
+        alive = [True] * n
+
+        def candidate(i: int):
+            j = nxt[i]
+            if j < n:
+                k = nxt[j]
+                rank = ranks.get(piece[i:k])
+                if rank is not None:
+                    return rank, i, j, k
+            return None
+
+        heap = [c for c in map(candidate, range(n - 1)) if c is not None]
+        heapq.heapify(heap)
+        count = n
+        while heap:
+            _, i, j, k = heapq.heappop(heap)
+            if not alive[i] or not alive[j] or nxt[i] != j or nxt[j] != k:
+                continue  # Stale: one side has merged since
+            alive[j] = False
+            nxt[i] = k
+            if k < n:
+                prv[k] = i
+            count -= 1
+            for start in (prv[i], i):
+                if start >= 0:
+                    c = candidate(start)
+                    if c is not None:
+                        heapq.heappush(heap, c)
+        return count
+
+
+class CachedCounter(TokenCounter):
+    """A counter with a memo of counts by content hash.
+
+    Texts of at least MEMO_MIN_LENGTH characters are looked up by
+    content_key() before being counted; shorter ones are cheaper to
+    count than to hash. ``dirty`` is set when the memo gains entries.
+
+    Args:
+        counter: Counter doing the actual counting
+        memo: Counts by content_key(), e.g. as persisted by ontos.io.tokens
+    """
+
+    def __init__(self, counter: TokenCounter, memo: Optional[Dict[str, int]] = None):
+        self.counter = counter
+        self.name = counter.name
+        self.memo: Dict[str, int] = memo if memo is not None else {}
+        self.used: Dict[str, None] = {}  # Keys looked up, in order
+        self.dirty = False
+
+    def count(self, text: str) -> int:
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        texts = list(texts)
+        memo, used = self.memo, self.used
+        counts: List[Optional[int]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}  # Key -> positions
+        short: List[int] = []
+        for i, text in enumerate(texts):
+            if len(text) < MEMO_MIN_LENGTH:
+                short.append(i)
+                continue
+            key = content_key(text)
+            used[key] = None
+            n = memo.get(key)
+            if n is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                counts[i] = n
+
+        todo = short + [positions[0] for positions in missing.values()]
+        for i, n in zip(todo, self.counter.count_batch(texts[i] for i in todo)):
+            counts[i] = n
+        for key, positions in missing.items():
+            n = memo[key] = counts[positions[0]]
+            for i in positions[1:]:
+                counts[i] = n
+        if missing:
+            self.dirty = True
+        return counts
+
+    def snapshot(self, limit: int) -> Dict[str, int]:
+        """Up to ``limit`` memo entries, those used in this session first."""
+        memo = self.memo
+        keys = [key for key in self.used if key in memo]
+        if len(keys) < limit:
+            keys += [key for key in memo if key not in self.used][:limit - len(keys)]
+        return {key: memo[key] for key in keys[:limit]}
@@ -11,14 +11,17 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 # =============================================================================
 # RE-EXPORTS (consolidate existing types here)
 # =============================================================================
 
-# Re-export CurationLevel from its canonical location
-from ontos.core.curation import CurationLevel
+from ontos._lazy import lazy_exports as _lazy_exports
+
+# Re-export CurationLevel from its canonical location, resolved on first
+# access so that importing types does not load the curation module
+__getattr__, __dir__ = _lazy_exports(__name__, {"ontos.core.curation": ("CurationLevel",)})
 
 # =============================================================================
 # ENUMS (new)
@@ -62,17 +65,60 @@ class ValidationErrorType(Enum):
 
 @dataclass
 class DocumentData:
-    """Parsed document with frontmatter and content."""
+    """Parsed document with frontmatter and content.
+
+    The body may be loaded lazily: construct with ``content=None`` and a
+    ``body_loader`` callable, and the loader runs on first access to
+    ``content`` (a property, see below). Its result is kept on the
+    instance until release_content().
+    """
     id: str
     type: DocumentType
     status: DocumentStatus
     filepath: Path
     frontmatter: Dict[str, Any]
-    content: str
+    content: Optional[str]
     depends_on: List[str] = field(default_factory=list)
     impacts: List[str] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
     aliases: List[str] = field(default_factory=list)
+    concepts: Optional[List[str]] = None  # Normalized frontmatter concepts; None = not computed
+    body_loader: Optional[Callable[[], str]] = field(default=None, repr=False, compare=False)
+
+    def _get_content(self) -> Optional[str]:
+        content = self._content
+        if content is None and self.body_loader is not None:
+            content = self._content = self.body_loader()
+        return content
+
+    def _set_content(self, value: Optional[str]) -> None:
+        self._content = value
+
+    @property
+    def content_loaded(self) -> bool:
+        """True once the body has been read into memory."""
+        return self._content is not None or self.body_loader is None
+
+    def release_content(self) -> bool:
+        """Drop a lazily loaded body; the next access reads it again.
+
+        Returns:
+            True if a body was dropped (documents built with their content
+            and no ``body_loader`` keep it)
+        """
+        if self.body_loader is None or self._content is None:
+            return False
+        self._content = None
+        return True
+
+
+# Installed after the class body so that the dataclass sees ``content`` as
+# a plain required field; __init__ then assigns it through the setter.
+DocumentData.content = property(
+    DocumentData._get_content,
+    DocumentData._set_content,
+    doc="Document body, read through ``body_loader`` on first access if lazy.",
+)
 
 
 @dataclass
@@ -17,6 +17,7 @@ from ontos.core.types import (
     ValidationErrorType,
 )
 from ontos.core.graph import (
+    DependencyGraph,
     build_graph,
     detect_cycles,
     detect_orphans,
@@ -56,16 +57,20 @@ class ValidationOrchestrator:
     def __init__(
         self,
         docs: Dict[str, DocumentData],
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        graph: Optional[Tuple[DependencyGraph, List[ValidationError]]] = None,
     ):
         """Initialize with documents and optional config.
 
         Args:
             docs: Dictionary mapping doc_id to DocumentData
             config: Optional configuration dict
+            graph: Optional result of build_graph(docs), reused instead of
+                rebuilding it (e.g. DocumentIndex.graph)
         """
         self.docs = docs
         self.config = config or {}
+        self.graph = graph
         self.errors: List[ValidationError] = []
         self.warnings: List[ValidationError] = []
 
@@ -76,24 +81,47 @@ class ValidationOrchestrator:
             ValidationResult with all errors and warnings
         """
         self.validate_graph()
-        self.validate_log_schema()
-        self.validate_impacts()
-        self.validate_describes()
+        self.validate_documents()
 
         return ValidationResult(
             errors=self.errors,
             warnings=self.warnings
         )
 
+    def validate_documents(self) -> None:
+        """Run the per-document checks in a single pass over the documents.
+
+        Same warnings, in the same order, as validate_log_schema(),
+        validate_impacts() and validate_describes() in turn.
+        """
+        schema: List[ValidationError] = []
+        impacts: List[ValidationError] = []
+        describes: List[ValidationError] = []
+        valid_ids = set(self.docs.keys())
+        for doc_id, doc in self.docs.items():
+            error = self._check_log_schema(doc_id, doc)
+            if error:
+                schema.append(error)
+            impacts.extend(self._check_impacts(doc_id, doc))
+            error = validate_describes_field(doc, valid_ids)
+            if error:
+                describes.append(error)
+        self.warnings.extend(schema)
+        self.warnings.extend(impacts)
+        self.warnings.extend(describes)
+
     def validate_graph(self) -> None:
         """Validate dependency graph: broken links, cycles, orphans, depth."""
-        graph, broken_link_errors = build_graph(self.docs)
+        graph, broken_link_errors = self.graph or build_graph(self.docs)
         self.errors.extend(broken_link_errors)
 
         # Detect cycles
         cycles = detect_cycles(graph)
-        for cycle in cycles:
+        for group, cycle in zip(graph.cycle_groups(), cycles):
             cycle_str = " -> ".join(cycle)
+            if len(group) > len(cycle) - 1:
+                # Other documents are caught in the same tangle
+                cycle_str += f" (cycle group of {len(group)} documents: {', '.join(group)})"
             self.errors.append(ValidationError(
                 error_type=ValidationErrorType.CYCLE,
                 doc_id=cycle[0],
@@ -133,40 +161,47 @@ class ValidationOrchestrator:
 
     def validate_log_schema(self) -> None:
         """Validate log documents have required v2.0 fields."""
-        required_fields = {"branch", "event_type", "source"}
-
         for doc_id, doc in self.docs.items():
-            # Handle both enum and string types
-            doc_type = doc.type.value if hasattr(doc.type, 'value') else str(doc.type)
-            if doc_type != "log":
-                continue
+            error = self._check_log_schema(doc_id, doc)
+            if error:
+                self.warnings.append(error)
 
-            missing = required_fields - set(doc.frontmatter.keys())
-            if missing:
-                self.warnings.append(ValidationError(
-                    error_type=ValidationErrorType.SCHEMA,
-                    doc_id=doc_id,
-                    filepath=str(doc.filepath),
-                    message=f"Log missing fields: {', '.join(sorted(missing))}",
-                    fix_suggestion="Add missing fields to frontmatter",
-                    severity="warning"
-                ))
+    def _check_log_schema(self, doc_id: str, doc: DocumentData) -> Optional[ValidationError]:
+        # Handle both enum and string types
+        doc_type = doc.type.value if hasattr(doc.type, 'value') else str(doc.type)
+        if doc_type != "log":
+            return None
+
+        missing = {"branch", "event_type", "source"} - set(doc.frontmatter.keys())
+        if not missing:
+            return None
+        return ValidationError(
+            error_type=ValidationErrorType.SCHEMA,
+            doc_id=doc_id,
+            filepath=str(doc.filepath),
+            message=f"Log missing fields: {', '.join(sorted(missing))}",
+            fix_suggestion="Add missing fields to frontmatter",
+            severity="warning"
+        )
 
     def validate_impacts(self) -> None:
         """Validate impacts[] references exist."""
-        valid_ids = set(self.docs.keys())
-
         for doc_id, doc in self.docs.items():
-            for impact in doc.impacts:
-                if impact not in valid_ids:
-                    self.warnings.append(ValidationError(
-                        error_type=ValidationErrorType.IMPACTS,
-                        doc_id=doc_id,
-                        filepath=str(doc.filepath),
-                        message=f"Impact reference '{impact}' not found",
-                        fix_suggestion=f"Remove '{impact}' or create the document",
-                        severity="warning"
-                    ))
+            self.warnings.extend(self._check_impacts(doc_id, doc))
+
+    def _check_impacts(self, doc_id: str, doc: DocumentData) -> List[ValidationError]:
+        return [
+            ValidationError(
+                error_type=ValidationErrorType.IMPACTS,
+                doc_id=doc_id,
+                filepath=str(doc.filepath),
+                message=f"Impact reference '{impact}' not found",
+                fix_suggestion=f"Remove '{impact}' or create the document",
+                severity="warning"
+            )
+            for impact in doc.impacts
+            if impact not in self.docs
+        ]
 
     def validate_describes(self) -> None:
         """Validate describes field references."""
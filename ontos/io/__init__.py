@@ -5,38 +5,49 @@ Phase 2 creates this layer to isolate I/O operations from core logic.
 Core modules should not import from this package directly.
 """
 
-from ontos.io.yaml import parse_yaml, dump_yaml, parse_frontmatter_yaml
-from ontos.io.git import (
-    get_current_branch,
-    get_commits_since_push,
-    get_changed_files_since_push,
-    get_file_mtime,
-    is_git_repo,
-    get_git_root,
-    get_session_git_log,
-    get_git_config,
-)
-from ontos.io.files import (
-    find_project_root,
-    scan_documents,
-    read_document,
-    load_document,
-    write_text_file,
-)
-from ontos.io.toml import (
-    load_config,
-    load_config_if_exists,
-    write_config,
-    merge_configs,
-)
-# Phase 3: Config I/O
-from ontos.io.config import (
-    CONFIG_FILENAME,
-    find_config,
-    load_project_config,
-    save_project_config,
-    config_exists,
-)
+from ontos._lazy import lazy_exports as _lazy_exports
+
+# Re-exports, resolved on first access (see ontos._lazy)
+_EXPORTS = {
+    "ontos.io.yaml": ("parse_yaml", "dump_yaml", "parse_frontmatter_yaml"),
+    "ontos.io.git": (
+        "get_current_branch",
+        "get_commits_since_push",
+        "get_changed_files_since_push",
+        "get_file_mtime",
+        "get_last_modified_dates",
+        "BulkGitMtimeProvider",
+        "is_git_repo",
+        "get_git_root",
+        "get_session_git_log",
+        "get_git_config",
+    ),
+    "ontos.io.files": (
+        "find_project_root",
+        "scan_documents",
+        "walk_documents",
+        "read_document",
+        "load_document",
+        "write_text_file",
+    ),
+    "ontos.io.index": ("load_document_index",),
+    "ontos.io.toml": (
+        "load_config",
+        "load_config_if_exists",
+        "write_config",
+        "merge_configs",
+    ),
+    # Phase 3: Config I/O
+    "ontos.io.config": (
+        "CONFIG_FILENAME",
+        "find_config",
+        "load_project_config",
+        "save_project_config",
+        "config_exists",
+    ),
+}
+
+__getattr__, __dir__ = _lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # yaml
@@ -48,6 +59,8 @@ __all__ = [
     "get_commits_since_push",
     "get_changed_files_since_push",
     "get_file_mtime",
+    "get_last_modified_dates",
+    "BulkGitMtimeProvider",
     "is_git_repo",
     "get_git_root",
     "get_session_git_log",
@@ -55,9 +68,12 @@ __all__ = [
     # files
     "find_project_root",
     "scan_documents",
+    "walk_documents",
     "read_document",
     "load_document",
     "write_text_file",
+    # index
+    "load_document_index",
     # toml
     "load_config",
     "load_config_if_exists",
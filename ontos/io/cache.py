@@ -0,0 +1,340 @@
+"""
+Persistent on-disk cache storage.
+
+Stores normalized DocumentData under .ontos/cache/ so repeated CLI
+invocations can skip reading and parsing unchanged files. The in-memory
+structure is ontos.core.cache.DocumentCache; this module only handles
+(de)serialization and the cache directory.
+
+The cache is JSON rather than pickle: it lives inside the user's
+repository, and loading it must never execute code.
+
+The other cache files (search, pack and token tables) are also remembered
+in memory by file stat, so a long-running process (``ontos serve``) only
+reads one again after another process rewrites it.
+"""
+
+import json
+import os
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from ontos.core.cache import DocumentCache
+from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+from ontos.io.files import BodyRef
+
+CACHE_DIR = Path(".ontos") / "cache"
+DOCUMENT_CACHE_FILE = "documents.json"
+
+# Bump when the on-disk layout below changes.
+CACHE_FORMAT_VERSION = 3
+
+_TAG = "__ontos_type__"
+
+# Cache files read or written by this process, by (resolved project root,
+# file name): (stat of the file at the time, value built from it)
+_remembered: Dict[Tuple[Path, str], Tuple[Tuple[int, int], Any]] = {}
+
+
+class _UnsupportedValue(Exception):
+    """Raised for frontmatter values that cannot round-trip through JSON."""
+
+
+def get_cache_dir(project_root: Path) -> Path:
+    """Return the cache directory for a project (may not exist yet)."""
+    return project_root / CACHE_DIR
+
+
+def ensure_cache_dir(project_root: Path) -> Path:
+    """Create the cache directory with a self-ignoring .gitignore.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Path to the cache directory
+    """
+    cache_dir = get_cache_dir(project_root)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Created by ontos - local cache, do not commit\n*\n", encoding="utf-8")
+    return cache_dir
+
+
+def cache_fingerprint() -> Dict[str, Any]:
+    """Describe the code that produced a cache file.
+
+    A cache written by a different Ontos version or parser is discarded
+    wholesale on load.
+    """
+    import ontos
+    from ontos.io.yaml import parser_fingerprint
+
+    return {
+        "format": CACHE_FORMAT_VERSION,
+        "ontos_version": ontos.__version__,
+        "parser": parser_fingerprint(),
+    }
+
+
+def read_cache_file(project_root: Path, name: str) -> Optional[Dict[str, Any]]:
+    """Read a JSON cache file if it exists and matches the current fingerprint.
+
+    Args:
+        project_root: Project root directory
+        name: File name inside the cache directory
+
+    Returns:
+        The payload stored under "data", or None if missing, corrupt, or stale.
+    """
+    path = get_cache_dir(project_root) / name
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("fingerprint") != cache_fingerprint():
+        return None
+    data = raw.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def write_cache_file(project_root: Path, name: str, data: Dict[str, Any]) -> bool:
+    """Atomically write a JSON cache file stamped with the current fingerprint.
+
+    Args:
+        project_root: Project root directory
+        name: File name inside the cache directory
+        data: JSON-serializable payload
+
+    Returns:
+        True on success, False if the cache could not be written.
+    """
+    try:
+        cache_dir = ensure_cache_dir(project_root)
+        payload = json.dumps(
+            {"fingerprint": cache_fingerprint(), "data": data},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{name}.", dir=str(cache_dir))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_name, cache_dir / name)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return True
+    except OSError:
+        return False
+
+
+def cache_file_stat(project_root: Path, name: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a cache file, or None if it is missing."""
+    try:
+        st = os.stat(get_cache_dir(project_root) / name)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def stat_key(stat: Optional[Sequence[Any]]) -> Optional[str]:
+    """Encode a document stat tuple as a JSON-safe string (None stays None)."""
+    return "/".join(map(repr, stat)) if stat is not None else None
+
+
+def recall_cache_file(
+    project_root: Path, name: str, stat: Optional[Tuple[int, int]]
+) -> Optional[Any]:
+    """Return the value remembered for a cache file if it is still at ``stat``.
+
+    Args:
+        project_root: Project root directory
+        name: File name inside the cache directory
+        stat: Current cache_file_stat() of the file
+
+    Returns:
+        The value passed to remember_cache_file(), or None if the file has
+        changed (or is missing) since.
+    """
+    remembered = _remembered.get((project_root.resolve(), name))
+    if stat is None or remembered is None or remembered[0] != stat:
+        return None
+    return remembered[1]
+
+
+def remember_cache_file(
+    project_root: Path, name: str, stat: Optional[Tuple[int, int]], value: Any
+) -> None:
+    """Keep the value read from (or written to) a cache file at ``stat``.
+
+    Take ``stat`` before reading the file, or after writing it; a missing
+    file (None) is not remembered.
+    """
+    key = (project_root.resolve(), name)
+    if stat is None:
+        _remembered.pop(key, None)
+    else:
+        _remembered[key] = (stat, value)
+
+
+def forget_cache_file(project_root: Path, name: str) -> None:
+    """Drop the value remembered for a cache file (e.g. after a failed write)."""
+    _remembered.pop((project_root.resolve(), name), None)
+
+
+def load_document_cache(project_root: Path) -> DocumentCache:
+    """Load the persisted document cache for a project.
+
+    Returns an empty cache when no usable cache file exists.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        DocumentCache populated with persisted entries
+    """
+    cache = DocumentCache()
+    data = read_cache_file(project_root, DOCUMENT_CACHE_FILE)
+    if data is None:
+        return cache
+
+    for item in data.get("entries", []):
+        try:
+            doc = _decode_document(item["doc"])
+            cache.set(
+                Path(item["path"]),
+                doc,
+                item["mtime"],
+                size=item.get("size"),
+                inode=item.get("inode"),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    cache.mark_clean()
+    return cache
+
+
+def save_document_cache(project_root: Path, cache: DocumentCache) -> bool:
+    """Persist a document cache if it changed since it was loaded.
+
+    Entries whose frontmatter cannot round-trip through JSON are skipped
+    and will simply be re-parsed next run.
+
+    Args:
+        project_root: Project root directory
+        cache: Cache to persist
+
+    Returns:
+        True if the cache is up to date on disk.
+    """
+    if not cache.dirty:
+        return True
+
+    entries = []
+    for path, entry in cache.items():
+        if not isinstance(entry.data, DocumentData):
+            continue
+        try:
+            doc = _encode_document(entry.data)
+        except _UnsupportedValue:
+            continue
+        entries.append({
+            "path": str(path),
+            "mtime": entry.mtime,
+            "size": entry.size,
+            "inode": entry.inode,
+            "doc": doc,
+        })
+
+    ok = write_cache_file(project_root, DOCUMENT_CACHE_FILE, {"entries": entries})
+    if ok:
+        cache.mark_clean()
+    return ok
+
+
+def _encode_document(doc: DocumentData) -> Dict[str, Any]:
+    """Convert DocumentData to a JSON-safe dict.
+
+    Bodies that were never loaded are stored as a file offset rather than
+    text, so the cache stays proportional to frontmatter size.
+    """
+    data = {
+        "id": _encode_value(doc.id),
+        "type": doc.type.value,
+        "status": doc.status.value,
+        "filepath": str(doc.filepath),
+        "frontmatter": _encode_value(doc.frontmatter),
+        "depends_on": _encode_value(doc.depends_on),
+        "impacts": _encode_value(doc.impacts),
+        "tags": list(doc.tags),
+        "aliases": list(doc.aliases),
+        "concepts": doc.concepts,
+    }
+    if not doc.content_loaded and isinstance(doc.body_loader, BodyRef):
+        data["body_offset"] = doc.body_loader.offset
+    else:
+        data["content"] = doc.content
+    return data
+
+
+def _decode_document(data: Dict[str, Any]) -> DocumentData:
+    """Rebuild DocumentData from its JSON-safe dict."""
+    filepath = Path(data["filepath"])
+    if "content" in data:
+        content, body_loader = data["content"], None
+    else:
+        content, body_loader = None, BodyRef(filepath, data["body_offset"])
+    return DocumentData(
+        id=_decode_value(data["id"]),
+        type=DocumentType(data["type"]),
+        status=DocumentStatus(data["status"]),
+        filepath=filepath,
+        frontmatter=_decode_value(data["frontmatter"]),
+        content=content,
+        depends_on=_decode_value(data["depends_on"]),
+        impacts=_decode_value(data["impacts"]),
+        tags=data["tags"],
+        aliases=data["aliases"],
+        concepts=data["concepts"],
+        body_loader=body_loader,
+    )
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a YAML-derived value, tagging dates so they survive JSON."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    # datetime is a subclass of date; check it first
+    if isinstance(value, datetime):
+        return {_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {_TAG: "date", "value": value.isoformat()}
+    if isinstance(value, list):
+        return [_encode_value(v) for v in value]
+    if isinstance(value, dict):
+        if _TAG in value or not all(isinstance(k, str) for k in value):
+            raise _UnsupportedValue(value)
+        return {k: _encode_value(v) for k, v in value.items()}
+    raise _UnsupportedValue(value)
+
+
+def _decode_value(value: Any) -> Any:
+    """Inverse of _encode_value."""
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    if isinstance(value, dict):
+        tag = value.get(_TAG)
+        if tag == "datetime":
+            return datetime.fromisoformat(value["value"])
+        if tag == "date":
+            return date.fromisoformat(value["value"])
+        return {k: _decode_value(v) for k, v in value.items()}
+    return value
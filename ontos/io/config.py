@@ -61,6 +61,19 @@ def load_project_config(
     return dict_to_config(data, repo_root=effective_repo_root)
 
 
+def load_scan_backend(repo_root: Path) -> str:
+    """Return the configured scanning backend for a project.
+
+    For commands that need nothing else from the config. Falls back to
+    "filesystem" if the config is missing or invalid.
+    """
+    try:
+        config = load_project_config(repo_root / CONFIG_FILENAME, repo_root=repo_root)
+    except Exception:
+        return "filesystem"
+    return config.scanning.backend
+
+
 def save_project_config(config: OntosConfig, path: Path) -> None:
     """Save configuration to .ontos.toml file."""
     data = config_to_dict(config)
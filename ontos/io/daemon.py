@@ -0,0 +1,170 @@
+"""
+Unix domain socket transport for ``ontos serve``.
+
+One request per connection: the client sends a JSON object terminated by a
+newline and reads back a single JSON object. The socket lives in the
+project's .ontos/ directory and is only accessible to its owner.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+SOCKET_NAME = "serve.sock"
+
+# Connecting to a live daemon is immediate; anything slower means it is gone
+CONNECT_TIMEOUT = 0.5
+
+# A client gets this many seconds to send its whole request; the daemon
+# serves one connection at a time, so a silent client must not stall it.
+REQUEST_TIMEOUT = 5.0
+
+_RECV_CHUNK = 65536
+
+
+def socket_path(project_root: Path) -> Path:
+    """Return the daemon socket path for a project."""
+    return project_root / ".ontos" / SOCKET_NAME
+
+
+def send_request(
+    path: Path,
+    request: Dict[str, Any],
+    timeout: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Send one request to a daemon.
+
+    Args:
+        path: Socket path
+        request: JSON-serializable request
+        timeout: Seconds to wait for the response (None waits forever)
+
+    Returns:
+        The decoded response, or None if no daemon answered
+    """
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(path))
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        response = _read_message(sock)
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+    return response if isinstance(response, dict) else None
+
+
+def _read_message(sock: socket.socket, deadline: Optional[float] = None) -> Any:
+    chunks = []
+    while True:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("request not received in time")
+            sock.settimeout(remaining)
+        chunk = sock.recv(_RECV_CHUNK)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+class DaemonServer:
+    """Accept requests on a Unix socket and answer them one at a time.
+
+    Requests are handled serially, so handlers may change process-wide
+    state (working directory, stdout redirection) without locking.
+
+    Args:
+        path: Socket path
+        handler: Maps a request to a response; exceptions become
+            ``{"error": message}`` responses
+        request_timeout: Seconds a client has to send its request before
+            the connection is closed unanswered
+
+    Raises:
+        OSError: If the socket cannot be bound
+        FileExistsError: If another daemon is already listening on ``path``
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+        request_timeout: float = REQUEST_TIMEOUT,
+    ):
+        self.path = path
+        self.handler = handler
+        self.request_timeout = request_timeout
+        self._stop = threading.Event()
+
+        if send_request(path, {"ping": True}, timeout=CONNECT_TIMEOUT) is not None:
+            raise FileExistsError(f"A daemon is already listening on {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            path.unlink()  # Left behind by a daemon that did not shut down
+        except FileNotFoundError:
+            pass
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            self._sock.bind(str(path))
+        except OSError:
+            self._sock.close()
+            raise
+        finally:
+            os.umask(old_umask)
+        self._sock.listen(16)
+        self._sock.settimeout(0.5)  # Lets serve_forever notice stop()
+
+    def serve_forever(self) -> None:
+        """Handle requests until stop() is called."""
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    self._handle(conn)
+        finally:
+            self.close()
+
+    def _handle(self, conn: socket.socket) -> None:
+        try:
+            request = _read_message(conn, time.monotonic() + self.request_timeout)
+        except (OSError, ValueError):
+            return  # Includes socket.timeout: closed without an answer
+        try:
+            response = self.handler(request)
+        except Exception as e:
+            response = {"error": str(e)}
+        try:
+            conn.settimeout(self.request_timeout)
+            conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:
+            pass  # Client went away or stopped reading
+
+    def stop(self) -> None:
+        """Ask serve_forever() to return (safe from any thread)."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Close and remove the socket."""
+        if self._sock.fileno() >= 0:
+            self._sock.close()
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
@@ -8,13 +8,53 @@ Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.7
 """
 
 import os
-from fnmatch import fnmatch
+import re
+import tempfile
+from dataclasses import dataclass
+from fnmatch import translate
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Any
 
+from ontos.core.index import LoadResult
 from ontos.core.types import DocumentType, DocumentStatus, DocumentData
 
+# Below this many files, process start-up costs more than parsing saves.
+PARALLEL_MIN_FILES = 256
+
+# Upper bound for the automatic worker count.
+MAX_DEFAULT_JOBS = 8
+
+# Hardcoded exclusion patterns for dependency directories.
+# These are always skipped regardless of .ontosignore presence.
+# Mirrors legacy _scripts/ontos_scaffold.py behavior.
+DEFAULT_IGNORES = [
+    'node_modules', '.venv', 'venv', 'vendor',
+    '__pycache__', '.pytest_cache', '.mypy_cache',
+    'dist', 'build', '.tox', '.eggs',
+]
+
+# Scanning backends: "filesystem" walks directories; "git" lists files from
+# the git index (tracked + untracked-but-not-ignored) and falls back to the
+# filesystem walker for roots outside a git work tree.
+SCAN_BACKENDS = ("filesystem", "git")
+
+# Version-control metadata never contains documents; always pruned.
+VCS_DIRS = frozenset({'.git', '.hg', '.svn'})
+
+# Header-only reads give up (and read the whole file) past this many bytes
+# without a closing frontmatter delimiter.
+FRONTMATTER_MAX_BYTES = 64 * 1024
+
+_READ_CHUNK = 4096
+
+# Bytes that str.lstrip() removes in the ASCII range
+_ASCII_WHITESPACE = frozenset(b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f')
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+_CASE_INSENSITIVE = os.path.normcase('A') == 'a'
+
 
 def find_project_root(start_path: Path = None) -> Path:
     """Find Ontos project root by walking up from start_path.
@@ -57,37 +97,209 @@ def find_project_root(start_path: Path = None) -> Path:
     )
 
 
+class SkipMatcher:
+    """All skip rules for a scan, compiled once.
+
+    Reproduces the historical per-file checks of scan_documents - a pattern
+    skips a file if ``fnmatch(str(path), pattern)`` or ``path.match(pattern)``
+    is true - with one regex per rule kind instead of a Python loop over
+    every pattern for every file.
+
+    Directories are pruned (never entered) when:
+    - their name is in ``ignore_dirs`` or VCS_DIRS, or
+    - a full-path pattern ending in ``*`` already matches ``dir + os.sep``,
+      which guarantees every descendant would be skipped anyway.
+    """
+
+    def __init__(
+        self,
+        patterns: Optional[Iterable[str]] = None,
+        ignore_dirs: Optional[Iterable[str]] = None
+    ):
+        patterns = [p for p in (patterns or []) if p]
+        flags = re.IGNORECASE if _CASE_INSENSITIVE else 0
+
+        self._full = _compile_union(
+            [translate(os.path.normcase(p)) for p in patterns], flags
+        )
+        self._tail = _compile_union(
+            [_translate_path_match(p) for p in patterns], flags
+        )
+        self._dir_prefix = _compile_union(
+            [translate(os.path.normcase(p[:-1])) for p in patterns if p.endswith('*')],
+            flags,
+        )
+        self.ignore_dirs = frozenset(ignore_dirs or ()) | VCS_DIRS
+
+    def skip_file(self, path: str) -> bool:
+        """True if a file path matches any skip pattern."""
+        if self._full is not None and self._full.match(os.path.normcase(path)):
+            return True
+        if self._tail is not None and self._tail.search(path.replace(os.sep, '/')):
+            return True
+        return False
+
+    def skip_dir(self, path: str, name: str) -> bool:
+        """True if nothing below a directory could survive the skip rules."""
+        if name in self.ignore_dirs:
+            return True
+        if self._dir_prefix is not None:
+            return self._dir_prefix.match(os.path.normcase(path + os.sep)) is not None
+        return False
+
+
+def _compile_union(regexes: List[str], flags: int) -> Optional["re.Pattern"]:
+    """Combine regex sources into one alternation (None if empty)."""
+    if not regexes:
+        return None
+    return re.compile('|'.join(f'(?:{r})' for r in regexes), flags)
+
+
+def _translate_path_match(pattern: str) -> str:
+    """Translate a glob to a regex with PurePath.match semantics.
+
+    Wildcards never cross a '/', and relative patterns are anchored at the
+    right on a component boundary (``archive/*`` matches ``a/archive/x.md``).
+    """
+    pattern = pattern.replace(os.sep, '/')
+    if len(pattern) > 1:
+        pattern = pattern.rstrip('/')  # PurePath drops trailing separators
+    anchored = pattern.startswith('/')
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            j = i
+            if j < n and pattern[j] in '!]':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                out.append('\\[')
+            else:
+                body = pattern[i:j].replace('\\', '\\\\')
+                i = j + 1
+                if body.startswith('!'):
+                    out.append(f'[^/{body[1:]}]')
+                else:
+                    out.append(f'[{body}]')
+        else:
+            out.append(re.escape(c))
+    prefix = '^' if anchored else '(?:^|/)'
+    return prefix + ''.join(out) + '\\Z'
+
+
+def walk_documents(
+    dirs: List[Path],
+    skip_patterns: Optional[List[str]] = None,
+    ignore_dirs: Optional[Iterable[str]] = None
+) -> Iterator[Path]:
+    """Yield markdown files under ``dirs`` without entering skipped directories.
+
+    Built on os.scandir. Symlinked directories are not followed (same as
+    Path.rglob). Overlapping roots - e.g. docs_dir inside project_root -
+    are walked once.
+
+    Args:
+        dirs: Directories to scan
+        skip_patterns: Glob patterns to skip (see SkipMatcher)
+        ignore_dirs: Directory names to prune wherever they appear below a root
+
+    Yields:
+        Markdown file paths, in directory-walk order
+    """
+    matcher = SkipMatcher(skip_patterns, ignore_dirs)
+    walked = set()
+
+    for root in dirs:
+        if not root.is_dir():
+            continue
+        root_str = str(root)
+        stack = [root_str]
+        while stack:
+            current = stack.pop()
+            key = os.path.normcase(os.path.abspath(current))
+            if key in walked:
+                continue  # Already covered by an enclosing root
+            walked.add(key)
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not matcher.skip_dir(entry.path, entry.name):
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        if not matcher.skip_file(entry.path):
+                            yield Path(entry.path)
+                except OSError:
+                    continue
+
+
 def scan_documents(
     dirs: List[Path],
-    skip_patterns: List[str] = None
+    skip_patterns: List[str] = None,
+    ignore_dirs: Optional[Iterable[str]] = None,
+    backend: str = "filesystem"
 ) -> List[Path]:
     """Recursively find markdown files.
 
     Args:
         dirs: Directories to scan
         skip_patterns: Glob patterns to skip
+        ignore_dirs: Directory names to prune (e.g. DEFAULT_IGNORES)
+        backend: "filesystem" or "git" (see SCAN_BACKENDS)
 
     Returns:
-        List of markdown file paths
+        Sorted list of unique markdown file paths
     """
-    skip_patterns = skip_patterns or []
-    results = []
+    if backend == "git":
+        return sorted(_walk_git_index(dirs, skip_patterns, ignore_dirs))
+    return sorted(walk_documents(dirs, skip_patterns, ignore_dirs))
 
-    for dir_path in dirs:
-        if not dir_path.exists():
-            continue
-        for md_file in dir_path.rglob("*.md"):
-            # Check skip patterns against full path for robust matching
-            skip = False
-            path_str = str(md_file)
-            for pattern in skip_patterns:
-                if fnmatch(path_str, pattern) or md_file.match(pattern):
-                    skip = True
-                    break
-            if not skip:
-                results.append(md_file)
 
-    return sorted(results)
+def _walk_git_index(
+    dirs: List[Path],
+    skip_patterns: Optional[List[str]],
+    ignore_dirs: Optional[Iterable[str]]
+) -> Iterator[Path]:
+    """Yield markdown files using a single git ls-files call for all roots.
+
+    Gitignored files are never returned. If the roots are not inside one
+    git work tree, they are walked on the filesystem instead.
+    """
+    from ontos.io.git import list_files
+
+    matcher = SkipMatcher(skip_patterns, ignore_dirs)
+    seen = set()
+
+    roots = [root for root in dirs if root.is_dir()]
+    listed = list_files(roots, "*.md")
+    for root in roots:
+        names = listed[root] if listed is not None else None
+        if names is None:
+            candidates = walk_documents([root], skip_patterns, ignore_dirs)
+        else:
+            candidates = (
+                root / name for name in names
+                if not any(part in matcher.ignore_dirs for part in name.split('/')[:-1])
+            )
+        for path in candidates:
+            key = os.path.normcase(os.path.abspath(path))
+            if key in seen:
+                continue  # Overlapping roots
+            seen.add(key)
+            if names is None or not matcher.skip_file(str(path)):
+                yield path
 
 
 def read_document(path: Path) -> str:
@@ -102,13 +314,123 @@ def read_document(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+@dataclass(frozen=True)
+class BodyRef:
+    """Location of a document body on disk; calling it reads the body.
+
+    Used as ``DocumentData.body_loader`` so bodies are only read when
+    something asks for ``content``. Picklable, so lazily loaded documents
+    can cross process boundaries. Bodies are decoded strictly, like
+    read_file_lenient: invalid UTF-8 raises UnicodeDecodeError.
+
+    Attributes:
+        path: Document path
+        offset: Byte offset just past the closing frontmatter delimiter,
+            or None if the document has no frontmatter (the whole file
+            is the body).
+    """
+    path: Path
+    offset: Optional[int] = None
+
+    def __call__(self) -> str:
+        if self.offset is None:
+            from ontos.io.obsidian import read_file_lenient
+            return read_file_lenient(self.path)
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            return f.read().decode('utf-8').lstrip('\n')
+
+
+def read_frontmatter_header(
+    path: Path,
+    max_bytes: int = FRONTMATTER_MAX_BYTES,
+    lenient: bool = True
+) -> Optional[Tuple[str, Optional[int]]]:
+    """Read a document only as far as its closing frontmatter delimiter.
+
+    Applies the same leniency as read_file_lenient (UTF-8 BOM, leading
+    whitespace) and the same delimiter rule as parse_frontmatter_content
+    (first two occurrences of '---'), so parsing the returned header gives
+    the same frontmatter as parsing the whole file.
+
+    Args:
+        path: Path to document
+        max_bytes: Stop streaming after this many bytes without finding
+            the closing delimiter.
+        lenient: If False, frontmatter must open at the first byte of the
+            file (core.frontmatter.parse_frontmatter's rule).
+
+    Returns:
+        (header, body_offset) where header runs from the opening to the end
+        of the closing '---' and body_offset is the byte offset right after
+        it. ("", None) if the document has no frontmatter. None if the
+        header could not be isolated cheaply (cap exceeded, unusual leading
+        whitespace); callers should fall back to a full read.
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the header is not valid UTF-8
+    """
+    with open(path, 'rb') as f:
+        buf = f.read(_READ_CHUNK)
+        start = len(_UTF8_BOM) if lenient and buf.startswith(_UTF8_BOM) else 0
+
+        # Skip leading whitespace, which may span chunks
+        while lenient:
+            while start < len(buf) and buf[start] in _ASCII_WHITESPACE:
+                start += 1
+            if start < len(buf):
+                break
+            chunk = f.read(_READ_CHUNK)
+            if not chunk:
+                return "", None  # Empty or whitespace-only
+            buf += chunk
+            if len(buf) > max_bytes:
+                return None
+
+        if lenient and buf[start] >= 0x80:
+            # Non-ASCII first character: whitespace such as U+00A0 would
+            # be stripped by read_file_lenient, so let a full read decide.
+            head = buf[start:start + 4].decode('utf-8', errors='ignore')
+            if not head or head[0].isspace():
+                return None
+
+        while len(buf) < start + 3:
+            chunk = f.read(_READ_CHUNK)
+            if not chunk:
+                break
+            buf += chunk
+        if buf[start:start + 3] != b'---':
+            return "", None
+
+        # '-' is ASCII, so a byte search cannot match inside a multi-byte
+        # UTF-8 sequence.
+        search_from = start + 3
+        while True:
+            end = buf.find(b'---', search_from)
+            if end != -1:
+                end += 3
+                return buf[start:end].decode('utf-8'), end
+            if len(buf) - start > max_bytes:
+                return None
+            chunk = f.read(_READ_CHUNK)
+            if not chunk:
+                return "", None  # Unterminated frontmatter is no frontmatter
+            # A delimiter may straddle the chunk boundary
+            search_from = max(start + 3, len(buf) - 2)
+            buf += chunk
+
+
 def load_document(
     path: Path,
     frontmatter_parser: Callable[[str], Tuple[Dict[str, Any], str]]
 ) -> DocumentData:
-    """Load and normalize a document file.
+    """Load and normalize a document file, reading only its frontmatter.
 
     This is the type normalization boundary - strings become enums here.
+    The body is read from disk on first access to ``content``; bytes read
+    up front scale with the frontmatter, not the document. A body that is
+    not valid UTF-8 raises UnicodeDecodeError on that first access.
 
     Args:
         path: Path to document
@@ -117,8 +439,14 @@ def load_document(
     Returns:
         DocumentData with normalized types
     """
-    content = path.read_text(encoding="utf-8")
-    return load_document_from_content(path, content, frontmatter_parser)
+    header = read_frontmatter_header(path)
+    if header is None:
+        from ontos.io.obsidian import read_file_lenient
+        return load_document_from_content(path, read_file_lenient(path), frontmatter_parser)
+
+    text, body_offset = header
+    fm = frontmatter_parser(text)[0] if text else {}
+    return _build_document(path, fm, None, BodyRef(path, body_offset))
 
 
 def load_document_from_content(
@@ -136,10 +464,19 @@ def load_document_from_content(
     Returns:
         DocumentData with normalized types
     """
-    from ontos.core.frontmatter import normalize_tags, normalize_aliases
-    
     fm, body = frontmatter_parser(content)
-    
+    return _build_document(path, fm, body)
+
+
+def _build_document(
+    path: Path,
+    fm: Dict[str, Any],
+    body: Optional[str],
+    body_loader: Optional[Callable[[], str]] = None
+) -> DocumentData:
+    """Normalize parsed frontmatter into DocumentData."""
+    from ontos.core.frontmatter import normalize_aliases, normalize_concepts, normalize_tags
+
     doc_id = fm.get("id", path.stem)
 
     # Normalize strings to enums at this boundary
@@ -186,9 +523,80 @@ def load_document_from_content(
         impacts=impacts,
         tags=tags,
         aliases=aliases,
+        concepts=normalize_concepts(fm),
+        body_loader=body_loader,
     )
 
 
+def default_jobs() -> int:
+    """Default number of parser processes, based on CPU count."""
+    return max(1, min(os.cpu_count() or 1, MAX_DEFAULT_JOBS))
+
+
+def load_documents(
+    paths: Sequence[Path],
+    jobs: Optional[int] = None
+) -> List[LoadResult]:
+    """Read and parse many documents, optionally in worker processes.
+
+    Each file goes through load_document with parse_frontmatter_content,
+    exactly like a serial map run: only frontmatter is read, bodies load
+    lazily. Results are returned in the order of
+    ``paths`` regardless of how work was distributed, so output is
+    identical to the serial path.
+
+    Args:
+        paths: Files to load
+        jobs: Worker process count. None picks a default based on CPU count
+            (serial for small inputs); 1 forces serial loading.
+
+    Returns:
+        List of (path, DocumentData or None, error message or None)
+
+    Raises:
+        ValueError: If ``jobs`` is less than 1
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+    paths = list(paths)
+    if jobs is None:
+        jobs = default_jobs() if len(paths) >= PARALLEL_MIN_FILES else 1
+    jobs = min(jobs, len(paths))
+
+    if jobs <= 1:
+        return _load_chunk(paths)
+
+    # Several chunks per worker keeps workers busy when file sizes vary
+    chunk_size = max(1, -(-len(paths) // (jobs * 4)))
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results: List[LoadResult] = []
+            # executor.map yields in submission order -> deterministic merge
+            for chunk_result in executor.map(_load_chunk, chunks):
+                results.extend(chunk_result)
+            return results
+    except (OSError, ImportError, NotImplementedError, RuntimeError):
+        # No working multiprocessing (restricted sandboxes, some platforms)
+        return _load_chunk(paths)
+
+
+def _load_chunk(paths: List[Path]) -> List[LoadResult]:
+    """Load a batch of documents. Runs in worker processes; must stay top-level."""
+    from ontos.io.yaml import parse_frontmatter_content
+
+    results: List[LoadResult] = []
+    for path in paths:
+        try:
+            doc = load_document(path, parse_frontmatter_content)
+            results.append((path, doc, None))
+        except Exception as e:
+            results.append((path, None, str(e)))
+    return results
+
+
 def get_file_mtime(path: Path) -> Optional[datetime]:
     """Get file modification time from filesystem.
 
@@ -221,3 +629,62 @@ def write_text_file(
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content, encoding=encoding)
+
+
+def write_text_atomic(
+    path: Path,
+    chunks: Iterable[str],
+    encoding: str = "utf-8",
+    replace: Optional[Callable[[], bool]] = None,
+) -> bool:
+    """Write text chunk by chunk to a temporary file, then rename it over ``path``.
+
+    Readers see either the old file or the complete new one, and the text
+    is never held in memory as a whole. The temporary file is created next
+    to ``path`` (with a ``.tmp`` suffix, so document scans skip it) and
+    removed if writing fails.
+
+    Args:
+        path: Destination path
+        chunks: Text to write, in order (e.g. a generator)
+        encoding: File encoding
+        replace: Called once every chunk is written; if it returns False,
+            the temporary file is discarded and ``path`` left unchanged
+
+    Returns:
+        True if ``path`` was replaced
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        if replace is not None and not replace():
+            os.unlink(tmp_name)
+            return False
+        if path.exists():
+            # mkstemp creates the file owner-only; keep the old file's mode
+            os.chmod(tmp_name, path.stat().st_mode & 0o7777)
+        else:
+            os.chmod(tmp_name, 0o666 & ~_process_umask())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+_umask: Optional[int] = None
+
+
+def _process_umask() -> int:
+    # os.umask() can only be read by setting it: do so once, not per write
+    global _umask
+    if _umask is None:
+        _umask = os.umask(0o022)
+        os.umask(_umask)
+    return _umask
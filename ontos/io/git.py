@@ -7,10 +7,11 @@ the core/io separation required by the architecture.
 Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.6
 """
 
+import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 def get_current_branch() -> Optional[str]:
@@ -120,6 +121,257 @@ def get_file_mtime(filepath: Path) -> Optional[datetime]:
     return None
 
 
+def get_last_modified_dates(paths: Iterable[Path]) -> Dict[Path, datetime]:
+    """Get last commit dates for many files from one git log pass.
+
+    Equivalent to calling get_file_mtime for each path, but runs a single
+    streamed ``git log --name-only`` over the repository containing the
+    current directory and stops reading as soon as every path has been seen.
+
+    Args:
+        paths: Files to look up (absolute, or relative to the current directory)
+
+    Returns:
+        Mapping from each given path to its last commit's author date.
+        Paths with no git history (untracked, outside the repo) are absent.
+    """
+    root = get_git_root()
+    if root is None:
+        return {}
+    root = root.resolve()
+
+    # git log prints paths relative to the top of the work tree
+    wanted: Dict[str, List[Path]] = {}
+    for path in paths:
+        try:
+            rel = Path(path).resolve().relative_to(root)
+        except (ValueError, OSError):
+            continue
+        wanted.setdefault(rel.as_posix(), []).append(path)
+    if not wanted:
+        return {}
+
+    found: Dict[str, str] = {}
+    remaining = set(wanted)
+    log = LogPathStream(root)
+    try:
+        for commit_date, name in log:
+            if name in remaining:
+                remaining.discard(name)
+                found[name] = commit_date
+                if not remaining:
+                    break  # Early stop: closing the generator kills git
+    finally:
+        log.close()
+
+    dates: Dict[Path, datetime] = {}
+    for name, value in found.items():
+        try:
+            modified = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            continue
+        for path in wanted[name]:
+            dates[path] = modified
+    return dates
+
+
+def get_all_last_modified(
+    root: Path,
+    revision_range: Optional[str] = None,
+    pathspec: Optional[str] = None,
+) -> Optional[Dict[str, str]]:
+    """Map every path changed in a revision range to its newest commit date.
+
+    Args:
+        root: Top of the git work tree
+        revision_range: e.g. "<commit>..HEAD"; None walks all of HEAD
+        pathspec: Optional pathspec limiting the paths reported
+
+    Returns:
+        {repo-relative path: ISO author date}, or None if git failed
+    """
+    found: Dict[str, str] = {}
+    log = LogPathStream(root, revision_range, pathspec)
+    for commit_date, name in log:
+        found.setdefault(name, commit_date)
+    return None if log.failed else found
+
+
+class LogPathStream:
+    """Stream (author date, path) pairs from ``git log --name-only``, newest first.
+
+    Iterate it like a generator; ``close()`` (or garbage collection) stops
+    git early. After exhaustion, ``failed`` tells whether git reported an
+    error (bad revision, not a repository, git missing).
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        revision_range: Optional[str] = None,
+        pathspec: Optional[str] = None,
+    ):
+        args = ["git", "log", "--name-only", "--no-renames", "-z", "--format=%x1e%aI"]
+        if revision_range:
+            args.append(revision_range)
+        args.append("--")
+        if pathspec:
+            args.append(pathspec)
+        self.failed = False
+        try:
+            self._proc = subprocess.Popen(
+                args, cwd=str(root), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            self._proc = None
+            self.failed = True
+        self._pairs = self._read() if self._proc is not None else iter(())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Tuple[str, str]:
+        return next(self._pairs)
+
+    def _read(self):
+        commit_date = None
+        pending = b""
+        # -z output: "\x1e<date>\0\n<path>\0<path>\0\x1e<date>\0..."
+        while True:
+            chunk = self._proc.stdout.read1(65536)
+            if not chunk:
+                break
+            *tokens, pending = (pending + chunk).split(b"\0")
+            for token in tokens:
+                if token.startswith(b"\x1e"):
+                    commit_date = token[1:].decode("ascii", "replace")
+                elif token.strip(b"\n"):
+                    yield commit_date, os.fsdecode(token.lstrip(b"\n"))
+
+        proc, self._proc = self._proc, None
+        proc.stdout.close()
+        self.failed = proc.wait() != 0
+
+    def close(self) -> None:
+        """Stop reading and terminate git if it is still running."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+    def __del__(self):
+        self.close()
+
+
+class BulkGitMtimeProvider:
+    """git_mtime_provider answered from a single bulk git log pass.
+
+    Drop-in replacement for get_file_mtime when many files are queried:
+
+        provider = BulkGitMtimeProvider(paths)
+        for path in paths:
+            get_git_last_modified(path, git_mtime_provider=provider)
+
+    The git pass runs on the first call and covers every path given here.
+    With ``project_root``, Markdown files are answered from the persistent
+    store in .ontos/cache/ (see ontos.io.git_dates), which only reads
+    commits made since the previous run. Paths not given up front fall
+    back to get_file_mtime.
+    """
+
+    def __init__(self, paths: Iterable[Path], project_root: Optional[Path] = None):
+        self._paths = {Path(p).resolve() for p in paths}
+        self._project_root = project_root
+        self._dates: Optional[Dict[Path, datetime]] = None
+
+    def __call__(self, filepath: Path) -> Optional[datetime]:
+        key = Path(filepath).resolve()
+        if key not in self._paths:
+            return get_file_mtime(filepath)
+        if self._dates is None:
+            self._dates = self._load()
+        return self._dates.get(key)
+
+    def _load(self) -> Dict[Path, datetime]:
+        if self._project_root is None:
+            return get_last_modified_dates(self._paths)
+
+        from ontos.io.git_dates import TRACKED_SUFFIX, load_git_dates
+        store = load_git_dates(self._project_root)
+        if store is None:
+            return get_last_modified_dates(self._paths)
+
+        root, stored = store
+        dates: Dict[Path, datetime] = {}
+        uncovered = []
+        for path in self._paths:
+            if path.suffix != TRACKED_SUFFIX:
+                uncovered.append(path)  # Not covered by the store
+                continue
+            try:
+                value = stored.get(path.relative_to(root).as_posix())
+                if value is not None:
+                    dates[path] = datetime.fromisoformat(value)
+            except ValueError:
+                continue
+        if uncovered:
+            dates.update(get_last_modified_dates(uncovered))
+        return dates
+
+
+def list_files(
+    roots: Sequence[Path], pathspec: str = "*.md"
+) -> Optional[Dict[Path, List[str]]]:
+    """List files under several directories from the git index in a single call.
+
+    Returns tracked files plus untracked files that are not gitignored
+    (``git ls-files --cached --others --exclude-standard``). Tracked files
+    deleted from the working tree are dropped. Git runs once, in the
+    deepest directory containing every root; its output is split between
+    the roots here.
+
+    Args:
+        roots: Directories to list
+        pathspec: Git pathspec; '*' also matches across directories
+
+    Returns:
+        Sorted paths relative to each root, keyed by root, or None if the
+        roots are not inside one git work tree or git is unavailable.
+    """
+    if not roots:
+        return {}
+    base = os.path.commonpath([os.path.abspath(root) for root in roots])
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard",
+             "--", pathspec],
+            cwd=base,
+            capture_output=True,
+            timeout=30
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, NotADirectoryError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    names = sorted(
+        name for name in set(os.fsdecode(result.stdout).split("\0"))
+        if name and os.path.isfile(os.path.join(base, name))
+    )
+    listed: Dict[Path, List[str]] = {}
+    for root in roots:
+        prefix = Path(os.path.relpath(os.path.abspath(root), base)).as_posix()
+        if prefix == ".":
+            listed[root] = names
+        else:
+            prefix += "/"
+            listed[root] = [name[len(prefix):] for name in names if name.startswith(prefix)]
+    return listed
+
+
 def is_git_repo() -> bool:
     """Check if current directory is in a git repository."""
     try:
@@ -133,11 +385,16 @@ def is_git_repo() -> bool:
         return False
 
 
-def get_git_root() -> Optional[Path]:
-    """Get the root directory of the git repository."""
+def get_git_root(cwd: Optional[Path] = None) -> Optional[Path]:
+    """Get the root directory of the git repository.
+
+    Args:
+        cwd: Directory inside the repository (defaults to current directory)
+    """
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
+            cwd=str(cwd) if cwd else None,
             capture_output=True,
             text=True,
             timeout=5
@@ -149,6 +406,47 @@ def get_git_root() -> Optional[Path]:
     return None
 
 
+def get_head_commit(cwd: Optional[Path] = None) -> Optional[str]:
+    """Get the full SHA of HEAD.
+
+    Args:
+        cwd: Directory inside the repository (defaults to current directory)
+
+    Returns:
+        Commit SHA, or None outside a repo or before the first commit
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "-q", "HEAD"],
+            cwd=str(cwd) if cwd else None,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except (subprocess.TimeoutExpired, FileNotFoundError, NotADirectoryError):
+        pass
+    return None
+
+
+def is_ancestor(commit: str, descendant: str = "HEAD", cwd: Optional[Path] = None) -> bool:
+    """Check whether commit is reachable from descendant.
+
+    False if either commit is unknown (e.g. after a history rewrite and gc).
+    """
+    try:
+        result = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", commit, descendant],
+            cwd=str(cwd) if cwd else None,
+            capture_output=True,
+            timeout=10
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, NotADirectoryError):
+        return False
+
+
 def get_session_git_log(max_commits: int = 20) -> List[str]:
     """Get git log for session summary.
 
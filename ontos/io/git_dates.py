@@ -0,0 +1,75 @@
+"""
+Persistent git last-modified store.
+
+Keeps the last commit date of every Markdown file in history under
+.ontos/cache/, stamped with the HEAD commit it was computed at. A later run
+reads only the commits between that cursor and the new HEAD
+(``git log <cursor>..HEAD``); the store is rebuilt from scratch only when
+the cursor is no longer an ancestor of HEAD (rebase, reset, amend) or the
+store is missing or from another Ontos version.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ontos.io.cache import read_cache_file, write_cache_file
+from ontos.io.git import get_all_last_modified, get_git_root, get_head_commit, is_ancestor
+
+GIT_DATES_CACHE_FILE = "git_dates.json"
+
+# Only documents are tracked; this bounds the store by the Markdown files
+# that ever existed in history.
+TRACKED_SUFFIX = ".md"
+TRACKED_PATHSPEC = "*" + TRACKED_SUFFIX
+
+
+def load_git_dates(project_root: Path) -> Optional[Tuple[Path, Dict[str, str]]]:
+    """Return last commit dates as of HEAD, updating the store incrementally.
+
+    Commits reached through ``<cursor>..HEAD`` take precedence over what was
+    stored, so a file's date is that of the latest commit touching it on
+    the way to the current HEAD.
+
+    Args:
+        project_root: Project root (the store lives in its cache directory)
+
+    Returns:
+        (git work-tree root, {root-relative path: ISO author date}), or
+        None outside a git repository, before the first commit, or if git
+        fails.
+    """
+    root = get_git_root(cwd=project_root)
+    if root is None:
+        return None
+    root = root.resolve()
+    head = get_head_commit(cwd=root)
+    if head is None:
+        return None
+
+    data = read_cache_file(project_root, GIT_DATES_CACHE_FILE)
+    dates = None
+    if (
+        data is not None
+        and data.get("root") == str(root)
+        and isinstance(data.get("head"), str)
+        and isinstance(data.get("dates"), dict)
+    ):
+        cursor = data["head"]
+        if cursor == head:
+            return root, data["dates"]
+        if is_ancestor(cursor, head, cwd=root):
+            newer = get_all_last_modified(root, f"{cursor}..{head}", TRACKED_PATHSPEC)
+            if newer is not None:
+                dates = data["dates"]
+                dates.update(newer)
+
+    if dates is None:
+        # No usable store, or history was rewritten: full rebuild
+        dates = get_all_last_modified(root, head, TRACKED_PATHSPEC)
+        if dates is None:
+            return None
+
+    write_cache_file(
+        project_root, GIT_DATES_CACHE_FILE, {"root": str(root), "head": head, "dates": dates}
+    )
+    return root, dates
@@ -0,0 +1,221 @@
+"""
+Standard wiring for the unified document index.
+
+Builds an ontos.core.index.DocumentIndex for a project: scan roots and skip
+patterns from config, the persistent document cache, and the (optionally
+parallel) header-only loader.
+
+A long-running process (``ontos serve``) can register a WarmIndex for its
+project; full-scan loads of that project are then answered from memory.
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ontos.core.config import OntosConfig, default_config
+from ontos.core.index import DocumentIndex, StatKey
+
+# Providers of in-memory indexes, by resolved project root
+_warm_indexes: Dict[Path, Callable[[], DocumentIndex]] = {}
+
+
+def load_document_index(
+    project_root: Path,
+    config: Optional[OntosConfig] = None,
+    dirs: Optional[Sequence[Path]] = None,
+    use_cache: bool = True,
+    jobs: Optional[int] = None,
+) -> DocumentIndex:
+    """Scan a project and return its document index.
+
+    Scanning happens immediately; documents are parsed on first access.
+    When the index loads, the persistent cache is saved.
+
+    Args:
+        project_root: Project root directory
+        config: Project config; loaded from .ontos.toml if None (defaults
+            are used if it is missing or invalid)
+        dirs: Directories to scan. None scans the docs directory and the
+            project root, exactly like ``ontos map``.
+        use_cache: Use the persistent document cache in .ontos/cache/
+        jobs: Parser process count (see ontos.io.files.load_documents)
+
+    Returns:
+        DocumentIndex over the scanned documents
+    """
+    if dirs is None and use_cache and _warm_indexes:
+        provider = _warm_indexes.get(project_root.resolve())
+        if provider is not None:
+            return provider()
+    return _build_index(project_root, config, dirs, use_cache, jobs)
+
+
+def _build_index(
+    project_root: Path,
+    config: Optional[OntosConfig],
+    dirs: Optional[Sequence[Path]],
+    use_cache: bool,
+    jobs: Optional[int],
+) -> DocumentIndex:
+    from ontos.io.cache import load_document_cache, save_document_cache
+    from ontos.io.files import load_documents
+
+    if config is None:
+        config = _load_config_or_default(project_root)
+
+    full_scan = dirs is None
+    paths = scan_project_documents(project_root, config, dirs)
+
+    def persist(index: DocumentIndex) -> None:
+        if full_scan:
+            # Only a full scan can tell which entries belong to deleted files
+            index.cache.retain(index.paths)
+        save_document_cache(project_root, index.cache)
+
+    cache = load_document_cache(project_root) if use_cache else None
+    return DocumentIndex(
+        paths,
+        loader=lambda batch: load_documents(batch, jobs=jobs),
+        stat=stat_key,
+        cache=cache,
+        on_loaded=persist if cache is not None else None,
+    )
+
+
+def scan_project_documents(
+    project_root: Path,
+    config: OntosConfig,
+    dirs: Optional[Sequence[Path]] = None,
+) -> List[Path]:
+    """Scan for documents the way load_document_index does.
+
+    Does not read any file; use with DocumentIndex.update() to rescan.
+
+    Args:
+        project_root: Project root directory
+        config: Project config (skip patterns, docs dir, scan backend)
+        dirs: Directories to scan; None scans the docs directory and the
+            project root
+
+    Returns:
+        Sorted list of document paths
+    """
+    from ontos.core.curation import load_ontosignore
+    from ontos.io.files import DEFAULT_IGNORES, scan_documents
+
+    if dirs is None:
+        dirs = [project_root / config.paths.docs_dir, project_root]
+
+    return scan_documents(
+        list(dirs),
+        skip_patterns=config.scanning.skip_patterns + load_ontosignore(project_root),
+        ignore_dirs=DEFAULT_IGNORES,
+        backend=config.scanning.backend,
+    )
+
+
+def stat_key(path: Path) -> StatKey:
+    """Return (mtime, size, inode) for cache validation.
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    st = path.stat()
+    return st.st_mtime, st.st_size, st.st_ino
+
+
+class WarmIndex:
+    """A project's full DocumentIndex, kept current between requests.
+
+    get() brings the index up to date before returning it: with inotify
+    only files reported as changed are re-checked; without it every file is
+    re-stat'ed (still no re-parse of unchanged files). Editing .ontos.toml
+    or .ontosignore rebuilds the index from scratch.
+
+    Args:
+        project_root: Project root directory
+        watch_backend: "auto", "inotify" or "poll" (see ontos.io.watch)
+    """
+
+    SETTINGS_FILES = (".ontos.toml", ".ontosignore")
+
+    def __init__(self, project_root: Path, watch_backend: str = "auto"):
+        from ontos.io.files import DEFAULT_IGNORES
+        from ontos.io.watch import InotifyWatcher
+
+        self.project_root = project_root.resolve()
+        self.watcher = None
+        if watch_backend != "poll":
+            # No polling thread: without inotify, get() re-stats on demand
+            try:
+                self.watcher = InotifyWatcher([self.project_root], ignore_dirs=DEFAULT_IGNORES)
+            except OSError:
+                if watch_backend == "inotify":
+                    raise
+        self._rebuild()
+
+    def _settings_key(self) -> Tuple:
+        key = []
+        for name in self.SETTINGS_FILES:
+            try:
+                st = os.stat(self.project_root / name)
+                key.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                key.append(None)
+        return tuple(key)
+
+    def _rebuild(self) -> None:
+        self._settings = self._settings_key()
+        self.config = _load_config_or_default(self.project_root)
+        self.index = _build_index(self.project_root, self.config, None, True, None)
+        self.index.load()
+
+    def _pending_changes(self):
+        from ontos.io.watch import WatchBatch
+
+        batch = WatchBatch()
+        while True:
+            more = self.watcher.poll(0)
+            if not more:
+                return batch
+            batch.merge(more)
+
+    def get(self) -> DocumentIndex:
+        """Return the index after applying any file changes."""
+        if self._settings_key() != self._settings:
+            if self.watcher is not None:
+                self._pending_changes()  # Superseded by the rebuild
+            self._rebuild()
+            return self.index
+
+        if self.watcher is None:
+            changed = self.index.paths
+        else:
+            batch = self._pending_changes()
+            if not batch:
+                return self.index
+            changed = self.index.paths if batch.overflow else batch.paths
+        self.index.update(scan_project_documents(self.project_root, self.config), changed)
+        return self.index
+
+    def register(self) -> None:
+        """Serve load_document_index() calls for this project from memory."""
+        _warm_indexes[self.project_root] = self.get
+
+    def close(self) -> None:
+        """Unregister and stop watching."""
+        if _warm_indexes.get(self.project_root) == self.get:
+            del _warm_indexes[self.project_root]
+        if self.watcher is not None:
+            self.watcher.close()
+            self.watcher = None
+
+
+def _load_config_or_default(project_root: Path) -> OntosConfig:
+    from ontos.io.config import CONFIG_FILENAME, load_project_config
+
+    try:
+        return load_project_config(project_root / CONFIG_FILENAME, repo_root=project_root)
+    except Exception:
+        return default_config()
@@ -0,0 +1,104 @@
+"""
+Persistent token estimates for context packs.
+
+Stores the ontos.core.pack estimate of every document in
+.ontos/cache/pack.json, keyed by path together with the stat key the
+document was measured at, for the token counter named in the file.
+``ontos map --budget`` then measures only changed documents (in one
+batch), so packing for a new budget reads no bodies except the ones it
+includes.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ontos.core.index import DocumentIndex
+from ontos.core.pack import PackEstimate, estimate_documents
+from ontos.core.tokens import HeuristicCounter, TokenCounter
+from ontos.core.types import DocumentData
+from ontos.io.cache import (
+    cache_file_stat,
+    forget_cache_file,
+    read_cache_file,
+    recall_cache_file,
+    remember_cache_file,
+    stat_key,
+    write_cache_file,
+)
+
+PACK_CACHE_FILE = "pack.json"
+
+
+def _load_table(project_root: Path) -> Dict[str, Any]:
+    """{"counter": name, "documents": {path: [stat key, entry, body]}}"""
+    file_stat = cache_file_stat(project_root, PACK_CACHE_FILE)
+    data = recall_cache_file(project_root, PACK_CACHE_FILE, file_stat)
+    if data is not None:
+        return data
+    data = read_cache_file(project_root, PACK_CACHE_FILE)
+    if not isinstance(data, dict) or not isinstance(data.get("documents"), dict):
+        data = {"counter": None, "documents": {}}
+    remember_cache_file(project_root, PACK_CACHE_FILE, file_stat, data)
+    return data
+
+
+def refresh_pack_estimates(
+    project_root: Path,
+    documents: DocumentIndex,
+    docs: Iterable[DocumentData],
+    use_cache: bool = True,
+    counter: Optional[TokenCounter] = None,
+) -> Dict[str, PackEstimate]:
+    """Estimates for ``docs``, measuring only documents changed since last time.
+
+    Args:
+        project_root: Project root
+        documents: Document index the documents came from
+        docs: Documents to estimate (e.g. the filtered map documents)
+        use_cache: Read and write .ontos/cache/; otherwise measure every
+            document
+        counter: Token counter (default: the heuristic)
+
+    Returns:
+        PackEstimate by document id
+    """
+    counter = counter or HeuristicCounter()
+    if not use_cache:
+        docs = list(docs)
+        return {doc.id: size for doc, size in zip(docs, estimate_documents(docs, counter))}
+
+    wanted = {id(doc) for doc in docs}
+    table = _load_table(project_root)
+    stored = table["documents"] if table.get("counter") == counter.name else {}
+    estimates: Dict[str, PackEstimate] = {}
+    changed: List[Tuple[str, Optional[str], DocumentData]] = []
+    for path, doc, _ in documents.results:
+        if doc is None or id(doc) not in wanted:
+            continue
+        stat = stat_key(documents.stat(path))
+        entry = stored.get(str(path))
+        if stat is not None and entry is not None and entry[0] == stat:
+            estimates[doc.id] = (entry[1], entry[2])
+        else:
+            changed.append((str(path), stat, doc))
+
+    updated = {}
+    sizes = estimate_documents([doc for _, _, doc in changed], counter)
+    for (path, stat, doc), size in zip(changed, sizes):
+        estimates[doc.id] = size
+        if stat is not None:
+            updated[path] = [stat, *size]
+
+    scanned = {str(path) for path in documents.paths}
+    stale = [path for path in stored if path not in scanned]
+    if updated or stale or stored is not table["documents"]:
+        rows = {path: entry for path, entry in stored.items() if path in scanned}
+        rows.update(updated)
+        table = {"counter": counter.name, "documents": rows}
+        if write_cache_file(project_root, PACK_CACHE_FILE, table):
+            remember_cache_file(
+                project_root, PACK_CACHE_FILE, cache_file_stat(project_root, PACK_CACHE_FILE), table
+            )
+        else:
+            forget_cache_file(project_root, PACK_CACHE_FILE)
+    return estimates
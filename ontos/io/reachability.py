@@ -0,0 +1,84 @@
+"""
+Persistent reachability index.
+
+Stores the ontos.core.reachability index next to the document cache in
+.ontos/cache/, tagged with the state of the document cache it was built
+from. The document cache file is rewritten whenever a document is added,
+changed or removed, so while its stat is unchanged the graph is too: a
+later run loads the stored index without rebuilding or hashing the graph.
+The last index is also kept in memory and reused while that stat matches,
+without reading the file.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from ontos.core.index import DocumentIndex
+from ontos.core.reachability import ReachabilityIndex, build_reachability
+from ontos.io.cache import (
+    DOCUMENT_CACHE_FILE,
+    cache_file_stat,
+    read_cache_file,
+    stat_key,
+    write_cache_file,
+)
+
+REACHABILITY_CACHE_FILE = "reachability.json"
+
+# Last index per project root: (document cache state, index)
+_loaded: Dict[Path, Tuple[str, ReachabilityIndex]] = {}
+
+
+def load_reachability_index(
+    project_root: Path,
+    documents: DocumentIndex,
+    edges: Callable[[], Mapping[str, Sequence[str]]],
+    use_cache: bool = True,
+) -> ReachabilityIndex:
+    """Return the reachability index for a project, reusing a stored one.
+
+    Args:
+        project_root: Project root (the index lives in its cache directory)
+        documents: Full-scan document index the graph was read from
+        edges: Returns doc_id -> ids it depends on; only called when the
+            index has to be rebuilt
+        use_cache: Read and write .ontos/cache/ (the in-memory copy is
+            always used)
+
+    Returns:
+        ReachabilityIndex for the graph ``edges`` returns
+    """
+    source = _documents_source(project_root, documents)
+    if source is None:
+        return build_reachability(edges())
+
+    key = project_root.resolve()
+    loaded = _loaded.get(key)
+    if loaded is not None and loaded[0] == source:
+        return loaded[1]
+
+    index = None
+    data = read_cache_file(project_root, REACHABILITY_CACHE_FILE) if use_cache else None
+    if data is not None and data.get("source") == source:
+        try:
+            index = ReachabilityIndex.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            index = None
+
+    if index is None:
+        index = build_reachability(edges())
+        if use_cache:
+            write_cache_file(
+                project_root, REACHABILITY_CACHE_FILE, {"source": source, **index.to_dict()}
+            )
+
+    _loaded[key] = (source, index)
+    return index
+
+
+def _documents_source(project_root: Path, documents: DocumentIndex) -> Optional[str]:
+    """Stat of the saved document cache, or None if it does not match ``documents``."""
+    cache = documents.load().cache
+    if cache is None or cache.dirty:
+        return None  # No cache, or it could not be saved
+    return stat_key(cache_file_stat(project_root, DOCUMENT_CACHE_FILE))
@@ -0,0 +1,138 @@
+"""
+Persistent full-text search index.
+
+Stores the ontos.core.search index next to the document cache in
+.ontos/cache/: the document table with the delta postings (search.json)
+and one file per base shard (search-<token>-<shard>.json). A query reads
+the table and only the shards of its own terms; saving an edit rewrites
+only the table. A merge writes a new set of shard files under a new
+token, switches the table over, then deletes the old set, so a reader
+never sees a base that does not match its table.
+
+refresh_search_index() compares each document's stat key with the one it
+was indexed at, so unchanged files are neither read nor re-tokenized.
+"""
+
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from ontos.core.index import DocumentIndex
+from ontos.core.search import Postings, SearchIndex
+from ontos.io.cache import (
+    cache_file_stat,
+    forget_cache_file,
+    get_cache_dir,
+    read_cache_file,
+    recall_cache_file,
+    remember_cache_file,
+    stat_key,
+    write_cache_file,
+)
+
+SEARCH_CACHE_FILE = "search.json"
+
+
+def _shard_file(token: str, name: str) -> str:
+    return f"search-{token}-{name}.json"
+
+
+def _shard_loader(project_root: Path):
+    def load_shard(token: str, name: str) -> Optional[Postings]:
+        return read_cache_file(project_root, _shard_file(token, name))
+
+    return load_shard
+
+
+def load_search_index(project_root: Path, use_cache: bool = True) -> SearchIndex:
+    """Return the stored search index, or a new empty one.
+
+    Args:
+        project_root: Project root (the index lives in its cache directory)
+        use_cache: Read .ontos/cache/; otherwise start empty in memory
+
+    Returns:
+        SearchIndex whose base shards load from disk on demand
+    """
+    if not use_cache:
+        return SearchIndex()
+    table_stat = cache_file_stat(project_root, SEARCH_CACHE_FILE)
+    index = recall_cache_file(project_root, SEARCH_CACHE_FILE, table_stat)
+    if index is not None:
+        return index
+
+    index = None
+    data = read_cache_file(project_root, SEARCH_CACHE_FILE)
+    if data is not None:
+        try:
+            index = SearchIndex.from_table(data, _shard_loader(project_root))
+        except (KeyError, TypeError, ValueError):
+            index = None
+    if index is None:
+        index = SearchIndex(load_shard=_shard_loader(project_root))
+    remember_cache_file(project_root, SEARCH_CACHE_FILE, table_stat, index)
+    return index
+
+
+def save_search_index(project_root: Path, index: SearchIndex) -> bool:
+    """Write the index, merging the delta into a new base when due.
+
+    Returns:
+        True on success (or if nothing changed), False if a file could
+        not be written.
+    """
+    if not index.dirty:
+        return True
+    merged = index.needs_merge()
+    if merged:
+        token = uuid.uuid4().hex[:12]
+        for name, shard in index.merge(token).items():
+            if not write_cache_file(project_root, _shard_file(token, name), shard):
+                # The stored table still names the old base; stop reusing this copy
+                forget_cache_file(project_root, SEARCH_CACHE_FILE)
+                return False
+    if not write_cache_file(project_root, SEARCH_CACHE_FILE, index.to_table()):
+        forget_cache_file(project_root, SEARCH_CACHE_FILE)
+        return False
+    index.saved()
+    remember_cache_file(
+        project_root, SEARCH_CACHE_FILE, cache_file_stat(project_root, SEARCH_CACHE_FILE), index
+    )
+
+    if merged:
+        # Shards of earlier bases (and of interrupted merges)
+        current = f"search-{index.token}-"
+        for path in get_cache_dir(project_root).glob("search-*.json"):
+            if not path.name.startswith(current):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    return True
+
+
+def refresh_search_index(
+    project_root: Path,
+    documents: DocumentIndex,
+    use_cache: bool = True,
+) -> SearchIndex:
+    """Return the search index, updated for changed documents and saved.
+
+    Args:
+        project_root: Project root
+        documents: Current document index
+        use_cache: Read and write .ontos/cache/; otherwise index every
+            document in memory
+
+    Returns:
+        SearchIndex covering every loaded document
+    """
+    index = load_search_index(project_root, use_cache)
+    current = []
+    for path, doc, _ in documents.results:
+        if doc is not None:
+            current.append((str(path), doc, stat_key(documents.stat(path))))
+    index.refresh(current)
+    if use_cache:
+        save_search_index(project_root, index)
+    return index
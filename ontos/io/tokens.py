@@ -0,0 +1,168 @@
+"""
+Token counter setup and the persistent count memo.
+
+create_token_counter() builds the counter chosen in the [tokens] section
+of .ontos.toml: the ~4 characters per token heuristic by default, or
+byte-level BPE with counter = "bpe" over a configured tiktoken rank file
+(e.g. cl100k_base.tiktoken, for that model's exact counts) or the
+bundled vocabulary, falling back to the heuristic when the vocabulary
+cannot be read.
+
+load_token_counter() wraps it in a CachedCounter whose memo of counts by
+content hash is stored in .ontos/cache/tokens-<counter name>.json, so
+unchanged text is never recounted; save_token_counter() writes the memo
+back.
+
+count_tokens() is the batch API for callers that only need the counts.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ontos.core.config import OntosConfig
+from ontos.core.tokens import BPECounter, CachedCounter, HeuristicCounter, TokenCounter, parse_bpe_ranks
+from ontos.io.cache import (
+    cache_file_stat,
+    forget_cache_file,
+    read_cache_file,
+    recall_cache_file,
+    remember_cache_file,
+    write_cache_file,
+)
+
+BUNDLED_VOCABULARY = Path(__file__).resolve().parents[1] / "_tokenizer" / "ontos_bpe.tiktoken"
+
+# Memo entries kept on disk (those used most recently first)
+MEMO_LIMIT = 100_000
+
+# Parsed vocabularies by resolved path (None = unreadable)
+_vocabularies: Dict[Path, Optional[BPECounter]] = {}
+
+
+def load_bpe_counter(vocabulary: Optional[Path] = None) -> Optional[BPECounter]:
+    """BPE counter over a tiktoken rank file (default: the bundled one).
+
+    Returns:
+        The counter, or None if the file is missing or not a complete
+        byte-level vocabulary
+    """
+    path = Path(vocabulary or BUNDLED_VOCABULARY).resolve()
+    if path not in _vocabularies:
+        counter = None
+        try:
+            data = path.read_bytes()
+            ranks = parse_bpe_ranks(data)
+        except (OSError, ValueError):
+            ranks = None
+        if ranks is not None and all(bytes([b]) in ranks for b in range(256)):
+            stem = re.sub(r"[^\w.-]", "_", path.stem)
+            digest = hashlib.blake2b(data, digest_size=4).hexdigest()
+            counter = BPECounter(ranks, name=f"bpe-{stem}-{digest}")
+        _vocabularies[path] = counter
+    return _vocabularies[path]
+
+
+def create_token_counter(project_root: Path, config: Optional[OntosConfig] = None) -> TokenCounter:
+    """The counter configured for a project, without a memo.
+
+    Args:
+        project_root: Project root (relative vocabulary paths start here)
+        config: Project config; loaded from .ontos.toml if None (defaults
+            are used if it is missing or invalid)
+    """
+    if config is None:
+        from ontos.io.config import CONFIG_FILENAME, load_project_config
+
+        try:
+            config = load_project_config(project_root / CONFIG_FILENAME, repo_root=project_root)
+        except Exception:
+            config = OntosConfig()
+
+    settings = config.tokens
+    if settings.counter == "bpe":
+        vocabulary = project_root / settings.vocabulary if settings.vocabulary else None
+        counter = load_bpe_counter(vocabulary)
+        if counter is not None:
+            return counter
+    return HeuristicCounter()
+
+
+def _memo_file(name: str) -> str:
+    return f"tokens-{name}.json"
+
+
+def load_token_counter(
+    project_root: Path,
+    config: Optional[OntosConfig] = None,
+    use_cache: bool = True,
+) -> TokenCounter:
+    """The configured counter, memoized by content hash.
+
+    Args:
+        project_root: Project root
+        config: Project config (see create_token_counter)
+        use_cache: Start from the memo in .ontos/cache/; otherwise from
+            an empty one
+
+    Returns:
+        A CachedCounter, or the heuristic counter itself (which is
+        cheaper than hashing)
+    """
+    counter = create_token_counter(project_root, config)
+    if isinstance(counter, HeuristicCounter):
+        return counter
+    if not use_cache:
+        return CachedCounter(counter)
+
+    name = _memo_file(counter.name)
+    file_stat = cache_file_stat(project_root, name)
+    memo = recall_cache_file(project_root, name, file_stat)
+    if memo is None:
+        data = read_cache_file(project_root, name)
+        memo = data if isinstance(data, dict) else {}
+        remember_cache_file(project_root, name, file_stat, memo)
+    return CachedCounter(counter, memo)
+
+
+def save_token_counter(project_root: Path, counter: TokenCounter) -> bool:
+    """Write the memo of a counter from load_token_counter() if it grew.
+
+    Returns:
+        True on success (or if there was nothing to write)
+    """
+    if not isinstance(counter, CachedCounter) or not counter.dirty:
+        return True
+    name = _memo_file(counter.name)
+    memo = counter.snapshot(MEMO_LIMIT)
+    if not write_cache_file(project_root, name, memo):
+        forget_cache_file(project_root, name)
+        return False
+    counter.dirty = False
+    remember_cache_file(project_root, name, cache_file_stat(project_root, name), memo)
+    return True
+
+
+def count_tokens(
+    project_root: Path,
+    texts: Iterable[str],
+    config: Optional[OntosConfig] = None,
+    use_cache: bool = True,
+) -> List[int]:
+    """Count tokens of many texts in one call, reusing and updating the memo.
+
+    Args:
+        project_root: Project root
+        texts: Texts to count (e.g. document bodies)
+        config: Project config (see create_token_counter)
+        use_cache: Read and write the memo in .ontos/cache/
+
+    Returns:
+        Token counts, in order
+    """
+    counter = load_token_counter(project_root, config, use_cache)
+    counts = counter.count_batch(texts)
+    if use_cache:
+        save_token_counter(project_root, counter)
+    return counts
@@ -0,0 +1,369 @@
+"""
+Filesystem watching for ``ontos map --watch``.
+
+Two backends report which paths changed under a set of roots:
+
+- InotifyWatcher: Linux inotify through ctypes (no extra dependency).
+- PollingWatcher: periodic stat snapshots; works everywhere.
+
+Watcher.next_batch() coalesces a burst of events (an editor's save, a git
+checkout) into a single WatchBatch, so callers re-scan once per burst
+instead of once per event.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ontos.io.files import SkipMatcher, walk_documents
+
+# Quiet period that ends a burst of events
+DEFAULT_DEBOUNCE = 0.2
+
+# Stat interval of the polling backend
+DEFAULT_POLL_INTERVAL = 1.0
+
+# A continuous stream of events is still flushed after this many seconds
+MAX_COALESCE = 5.0
+
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+
+# Only these files are reported (directory events are always reported)
+WATCHED_SUFFIX = ".md"
+
+
+@dataclass
+class WatchBatch:
+    """Coalesced changes from one burst of filesystem events.
+
+    Attributes:
+        paths: Files (and directories) that were created, modified, moved
+            or deleted.
+        overflow: Events were lost; callers must treat every file as
+            possibly changed.
+    """
+    paths: Set[Path] = field(default_factory=set)
+    overflow: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.paths) or self.overflow
+
+    def merge(self, other: "WatchBatch") -> None:
+        self.paths |= other.paths
+        self.overflow = self.overflow or other.overflow
+
+
+class Watcher:
+    """Base class: backends implement poll() and close()."""
+
+    def poll(self, timeout: float) -> WatchBatch:
+        """Wait up to ``timeout`` seconds and return the events seen."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release OS resources."""
+
+    def next_batch(
+        self,
+        debounce: float = DEFAULT_DEBOUNCE,
+        timeout: Optional[float] = None,
+    ) -> WatchBatch:
+        """Block until something changes, then coalesce the burst.
+
+        Events keep being merged into the batch until no new event arrives
+        for ``debounce`` seconds (or MAX_COALESCE seconds have passed).
+
+        Args:
+            debounce: Quiet period that ends a burst
+            timeout: Give up after this many seconds without any event and
+                return an empty batch (None waits forever)
+
+        Returns:
+            WatchBatch (empty only if ``timeout`` expired)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        batch = WatchBatch()
+        while not batch:
+            wait = 1.0
+            if deadline is not None:
+                wait = deadline - time.monotonic()
+                if wait <= 0:
+                    return batch
+                wait = min(wait, 1.0)
+            batch.merge(self.poll(wait))
+
+        flush_at = time.monotonic() + MAX_COALESCE
+        while time.monotonic() < flush_at:
+            more = self.poll(debounce)
+            if not more:
+                break
+            batch.merge(more)
+        return batch
+
+    def __enter__(self) -> "Watcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PollingWatcher(Watcher):
+    """Detect changes by comparing stat snapshots of the watched files.
+
+    Args:
+        roots: Directories to watch recursively
+        ignore_dirs: Directory names to prune (VCS directories always are)
+        exclude: Files whose changes are never reported
+        interval: Seconds between snapshots
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        ignore_dirs: Optional[Iterable[str]] = None,
+        exclude: Iterable[Path] = (),
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.roots = list(roots)
+        self.ignore_dirs = ignore_dirs
+        self.exclude = set(exclude)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+        self._next = time.monotonic() + interval
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int, int]]:
+        snapshot = {}
+        for path in walk_documents(self.roots, ignore_dirs=self.ignore_dirs):
+            if path in self.exclude:
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return snapshot
+
+    def poll(self, timeout: float) -> WatchBatch:
+        delay = self._next - time.monotonic()
+        if delay > timeout:
+            time.sleep(max(timeout, 0))
+            return WatchBatch()
+        if delay > 0:
+            time.sleep(delay)
+        self._next = time.monotonic() + self.interval
+
+        old, new = self._snapshot, self._take_snapshot()
+        self._snapshot = new
+        changed = {p for p, key in new.items() if old.get(p) != key}
+        changed.update(p for p in old if p not in new)
+        return WatchBatch(changed)
+
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    return _libc
+
+
+def inotify_available() -> bool:
+    """True if the inotify backend can be used on this system."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        return hasattr(_load_libc(), "inotify_init1")
+    except OSError:
+        return False
+
+
+class InotifyWatcher(Watcher):
+    """Linux inotify watcher covering whole directory trees.
+
+    inotify watches single directories, so one watch is added per directory
+    and new subdirectories are picked up as they appear.
+
+    Args:
+        roots: Directories to watch recursively
+        ignore_dirs: Directory names to prune (VCS directories always are)
+        exclude: Files whose changes are never reported
+
+    Raises:
+        OSError: If inotify is unavailable or the watch limit is reached
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        ignore_dirs: Optional[Iterable[str]] = None,
+        exclude: Iterable[Path] = (),
+    ):
+        if not inotify_available():
+            raise OSError("inotify is not available on this platform")
+        self._libc = _load_libc()
+        self._matcher = SkipMatcher(None, ignore_dirs)
+        self.exclude = set(exclude)
+        self._dirs: Dict[int, Path] = {}
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        try:
+            for root in roots:
+                if root.is_dir():
+                    self._watch_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, root: Path) -> List[Path]:
+        """Watch ``root`` and its subdirectories; return files found inside."""
+        found = []
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC or (directory == root and err != errno.ENOENT):
+                    raise OSError(err, os.strerror(err), str(directory))
+                continue  # Removed before we got to it
+            self._dirs[wd] = directory
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not self._matcher.skip_dir(entry.path, entry.name):
+                        stack.append(Path(entry.path))
+                else:
+                    found.append(Path(entry.path))
+        return found
+
+    def _relevant(self, path: Path, is_dir: bool) -> bool:
+        if path in self.exclude:
+            return False
+        return is_dir or path.name.endswith(WATCHED_SUFFIX)
+
+    def poll(self, timeout: float) -> WatchBatch:
+        batch = WatchBatch()
+        if self._fd < 0:
+            return batch
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return batch
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return batch
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                batch.overflow = True
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._dirs[wd]
+                continue
+            if not name:
+                # The watched directory itself was deleted or moved
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    batch.paths.add(directory)
+                continue
+
+            path = directory / os.fsdecode(name)
+            is_dir = bool(mask & IN_ISDIR)
+            if is_dir and mask & (IN_CREATE | IN_MOVED_TO):
+                if self._matcher.skip_dir(str(path), path.name):
+                    continue
+                # Files may land before the new watch exists; report them too
+                batch.paths.update(
+                    p for p in self._watch_tree(path) if self._relevant(p, False)
+                )
+            if self._relevant(path, is_dir):
+                batch.paths.add(path)
+        return batch
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._dirs.clear()
+
+
+def create_watcher(
+    roots: Iterable[Path],
+    ignore_dirs: Optional[Iterable[str]] = None,
+    exclude: Iterable[Path] = (),
+    backend: str = "auto",
+    interval: float = DEFAULT_POLL_INTERVAL,
+) -> Watcher:
+    """Create a watcher, preferring inotify and falling back to polling.
+
+    Args:
+        roots: Directories to watch recursively
+        ignore_dirs: Directory names to prune
+        exclude: Files whose changes are never reported
+        backend: "auto", "inotify" or "poll" (see WATCH_BACKENDS)
+        interval: Polling interval in seconds
+
+    Returns:
+        A Watcher
+
+    Raises:
+        ValueError: If ``backend`` is unknown
+        OSError: If ``backend`` is "inotify" and inotify cannot be used
+    """
+    if backend not in WATCH_BACKENDS:
+        raise ValueError(f"Unknown watch backend: {backend}")
+    roots = list(roots)
+    if backend in ("auto", "inotify"):
+        try:
+            return InotifyWatcher(roots, ignore_dirs=ignore_dirs, exclude=exclude)
+        except OSError:
+            if backend == "inotify":
+                raise
+    return PollingWatcher(roots, ignore_dirs=ignore_dirs, exclude=exclude, interval=interval)
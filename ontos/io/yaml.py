@@ -7,13 +7,68 @@ Core modules that need YAML parsing should accept a parser function as parameter
 Phase 2 Decomposition - Created from Phase2-Implementation-Spec.md Section 4.9
 """
 
-import yaml
+import os
+from functools import lru_cache
+from importlib.machinery import EXTENSION_SUFFIXES
+from importlib.util import find_spec
 from typing import Any, Dict, Optional
 
+from ontos.core.frontmatter import parse_flat_yaml
+
+# Bump whenever parse_frontmatter_content (or the normalization in
+# io/files.load_document_from_content) changes its output, so persisted
+# document caches built by an older parser are discarded.
+PARSER_VERSION = 2
+
+
+def _yaml():
+    """PyYAML, imported on first use (flat frontmatter never needs it)."""
+    import yaml
+    return yaml
+
+
+@lru_cache(maxsize=None)
+def _safe_loader():
+    """libyaml-backed loader when PyYAML was built with it; same results, much faster."""
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parser_fingerprint() -> str:
+    """Identify the frontmatter parser for cache invalidation.
+
+    Returns:
+        String combining PARSER_VERSION, the PyYAML installation and loader
+    """
+    return f"{PARSER_VERSION}:{_pyyaml_fingerprint()}"
+
+
+@lru_cache(maxsize=None)
+def _pyyaml_fingerprint() -> str:
+    """Checked on every cached run, so PyYAML is located but not imported:
+    the installed package is identified by the stat of its __init__.py,
+    and the C loader by its extension module being present."""
+    spec = find_spec("yaml")
+    if spec is None or not spec.origin or not spec.submodule_search_locations:
+        return "pyyaml-missing"
+    try:
+        st = os.stat(spec.origin)
+        files = os.listdir(spec.submodule_search_locations[0])
+    except OSError:
+        return "pyyaml-unreadable"
+    libyaml = any(
+        name.startswith("_yaml.") and name.endswith(tuple(EXTENSION_SUFFIXES)) for name in files
+    )
+    loader = "CSafeLoader" if libyaml else "SafeLoader"
+    return f"pyyaml-{st.st_mtime_ns}-{st.st_size}:{loader}"
+
 
 def parse_yaml(content: str) -> Dict[str, Any]:
     """Parse YAML content into a dictionary.
 
+    Flat frontmatter is handled by parse_flat_yaml without PyYAML; anything
+    else goes through PyYAML's safe loader (the C loader if available).
+
     Args:
         content: YAML string to parse
 
@@ -25,7 +80,9 @@ def parse_yaml(content: str) -> Dict[str, Any]:
     """
     if not content or not content.strip():
         return {}
-    result = yaml.safe_load(content)
+    result = parse_flat_yaml(content)
+    if result is None:
+        result = _yaml().load(content, Loader=_safe_loader())
     return result if isinstance(result, dict) else {}
 
 
@@ -39,7 +96,7 @@ def dump_yaml(data: Dict[str, Any], default_flow_style: bool = False) -> str:
     Returns:
         YAML string representation
     """
-    return yaml.dump(data, default_flow_style=default_flow_style, allow_unicode=True)
+    return _yaml().dump(data, default_flow_style=default_flow_style, allow_unicode=True)
 
 
 def parse_frontmatter_yaml(content: str) -> Optional[Dict[str, Any]]:
@@ -70,7 +127,7 @@ def parse_frontmatter_yaml(content: str) -> Optional[Dict[str, Any]]:
     yaml_content = '\n'.join(lines[1:end_idx])
     try:
         return parse_yaml(yaml_content)
-    except yaml.YAMLError:
+    except _yaml().YAMLError:
         return None
 
 
@@ -96,7 +153,7 @@ def parse_frontmatter_content(content: str) -> tuple:
     
     try:
         fm = parse_yaml(parts[1])
-    except yaml.YAMLError:
+    except _yaml().YAMLError:
         fm = {}
     body = parts[2].lstrip('\n')
     return fm, body
@@ -1,9 +1,28 @@
-"""MCP module - Placeholder for Phase 2."""
-import warnings
-
-warnings.warn(
-    "The 'ontos.mcp' module is a placeholder for Phase 2. "
-    "No functionality is currently available.",
-    FutureWarning,
-    stacklevel=2
-)
+"""MCP server for Ontos.
+
+Exposes the project's document graph to AI agents through the Model
+Context Protocol (JSON-RPC 2.0 over stdio). Requires the ``mcp`` extra:
+
+    pip install 'ontos[mcp]'
+
+Run with ``ontos mcp`` or ``python -m ontos.mcp``.
+"""
+
+try:
+    import pydantic  # noqa: F401
+except ImportError as e:
+    raise ImportError(
+        "The Ontos MCP server requires pydantic. Install it with: pip install 'ontos[mcp]'"
+    ) from e
+
+from ontos.mcp.server import OntosMcpServer, serve_stdio
+from ontos.mcp.tools import TOOLS, GraphSnapshot, Tool, ToolError
+
+__all__ = [
+    "OntosMcpServer",
+    "serve_stdio",
+    "TOOLS",
+    "GraphSnapshot",
+    "Tool",
+    "ToolError",
+]
@@ -0,0 +1,8 @@
+"""Entry point for ``python -m ontos.mcp``."""
+
+import sys
+
+from ontos.mcp import serve_stdio
+
+if __name__ == "__main__":
+    sys.exit(serve_stdio())
@@ -0,0 +1,182 @@
+"""
+MCP server speaking JSON-RPC 2.0 over stdio.
+
+Messages are newline-delimited JSON objects (the MCP stdio transport).
+Supported methods: ``initialize``, ``ping``, ``tools/list`` and
+``tools/call``; notifications are accepted and ignored.
+
+The project is loaded once into an ontos.io.index.WarmIndex when the server
+starts. Each tool call first applies pending file changes to it (no rescan
+with inotify), then answers from a GraphSnapshot (see ontos.mcp.tools).
+"""
+
+import json
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO
+
+from pydantic import ValidationError
+
+import ontos
+from ontos.mcp.tools import TOOLS, GraphSnapshot, ToolError
+
+# Newest first; the client's version is echoed back when we support it
+PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class _RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class OntosMcpServer:
+    """Answers MCP requests for one project.
+
+    Args:
+        project_root: Project root directory
+        warm: WarmIndex to serve from (created from project_root if None)
+    """
+
+    def __init__(self, project_root: Path, warm=None):
+        from ontos.io.index import WarmIndex
+
+        self.project_root = project_root.resolve()
+        self.warm = warm or WarmIndex(self.project_root)
+        self.tools = {tool.name: tool for tool in TOOLS}
+        self._snapshot: Optional[GraphSnapshot] = None
+
+    def snapshot(self) -> GraphSnapshot:
+        """Current snapshot, rebuilt only if the index changed."""
+        index = self.warm.get()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.index is not index or snapshot.generation != index.generation:
+            snapshot = self._snapshot = GraphSnapshot(index, self.project_root)
+        return snapshot
+
+    # -------------------------------------------------------------------------
+    # JSON-RPC
+    # -------------------------------------------------------------------------
+
+    def handle(self, message: Any) -> Optional[Dict[str, Any]]:
+        """Handle one decoded message; returns the response (None for notifications)."""
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" \
+                or not isinstance(message.get("method"), str):
+            return _error_response(
+                message.get("id") if isinstance(message, dict) else None,
+                INVALID_REQUEST, "Invalid Request",
+            )
+        if "id" not in message:
+            return None  # Notification (e.g. notifications/initialized)
+
+        request_id = message["id"]
+        params = message.get("params") or {}
+        try:
+            if not isinstance(params, dict):
+                raise _RpcError(INVALID_PARAMS, "params must be an object")
+            result = self._dispatch(message["method"], params)
+        except _RpcError as e:
+            return _error_response(request_id, e.code, str(e))
+        except Exception as e:
+            return _error_response(request_id, INTERNAL_ERROR, f"Internal error: {e}")
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _dispatch(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if method == "initialize":
+            requested = params.get("protocolVersion")
+            return {
+                "protocolVersion": requested if requested in PROTOCOL_VERSIONS else PROTOCOL_VERSIONS[0],
+                "capabilities": {"tools": {"listChanged": False}},
+                "serverInfo": {"name": "ontos", "version": ontos.__version__},
+            }
+        if method == "ping":
+            return {}
+        if method == "tools/list":
+            return {"tools": [tool.definition() for tool in self.tools.values()]}
+        if method == "tools/call":
+            return self.call_tool(params.get("name"), params.get("arguments") or {})
+        raise _RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+
+    def call_tool(self, name: Any, arguments: Any) -> Dict[str, Any]:
+        """Run a tool and wrap its result as MCP tool content."""
+        tool = self.tools.get(name)
+        if tool is None:
+            raise _RpcError(INVALID_PARAMS, f"Unknown tool: {name}")
+        try:
+            args = tool.args.model_validate(arguments)
+        except ValidationError as e:
+            raise _RpcError(INVALID_PARAMS, f"Invalid arguments for {name}: {e}")
+
+        try:
+            result = tool.run(self.snapshot(), args, self.warm.config)
+        except ToolError as e:
+            return {"content": [{"type": "text", "text": str(e)}], "isError": True}
+        return {
+            "content": [{"type": "text", "text": json.dumps(result, default=str)}],
+            "structuredContent": result,
+            "isError": False,
+        }
+
+    # -------------------------------------------------------------------------
+    # Transport
+    # -------------------------------------------------------------------------
+
+    def serve(self, stdin: TextIO, stdout: TextIO) -> None:
+        """Read requests from ``stdin`` and write responses to ``stdout`` until EOF."""
+        for line in stdin:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                response = _error_response(None, PARSE_ERROR, "Parse error")
+            else:
+                # Anything printed by command code must not corrupt the protocol
+                with redirect_stdout(sys.stderr):
+                    if isinstance(message, list):
+                        responses = [r for r in map(self.handle, message) if r is not None]
+                        response = responses or None
+                    else:
+                        response = self.handle(message)
+            if response is not None:
+                stdout.write(json.dumps(response, default=str) + "\n")
+                stdout.flush()
+
+
+def _error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def serve_stdio(project_root: Optional[Path] = None) -> int:
+    """Run the MCP server on stdin/stdout.
+
+    Args:
+        project_root: Project to serve (found from the working directory if None)
+
+    Returns:
+        Exit code
+    """
+    from ontos.io.files import find_project_root
+
+    try:
+        root = project_root or find_project_root()
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    server = OntosMcpServer(root)
+    try:
+        server.serve(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.warm.close()
+    return 0
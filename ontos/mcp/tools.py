@@ -0,0 +1,308 @@
+"""
+MCP tools over an in-memory project index.
+
+Every tool reads from a GraphSnapshot: lookup tables derived once from the
+warm DocumentIndex and rebuilt only when the index changes. Arguments are
+validated with pydantic models, whose JSON schemas are advertised in
+``tools/list``.
+
+List results are paginated (``cursor``/``limit``) and long texts are
+returned in slices (``cursor``/``max_chars``); in both cases a page is also
+cut short once it would exceed MAX_PAGE_BYTES, so no response grows
+without bound.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ontos.core.index import DocumentIndex, document_concepts
+from ontos.core.types import DocumentData
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+DEFAULT_MAX_CHARS = 20_000
+MAX_CHARS = 100_000
+
+# Upper bound for the serialized payload of one page
+MAX_PAGE_BYTES = 128 * 1024
+
+
+class ToolError(Exception):
+    """A tool call failed; reported to the client as an error result."""
+
+
+# =============================================================================
+# Argument models
+# =============================================================================
+
+class _Args(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class _PageArgs(_Args):
+    cursor: Optional[str] = Field(None, description="nextCursor from the previous page")
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size")
+
+
+class _TextArgs(_Args):
+    cursor: Optional[str] = Field(None, description="nextCursor from the previous slice")
+    max_chars: int = Field(
+        DEFAULT_MAX_CHARS, ge=1, le=MAX_CHARS, description="Maximum characters to return"
+    )
+
+
+class ContextMapArgs(_TextArgs):
+    compact: Literal["off", "basic", "rich"] = Field(
+        "off", description="Compact output mode, as in `ontos map --compact`"
+    )
+
+
+class ListDocumentsArgs(_PageArgs):
+    type: Optional[str] = Field(None, description="Only documents of this type")
+    status: Optional[str] = Field(None, description="Only documents with this status")
+
+
+class RelationArgs(_PageArgs):
+    id: str = Field(..., min_length=1, description="Document id")
+    transitive: bool = Field(False, description="Follow the relation transitively")
+
+
+class ConceptArgs(_PageArgs):
+    concept: str = Field(..., min_length=1, description="Concept tag")
+
+
+class StaleArgs(_PageArgs):
+    days: int = Field(..., ge=0, description="Age threshold in days")
+
+
+class DocumentArgs(_TextArgs):
+    id: str = Field(..., min_length=1, description="Document id")
+    include_body: bool = Field(True, description="Include the document body")
+
+
+# =============================================================================
+# Snapshot
+# =============================================================================
+
+class GraphSnapshot:
+    """Lookup tables derived from one generation of a DocumentIndex."""
+
+    def __init__(self, index: DocumentIndex, project_root: Path):
+        self.index = index
+        self.project_root = project_root
+        self.generation = index.generation
+        graph, _ = index.graph
+        self.depends_on: Dict[str, List[str]] = graph.edges
+        self.depended_by: Dict[str, List[str]] = graph.reverse_edges
+        self.summaries: Dict[str, Dict[str, Any]] = {
+            doc_id: self._summary(doc) for doc_id, doc in index.documents.items()
+        }
+        self._memo: Dict[Any, Any] = {}
+
+    def _summary(self, doc: DocumentData) -> Dict[str, Any]:
+        path = doc.filepath
+        try:
+            path = path.relative_to(self.project_root)
+        except ValueError:
+            pass
+        return {
+            "id": doc.id,
+            "type": doc.type.value,
+            "status": doc.status.value,
+            "path": path.as_posix(),
+            "depends_on": list(doc.depends_on),
+            "concepts": document_concepts(doc),
+        }
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Compute a derived value once per snapshot."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def require(self, doc_id: str) -> DocumentData:
+        doc = self.index.get(doc_id)
+        if doc is None:
+            raise ToolError(f"Unknown document id: {doc_id}")
+        return doc
+
+    def walk(self, edges: Dict[str, List[str]], start: str, transitive: bool) -> List[str]:
+        """Ids reachable from ``start`` over ``edges`` (breadth-first order)."""
+        if not transitive:
+            return list(edges.get(start, ()))
+        seen = {start}
+        order = []
+        frontier = [start]
+        while frontier:
+            following = []
+            for node in frontier:
+                for neighbor in edges.get(node, ()):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        order.append(neighbor)
+                        following.append(neighbor)
+            frontier = following
+        return order
+
+    def describe(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Summaries for ids; ids without a document (broken links) are marked."""
+        return [self.summaries.get(i) or {"id": i, "missing": True} for i in ids]
+
+
+# =============================================================================
+# Pagination
+# =============================================================================
+
+def _decode_cursor(cursor: Optional[str]) -> int:
+    if cursor is None:
+        return 0
+    if not cursor.isdigit():
+        raise ToolError(f"Invalid cursor: {cursor!r}")
+    return int(cursor)
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, default=str).encode("utf-8"))
+
+
+def paginate(items: List[Any], cursor: Optional[str], limit: int) -> Dict[str, Any]:
+    """Return one page of ``items`` that fits in MAX_PAGE_BYTES."""
+    start = _decode_cursor(cursor)
+    page = items[start:start + limit]
+    while len(page) > 1 and _json_size(page) > MAX_PAGE_BYTES:
+        page = page[:len(page) // 2]
+    end = start + len(page)
+    return {
+        "items": page,
+        "total": len(items),
+        "nextCursor": str(end) if end < len(items) else None,
+    }
+
+
+def slice_text(text: str, cursor: Optional[str], max_chars: int) -> Dict[str, Any]:
+    """Return a slice of ``text``, preferably ending at a line break."""
+    start = _decode_cursor(cursor)
+    end = min(start + max_chars, len(text))
+    while end > start and len(text[start:end].encode("utf-8")) > MAX_PAGE_BYTES:
+        end = start + (end - start) // 2
+    if end < len(text):
+        newline = text.rfind("\n", start, end)
+        if newline > start + (end - start) // 2:
+            end = newline + 1
+    return {
+        "text": text[start:end],
+        "totalChars": len(text),
+        "nextCursor": str(end) if end < len(text) else None,
+    }
+
+
+# =============================================================================
+# Tools
+# =============================================================================
+
+def get_context_map(snapshot: GraphSnapshot, args: ContextMapArgs, config) -> Dict[str, Any]:
+    from ontos.commands.map import CompactMode, MapOptions, MapSession
+
+    def render() -> str:
+        options = MapOptions(quiet=True, compact=CompactMode(args.compact))
+        return MapSession(snapshot.project_root, config, options, snapshot.index).render()
+
+    text = snapshot.memo(("map", args.compact), render)
+    return slice_text(text, args.cursor, args.max_chars)
+
+
+def list_documents(snapshot: GraphSnapshot, args: ListDocumentsArgs, config) -> Dict[str, Any]:
+    items = [
+        s for s in snapshot.summaries.values()
+        if (args.type is None or s["type"] == args.type)
+        and (args.status is None or s["status"] == args.status)
+    ]
+    return paginate(items, args.cursor, args.limit)
+
+
+def get_dependencies(snapshot: GraphSnapshot, args: RelationArgs, config) -> Dict[str, Any]:
+    snapshot.require(args.id)
+    ids = snapshot.walk(snapshot.depends_on, args.id, args.transitive)
+    return paginate(snapshot.describe(ids), args.cursor, args.limit)
+
+
+def get_dependents(snapshot: GraphSnapshot, args: RelationArgs, config) -> Dict[str, Any]:
+    snapshot.require(args.id)
+    ids = snapshot.walk(snapshot.depended_by, args.id, args.transitive)
+    return paginate(snapshot.describe(ids), args.cursor, args.limit)
+
+
+def search_concept(snapshot: GraphSnapshot, args: ConceptArgs, config) -> Dict[str, Any]:
+    ids = [doc.id for doc in snapshot.index.with_concept(args.concept)]
+    return paginate(snapshot.describe(ids), args.cursor, args.limit)
+
+
+def find_stale(snapshot: GraphSnapshot, args: StaleArgs, config) -> Dict[str, Any]:
+    from ontos.commands.query import query_stale, scan_docs_for_query
+
+    root = snapshot.project_root
+    records = snapshot.memo(
+        "query_records", lambda: scan_docs_for_query(root, index=snapshot.index)
+    )
+    stale = snapshot.memo(("stale", args.days), lambda: query_stale(records, args.days, project_root=root))
+    items = [{**snapshot.summaries[doc_id], "age_days": age} for doc_id, age in stale]
+    return paginate(items, args.cursor, args.limit)
+
+
+def get_document(snapshot: GraphSnapshot, args: DocumentArgs, config) -> Dict[str, Any]:
+    doc = snapshot.require(args.id)
+    result = {
+        **snapshot.summaries[doc.id],
+        "frontmatter": json.loads(json.dumps(doc.frontmatter, default=str)),
+        "depended_by": list(snapshot.depended_by.get(doc.id, ())),
+    }
+    if args.include_body:
+        result["body"] = slice_text(doc.content, args.cursor, args.max_chars)
+    return result
+
+
+@dataclass(frozen=True)
+class Tool:
+    """An MCP tool: name, description, argument model and implementation."""
+    name: str
+    description: str
+    args: Type[_Args]
+    run: Callable[[GraphSnapshot, Any, Any], Dict[str, Any]]
+
+    def definition(self) -> Dict[str, Any]:
+        """Tool entry for ``tools/list``."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "inputSchema": self.args.model_json_schema(),
+        }
+
+
+TOOLS: Tuple[Tool, ...] = (
+    Tool("get_context_map",
+         "Context map of the project (same content as `ontos map`), in slices.",
+         ContextMapArgs, get_context_map),
+    Tool("list_documents",
+         "List documents, optionally filtered by type and status.",
+         ListDocumentsArgs, list_documents),
+    Tool("get_dependencies",
+         "Documents that a document depends on (directly or transitively).",
+         RelationArgs, get_dependencies),
+    Tool("get_dependents",
+         "Documents that depend on a document (directly or transitively).",
+         RelationArgs, get_dependents),
+    Tool("search_concept",
+         "Documents tagged with a concept.",
+         ConceptArgs, search_concept),
+    Tool("find_stale",
+         "Documents not modified (per git history) in more than N days, oldest first.",
+         StaleArgs, find_stale),
+    Tool("get_document",
+         "Metadata, frontmatter and body of one document.",
+         DocumentArgs, get_document),
+)
@@ -11,21 +11,30 @@ Layer Rules:
 - Must NOT import from io/ or commands/
 """
 
-from ontos.ui.output import OutputHandler
-from ontos.ui.json_output import (
-    JsonOutputHandler,
-    emit_json,
-    emit_error,
-    emit_result,
-    to_json,
-    validate_json_output,
-)
+from ontos._lazy import lazy_exports as _lazy_exports
+
+# Re-exports, resolved on first access (see ontos._lazy)
+_EXPORTS = {
+    "ontos.ui.output": ("OutputHandler",),
+    "ontos.ui.json_output": (
+        "JsonOutputHandler",
+        "NdjsonOutputHandler",
+        "emit_json",
+        "emit_error",
+        "emit_result",
+        "to_json",
+        "validate_json_output",
+    ),
+}
+
+__getattr__, __dir__ = _lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # output.py
     "OutputHandler",
     # json_output.py
     "JsonOutputHandler",
+    "NdjsonOutputHandler",
     "emit_json",
     "emit_error",
     "emit_result",
@@ -11,6 +11,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ontos.ui.output import OutputHandler
+
 
 class JsonOutputHandler:
     """Handler for JSON output mode."""
@@ -34,6 +36,20 @@ class JsonOutputHandler:
             output = json.dumps(data, default=str, ensure_ascii=False)
         print(output, file=self.file)
 
+    def record(self, kind: str, data: Any = None) -> None:
+        """
+        Emit one NDJSON record and flush it, so a reader sees it at once.
+
+        Used by ``--format ndjson``. Records are single-line objects whose
+        "record" key names their kind (document, edge, issue, stale,
+        summary, error); the other keys come from ``data`` (a dict or a
+        dataclass) and depend on the kind.
+        """
+        output = {"record": kind}
+        if data:
+            output.update(to_json(data))
+        print(json.dumps(output, default=str, ensure_ascii=False), file=self.file, flush=True)
+
     def error(
         self,
         message: str,
@@ -65,6 +81,26 @@ class JsonOutputHandler:
         self.emit(output)
 
 
+class NdjsonOutputHandler(OutputHandler):
+    """
+    OutputHandler for commands running with ``--format ndjson``.
+
+    Human-readable messages are suppressed; errors become "error" records
+    on the given stream, so stdout stays valid NDJSON.
+    """
+
+    def __init__(self, stream: JsonOutputHandler):
+        super().__init__(quiet=True)
+        self.stream = stream
+
+    def display_errors(self, errors: List[str]) -> None:
+        for e in errors:
+            self.error(e)
+
+    def error(self, message: str) -> None:
+        self.stream.record("error", {"message": message})
+
+
 def to_json(obj: Any) -> Any:
     """
     Convert Ontos objects to JSON-serializable types.
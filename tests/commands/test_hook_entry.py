@@ -0,0 +1,145 @@
+"""Tests for the fast git hook entry point (ontos._hooks.entry)."""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ontos import cli
+from ontos._hooks.entry import hook_enabled, read_hooks_table, run
+from ontos.commands.init import _write_shim_hook
+from ontos.core.config import config_to_dict, default_config
+from ontos.io.config import load_project_config
+from ontos.io.toml import write_config
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _toml(text):
+    return textwrap.dedent(text).lstrip()
+
+
+class TestReadHooksTable:
+    """Tests for the [hooks]-only reader."""
+
+    def test_reads_hooks_table(self):
+        text = _toml("""
+            [paths]
+            docs_dir = "docs"  # [hooks] in a comment
+            skip_patterns = [
+                "a.md",
+                ["nested"],
+            ]
+
+            [ hooks ]
+            pre_push = false   # off for now
+            strict = true
+            """)
+        assert read_hooks_table(text) == {"pre_push": False, "strict": True}
+
+    def test_missing_table(self):
+        assert read_hooks_table("[ontos]\nversion = \"3.0\"\n") == {}
+
+    @pytest.mark.parametrize("text", [
+        "hooks.pre_push = false\n",
+        "hooks = { pre_push = false }\n",
+        "[hooks.extra]\nx = 1\n",
+        "[[hooks]]\npre_push = false\n",
+        "[hooks]\npre_push = 0\n",
+        "[hooks]\nunknown = true\n",
+        "[hooks]\npre_push = true\npre_push = false\n",
+        "[hooks]\npre_push = true\n[hooks]\npre_commit = true\n",
+        "[paths]\nnote = '''\n[hooks]\npre_push = false\n'''\n",
+    ])
+    def test_falls_back_on_unusual_toml(self, text):
+        assert read_hooks_table(text) is None
+
+    @pytest.mark.parametrize("pre_push,pre_commit", [(True, False), (False, True)])
+    def test_agrees_with_full_loader(self, tmp_path, pre_push, pre_commit):
+        config = default_config()
+        config.hooks.pre_push = pre_push
+        config.hooks.pre_commit = pre_commit
+        path = tmp_path / ".ontos.toml"
+        write_config(path, config_to_dict(config))
+
+        assert hook_enabled("pre-push", str(tmp_path)) is pre_push
+        assert hook_enabled("pre-commit", str(tmp_path)) is pre_commit
+        assert load_project_config(path).hooks.pre_push is pre_push
+
+
+class TestRun:
+    """Tests for run(): the full hook machinery loads only when needed."""
+
+    def test_disabled_hook_skips_dispatch(self, tmp_path, monkeypatch):
+        (tmp_path / ".ontos.toml").write_text("[hooks]\npre_push = false\n")
+        monkeypatch.chdir(tmp_path)
+        with patch("ontos.commands.hook.hook_command") as mock:
+            assert run("pre-push", ["origin"]) == 0
+        mock.assert_not_called()
+
+    def test_pre_commit_has_no_work(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        with patch("ontos.commands.hook.hook_command") as mock:
+            assert run("pre-commit", []) == 0
+        mock.assert_not_called()
+
+    @pytest.mark.parametrize("config", ["[hooks]\npre_push = true\n", "hooks.pre_push = true\n", None])
+    def test_enabled_or_unknown_dispatches(self, tmp_path, monkeypatch, config):
+        if config is not None:
+            (tmp_path / ".ontos.toml").write_text(config)
+        monkeypatch.chdir(tmp_path)
+        with patch("ontos.commands.hook.hook_command", return_value=1) as mock:
+            assert run("pre-push", ["origin", "url"]) == 1
+        options = mock.call_args[0][0]
+        assert (options.hook_type, options.args) == ("pre-push", ["origin", "url"])
+
+    def test_cli_routes_hooks_to_entry(self):
+        with patch("ontos._hooks.entry.run", return_value=0) as mock, \
+                patch("ontos.cli.create_parser") as parser:
+            assert cli.main(["hook", "pre-push", "origin"]) == 0
+        mock.assert_called_once_with("pre-push", ["origin"])
+        parser.assert_not_called()
+
+
+def test_shim_runs_entry_in_process(tmp_path):
+    """An installed shim exits 0 for a disabled hook without starting the CLI."""
+    (tmp_path / ".ontos.toml").write_text("[hooks]\npre_push = false\n")
+    shim = tmp_path / "pre-push"
+    _write_shim_hook(shim, "pre-push")
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(shim), "origin", "url"],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(PACKAGE_ROOT), "PATH": ""},
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0
+    assert "ontos._hooks.entry" in result.stderr
+    assert "ontos.cli" not in result.stderr and "subprocess" not in result.stderr
+
+
+def test_shim_skips_in_process_entry_from_another_environment(tmp_path):
+    """A python3 outside the installing environment never imports its own ontos."""
+    (tmp_path / ".ontos.toml").write_text("[hooks]\npre_push = false\n")
+    shim = tmp_path / "pre-push"
+    _write_shim_hook(shim, "pre-push")
+    text = shim.read_text()
+    assert f"ONTOS_PREFIX = {sys.prefix!r}" in text
+    shim.write_text(text.replace(repr(sys.prefix), repr("/some/other/venv")))
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(shim), "origin", "url"],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(PACKAGE_ROOT), "PATH": ""},
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0
+    assert "ontos._hooks.entry" not in result.stderr
+    assert "subprocess" in result.stderr
@@ -0,0 +1,75 @@
+"""Tests for token-budgeted maps (ontos map --budget)."""
+
+import json
+
+import pytest
+
+from ontos import cli
+from ontos.core.tokens import estimate_tokens
+from ontos.io import cache
+from ontos.io import pack as stored
+from ontos.io.tokens import load_bpe_counter
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\nMission.\n")
+    for i in range(30):
+        (docs / f"atom_{i:02d}.md").write_text(
+            f"---\nid: atom_{i:02d}\ntype: atom\nstatus: active\nsummary: Atom {i}\n"
+            f"depends_on: [kernel]\n---\n" + "words " * 50 + "\n"
+        )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ONTOS_NO_DAEMON", "1")
+    monkeypatch.setattr(cache, "_remembered", {})
+    return tmp_path
+
+
+@pytest.mark.parametrize("budget", [250, 600, 3000])
+def test_map_fits_budget(project, budget, capsys):
+    output = project / "pack.md"
+    assert cli.main(["--json", "map", "--budget", str(budget), "-o", str(output)]) == 0
+    report = json.loads(capsys.readouterr().out)
+    content = output.read_text()
+    assert estimate_tokens(content) <= budget
+    assert report["pack"]["tokens"] <= budget
+    assert content.index("kernel:kernel:active") < content.index("atom_")
+
+
+def test_budget_follows_filters(project):
+    output = project / "pack.md"
+    assert cli.main(["map", "--budget", "5000", "--filter", "type:kernel", "-o", str(output)]) == 0
+    content = output.read_text()
+    assert "### kernel" in content and "atom_" not in content
+
+
+def test_bpe_counter(project, capsys):
+    config = project / ".ontos.toml"
+    config.write_text(config.read_text() + "\n[tokens]\ncounter = \"bpe\"\n")
+    output = project / "pack.md"
+    assert cli.main(["map", "--budget", "400", "-o", str(output)]) == 0
+    assert load_bpe_counter().count(output.read_text()) <= 400
+
+
+def test_invalid_budget(project):
+    assert cli.main(["map", "--budget", "0"]) == 1
+
+
+def test_budget_excludes_compact(project):
+    with pytest.raises(SystemExit):
+        cli.main(["map", "--budget", "100", "--compact"])
+
+
+def test_budget_smaller_than_header(project, capsys):
+    output = project / "pack.md"
+    assert cli.main(["map", "--budget", "20", "-o", str(output)]) == 1
+    out = capsys.readouterr().out
+    assert "Error: --budget 20 is smaller than the map header" in out
+
+    assert cli.main(["--json", "map", "--budget", "20", "-o", str(output)]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["status"] == "error"
+    assert report["pack"]["tokens"] > 20 and "map header" in report["message"]
@@ -0,0 +1,82 @@
+"""Tests for the streaming map pipeline (chunked generation and writing)."""
+
+import pytest
+
+from ontos.commands.map import (
+    CompactMode,
+    GenerateMapOptions,
+    MapOptions,
+    MapSession,
+    generate_context_map,
+    iter_context_map,
+)
+from ontos.core.config import default_config
+from ontos.core.validation import ValidationOrchestrator
+from ontos.io.index import load_document_index
+
+
+@pytest.fixture
+def project(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\nKernel\n")
+    for i in range(5):
+        (docs / f"atom_{i}.md").write_text(
+            f"---\nid: atom_{i}\ntype: atom\nstatus: active\ndepends_on: [kernel, gone_{i}]\n"
+            f"impacts: [nowhere]\n---\n" + "Body text. " * 50 + "\n"
+        )
+    (docs / "log.md").write_text(
+        "---\nid: log\ntype: log\nstatus: active\nimpacts: [atom_0, missing]\n"
+        "describes: atom_9\n---\nLog\n"
+    )
+    return tmp_path
+
+
+def _index(root):
+    return load_document_index(root, config=default_config(), use_cache=False, jobs=1)
+
+
+@pytest.mark.parametrize("compact", list(CompactMode))
+def test_chunks_concatenate_to_the_map(project, compact):
+    docs = {doc.id: doc for _, doc, _ in _index(project).results}
+    options = GenerateMapOptions(compact=compact, include_lint=True)
+    content, result = generate_context_map(docs, {}, options)
+    chunks, streamed = iter_context_map(docs, {}, options)
+    chunks = list(chunks)
+    assert "".join(chunks) == content
+    assert streamed == result
+    assert len(chunks) >= len(docs)  # A chunk per document
+
+
+def test_single_validation_pass_matches_separate_checks(project):
+    docs = {doc.id: doc for _, doc, _ in _index(project).results}
+    separate = ValidationOrchestrator(docs)
+    separate.validate_log_schema()
+    separate.validate_impacts()
+    separate.validate_describes()
+    single = ValidationOrchestrator(docs)
+    single.validate_documents()
+    assert single.warnings == separate.warnings
+    assert len(single.warnings) == 8  # Log schema, 7 impacts, describes
+
+
+@pytest.mark.parametrize("budget", [None, 10_000])
+def test_session_streams_without_keeping_bodies(project, budget):
+    index = _index(project)
+    session = MapSession(
+        project, default_config(), MapOptions(quiet=True, budget=budget, no_cache=True), index
+    )
+    assert session.write(session.render_chunks())
+    content = session.output_path.read_text()
+    assert "atom_4" in content
+    if budget is not None:
+        assert "Body text." in content
+    assert not any(doc.content_loaded for _, doc, _ in index.results)
+
+    # Same content apart from the timestamp: the file is left alone
+    session.output_path.write_text("sentinel")
+    assert not session.write(session.render_chunks())
+    assert session.output_path.read_text() == "sentinel"
+    assert sorted(p.name for p in session.output_path.parent.iterdir()) == [
+        session.output_path.name, "docs",
+    ]
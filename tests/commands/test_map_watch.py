@@ -0,0 +1,101 @@
+"""Tests for `ontos map --watch` (incremental regeneration)."""
+
+import pytest
+
+from ontos.commands.map import MapOptions, MapSession, watch_map
+from ontos.core.config import default_config
+from ontos.io.index import load_document_index
+from ontos.io.watch import PollingWatcher, WatchBatch
+
+
+@pytest.fixture
+def project(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\n")
+    (docs / "atom.md").write_text(
+        "---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [kernel]\n---\n"
+    )
+    return tmp_path
+
+
+def _session(root, **kwargs):
+    config = default_config()
+    index = load_document_index(root, config=config, use_cache=False, jobs=1)
+    session = MapSession(root, config, MapOptions(quiet=True, **kwargs), index)
+    assert session.write(session.render())
+    # The first rescan picks up the freshly written map itself
+    session.apply(WatchBatch())
+    return session
+
+
+def test_apply_reparses_only_changed_files(project, monkeypatch):
+    session = _session(project)
+    output = session.output_path
+
+    parsed = []
+    import ontos.io.files as files
+    original = files.read_frontmatter_header
+
+    def tracking_read(path, *args, **kwargs):
+        parsed.append(path)
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(files, "read_frontmatter_header", tracking_read)
+
+    new_doc = project / "docs" / "new.md"
+    new_doc.write_text("---\nid: new_doc\ntype: atom\nstatus: draft\ndepends_on: [kernel]\n---\n")
+    assert session.apply(WatchBatch({new_doc})) is True
+    assert parsed == [new_doc]
+    assert "new_doc" in output.read_text()
+
+    (project / "docs" / "atom.md").unlink()
+    assert session.apply(WatchBatch({project / "docs" / "atom.md"})) is True
+    assert parsed == [new_doc]
+    assert "`atom`" not in output.read_text()
+    assert set(session.docs) == {"kernel", "new_doc", "ontos_context_map"}
+
+
+def test_apply_skips_write_when_output_is_unchanged(project):
+    session = _session(project)
+    session.output_path.write_text("sentinel")
+
+    atom = project / "docs" / "atom.md"
+    assert session.apply(WatchBatch({atom})) is None  # Event without a change
+
+    atom.write_text(atom.read_text() + "\nA body edit does not show in the map.\n")
+    assert session.apply(WatchBatch({atom})) is False
+    assert session.output_path.read_text() == "sentinel"
+
+
+def test_watch_map_runs_batches(project):
+    session = _session(project)
+    watcher = PollingWatcher([project], interval=0.01)
+    (project / "docs" / "kernel.md").write_text(
+        "---\nid: kernel\ntype: kernel\nstatus: active\nconcepts: [core]\n---\n"
+    )
+
+    assert watch_map(session, watcher=watcher, max_batches=1) == 0
+    assert session.index.get("kernel").frontmatter["concepts"] == ["core"]
+
+
+def test_watch_map_ignores_relative_output(project, monkeypatch):
+    import time
+    from pathlib import Path
+
+    from ontos.io import watch
+
+    monkeypatch.chdir(project)
+    session = _session(project, output=Path("docs/map.md"))
+    created = []
+
+    def polling(roots, ignore_dirs=None, exclude=(), backend="auto"):
+        created.append(PollingWatcher(roots, ignore_dirs=ignore_dirs, exclude=exclude, interval=0))
+        return created[0]
+
+    monkeypatch.setattr(watch, "create_watcher", polling)
+    assert watch_map(session, max_batches=0) == 0
+
+    time.sleep(0.01)
+    (project / "docs" / "map.md").write_text("rewritten by the map itself")
+    assert not created[0].poll(0)
@@ -0,0 +1,176 @@
+"""Tests for --format ndjson on map, query and verify."""
+
+import json
+
+import pytest
+
+from ontos import cli
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for doc_id, doc_type, depends_on in [
+        ("mission", "kernel", "[]"),
+        ("auth_flow", "atom", "[mission]"),
+        ("token_store", "atom", "[auth_flow, missing_doc]"),
+    ]:
+        (docs / f"{doc_id}.md").write_text(
+            f"---\nid: {doc_id}\ntype: {doc_type}\nstatus: active\n"
+            f"depends_on: {depends_on}\nconcepts: [auth]\n---\nBody\n"
+        )
+    (docs / "auth_guide.md").write_text(
+        "---\nid: auth_guide\ntype: atom\nstatus: active\ndepends_on: [auth_flow]\n"
+        "describes: token_store\ndescribes_verified: 2000-01-01\n---\nGuide\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ONTOS_NO_DAEMON", "1")
+    return tmp_path
+
+
+def _records(capsys):
+    # Every line must be a JSON object
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def _kinds(records):
+    return [r["record"] for r in records]
+
+
+def test_map_streams_documents_edges_and_issues(project, capsys):
+    code = cli.main(["map", "--format", "ndjson", "-o", "map.md"])
+    records = _records(capsys)
+    assert code == 1  # missing_doc is a broken link
+
+    documents = {r["id"]: r for r in records if r["record"] == "document"}
+    assert set(documents) == {"mission", "auth_flow", "token_store", "auth_guide"}
+    assert documents["mission"]["type"] == "kernel"
+    edges = {(r["from"], r["to"]) for r in records if r["record"] == "edge"}
+    assert ("token_store", "missing_doc") in edges
+    assert ("auth_flow", "mission") in edges
+    issues = [r for r in records if r["record"] == "issue"]
+    assert any(r["error_type"] == "broken_link" and r["doc_id"] == "token_store" for r in issues)
+
+    # Documents come before the issues found in them; the summary is last
+    kinds = _kinds(records)
+    assert kinds.index("issue") > max(i for i, k in enumerate(kinds) if k == "document")
+    assert records[-1]["record"] == "summary"
+    assert records[-1]["documents"] == 4
+    assert (project / "map.md").exists()
+
+
+def test_map_ndjson_counts_duplicate_ids_once(project, capsys):
+    archive = project / "docs" / "archive"
+    archive.mkdir()
+    (archive / "mission.md").write_text("---\nid: mission\ntype: kernel\nstatus: active\n---\nOld\n")
+
+    cli.main(["map", "--format", "ndjson", "-o", "map.md"])
+    records = _records(capsys)
+    documents = [r for r in records if r["record"] == "document"]
+    assert sorted(r["id"] for r in documents) == ["auth_flow", "auth_guide", "mission", "token_store"]
+    assert records[-1]["documents"] == len(documents)
+
+
+@pytest.mark.parametrize("command", [["map", "-o", "map.md"], ["query", "--list-ids"], ["verify"]])
+def test_ndjson_rejects_json_flag(project, capsys, command):
+    assert cli.main(["--json", *command, "--format", "ndjson"]) == 2
+    records = _records(capsys)
+    assert len(records) == 1
+    assert records[0]["error_code"] == "E_FORMAT_CONFLICT"
+    assert not (project / "map.md").exists()
+
+
+def test_map_ndjson_error(project, capsys):
+    assert cli.main(["map", "--format", "ndjson", "--budget", "0"]) == 1
+    assert _records(capsys) == [{"record": "error", "message": "--budget must be at least 1"}]
+
+
+def test_query_edges(project, capsys):
+    assert cli.main(["query", "--depends-on", "token_store", "--format", "ndjson"]) == 0
+    records = _records(capsys)
+    assert records[:-1] == [
+        {"record": "edge", "from": "token_store", "to": "auth_flow", "direct": True},
+        {"record": "edge", "from": "token_store", "to": "missing_doc", "direct": True},
+    ]
+    assert records[-1] == {"record": "summary", "status": "success", "results": 2}
+
+    assert cli.main(["query", "--depended-by", "mission", "--transitive", "--format", "ndjson"]) == 0
+    records = _records(capsys)
+    assert {r["from"] for r in records if r["record"] == "edge"} == {
+        "auth_flow", "token_store", "auth_guide",
+    }
+    assert all(r["direct"] is False for r in records if r["record"] == "edge")
+
+
+def test_query_documents(project, capsys):
+    assert cli.main(["query", "--concept", "auth", "--format", "ndjson"]) == 0
+    ids = [r["id"] for r in _records(capsys) if r["record"] == "document"]
+    assert ids == ["auth_flow", "mission", "token_store"]
+
+    assert cli.main(["query", "--list-ids", "--format", "ndjson"]) == 0
+    records = _records(capsys)
+    assert {"record": "document", "id": "mission", "type": "kernel"} in records
+    assert records[-1]["results"] == 4
+
+
+def test_query_health_and_stale(project, capsys):
+    assert cli.main(["query", "--health", "--format", "ndjson"]) == 0
+    records = _records(capsys)
+    assert _kinds(records) == ["health", "summary"]
+    assert records[0]["total_docs"] == 4
+
+    assert cli.main(["query", "--stale", "100000", "--format", "ndjson"]) == 0
+    assert _records(capsys) == [{"record": "summary", "status": "success", "results": 0}]
+
+
+def test_query_errors_are_records(project, capsys):
+    assert cli.main(["query", "--concept", "auth", "--limit", "3", "--format", "ndjson"]) == 1
+    assert _records(capsys) == [{"record": "error", "message": "--limit applies to --text"}]
+
+
+def test_verify_streams_stale_documents(project, capsys):
+    assert cli.main(["verify", "--format", "ndjson"]) == 0
+    records = _records(capsys)
+    assert _kinds(records) == ["stale", "summary"]
+    stale = records[0]
+    assert stale["id"] == "auth_guide"
+    assert stale["describes"] == ["token_store"]
+    assert stale["verified"] == "2000-01-01"
+    assert [a["id"] for a in stale["stale_atoms"]] == ["token_store"]
+    assert records[1] == {"record": "summary", "status": "success", "stale": 1}
+
+
+def test_verify_path(project, capsys):
+    path = project / "docs" / "auth_guide.md"
+    assert cli.main(["verify", str(path), "--date", "2030-01-02", "--format", "ndjson"]) == 0
+    records = _records(capsys)
+    assert records[0] == {"record": "verified", "path": str(path), "date": "2030-01-02"}
+    assert "describes_verified: 2030-01-02" in path.read_text()
+
+    assert cli.main(["verify", "nowhere.md", "--format", "ndjson"]) == 1
+    assert _kinds(_records(capsys)) == ["error"]
+
+
+def test_ndjson_reader_closing_early_is_quiet(project):
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    docs = project / "docs"
+    for i in range(1500):
+        (docs / f"bulk_{i:04d}.md").write_text(
+            f"---\nid: bulk_{i:04d}\ntype: atom\nstatus: active\ndepends_on: [mission]\n---\n"
+        )
+    env = {**os.environ, "PYTHONPATH": str(Path(cli.__file__).resolve().parents[1])}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "ontos", "map", "--format", "ndjson", "-o", "map.md"],
+        cwd=project, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    assert json.loads(process.stdout.readline())["record"] == "document"
+    process.stdout.close()  # Like `| head -1`
+    stderr = process.stderr.read().decode()
+    assert process.wait(timeout=60) == 141
+    assert stderr == ""
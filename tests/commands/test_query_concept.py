@@ -0,0 +1,59 @@
+"""Tests for concept lookups (query --concept, map --filter concept:)."""
+
+import pytest
+
+from ontos import cli
+from ontos.commands.map import MapOptions, map_command
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for doc_id, concepts in [
+        ("auth_flow", "[Auth, api]"),
+        ("token_store", "[auth, storage]"),
+        ("billing", "Billing"),
+    ]:
+        (docs / f"{doc_id}.md").write_text(
+            f"---\nid: {doc_id}\ntype: atom\nstatus: active\nconcepts: {concepts}\n---\nBody\n"
+        )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ONTOS_NO_DAEMON", "1")
+    return tmp_path
+
+
+def _results(capsys):
+    lines = [line.strip() for line in capsys.readouterr().out.splitlines()]
+    return [line.split()[1] for line in lines if line.startswith("•")]
+
+
+def test_concept_lookup_ignores_case(project, capsys):
+    assert cli.main(["query", "--concept", "AUTH"]) == 0
+    assert _results(capsys) == ["auth_flow", "token_store"]
+    assert cli.main(["query", "--concept", "billing"]) == 0
+    assert _results(capsys) == ["billing"]
+
+
+def test_concept_lookup_skips_documents_without_id(project, capsys):
+    (project / "docs" / "notes.md").write_text("---\ntype: atom\nconcepts: [auth]\n---\nBody\n")
+    assert cli.main(["query", "--concept", "auth"]) == 0
+    assert _results(capsys) == ["auth_flow", "token_store"]
+
+
+def test_concept_lookup_from_cache(project, capsys):
+    assert cli.main(["query", "--concept", "storage"]) == 0
+    assert _results(capsys) == ["token_store"]
+    # Second run is served from the document cache
+    assert cli.main(["query", "--concept", "Storage"]) == 0
+    assert _results(capsys) == ["token_store"]
+
+
+def test_map_concept_filters(project):
+    output = project / "map.md"
+    options = MapOptions(output=output, quiet=True, filter_expr="concept:auth,billing concept:API")
+    assert map_command(options) == 0
+    content = output.read_text()
+    assert "auth_flow" in content
+    assert "token_store" not in content and "billing" not in content
@@ -0,0 +1,81 @@
+"""Tests for full-text search (query --text)."""
+
+import pytest
+
+from ontos import cli
+from ontos.io import cache
+from ontos.io import search as stored
+from ontos.io.cache import get_cache_dir
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for doc_id, summary, body in [
+        ("auth_flow", "How sessions are authenticated", "The auth token is refreshed hourly."),
+        ("token_store", "", "Tokens are stored encrypted. Token refresh rotates keys."),
+        ("billing", "Nightly billing", "Invoices are sent after the billing run."),
+    ]:
+        (docs / f"{doc_id}.md").write_text(
+            f"---\nid: {doc_id}\ntype: atom\nstatus: active\nsummary: '{summary}'\n---\n{body}\n"
+        )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ONTOS_NO_DAEMON", "1")
+    monkeypatch.setattr(cache, "_remembered", {})
+    return tmp_path
+
+
+def _results(capsys):
+    lines = [line.strip() for line in capsys.readouterr().out.splitlines()]
+    return [line.split()[1] for line in lines if line.startswith("•")]
+
+
+def test_text_search(project, capsys):
+    assert cli.main(["query", "--text", "token"]) == 0
+    assert _results(capsys) == ["token_store", "auth_flow"]
+    assert cli.main(["query", "--text", '"token refresh"']) == 0
+    assert _results(capsys) == ["token_store"]
+    assert cli.main(["query", "--text", "authenticat*"]) == 0
+    assert _results(capsys) == ["auth_flow"]
+
+
+def test_no_match(project, capsys):
+    assert cli.main(["query", "--text", "kubernetes"]) == 0
+    assert "No documents match" in capsys.readouterr().out
+
+
+def test_limit(project, capsys):
+    assert cli.main(["query", "--text", "the", "--limit", "1"]) == 0
+    out = capsys.readouterr().out
+    assert "showing the best 1" in out
+
+
+@pytest.mark.parametrize("args", [
+    ["--list-ids", "--limit", "3"],
+    ["--text", "token", "--limit", "0"],
+])
+def test_invalid_options(project, args):
+    assert cli.main(["query", *args]) == 1
+
+
+def test_index_is_persisted_and_updated(project, capsys, monkeypatch):
+    assert cli.main(["query", "--text", "invoices"]) == 0
+    assert _results(capsys) == ["billing"]
+    assert (get_cache_dir(project) / stored.SEARCH_CACHE_FILE).exists()
+
+    # A fresh process answers from the stored index without reading bodies
+    monkeypatch.setattr(cache, "_remembered", {})
+    with monkeypatch.context() as m:
+        m.setattr("ontos.core.search.document_text", lambda doc: pytest.fail(f"read {doc.id}"))
+        assert cli.main(["query", "--text", "invoices"]) == 0
+    assert _results(capsys) == ["billing"]
+
+    (project / "docs" / "billing.md").write_text(
+        "---\nid: billing\ntype: atom\nstatus: active\n---\nReceipts only now.\n"
+    )
+    assert cli.main(["query", "--text", "invoices"]) == 0
+    assert _results(capsys) == []
+    assert cli.main(["query", "--text", "receipts"]) == 0
+    assert _results(capsys) == ["billing"]
@@ -0,0 +1,102 @@
+"""Tests for transitive queries (query --transitive / --max-depth)."""
+
+import pytest
+
+from ontos import cli
+from ontos.core import reachability
+from ontos.io import reachability as stored
+from ontos.io.cache import get_cache_dir
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for doc_id, doc_type, deps in [
+        ("kernel", "kernel", []),
+        ("strategy", "strategy", ["kernel"]),
+        ("feature", "atom", ["strategy", "helper"]),
+        ("helper", "atom", ["feature"]),
+    ]:
+        (docs / f"{doc_id}.md").write_text(
+            f"---\nid: {doc_id}\ntype: {doc_type}\nstatus: active\ndepends_on: {deps}\n---\n"
+        )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ONTOS_NO_DAEMON", "1")
+    monkeypatch.setattr(stored, "_loaded", {})
+    return tmp_path
+
+
+def _lines(capsys):
+    return [line.strip() for line in capsys.readouterr().out.splitlines()]
+
+
+def test_depended_by_transitive(project, capsys):
+    assert cli.main(["query", "--depended-by", "kernel", "--transitive"]) == 0
+    lines = _lines(capsys)
+    assert "Documents that depend on kernel (transitively):" in lines[0]
+    assert lines[1:] == ["← feature", "← helper", "← strategy"]
+
+
+def test_max_depth(project, capsys):
+    assert cli.main(["query", "--depended-by", "kernel", "--max-depth", "2"]) == 0
+    assert _lines(capsys)[1:] == ["← strategy", "← feature"]
+    assert cli.main(["query", "--depends-on", "helper", "--max-depth", "1"]) == 0
+    assert _lines(capsys)[1:] == ["→ feature"]
+
+
+def test_direct_queries_unchanged(project, capsys):
+    assert cli.main(["query", "--depended-by", "kernel"]) == 0
+    assert _lines(capsys)[1:] == ["← strategy"]
+
+
+@pytest.mark.parametrize("args", [
+    ["--list-ids", "--transitive"],
+    ["--depends-on", "feature", "--max-depth", "0"],
+])
+def test_invalid_options(project, args):
+    assert cli.main(["query", *args]) == 1
+
+
+def test_index_is_persisted_and_reused(project, capsys, monkeypatch):
+    assert cli.main(["query", "--depends-on", "helper", "--transitive"]) == 0
+    assert _lines(capsys)[1:] == ["→ feature", "→ kernel", "→ strategy"]
+    assert (get_cache_dir(project) / stored.REACHABILITY_CACHE_FILE).exists()
+
+    # A new process (empty in-memory copy) reads the stored index
+    monkeypatch.setattr(stored, "_loaded", {})
+
+    def fail(edges):
+        raise AssertionError("index rebuilt")
+
+    monkeypatch.setattr(stored, "build_reachability", fail)
+    assert cli.main(["query", "--depended-by", "strategy", "--transitive"]) == 0
+    assert _lines(capsys)[1:] == ["← feature", "← helper"]
+
+    # Editing a dependency list invalidates it
+    monkeypatch.setattr(stored, "build_reachability", reachability.build_reachability)
+    (project / "docs" / "helper.md").write_text("---\nid: helper\ntype: atom\nstatus: active\n---\n")
+    assert cli.main(["query", "--depended-by", "strategy", "--transitive"]) == 0
+    assert _lines(capsys)[1:] == ["← feature"]
+
+
+def test_stored_index_follows_the_document_cache(project, capsys, monkeypatch):
+    assert cli.main(["query", "--depended-by", "kernel", "--transitive"]) == 0
+    capsys.readouterr()
+
+    # Removing a document rewrites the document cache, so the index is rebuilt
+    monkeypatch.setattr(stored, "_loaded", {})
+    (project / "docs" / "helper.md").unlink()
+    assert cli.main(["query", "--depended-by", "kernel", "--transitive"]) == 0
+    assert _lines(capsys)[1:] == ["← feature", "← strategy"]
+
+    # A --dir scan sees part of the graph and never uses the stored index
+    monkeypatch.setattr(stored, "_loaded", {})
+
+    def fail(*args):
+        raise AssertionError("stored index used")
+
+    monkeypatch.setattr("ontos.commands.query.load_reachability_index", fail)
+    assert cli.main(["query", "--depended-by", "kernel", "--transitive", "--dir", "docs"]) == 0
+    assert _lines(capsys)[1:] == ["← feature", "← strategy"]
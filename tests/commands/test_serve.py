@@ -0,0 +1,130 @@
+"""Tests for the `ontos serve` daemon and CLI forwarding."""
+
+import threading
+
+import pytest
+
+from ontos import cli
+from ontos.commands.serve import ServeHandler, ServeOptions, serve_command
+from ontos.io.daemon import DaemonServer, send_request, socket_path
+from ontos.io.index import WarmIndex
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\n")
+    (docs / "atom.md").write_text(
+        "---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [kernel]\n---\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ONTOS_NO_DAEMON", raising=False)
+    return tmp_path
+
+
+@pytest.fixture(params=["auto", "poll"])
+def daemon(project, request):
+    warm = WarmIndex(project, watch_backend=request.param)
+    handler = ServeHandler(project, warm)
+    server = DaemonServer(socket_path(project), handler)
+    handler.server = server
+    warm.register()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield handler
+    server.stop()
+    thread.join(timeout=5)
+    warm.close()
+
+
+def _run(capsys, argv, forward=True):
+    code = cli.main(argv, forward=forward)
+    return code, capsys.readouterr().out
+
+
+def test_forwarded_output_matches_in_process(project, daemon, capsys):
+    for argv in (["query", "--list-ids"], ["query", "--depended-by", "kernel"], ["--json", "map"]):
+        forwarded = _run(capsys, argv)
+        local = _run(capsys, argv, forward=False)
+        if "map" in argv:
+            assert forwarded[0] == local[0]
+        else:
+            assert forwarded == local
+    assert daemon.requests == 3
+
+
+def test_daemon_sees_file_changes(project, daemon, capsys):
+    assert "new_doc" not in _run(capsys, ["query", "--list-ids"])[1]
+
+    (project / "docs" / "new.md").write_text("---\nid: new_doc\ntype: atom\nstatus: draft\n---\n")
+    (project / "docs" / "atom.md").unlink()
+    out = _run(capsys, ["query", "--list-ids"])[1]
+
+    assert "new_doc" in out and "atom (" not in out
+    assert daemon.requests == 2
+
+
+def test_no_daemon_env_runs_in_process(project, daemon, capsys, monkeypatch):
+    monkeypatch.setenv("ONTOS_NO_DAEMON", "1")
+    _run(capsys, ["query", "--list-ids"])
+    assert daemon.requests == 0
+
+
+def test_status_and_stop(project, daemon, capsys):
+    assert serve_command(ServeOptions(status=True)) == 0
+    assert "Documents: 2" in capsys.readouterr().out
+    assert serve_command(ServeOptions(stop=True, quiet=True)) == 0
+
+    for _ in range(50):
+        if not socket_path(project).exists():
+            break
+        threading.Event().wait(0.1)
+    assert not socket_path(project).exists()
+
+
+def test_falls_back_without_daemon(project, capsys):
+    assert send_request(socket_path(project), {"ping": True}) is None
+    assert serve_command(ServeOptions(status=True, quiet=True)) == 1
+    code, out = _run(capsys, ["query", "--list-ids"])
+    assert code == 0 and "kernel" in out
+
+
+def test_stale_socket_is_replaced(project):
+    path = socket_path(project)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("")  # Left behind by a killed daemon
+    server = DaemonServer(path, lambda request: {"ok": True})
+    try:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        assert send_request(path, {}) == {"ok": True}
+        with pytest.raises(FileExistsError):
+            DaemonServer(path, lambda request: {})
+    finally:
+        server.stop()
+        thread.join(timeout=5)
+
+
+@pytest.mark.parametrize("partial", [b"", b'{"argv": ['])
+def test_silent_client_does_not_stall_the_daemon(project, partial):
+    import socket
+    import time
+
+    path = socket_path(project)
+    server = DaemonServer(path, lambda request: {"ok": True}, request_timeout=0.2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    silent = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        silent.connect(str(path))
+        silent.sendall(partial)
+        start = time.monotonic()
+        assert send_request(path, {}, timeout=5) == {"ok": True}
+        assert time.monotonic() - start < 2
+        assert silent.recv(1) == b""  # Closed without an answer
+    finally:
+        silent.close()
+        server.stop()
+        thread.join(timeout=5)
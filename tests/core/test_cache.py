@@ -46,3 +46,33 @@ def test_cache_explicit_invalidate_and_clear():
     cache.clear()
     assert cache.stats["entries"] == 0
     assert cache.stats["hits"] == 0
+
+def test_cache_size_and_inode_invalidation():
+    cache = DocumentCache()
+    path = Path("/tmp/test.md").resolve()
+
+    cache.set(path, {"v": 1}, 100.0, size=10, inode=42)
+    assert cache.get(path, 100.0, size=10, inode=42) == {"v": 1}
+
+    # Same mtime but different size (e.g. coarse mtime resolution)
+    assert cache.get(path, 100.0, size=11, inode=42) is None
+
+    # Same mtime/size but file replaced (new inode)
+    cache.set(path, {"v": 1}, 100.0, size=10, inode=42)
+    assert cache.get(path, 100.0, size=10, inode=43) is None
+
+def test_cache_retain_and_dirty_flag():
+    cache = DocumentCache()
+    path1 = Path("/tmp/test1.md").resolve()
+    path2 = Path("/tmp/test2.md").resolve()
+
+    assert cache.dirty is False
+    cache.set(path1, {"v": 1}, 100.0)
+    cache.set(path2, {"v": 2}, 100.0)
+    assert cache.dirty is True
+
+    cache.mark_clean()
+    cache.retain([path1])
+    assert cache.dirty is True
+    assert cache.get(path1, 100.0) is not None
+    assert cache.get(path2, 100.0) is None
@@ -0,0 +1,113 @@
+"""Tests for the CSR dependency graph (ontos.core.compact_graph)."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from ontos.core import compact_graph
+from ontos.core.compact_graph import CompactGraph, build_compact_graph
+from ontos.core.graph import (
+    broken_link_errors,
+    build_graph,
+    calculate_depths,
+    detect_cycles,
+    detect_orphans,
+)
+from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+from ontos.core.validation import ValidationOrchestrator
+from ontos.commands.map import GenerateMapOptions, generate_context_map
+
+
+def _doc(doc_id, depends_on=(), doc_type=DocumentType.ATOM):
+    return DocumentData(
+        id=doc_id,
+        type=doc_type,
+        status=DocumentStatus.ACTIVE,
+        filepath=Path(f"/project/{doc_id}.md"),
+        frontmatter={"id": doc_id},
+        content="",
+        depends_on=list(depends_on),
+    )
+
+
+def _random_docs(seed, count=60):
+    rng = random.Random(seed)
+    ids = [f"d{i}" for i in range(count)]
+    docs = {}
+    for doc_id in ids:
+        deps = [rng.choice(ids) for _ in range(rng.randint(0, 3))]  # Cycles, duplicates
+        if rng.random() < 0.1:
+            deps.append(f"missing{rng.randint(0, 3)}")
+        doc_type = rng.choice([DocumentType.ATOM, DocumentType.KERNEL, DocumentType.STRATEGY])
+        docs[doc_id] = _doc(doc_id, deps, doc_type)
+    return docs
+
+
+def _queries(graph):
+    return {
+        "nodes": {k: v for k, v in graph.nodes.items()},
+        "edges": dict(graph.edges),
+        "reverse": dict(graph.reverse_edges),
+        "broken": dict(graph.broken),
+        "cycles": detect_cycles(graph),
+        "groups": graph.cycle_groups(),
+        "orphans": detect_orphans(graph, {"kernel"}),
+        "depths": list(calculate_depths(graph).items()),
+        "upstream": sorted(graph.upstream("d0", include_self=True)),
+    }
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_dependency_graph(seed):
+    docs = _random_docs(seed)
+    graph, errors = build_graph(docs)
+    compact, compact_errors = build_compact_graph(docs)
+    assert _queries(compact) == _queries(graph)
+    assert compact_errors == errors
+    assert _queries(CompactGraph.from_graph(graph)) == _queries(graph)
+
+
+def test_views():
+    compact, _ = build_compact_graph({
+        "a": _doc("a", ["b", "ghost"]),
+        "b": _doc("b", [], DocumentType.KERNEL),
+    })
+    assert list(compact.nodes) == ["a", "b"] and len(compact.nodes) == 2
+    assert "ghost" not in compact.nodes and "ghost" not in compact.edges
+    assert compact.nodes["b"].doc_type == "kernel"
+    assert compact.edges.get("a") == ["b", "ghost"]
+    assert dict(compact.reverse_edges) == {"b": ["a"], "ghost": ["a"]}
+    assert compact.reverse_edges.get("a", []) == []
+    assert compact.broken == {"a": ["ghost"]}
+    assert list(compact.out_target) == [1, 2] and compact.ids == ["a", "b", "ghost"]
+
+
+def test_validation_runs_unchanged():
+    docs = _random_docs(3)
+    expected = ValidationOrchestrator(docs, graph=build_graph(docs)).validate_all()
+    result = ValidationOrchestrator(docs, graph=build_compact_graph(docs)).validate_all()
+    assert result == expected
+
+
+def test_context_map_runs_unchanged():
+    docs = _random_docs(5)
+    config = {"project_name": "demo", "version": "3.0"}
+    expected, _ = generate_context_map(docs, config, GenerateMapOptions(), graph=build_graph(docs))
+    content, _ = generate_context_map(docs, config, GenerateMapOptions(), graph=build_compact_graph(docs))
+    strip = lambda text: [line for line in text.splitlines() if "Generated" not in line]
+    assert strip(content) == strip(expected)
+
+
+def test_deep_chain():
+    n = 20_000
+    compact = CompactGraph((f"n{i}", "atom", "", [f"n{i + 1}"] if i < n - 1 else []) for i in range(n))
+    assert compact.depths()["n0"] == n - 1
+    assert compact.cycles() == []
+
+
+def test_numpy_reverse_matches_python():
+    np = pytest.importorskip("numpy")
+    compact, _ = build_compact_graph(_random_docs(11, count=500))
+    args = (compact.out_start, compact.out_target, len(compact.ids))
+    assert compact_graph._reverse_csr_numpy(np, *args) == compact_graph._reverse_csr_python(*args)
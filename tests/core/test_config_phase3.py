@@ -86,6 +86,18 @@ class TestValidateTypes:
         _validate_types({"workflow": {"enforce_archive_before_push": True}})
         _validate_types({"validation": {"strict": False}})
         _validate_types({"hooks": {"pre_push": True, "pre_commit": False}})
+        _validate_types({"scanning": {"backend": "git"}})
+
+    def test_validate_types_rejects_unknown_scan_backend(self):
+        """Only the known scanning backends are accepted."""
+        with pytest.raises(ConfigError, match="scanning.backend"):
+            _validate_types({"scanning": {"backend": "svn"}})
+
+    def test_validate_types_rejects_unknown_token_counter(self):
+        """Only the known token counters are accepted."""
+        _validate_types({"tokens": {"counter": "heuristic", "vocabulary": "cl100k.tiktoken"}})
+        with pytest.raises(ConfigError, match="tokens.counter"):
+            _validate_types({"tokens": {"counter": "words"}})
 
 
 class TestValidatePath:
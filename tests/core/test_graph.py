@@ -0,0 +1,269 @@
+"""Tests for the dependency graph (ontos.core.graph)."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from ontos.core.graph import (
+    DependencyGraph,
+    broken_link_errors,
+    build_graph,
+    calculate_depths,
+    detect_cycles,
+    detect_orphans,
+    strongly_connected_components,
+)
+from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+from ontos.core.validation import ValidationOrchestrator
+
+ALLOWED_ORPHANS = {"kernel"}
+
+
+def _doc(doc_id, depends_on=(), doc_type=DocumentType.ATOM):
+    return DocumentData(
+        id=doc_id,
+        type=doc_type,
+        status=DocumentStatus.ACTIVE,
+        filepath=Path(f"/project/{doc_id}.md"),
+        frontmatter={"id": doc_id},
+        content="",
+        depends_on=list(depends_on),
+    )
+
+
+def _state(graph):
+    """Everything observable about a graph, for comparison with a fresh build."""
+    return {
+        "nodes": list(graph.nodes),
+        "edges": graph.edges,
+        "reverse": {k: v for k, v in graph.reverse_edges.items() if v},
+        "broken": [(e.doc_id, e.message) for e in broken_link_errors(graph)],
+        "orphans": detect_orphans(graph, ALLOWED_ORPHANS),
+        "depths": calculate_depths(graph),
+    }
+
+
+def _assert_matches_fresh(graph, docs):
+    graph.reorder(list(docs))
+    fresh, _ = build_graph(docs)
+    assert _state(graph) == _state(fresh)
+    assert list(calculate_depths(graph).items()) == list(calculate_depths(fresh).items())
+
+
+def test_build_graph_reports_broken_links():
+    graph, errors = build_graph({
+        "a": _doc("a", ["b", "ghost"]),
+        "b": _doc("b", ["a2"]),
+    })
+    assert [(e.doc_id, e.message) for e in errors] == [
+        ("a", "Broken dependency: 'ghost' does not exist"),
+        ("b", "Broken dependency: 'a2' does not exist"),
+    ]
+    assert graph.reverse_edges == {"b": ["a"], "ghost": ["a"], "a2": ["b"]}
+    assert calculate_depths(graph) == {"a": 2, "b": 1}
+
+
+def test_update_and_remove_keep_tables_consistent():
+    docs = {
+        "k": _doc("k", doc_type=DocumentType.KERNEL),
+        "s": _doc("s", ["k"]),
+        "a": _doc("a", ["s", "later"]),
+    }
+    graph, _ = build_graph(docs)
+    assert graph.broken == {"a": ["later"]}
+    assert calculate_depths(graph) == {"k": 0, "s": 1, "a": 2}
+
+    graph.add_node("later", "atom", "/project/later.md", ["k"])
+    assert graph.broken == {}
+    assert detect_orphans(graph, ALLOWED_ORPHANS) == ["a"]
+
+    graph.update_node("a", "atom", "/project/a.md", ["k"])
+    assert graph.reverse_edges == {"k": ["s", "later", "a"]}
+    assert sorted(detect_orphans(graph, ALLOWED_ORPHANS)) == ["a", "later", "s"]
+
+    graph.remove_node("k")
+    assert graph.broken == {"s": ["k"], "later": ["k"], "a": ["k"]}
+    assert calculate_depths(graph) == {"s": 1, "a": 1, "later": 1}
+    assert "k" not in graph.edges and graph.reverse_edges["k"] == ["s", "later", "a"]
+
+
+def test_depth_updates_touch_only_upstream_nodes():
+    docs = {f"n{i}": _doc(f"n{i}", [f"n{i - 1}"] if i else []) for i in range(6)}
+    docs["side"] = _doc("side", ["n2"])
+    graph, _ = build_graph(docs)
+    assert calculate_depths(graph)["n5"] == 5
+
+    graph.update_node("n3", "atom", "/project/n3.md", [])
+    # n0..n2 and side are downstream or unrelated: still cached
+    assert set(graph._depths) == {"n0", "n1", "n2", "side"}
+    assert calculate_depths(graph) == {
+        "n0": 0, "n1": 1, "n2": 2, "n3": 0, "n4": 1, "n5": 2, "side": 3,
+    }
+
+
+def test_cycles_follow_edits():
+    graph, _ = build_graph({
+        "a": _doc("a", ["b"]),
+        "b": _doc("b", ["c"]),
+        "c": _doc("c"),
+        "d": _doc("d", ["d"]),
+    })
+    assert detect_cycles(graph) == [["d", "d"]]
+
+    graph.update_node("c", "atom", "/project/c.md", ["a"])
+    assert detect_cycles(graph) == [["a", "b", "c", "a"], ["d", "d"]]
+    # Members of a cycle share one depth
+    assert calculate_depths(graph) == {"a": 1, "b": 1, "c": 1, "d": 1}
+
+    graph.remove_node("b")
+    assert detect_cycles(graph) == [["d", "d"]]
+    graph.add_node("b", "atom", "/project/b.md", ["c"])
+    assert detect_cycles(graph) == [["a", "b", "c", "a"], ["d", "d"]]
+    graph.update_node("d", "atom", "/project/d.md", [])
+    assert detect_cycles(graph) == [["a", "b", "c", "a"]]
+
+
+def test_every_cycle_group_is_reported():
+    graph, _ = build_graph({
+        "a": _doc("a", ["b"]),
+        "b": _doc("b", ["a", "c"]),
+        "c": _doc("c", ["a", "x"]),
+        "x": _doc("x", ["y"]),
+        "y": _doc("y", ["x"]),
+        "z": _doc("z", ["a", "x"]),
+    })
+    assert graph.cycle_groups() == [["a", "b", "c"], ["x", "y"]]
+    # One shortest cycle per group
+    assert detect_cycles(graph) == [["a", "b", "a"], ["x", "y", "x"]]
+    # Groups are condensed: {x, y} is a leaf, {a, b, c} sits on top of it
+    assert calculate_depths(graph) == {"a": 2, "b": 2, "c": 2, "x": 1, "y": 1, "z": 3}
+
+
+def test_validation_names_whole_cycle_group():
+    docs = {
+        "a": _doc("a", ["b"]),
+        "b": _doc("b", ["a", "c"]),
+        "c": _doc("c", ["a"]),
+        "d": _doc("d", ["d"]),
+    }
+    orchestrator = ValidationOrchestrator(docs)
+    orchestrator.validate_graph()
+    assert [e.message for e in orchestrator.errors] == [
+        "Circular dependency: a -> b -> a (cycle group of 3 documents: a, b, c)",
+        "Circular dependency: d -> d",
+    ]
+
+
+def test_depth_warnings_follow_dfs_post_order():
+    # Node order puts dependents first; warnings list dependencies first
+    docs = {
+        "top": _doc("top", ["mid", "side"]),
+        "side": _doc("side", ["leaf"]),
+        "mid": _doc("mid", ["low"]),
+        "low": _doc("low", ["leaf"]),
+        "leaf": _doc("leaf"),
+    }
+    graph, _ = build_graph(docs)
+    assert list(calculate_depths(graph)) == ["leaf", "low", "mid", "side", "top"]
+
+    orchestrator = ValidationOrchestrator(docs, {"max_dependency_depth": 0})
+    orchestrator.validate_graph()
+    depth_warnings = [e.doc_id for e in orchestrator.warnings if "depth" in e.message]
+    assert depth_warnings == ["low", "mid", "side", "top"]
+
+
+def test_scc_order_is_dependencies_first():
+    graph, _ = build_graph({
+        "top": _doc("top", ["mid"]),
+        "mid": _doc("mid", ["leaf", "loop"]),
+        "loop": _doc("loop", ["mid"]),
+        "leaf": _doc("leaf", ["missing"]),
+    })
+    assert [sorted(c) for c in strongly_connected_components(graph)] == [
+        ["leaf"], ["loop", "mid"], ["top"],
+    ]
+
+
+def test_cycle_groups_merge_and_split_incrementally():
+    docs = {
+        "a": _doc("a", ["b"]),
+        "b": _doc("b", ["a"]),
+        "c": _doc("c", ["d"]),
+        "d": _doc("d", ["c"]),
+    }
+    graph, _ = build_graph(docs)
+    assert graph.cycle_groups() == [["a", "b"], ["c", "d"]]
+
+    graph.update_node("b", "atom", "/project/b.md", ["a", "c"])
+    graph.update_node("d", "atom", "/project/d.md", ["c", "b"])
+    assert graph.cycle_groups() == [["a", "b", "c", "d"]]
+    assert calculate_depths(graph) == {"a": 1, "b": 1, "c": 1, "d": 1}
+
+    graph.update_node("b", "atom", "/project/b.md", ["a"])
+    assert graph.cycle_groups() == [["a", "b"], ["c", "d"]]
+    assert calculate_depths(graph) == {"a": 1, "b": 1, "c": 2, "d": 2}
+
+    graph.remove_node("a")
+    assert graph.cycle_groups() == [["c", "d"]]
+
+
+@pytest.mark.parametrize("cyclic", [False, True])
+def test_random_edits_match_fresh_build(cyclic):
+    rng = random.Random(7)
+    ids = [f"d{i}" for i in range(40)]
+    docs = {}
+
+    def random_doc(doc_id):
+        # Depend on lower ids only (acyclic), plus the odd missing id
+        position = ids.index(doc_id)
+        deps = rng.sample(ids[:position], min(position, rng.randint(0, 3)))
+        if cyclic and rng.random() < 0.15:
+            deps.append(rng.choice(ids))  # Possibly upward: may close a cycle
+        if rng.random() < 0.1:
+            deps.append("missing")
+        doc_type = DocumentType.KERNEL if rng.random() < 0.2 else DocumentType.ATOM
+        return _doc(doc_id, deps, doc_type)
+
+    for doc_id in ids[:25]:
+        docs[doc_id] = random_doc(doc_id)
+    graph, _ = build_graph(docs)
+    calculate_depths(graph)  # Populate the caches the edits must maintain
+    detect_cycles(graph)
+
+    for _ in range(200):
+        doc_id = rng.choice(ids)
+        if doc_id in docs and rng.random() < 0.3:
+            del docs[doc_id]
+            graph.remove_node(doc_id)
+        else:
+            docs[doc_id] = random_doc(doc_id)
+            graph.update_node(doc_id, docs[doc_id].type.value,
+                              str(docs[doc_id].filepath), docs[doc_id].depends_on)
+        docs = {i: docs[i] for i in ids if i in docs}
+        _assert_matches_fresh(graph, docs)
+        fresh, _ = build_graph(docs)
+        assert graph.cycle_groups() == fresh.cycle_groups()
+        assert detect_cycles(graph) == detect_cycles(fresh)
+        if not cyclic:
+            assert detect_cycles(graph) == []
+
+
+def test_deep_chain_does_not_recurse():
+    # Far beyond the recursion limit (see tests/perf/bench_graph.py for 100k)
+    docs = {f"n{i}": _doc(f"n{i}", [f"n{i - 1}"] if i else []) for i in range(20_000)}
+    graph, _ = build_graph(docs)
+    assert calculate_depths(graph)["n19999"] == 19999
+    assert detect_cycles(graph) == []
+
+    # Close the chain into one 20k-document cycle
+    graph.update_node("n0", "atom", "/project/n0.md", ["n19999"])
+    assert [len(g) for g in graph.cycle_groups()] == [20_000]
+    assert len(detect_cycles(graph)[0]) == 20_001
+    assert set(calculate_depths(graph).values()) == {1}
+
+
+def test_direct_construction_tracks_orphans():
+    graph = DependencyGraph()
+    graph.add_node("a", "atom", "a.md", [])
+    assert detect_orphans(graph, set()) == ["a"]
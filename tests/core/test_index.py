@@ -0,0 +1,188 @@
+"""Tests for the unified document index (ontos.core.index)."""
+
+from pathlib import Path
+
+from ontos.core.cache import DocumentCache
+from ontos.core.index import DocumentIndex, IndexChanges
+from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+
+ROOT = Path("/project")
+
+
+def _doc(path, doc_id, doc_type=DocumentType.ATOM, **fm):
+    return DocumentData(
+        id=doc_id,
+        type=doc_type,
+        status=DocumentStatus.ACTIVE,
+        filepath=path,
+        frontmatter={"id": doc_id, **fm},
+        content="",
+    )
+
+
+class FakeFiles:
+    """In-memory loader/stat pair that records which paths were parsed."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.parsed = []
+        self.stats = {}
+
+    def load(self, paths):
+        self.parsed.extend(paths)
+        results = []
+        for p in paths:
+            doc = self.docs.get(p)
+            results.append((p, doc, None) if doc else (p, None, "bad yaml"))
+        return results
+
+    def stat(self, path):
+        if path.name == "gone.md":
+            raise OSError("No such file")
+        return self.stats.get(path, (1.0, 10, 1))
+
+
+def _index(docs, paths=None, **kwargs):
+    files = FakeFiles(docs)
+    index = DocumentIndex(paths or list(docs), loader=files.load, stat=files.stat, **kwargs)
+    return index, files
+
+
+def test_lookups():
+    a, b, k = ROOT / "a.md", ROOT / "b.md", ROOT / "k.md"
+    index, _ = _index({
+        a: _doc(a, "a", concepts=["auth", "api"]),
+        b: _doc(b, "b", concepts="auth"),
+        k: _doc(k, "k", DocumentType.KERNEL),
+    })
+
+    assert index.get("a").filepath == a
+    assert index.get_by_path(k).id == "k"
+    assert [d.id for d in index.of_type(DocumentType.ATOM)] == ["a", "b"]
+    assert [d.id for d in index.with_concept("auth")] == ["a", "b"]
+    assert [d.id for d in index.with_concept(" AUTH ")] == ["a", "b"]
+    assert index.with_concept("missing") == []
+    assert index.ids_with_concepts(["api", "Auth", "missing"]) == {"a", "b"}
+    assert "k" in index and "x" not in index
+    assert len(index) == 3
+    assert [d.id for d in index] == ["a", "b", "k"]
+
+
+def test_loads_lazily_and_once():
+    a = ROOT / "a.md"
+    loaded = []
+    index, files = _index({a: _doc(a, "a")}, on_loaded=loaded.append)
+
+    assert files.parsed == []
+    assert index.paths_under(ROOT) == [a]
+    assert not index.loaded
+
+    index.get("a")
+    index.of_type(DocumentType.ATOM)
+    assert files.parsed == [a]
+    assert loaded == [index]
+
+
+def test_errors_are_reported_in_scan_order():
+    a, bad, gone = ROOT / "a.md", ROOT / "bad.md", ROOT / "gone.md"
+    index, _ = _index({a: _doc(a, "a"), bad: None}, paths=[a, bad, gone])
+
+    assert index.errors == [(bad, "bad yaml"), (gone, "No such file")]
+    assert [p for p, _, _ in index.results] == [a, bad, gone]
+    assert list(index.documents) == ["a"]
+
+
+def test_duplicate_ids_last_wins():
+    first, second = ROOT / "one.md", ROOT / "two.md"
+    index, _ = _index({first: _doc(first, "dup"), second: _doc(second, "dup")})
+
+    assert index.get("dup").filepath == second
+    assert index.get_by_path(first).filepath == first
+    assert len(index.of_type(DocumentType.ATOM)) == 1
+
+
+def test_cache_hits_skip_loader():
+    a, b = ROOT / "a.md", ROOT / "b.md"
+    cache = DocumentCache()
+    cache.set(a, _doc(a, "cached"), 1.0, size=10, inode=1)
+    index, files = _index({a: _doc(a, "a"), b: _doc(b, "b")}, cache=cache)
+
+    assert index.get("cached") is not None
+    assert files.parsed == [b]
+    assert cache.get(b, 1.0, size=10, inode=1).id == "b"
+
+
+def test_update_reparses_only_changed_files():
+    a, b, c = ROOT / "a.md", ROOT / "b.md", ROOT / "c.md"
+    loaded = []
+    index, files = _index({a: _doc(a, "a"), b: _doc(b, "b")}, on_loaded=loaded.append)
+    index.load()
+    files.parsed.clear()
+
+    files.docs[a] = _doc(a, "a", doc_type=DocumentType.KERNEL)
+    files.stats[a] = (2.0, 12, 1)
+    files.docs[c] = _doc(c, "c")
+    changes = index.update([a, c], changed=[a, b])
+
+    assert changes == IndexChanges(added=[c], removed=[b], updated=[a])
+    assert files.parsed == [c, a]
+    assert list(index.documents) == ["a", "c"]
+    assert [d.id for d in index.of_type(DocumentType.KERNEL)] == ["a"]
+    assert index.get_by_path(b) is None
+    assert len(loaded) == 2
+
+
+def test_update_ignores_events_without_content_change():
+    a = ROOT / "a.md"
+    loaded = []
+    index, files = _index({a: _doc(a, "a")}, on_loaded=loaded.append)
+    index.load()
+    files.parsed.clear()
+
+    changes = index.update([a], changed=[a])
+
+    assert not changes
+    assert files.parsed == []
+    assert len(loaded) == 1
+
+
+def test_update_keeps_cache_in_step():
+    a, b = ROOT / "a.md", ROOT / "b.md"
+    cache = DocumentCache()
+    index, files = _index({a: _doc(a, "a"), b: _doc(b, "b")}, cache=cache)
+    index.load()
+
+    files.docs[a] = None  # Now fails to parse
+    files.stats[a] = (2.0, 3, 1)
+    index.update([a], changed=[a])
+
+    assert index.errors == [(a, "bad yaml")]
+    assert cache.get(a, 2.0, size=3, inode=1) is None
+    assert cache.get(b, 1.0, size=10, inode=1) is None
+
+
+def test_update_applies_changes_to_built_graph():
+    a, b, c, k = ROOT / "a.md", ROOT / "b.md", ROOT / "c.md", ROOT / "k.md"
+    index, files = _index({
+        k: _doc(k, "k", DocumentType.KERNEL),
+        a: _doc(a, "a"),
+        b: _doc(b, "b"),
+    }, paths=[k, a, b])
+    index.get("a").depends_on.append("k")
+    graph, errors = index.graph
+    assert errors == [] and graph.reverse_edges == {"k": ["a"]}
+
+    files.docs[b] = _doc(b, "b")
+    files.docs[b].depends_on.extend(["a", "c"])
+    files.stats[b] = (2.0, 12, 1)
+    files.docs[c] = _doc(c, "c")
+    index.update([k, c, a, b], changed=[b])
+
+    updated, errors = index.graph
+    assert updated is graph
+    assert list(graph.nodes) == ["k", "c", "a", "b"]
+    assert graph.reverse_edges == {"k": ["a"], "a": ["b"], "c": ["b"]}
+    assert errors == []
+
+    index.update([k, a, b])
+    assert [e.message for e in index.graph[1]] == ["Broken dependency: 'c' does not exist"]
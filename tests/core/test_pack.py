@@ -0,0 +1,146 @@
+"""Tests for token-budgeted context packs (ontos.core.pack)."""
+
+import pytest
+
+from ontos.core import pack as core_pack
+from ontos.core.pack import (
+    estimate_document, estimate_documents, iter_pack, pack_documents, rank_documents, render_pack,
+)
+from ontos.core.tokens import HeuristicCounter
+from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+from ontos.io.tokens import load_bpe_counter
+
+HEADER = "# Project Context Map"
+
+
+def _doc(doc_id, doc_type=DocumentType.ATOM, depends_on=(), body="", summary=None):
+    frontmatter = {"id": doc_id}
+    if summary:
+        frontmatter["summary"] = summary
+    return DocumentData(
+        id=doc_id, type=doc_type, status=DocumentStatus.ACTIVE,
+        filepath=f"docs/{doc_id}.md", frontmatter=frontmatter, content=body,
+        depends_on=list(depends_on),
+    )
+
+
+def _docs(*docs):
+    return {doc.id: doc for doc in docs}
+
+
+def _pack(docs, budget, recency=None, counter=None):
+    estimates = {doc_id: estimate_document(doc, counter) for doc_id, doc in docs.items()}
+    pack = pack_documents(rank_documents(docs, recency), estimates, budget, HEADER, counter)
+    return pack, render_pack(HEADER, docs, pack)
+
+
+def test_rank_kernel_then_in_degree_then_recency():
+    docs = _docs(
+        _doc("a", depends_on=["hub", "k"]),
+        _doc("b", depends_on=["hub", "hub"]),
+        _doc("hub"),
+        _doc("old"),
+        _doc("new"),
+        _doc("k", DocumentType.KERNEL),
+    )
+    ranked = rank_documents(docs, recency={"new": 2.0, "old": 1.0})
+    assert ranked == ["k", "hub", "new", "old", "a", "b"]
+
+
+def test_everything_fits():
+    docs = _docs(_doc("k", DocumentType.KERNEL, body="Kernel body."), _doc("a", summary="An atom"))
+    pack, content = _pack(docs, 1000)
+    assert pack.listed == ["k", "a"] and pack.expanded == ["k"] and pack.omitted == 0
+    assert 'a:atom:active:"An atom"' in content
+    assert "### k\n\nKernel body." in content
+    assert "left out" not in content
+
+
+def test_entries_come_before_bodies():
+    docs = _docs(
+        _doc("k", DocumentType.KERNEL, body="word " * 200),
+        _doc("a", body="short"),
+    )
+    pack, _ = _pack(docs, 150)
+    assert pack.listed == ["k", "a"]
+    assert pack.expanded == ["a"]  # The kernel body does not fit; a smaller one does
+
+
+def test_omitted_documents_are_noted():
+    docs = _docs(*(_doc(f"doc_{i:02d}", summary="x" * 40) for i in range(50)))
+    pack, content = _pack(docs, 200)
+    assert 0 < len(pack.listed) < 50
+    assert pack.listed == sorted(docs)[:len(pack.listed)]
+    assert f"_{pack.omitted} of 50 documents left out to stay within 200 tokens._" in content
+
+
+@pytest.mark.parametrize("counter", [HeuristicCounter(), load_bpe_counter()], ids=["heuristic", "bpe"])
+@pytest.mark.parametrize("budget", [60, 100, 150, 250, 400, 800, 5000])
+def test_count_stays_within_budget(budget, counter):
+    docs = _docs(
+        _doc("k", DocumentType.KERNEL, body="kernel " * 30),
+        *(_doc(f"doc_{i}", depends_on=["k"], summary=f"Summary {i}",
+               body="text, *more* text\n\n" * (i * 7) + "`code()`")
+          for i in range(20)),
+    )
+    pack, content = _pack(docs, budget, counter=counter)
+    assert counter.count(content) <= pack.tokens <= budget
+
+
+def test_header_larger_than_budget():
+    pack, content = _pack(_docs(_doc("a")), 3)
+    assert pack.listed == [] and pack.omitted == 1
+    assert content.startswith(HEADER)
+
+
+def _lazy_doc(doc_id, body, reads):
+    def load():
+        reads.append(doc_id)
+        return body
+
+    return DocumentData(
+        id=doc_id, type=DocumentType.ATOM, status=DocumentStatus.ACTIVE,
+        filepath=f"docs/{doc_id}.md", frontmatter={"id": doc_id}, content=None,
+        body_loader=load,
+    )
+
+
+def test_estimates_release_lazy_bodies(monkeypatch):
+    monkeypatch.setattr(core_pack, "ESTIMATE_BATCH_SIZE", 2)
+    reads = []
+    lazy = [_lazy_doc(f"doc_{i}", f"Body {i}", reads) for i in range(5)]
+    eager = _doc("eager", body="Eager body")
+    estimates = estimate_documents(lazy + [eager])
+    assert len(reads) == 5
+    assert not any(doc.content_loaded for doc in lazy)
+    assert eager.content == "Eager body"
+    expected = [_doc(d.id, body=f"Body {i}") for i, d in enumerate(lazy)] + [eager]
+    assert estimates == [estimate_document(doc) for doc in expected]
+
+
+def test_iter_pack_matches_render_and_releases_bodies():
+    reads = []
+    docs = _docs(
+        _doc("k", DocumentType.KERNEL, body="Kernel body\n\n"),
+        *(_lazy_doc(f"doc_{i}", f"Body {i}\n" if i else "", reads) for i in range(4)),
+    )
+    estimates = dict(zip(docs, estimate_documents(list(docs.values()))))
+    pack = pack_documents(rank_documents(docs), estimates, 1000, HEADER)
+    reads.clear()
+
+    chunks = iter_pack(HEADER, docs, pack)
+    loaded = []
+    for _ in chunks:
+        loaded.append(sum(doc.content_loaded for doc in docs.values()))
+    assert max(loaded) <= 2  # The eager kernel body and at most one lazy one
+    assert sorted(reads) == ["doc_1", "doc_2", "doc_3"]  # doc_0 has no body to include
+    assert not any(docs[f"doc_{i}"].content_loaded for i in range(4))
+
+    content = render_pack(HEADER, docs, pack)
+    assert content == "".join(iter_pack(HEADER, docs, pack))
+    assert content.endswith("Body 3\n") and not content.endswith("\n\n")
+
+
+def test_iter_pack_without_documents():
+    pack = pack_documents([], {}, 100, HEADER)
+    assert "".join(iter_pack(HEADER, {}, pack)) == HEADER + "\n\n## Documents\n"
@@ -0,0 +1,87 @@
+"""Tests for the reachability index (ontos.core.reachability)."""
+
+import random
+
+import pytest
+
+from ontos.core.reachability import (
+    ReachabilityIndex,
+    build_reachability,
+    graph_signature,
+    within_depth,
+)
+
+
+def _closure(edges, start):
+    """Brute-force transitive successors of ``start``."""
+    seen = set()
+    frontier = list(edges.get(start, ()))
+    while frontier:
+        node = frontier.pop()
+        if node not in seen:
+            seen.add(node)
+            frontier.extend(edges.get(node, ()))
+    return seen
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    ids = [f"d{i}" for i in range(40)]
+    edges = {i: [rng.choice(ids + ["ghost"]) for _ in range(rng.randint(0, 3))] for i in ids}
+    reverse = {}
+    for source, deps in edges.items():
+        for dep in deps:
+            reverse.setdefault(dep, []).append(source)
+
+    index = build_reachability(edges)
+    for doc_id in ids + ["ghost"]:
+        assert set(index.depends_on(doc_id)) == _closure(edges, doc_id) - {doc_id}
+        assert set(index.depended_by(doc_id)) == _closure(reverse, doc_id) - {doc_id}
+        for other in ids:
+            assert index.reaches(doc_id, other) == (other in _closure(edges, doc_id))
+
+    restored = ReachabilityIndex.from_dict(index.to_dict())
+    assert restored == index
+    assert restored.depended_by("d0") == index.depended_by("d0")
+
+
+def test_cycles_and_missing_ids():
+    index = build_reachability({"a": ["b"], "b": ["a", "ghost"], "c": ["c"], "d": []})
+    assert sorted(index.depends_on("a")) == ["b", "ghost"]
+    assert index.reaches("a", "a") and index.reaches("c", "c")
+    assert not index.reaches("d", "d")
+    assert sorted(index.depended_by("ghost")) == ["a", "b"]
+    assert index.depends_on("unknown") == [] and "unknown" not in index
+
+
+def test_deep_chain():
+    n = 5000
+    edges = {f"n{i}": [f"n{i + 1}"] for i in range(n - 1)}
+    index = build_reachability(edges)
+    assert len(index.depended_by(f"n{n - 1}")) == n - 1
+    assert index.reaches("n0", f"n{n - 1}")
+
+
+def test_sparse_bitsets_round_trip():
+    edges = {f"x{i}": [] for i in range(300)}
+    edges["top"] = ["x0"]
+    index = build_reachability(edges)
+    data = index.to_dict()
+    # x0's only dependent is ~300 components away: stored as a position
+    assert isinstance(data["dependents"][index.component_of["x0"]], list)
+    restored = ReachabilityIndex.from_dict(data)
+    assert restored == index and restored.depended_by("x0") == ["top"]
+
+
+def test_within_depth():
+    edges = {"a": ["b", "c"], "b": ["d"], "c": ["d", "a"], "d": ["e"]}
+    assert within_depth(edges, "a", 1) == [("b", 1), ("c", 1)]
+    assert within_depth(edges, "a", 2) == [("b", 1), ("c", 1), ("d", 2)]
+    assert within_depth(edges, "a", 10)[-1] == ("e", 3)
+
+
+def test_signature_ignores_key_order():
+    assert graph_signature({"a": ["b"], "b": []}) == graph_signature({"b": [], "a": ["b"]})
+    assert graph_signature({"a": ["b", "c"]}) != graph_signature({"a": ["c", "b"]})
+    assert graph_signature({"a": ["bc"]}) != graph_signature({"a": ["b", "c"]})
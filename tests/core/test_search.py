@@ -0,0 +1,237 @@
+"""Tests for the full-text search index (ontos.core.search)."""
+
+import random
+
+import pytest
+
+from ontos.core import search
+from ontos.core.search import (
+    QueryPart,
+    SearchIndex,
+    all_shards,
+    parse_query,
+    shard_of,
+    tokenize,
+)
+from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+
+
+def _doc(doc_id, body, summary=None):
+    frontmatter = {"id": doc_id}
+    if summary:
+        frontmatter["summary"] = summary
+    return DocumentData(
+        id=doc_id, type=DocumentType.ATOM, status=DocumentStatus.ACTIVE,
+        filepath=f"docs/{doc_id}.md", frontmatter=frontmatter, content=body,
+    )
+
+
+def _index(bodies):
+    index = SearchIndex()
+    for doc_id, body in bodies.items():
+        index.put(f"docs/{doc_id}.md", doc_id, body)
+    return index
+
+
+def _ids(results):
+    return [doc_id for doc_id, _ in results]
+
+
+CORPUS = {
+    "auth": "Authentication flow. The auth token is refreshed by the token service.",
+    "tokens": "Token refresh happens hourly. Refresh the token before it expires.",
+    "billing": "Billing runs nightly and never touches authentication.",
+    "notes": "Random notes about the flow of water.",
+}
+
+
+def test_tokenize_casefolds_words():
+    assert tokenize("Auth-Flow: Token_ID 42, Straße") == ["auth", "flow", "token_id", "42", "strasse"]
+
+
+def test_shard_of_groups_terms_by_first_two_characters():
+    assert shard_of("auth") == shard_of("authz") == shard_of("au")
+    assert {shard_of(t) for t in ["auth", "été", "42", "_x", "a"]} <= set(all_shards())
+    assert len(all_shards()) == search.SHARD_COUNT
+
+
+def test_parse_query():
+    assert parse_query('auth "token refresh" serv* auth-flow "solo" auth-fl*') == [
+        QueryPart("term", ["auth"]),
+        QueryPart("phrase", ["token", "refresh"]),
+        QueryPart("prefix", ["serv"]),
+        QueryPart("phrase", ["auth", "flow"]),
+        QueryPart("term", ["solo"]),
+        QueryPart("phrase", ["auth"]),
+        QueryPart("prefix", ["fl"]),
+    ]
+    assert parse_query('"" - *') == []
+
+
+def test_all_terms_must_match():
+    index = _index(CORPUS)
+    assert _ids(index.search("token")) == ["tokens", "auth"]
+    assert _ids(index.search("token flow")) == ["auth"]
+    assert index.search("token billing") == []
+    assert index.search("") == []
+
+
+def test_ranking_prefers_frequent_terms_in_short_documents():
+    index = _index({
+        "short": "cache cache",
+        "long": "cache " + "filler " * 50,
+        "none": "nothing here",
+    })
+    results = index.search("cache")
+    assert _ids(results) == ["short", "long"]
+    assert results[0][1] > results[1][1] > 0
+
+
+def test_phrase():
+    index = _index(CORPUS)
+    assert _ids(index.search('"token refresh"')) == ["tokens"]
+    assert _ids(index.search('"refresh the token"')) == ["tokens"]
+    assert index.search('"token auth"') == []
+
+
+def test_prefix():
+    index = _index(CORPUS)
+    assert sorted(_ids(index.search("auth*"))) == ["auth", "billing"]
+    assert _ids(index.search("expir*")) == ["tokens"]
+    assert index.search("zzz*") == []
+
+
+def test_limit_and_tie_order():
+    index = _index({f"d{i}": "same words" for i in range(5)})
+    assert _ids(index.search("same", limit=3)) == ["d0", "d1", "d2"]
+
+
+def test_files_sharing_an_id_are_one_result():
+    index = _index(CORPUS)
+    index.put("archive/auth.md", "auth", "An older copy of the auth token notes.")
+    assert _ids(index.search("auth")) == ["auth"]
+    assert _ids(index.search("token", limit=2)) == ["tokens", "auth"]
+
+
+def test_remove_and_reindex():
+    index = _index(CORPUS)
+    index.remove("docs/billing.md")
+    assert sorted(_ids(index.search("auth*"))) == ["auth"]
+    index.put("docs/notes.md", "notes", "Notes about authentication")
+    assert sorted(_ids(index.search("authentication"))) == ["auth", "notes"]
+    assert index.search("water") == []
+
+
+def test_refresh_reads_only_changed_documents():
+    docs = {doc_id: _doc(doc_id, body) for doc_id, body in CORPUS.items()}
+    stats = {doc_id: f"1.0/{len(body)}/{i}" for i, (doc_id, body) in enumerate(CORPUS.items())}
+    read = []
+
+    def text_of(doc):
+        read.append(doc.id)
+        return doc.content
+
+    def current():
+        return [(f"docs/{i}.md", docs[i], stats[i]) for i in docs]
+
+    index = SearchIndex()
+    assert index.refresh(current(), text_of) == 4
+    assert sorted(read) == sorted(CORPUS)
+
+    read.clear()
+    assert index.refresh(current(), text_of) == 0
+    assert read == []
+
+    # Touched but unchanged: read, not re-tokenized
+    stats["auth"] = stats["auth"].replace("1.0", "2.0")
+    assert index.refresh(current(), text_of) == 0
+    assert read == ["auth"]
+
+    read.clear()
+    docs["notes"] = _doc("notes", "Now about billing")
+    stats["notes"] = "3.0/17/3"
+    del docs["billing"]
+    assert index.refresh(current(), text_of) == 1
+    assert read == ["notes"]
+    assert _ids(index.search("billing")) == ["notes"]
+
+
+def test_summary_is_searchable():
+    index = SearchIndex()
+    index.refresh([("docs/a.md", _doc("a", "Body text", summary="Overview of caching"), None)])
+    assert _ids(index.search("caching")) == ["a"]
+
+
+def _round_trip(index, disk, merge=True):
+    """Persist ``index`` into ``disk`` and load it back, as ontos.io.search does.
+
+    Returns:
+        (loaded index, shards written by the merge)
+    """
+    written = {}
+    if merge:
+        token = f"t{index.next_num}"
+        written = index.merge(token)
+        disk.update({(token, name): shard for name, shard in written.items()})
+        index.saved()
+    loaded = SearchIndex.from_table(index.to_table(), lambda token, name: disk.get((token, name)))
+    return loaded, written
+
+
+def test_persisted_index_answers_the_same():
+    index = _index(CORPUS)
+    for merge in (False, True):
+        loaded, _ = _round_trip(index, {}, merge)
+        for query in ["token", "auth*", '"token refresh"', "flow", "a*", "nothing"]:
+            assert loaded.search(query) == index.search(query)
+
+
+def test_merge_drops_removed_documents():
+    index = _index(CORPUS)
+    _, written = _round_trip(index, {})
+    assert any("water" in shard for shard in written.values())
+    index.remove("docs/notes.md")
+    index.put("docs/billing.md", "billing", "Billing moved to weekly runs.")
+    assert index.to_table()["delta"] and index.needs_merge() is False
+    _, written = _round_trip(index, {})
+    assert not index.to_table()["delta"]
+    assert not any("water" in shard or "nightly" in shard for shard in written.values())
+    assert _ids(index.search("billing")) == ["billing"]
+
+
+def test_needs_merge(monkeypatch):
+    monkeypatch.setattr(search, "MERGE_MINIMUM", 2)
+    index = _index({"a": "one", "b": "two"})
+    assert index.needs_merge() is False
+    index.put("docs/c.md", "c", "three")
+    assert index.needs_merge() is True
+    _round_trip(index, {})
+    assert index.needs_merge() is False
+    for path in ["docs/a.md", "docs/b.md", "docs/c.md"]:
+        index.remove(path)
+    assert index.needs_merge() is True
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_match_a_fresh_index(seed):
+    rng = random.Random(seed)
+    words = ["alpha", "beta", "gamma", "delta", "alphabet", "betamax", "gam"]
+    bodies = {}
+    disk = {}
+    index = SearchIndex()
+    for step in range(60):
+        doc_id = f"d{rng.randrange(15)}"
+        if rng.random() < 0.2:
+            bodies.pop(doc_id, None)
+            index.remove(f"docs/{doc_id}.md")
+        else:
+            bodies[doc_id] = " ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+            index.put(f"docs/{doc_id}.md", doc_id, bodies[doc_id])
+        if step % 10 == 9:
+            index, _ = _round_trip(index, disk, merge=rng.random() < 0.5)
+
+    fresh = _index(bodies)
+    for query in ["alpha", "alpha*", "bet* gamma", '"alpha beta"', "gam delta", "g*"]:
+        got, want = index.search(query), fresh.search(query)
+        assert _ids(got) == _ids(want)
+        assert [s for _, s in got] == pytest.approx([s for _, s in want])
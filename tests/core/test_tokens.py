@@ -0,0 +1,96 @@
+"""Tests for token counters (ontos.core.tokens)."""
+
+import base64
+
+import pytest
+
+from ontos.core.tokens import (
+    MEMO_MIN_LENGTH,
+    BPECounter,
+    CachedCounter,
+    HeuristicCounter,
+    content_key,
+    parse_bpe_ranks,
+)
+
+
+def _ranks(*merges):
+    tokens = [bytes([b]) for b in range(256)] + [m.encode() for m in merges]
+    return {token: rank for rank, token in enumerate(tokens)}
+
+
+def _reference(piece, ranks):
+    """Textbook BPE: merge the lowest-ranked adjacent pair until none is left."""
+    parts = [bytes([b]) for b in piece]
+    while True:
+        pairs = [(ranks.get(a + b), i) for i, (a, b) in enumerate(zip(parts, parts[1:]))]
+        pairs = [p for p in pairs if p[0] is not None]
+        if not pairs:
+            return len(parts)
+        _, i = min(pairs)
+        parts[i:i + 2] = [parts[i] + parts[i + 1]]
+
+
+def test_parse_bpe_ranks():
+    data = b"".join(base64.b64encode(t) + b" %d\n" % r for t, r in [(b"a", 0), (b" the", 1)])
+    assert parse_bpe_ranks(data + b"\n") == {b"a": 0, b" the": 1}
+    with pytest.raises(ValueError):
+        parse_bpe_ranks(b"not-base64!! 1\n")
+
+
+def test_bpe_merges_by_rank():
+    counter = BPECounter(_ranks("th", "the", " the", "er", "re"))
+    assert counter.count("") == 0
+    assert counter.count("the") == 1
+    assert counter.count(" the there") == 1 + 2  # " the" + " the|re"
+    assert counter.count("other") == 3  # o|the|r: "th" merges before "er"
+
+
+def test_bpe_matches_reference_merges():
+    ranks = _ranks("ab", "bc", "abc", "ca", "cab", "aa", "aaa", "bcab")
+    counter = BPECounter(ranks)
+    for piece in ["abcabcab", "aaaaaaa", "cabcab", "bcabcabca", "x", "ababab"]:
+        assert counter._merge_count(piece.encode()) == _reference(piece.encode(), ranks)
+
+
+def test_pieces_split_like_cl100k():
+    counter = BPECounter(_ranks())
+    # Without merges every byte is a token, so counts show the split is by byte
+    assert counter.count("héllo") == len("héllo".encode())
+    assert counter.count("12345") == 5
+
+
+def test_heuristic():
+    assert HeuristicCounter().count("x" * 41) == 10
+
+
+class CountingCounter(HeuristicCounter):
+    def __init__(self):
+        self.batches = []
+
+    def count_batch(self, texts):
+        texts = list(texts)
+        self.batches.append(texts)
+        return super().count_batch(texts)
+
+
+def test_cached_counter_memoizes_long_texts():
+    inner = CountingCounter()
+    long_a, long_b = "a" * MEMO_MIN_LENGTH, "b" * (MEMO_MIN_LENGTH + 4)
+    counter = CachedCounter(inner, {content_key(long_b): 7})
+
+    assert counter.count_batch([long_a, "short", long_a, long_b]) == [64, 1, 64, 7]
+    assert inner.batches == [["short", long_a]]  # One call; duplicates counted once
+    assert counter.dirty and counter.memo[content_key(long_a)] == 64
+
+    inner.batches.clear()
+    assert counter.count(long_a) == 64
+    assert inner.batches == [[]]
+
+
+def test_snapshot_keeps_used_entries_first():
+    counter = CachedCounter(HeuristicCounter(), {"old1": 1, "old2": 2})
+    counter.count("c" * MEMO_MIN_LENGTH)
+    key = content_key("c" * MEMO_MIN_LENGTH)
+    assert list(counter.snapshot(2)) == [key, "old1"]
+    assert len(counter.snapshot(10)) == 3
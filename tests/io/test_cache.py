@@ -0,0 +1,195 @@
+"""Tests for the persistent document cache (ontos.io.cache)."""
+
+import json
+import os
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from ontos.core.cache import DocumentCache
+from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+from ontos.io import cache as io_cache
+from ontos.io.cache import (
+    DOCUMENT_CACHE_FILE,
+    get_cache_dir,
+    load_document_cache,
+    save_document_cache,
+)
+
+
+def _make_doc(path: Path, **frontmatter) -> DocumentData:
+    fm = {"id": "doc_a", "type": "atom", "status": "active", **frontmatter}
+    return DocumentData(
+        id="doc_a",
+        type=DocumentType.ATOM,
+        status=DocumentStatus.ACTIVE,
+        filepath=path,
+        frontmatter=fm,
+        content="Body\n",
+        depends_on=["doc_b"],
+        impacts=[],
+        tags=["auth"],
+        aliases=["Doc A", "doc-a"],
+        concepts=["auth"],
+    )
+
+
+def test_roundtrip_preserves_document(tmp_path):
+    path = tmp_path / "doc_a.md"
+    doc = _make_doc(
+        path,
+        describes_verified=date(2025, 1, 2),
+        generated_at=datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        nested={"a": [1, 2.5, None, True]},
+    )
+
+    cache = DocumentCache()
+    cache.set(path, doc, 123.5, size=10, inode=7)
+    assert save_document_cache(tmp_path, cache) is True
+    assert cache.dirty is False
+
+    loaded = load_document_cache(tmp_path)
+    assert loaded.dirty is False
+    assert loaded.get(path, 123.5, size=10, inode=7) == doc
+
+
+def test_cache_dir_is_self_ignoring(tmp_path):
+    cache = DocumentCache()
+    cache.set(tmp_path / "x.md", _make_doc(tmp_path / "x.md"), 1.0)
+    save_document_cache(tmp_path, cache)
+
+    cache_dir = get_cache_dir(tmp_path)
+    assert (cache_dir / DOCUMENT_CACHE_FILE).exists()
+    assert "*" in (cache_dir / ".gitignore").read_text().split()
+
+
+def test_fingerprint_change_discards_cache(tmp_path, monkeypatch):
+    path = tmp_path / "doc_a.md"
+    cache = DocumentCache()
+    cache.set(path, _make_doc(path), 1.0)
+    save_document_cache(tmp_path, cache)
+
+    monkeypatch.setattr("ontos.io.yaml.PARSER_VERSION", 999)
+    assert load_document_cache(tmp_path).stats["entries"] == 0
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    cache_dir = get_cache_dir(tmp_path)
+    cache_dir.mkdir(parents=True)
+    (cache_dir / DOCUMENT_CACHE_FILE).write_text("{not json", encoding="utf-8")
+    assert load_document_cache(tmp_path).stats["entries"] == 0
+
+
+def test_unserializable_frontmatter_is_skipped(tmp_path):
+    good = tmp_path / "good.md"
+    bad = tmp_path / "bad.md"
+    cache = DocumentCache()
+    cache.set(good, _make_doc(good), 1.0)
+    cache.set(bad, _make_doc(bad, weird={1: "int key"}), 1.0)
+    save_document_cache(tmp_path, cache)
+
+    loaded = load_document_cache(tmp_path)
+    assert loaded.get(good, 1.0) is not None
+    assert loaded.get(bad, 1.0) is None
+
+
+def test_map_command_reuses_persisted_cache(tmp_path, monkeypatch):
+    """Second `ontos map` run must not re-read unchanged files."""
+    from ontos.commands import map as map_module
+    from ontos.commands.map import MapOptions, map_command
+
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\nBody\n")
+    (docs / "atom.md").write_text("---\nid: atom\ntype: atom\nstatus: active\ndepends_on: [kernel]\n---\n")
+    monkeypatch.chdir(tmp_path)
+
+    # Run twice so the generated map itself is part of the scanned set
+    assert map_command(MapOptions(quiet=True)) == 0
+    assert map_command(MapOptions(quiet=True)) == 0
+    first = (tmp_path / "Ontos_Context_Map.md").read_text()
+
+    reads = []
+    import ontos.io.files as files
+    original = files.read_frontmatter_header
+    context_map = tmp_path / "Ontos_Context_Map.md"
+
+    def tracking_read(p, *args, **kwargs):
+        # The regenerated map is itself scanned and always changes
+        if p != context_map:
+            reads.append(p)
+        return original(p, *args, **kwargs)
+
+    monkeypatch.setattr(files, "read_frontmatter_header", tracking_read)
+
+    assert map_command(MapOptions(quiet=True)) == 0
+    assert reads == []
+    second = (tmp_path / "Ontos_Context_Map.md").read_text()
+    assert _strip_timestamps(first) == _strip_timestamps(second)
+
+    # Touching a file forces a re-read of that file only
+    kernel = docs / "kernel.md"
+    st = kernel.stat()
+    kernel.write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\nChanged body\n")
+    os.utime(kernel, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    assert map_command(MapOptions(quiet=True)) == 0
+    assert reads == [kernel]
+
+    # --no-cache always re-reads
+    reads.clear()
+    assert map_command(MapOptions(quiet=True, no_cache=True)) == 0
+    assert len(reads) >= 2
+
+
+def _strip_timestamps(content: str) -> str:
+    return "\n".join(
+        line for line in content.splitlines()
+        if "generated_at" not in line and "Last updated" not in line
+    )
+
+
+def test_unloaded_body_is_stored_as_offset(tmp_path):
+    from ontos.io.files import load_document
+    from ontos.io.yaml import parse_frontmatter_content
+
+    path = tmp_path / "doc.md"
+    path.write_text("---\nid: doc\n---\n" + "x" * 10000 + "\n", encoding="utf-8")
+    doc = load_document(path, parse_frontmatter_content)
+
+    cache = DocumentCache()
+    cache.set(path, doc, 1.0)
+    save_document_cache(tmp_path, cache)
+    assert (get_cache_dir(tmp_path) / DOCUMENT_CACHE_FILE).stat().st_size < 2000
+
+    loaded = load_document_cache(tmp_path).get(path, 1.0)
+    assert not loaded.content_loaded
+    assert loaded.content == "x" * 10000 + "\n"
+
+
+def test_remembered_cache_file_follows_stat(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_cache, "_remembered", {})
+    assert io_cache.cache_file_stat(tmp_path, "t.json") is None
+    io_cache.remember_cache_file(tmp_path, "t.json", None, {"a": 1})
+    assert io_cache.recall_cache_file(tmp_path, "t.json", None) is None
+
+    assert io_cache.write_cache_file(tmp_path, "t.json", {"a": 1})
+    stat = io_cache.cache_file_stat(tmp_path, "t.json")
+    value = {"a": 1}
+    io_cache.remember_cache_file(tmp_path, "t.json", stat, value)
+    assert io_cache.recall_cache_file(tmp_path, "t.json", stat) is value
+
+    # Another process rewrites the file
+    assert io_cache.write_cache_file(tmp_path, "t.json", {"a": 22})
+    changed = io_cache.cache_file_stat(tmp_path, "t.json")
+    assert changed != stat
+    assert io_cache.recall_cache_file(tmp_path, "t.json", changed) is None
+
+    io_cache.forget_cache_file(tmp_path, "t.json")
+    assert io_cache.recall_cache_file(tmp_path, "t.json", stat) is None
+
+
+def test_stat_key():
+    assert io_cache.stat_key(None) is None
+    assert io_cache.stat_key((1.5, 10, 7)) == "1.5/10/7"
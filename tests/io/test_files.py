@@ -0,0 +1,477 @@
+"""Tests for ontos.io.files document loading."""
+
+from pathlib import Path
+
+import pytest
+
+from ontos.io import files as io_files
+from ontos.io.files import load_documents
+
+
+def _write_docs(root: Path, count: int) -> list:
+    paths = []
+    for i in range(count):
+        p = root / f"doc_{i:03d}.md"
+        deps = f"[doc_{i - 1:03d}]" if i else "[]"
+        p.write_text(
+            f"---\nid: doc_{i:03d}\ntype: atom\nstatus: active\n"
+            f"depends_on: {deps}\nconcepts: [c{i % 5}]\n---\n\nBody {i}\n",
+            encoding="utf-8",
+        )
+        paths.append(p)
+    return paths
+
+
+def test_parallel_matches_serial(tmp_path):
+    paths = _write_docs(tmp_path, 40)
+    broken = tmp_path / "broken.md"
+    broken.write_bytes(b"---\nid: \xff\xfe\n---\n")  # invalid UTF-8
+    paths.insert(7, broken)
+
+    serial = load_documents(paths, jobs=1)
+    parallel = load_documents(paths, jobs=3)
+
+    assert [r[0] for r in parallel] == paths
+    assert parallel == serial
+    assert serial[7][1] is None and serial[7][2]
+
+
+def test_auto_jobs_is_serial_for_small_inputs(tmp_path, monkeypatch):
+    paths = _write_docs(tmp_path, 3)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool should not be used")
+
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", no_pool)
+    results = load_documents(paths)
+    assert [doc.id for _, doc, _ in results] == ["doc_000", "doc_001", "doc_002"]
+
+
+def test_falls_back_to_serial_without_multiprocessing(tmp_path, monkeypatch):
+    paths = _write_docs(tmp_path, 5)
+
+    def broken_pool(*args, **kwargs):
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", broken_pool)
+    assert load_documents(paths, jobs=4) == load_documents(paths, jobs=1)
+
+
+def test_default_jobs_bounds(monkeypatch):
+    monkeypatch.setattr(io_files.os, "cpu_count", lambda: None)
+    assert io_files.default_jobs() == 1
+    monkeypatch.setattr(io_files.os, "cpu_count", lambda: 64)
+    assert io_files.default_jobs() == io_files.MAX_DEFAULT_JOBS
+
+
+@pytest.mark.parametrize("jobs", [0, -3])
+def test_jobs_below_one_rejected(tmp_path, jobs):
+    with pytest.raises(ValueError, match="at least 1"):
+        load_documents(_write_docs(tmp_path, 2), jobs=jobs)
+
+
+@pytest.mark.parametrize("jobs", ["0", "-3", "two"])
+def test_cli_rejects_invalid_jobs(tmp_path, monkeypatch, capsys, jobs):
+    from ontos import cli
+
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["map", "--jobs", jobs])
+    assert exc.value.code == 2
+    assert "--jobs" in capsys.readouterr().err
+
+
+def test_map_output_identical_with_jobs(tmp_path, monkeypatch):
+    from ontos.commands.map import MapOptions, map_command
+
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _write_docs(docs, 30)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("ontos.commands.map.datetime", _FrozenDatetime)
+
+    outputs = []
+    for jobs in (1, 4):
+        out = tmp_path / f"map_{jobs}.txt"  # .txt so it is not scanned
+        assert map_command(MapOptions(output=out, quiet=True, no_cache=True, jobs=jobs)) in (0, 1)
+        outputs.append(out.read_bytes())
+
+    assert outputs[0] == outputs[1]
+
+
+class _FrozenDatetime:
+    @staticmethod
+    def now():
+        from datetime import datetime
+        return datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _legacy_scan(dirs, skip_patterns):
+    """The rglob-then-fnmatch scan this module used to do."""
+    from fnmatch import fnmatch
+
+    results = []
+    for dir_path in dirs:
+        if not dir_path.exists():
+            continue
+        for md_file in dir_path.rglob("*.md"):
+            if not any(fnmatch(str(md_file), p) or md_file.match(p) for p in skip_patterns):
+                results.append(md_file)
+    return sorted(set(results))
+
+
+@pytest.fixture
+def doc_tree(tmp_path):
+    for rel in [
+        "README.md",
+        "docs/a.md",
+        "docs/_template.md",
+        "docs/sub/b.md",
+        "docs/archive/old.md",
+        "docs/archive/deep/older.md",
+        "archive/top.md",
+        "notes/x1.md",
+        "notes/readme.txt",
+        ".ontos-internal/kernel/k.md",
+        "node_modules/pkg/README.md",
+        ".git/info/x.md",
+    ]:
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("---\nid: x\n---\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("patterns", [
+    [],
+    ["_template.md", "archive/*"],
+    ["*/archive/*"],
+    ["*/docs/*"],
+    ["x?.md", "[!a]*.md"],
+    ["docs/sub/"],
+])
+def test_walker_matches_legacy_scan(doc_tree, patterns):
+    from ontos.io.files import scan_documents
+
+    expected = [p for p in _legacy_scan([doc_tree], patterns) if ".git" not in p.parts]
+    assert scan_documents([doc_tree], skip_patterns=patterns) == expected
+
+
+def test_walker_prunes_ignored_dirs(doc_tree, monkeypatch):
+    from ontos.io import files as io_files
+    from ontos.io.files import DEFAULT_IGNORES, scan_documents
+
+    visited = []
+    real_scandir = io_files.os.scandir
+
+    def tracking_scandir(path):
+        visited.append(Path(path).name)
+        return real_scandir(path)
+
+    monkeypatch.setattr(io_files.os, "scandir", tracking_scandir)
+    found = scan_documents([doc_tree], skip_patterns=["*/archive/*"], ignore_dirs=DEFAULT_IGNORES)
+
+    assert "node_modules" not in visited
+    assert ".git" not in visited
+    assert "archive" not in visited
+    assert all("node_modules" not in p.parts for p in found)
+
+
+def test_overlapping_roots_are_walked_once(doc_tree):
+    from ontos.io.files import scan_documents
+
+    found = scan_documents([doc_tree / "docs", doc_tree])
+    assert len(found) == len(set(found))
+    assert doc_tree / "docs" / "a.md" in found
+
+
+def test_explicit_root_inside_ignored_dir_is_scanned(doc_tree):
+    from ontos.io.files import DEFAULT_IGNORES, scan_documents
+
+    found = scan_documents([doc_tree / "node_modules"], ignore_dirs=DEFAULT_IGNORES)
+    assert found == [doc_tree / "node_modules" / "pkg" / "README.md"]
+
+
+def _git(cwd, *args):
+    import subprocess
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_tree(tmp_path):
+    import shutil
+    if shutil.which("git") is None:
+        pytest.skip("git not available")
+    _git(tmp_path, "init", "-q")
+    (tmp_path / ".gitignore").write_text("build/\n*.draft.md\n")
+    for rel in ["docs/tracked.md", "docs/untracked.md", "build/out.md",
+                "docs/x.draft.md", "docs/archive/old.md", "gone.md"]:
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("---\nid: x\n---\n")
+    _git(tmp_path, "add", "docs/tracked.md", "docs/archive/old.md", "gone.md")
+    (tmp_path / "gone.md").unlink()  # tracked but deleted from the work tree
+    return tmp_path
+
+
+def test_git_backend_lists_tracked_and_untracked(git_tree):
+    from ontos.io.files import scan_documents
+
+    found = scan_documents([git_tree / "docs", git_tree], backend="git")
+    assert found == [
+        git_tree / "docs" / "archive" / "old.md",
+        git_tree / "docs" / "tracked.md",
+        git_tree / "docs" / "untracked.md",
+    ]
+
+
+def test_git_backend_lists_all_roots_in_one_call(git_tree, monkeypatch):
+    import subprocess
+
+    from ontos.io.files import scan_documents
+
+    calls = []
+    run = subprocess.run
+
+    def recording(args, **kwargs):
+        calls.append(args)
+        return run(args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", recording)
+    found = scan_documents([git_tree / "docs" / "archive", git_tree / "docs"], backend="git")
+    assert len(calls) == 1
+    assert found == [
+        git_tree / "docs" / "archive" / "old.md",
+        git_tree / "docs" / "tracked.md",
+        git_tree / "docs" / "untracked.md",
+    ]
+
+
+def test_git_backend_applies_skip_patterns(git_tree):
+    from ontos.io.files import scan_documents
+
+    found = scan_documents([git_tree], skip_patterns=["archive/*"], backend="git")
+    assert git_tree / "docs" / "archive" / "old.md" not in found
+    assert git_tree / "docs" / "tracked.md" in found
+
+
+def test_git_backend_falls_back_outside_git(doc_tree, monkeypatch):
+    from ontos.io.files import scan_documents
+
+    monkeypatch.setattr("ontos.io.git.list_files", lambda roots, pathspec="*.md": None)
+    assert scan_documents([doc_tree], backend="git") == scan_documents([doc_tree])
+
+
+# --- Header-only reads -------------------------------------------------------
+
+_BIG_BODY = "# Generated\n" + ("lorem ipsum dolor sit amet\n" * 40000)
+
+_HEADER_CASES = {
+    "plain": "---\nid: a\ntype: kernel\n---\nBody\n",
+    "bom": "\ufeff---\nid: a\n---\nBody\n",
+    "leading_ws": "\n\n  ---\nid: a\n---\n\n\nBody\n",
+    "no_frontmatter": "# Title\n\nText --- with dashes\n",
+    "unicode_leading": "été\n---\nid: a\n---\n",
+    "nbsp_leading": "\u00a0---\nid: a\n---\nBody\n",
+    "unterminated": "---\nid: a\nno closing delimiter\n",
+    "inline_dashes": "---\nid: a\nsummary: x---y\n---\nBody\n",
+    "empty": "",
+    "whitespace_only": "\n \n",
+    "unicode_header": "---\nid: a\ntitle: über — café\n---\nüber body\n",
+    "large_body": "---\nid: big\ntype: atom\n---\n" + _BIG_BODY,
+    "straddle": "---\n" + "x" * (io_files._READ_CHUNK - 6) + ": 1\n---\nBody\n",
+}
+
+
+@pytest.mark.parametrize("name", sorted(_HEADER_CASES))
+def test_header_only_load_matches_full_read(tmp_path, name):
+    from ontos.io.obsidian import read_file_lenient
+    from ontos.io.yaml import parse_frontmatter_content
+
+    path = tmp_path / f"{name}.md"
+    path.write_bytes(_HEADER_CASES[name].encode("utf-8"))
+
+    expected = io_files.load_document_from_content(
+        path, read_file_lenient(path), parse_frontmatter_content
+    )
+    doc = io_files.load_document(path, parse_frontmatter_content)
+    assert doc.frontmatter == expected.frontmatter
+    assert doc.content == expected.content
+    assert doc == expected
+
+
+def test_header_read_stops_at_closing_delimiter(tmp_path, monkeypatch):
+    from ontos.io.yaml import parse_frontmatter_content
+
+    path = tmp_path / "big.md"
+    path.write_text(_HEADER_CASES["large_body"], encoding="utf-8")
+    assert path.stat().st_size > 1_000_000
+
+    reads = []
+    real_open = open
+
+    class CountingFile:
+        def __init__(self, f):
+            self._f = f
+
+        def read(self, n=-1):
+            data = self._f.read(n)
+            reads.append(len(data))
+            return data
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._f.close()
+
+    monkeypatch.setattr(
+        io_files, "open", lambda *a, **k: CountingFile(real_open(*a, **k)), raising=False
+    )
+    doc = io_files.load_document(path, parse_frontmatter_content)
+    assert doc.id == "big"
+    assert not doc.content_loaded
+    assert sum(reads) <= io_files._READ_CHUNK
+
+
+def test_oversized_header_falls_back_to_full_read(tmp_path):
+    from ontos.io.yaml import parse_frontmatter_content
+
+    path = tmp_path / "huge_fm.md"
+    path.write_text("---\nid: a\n" + "# pad\n" * 20000 + "---\nBody\n", encoding="utf-8")
+
+    assert io_files.read_frontmatter_header(path, max_bytes=1024) is None
+    doc = io_files.load_document(path, parse_frontmatter_content)
+    assert doc.id == "a"
+    assert doc.content == "Body\n"
+
+
+def test_lazy_body_survives_pickling(tmp_path):
+    import pickle
+    from ontos.io.yaml import parse_frontmatter_content
+
+    path = tmp_path / "a.md"
+    path.write_text("---\nid: a\n---\nBody\n", encoding="utf-8")
+    doc = pickle.loads(pickle.dumps(io_files.load_document(path, parse_frontmatter_content)))
+    assert not doc.content_loaded
+    assert doc.content == "Body\n"
+    assert doc.content_loaded
+
+
+def test_parse_frontmatter_reads_only_header(tmp_path):
+    from ontos.core.frontmatter import _read_frontmatter_block, parse_frontmatter
+
+    path = tmp_path / "big.md"
+    path.write_text("---\nid: big\ntype: atom\n---\n" + _BIG_BODY, encoding="utf-8")
+
+    assert len(_read_frontmatter_block(str(path))) < 2 * 4096
+    assert parse_frontmatter(str(path)) == {"id": "big", "type": "atom"}
+
+
+def test_invalid_utf8_body_fails_when_read(tmp_path):
+    from ontos.io.yaml import parse_frontmatter_content
+
+    path = tmp_path / "bad.md"
+    path.write_bytes(b"---\nid: bad\n---\n" + b"x" * 10000 + b"\xff\xfe body\n")
+
+    doc = io_files.load_document(path, parse_frontmatter_content)
+    assert doc.id == "bad"
+    with pytest.raises(UnicodeDecodeError):
+        doc.content
+    assert not doc.content_loaded
+
+    # A header that is not valid UTF-8 still fails at load time
+    path.write_bytes(b"---\nid: b\xffad\n---\nBody\n")
+    results = load_documents([path])
+    assert results[0][1] is None and "utf-8" in results[0][2]
+
+
+def test_parse_frontmatter_tolerates_invalid_utf8(tmp_path):
+    from ontos.core.frontmatter import parse_frontmatter
+
+    path = tmp_path / "bad.md"
+    path.write_bytes(b"---\nid: bad\nsummary: caf\xe9\n---\nBody\n")
+
+    assert parse_frontmatter(str(path))["id"] == "bad"
+
+
+def test_lazy_content_property(tmp_path):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "Body"
+
+    from ontos.core.types import DocumentData, DocumentStatus, DocumentType
+
+    doc = DocumentData(
+        id="a", type=DocumentType.ATOM, status=DocumentStatus.DRAFT,
+        filepath=tmp_path / "a.md", frontmatter={}, content=None, body_loader=loader,
+    )
+    assert not doc.content_loaded
+    assert doc.content == "Body" and doc.content == "Body"
+    assert calls == [1]
+    assert doc.release_content()
+    assert not doc.content_loaded
+    doc.content = "New"
+    assert doc.content == "New" and calls == [1]
+
+
+# --- Document index -----------------------------------------------------------
+
+def test_commands_share_one_parse_per_file(tmp_path, monkeypatch):
+    from ontos.commands.query import scan_docs_for_query
+    from ontos.commands.verify import find_stale_documents_list
+    from ontos.io.index import load_document_index
+
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\n---\n")
+    (docs / "atom.md").write_text("---\nid: atom\ndepends_on: [kernel]\n---\n")
+    monkeypatch.chdir(tmp_path)
+
+    parsed = []
+    original = io_files.read_frontmatter_header
+
+    def tracking(path, *args, **kwargs):
+        parsed.append(path)
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(io_files, "read_frontmatter_header", tracking)
+
+    index = load_document_index(tmp_path, use_cache=False)
+    files_data = scan_docs_for_query(tmp_path, index=index)
+    assert find_stale_documents_list(index=index) == []
+    assert files_data["atom"]["depends_on"] == ["kernel"]
+    assert index.get("kernel").type.value == "kernel"
+    assert sorted(parsed) == sorted([docs / "kernel.md", docs / "atom.md"])
+
+
+def test_write_text_atomic(tmp_path):
+    path = tmp_path / "out" / "map.md"
+    assert io_files.write_text_atomic(path, iter(["a", "b\n"]))
+    assert path.read_text(encoding="utf-8") == "ab\n"
+
+    assert not io_files.write_text_atomic(path, ["new\n"], replace=lambda: False)
+    assert path.read_text(encoding="utf-8") == "ab\n"
+    assert [p.name for p in path.parent.iterdir()] == ["map.md"]
+
+
+def test_write_text_atomic_keeps_old_file_on_failure(tmp_path):
+    path = tmp_path / "map.md"
+    path.write_text("old\n", encoding="utf-8")
+    path.chmod(0o640)
+
+    def chunks():
+        yield "partial"
+        raise RuntimeError("generation failed")
+
+    with pytest.raises(RuntimeError):
+        io_files.write_text_atomic(path, chunks())
+    assert path.read_text(encoding="utf-8") == "old\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["map.md"]
+
+    io_files.write_text_atomic(path, ["new\n"])
+    assert path.stat().st_mode & 0o777 == 0o640
@@ -0,0 +1,161 @@
+"""Tests for bulk git last-modified lookups (ontos.io.git)."""
+
+import os
+import shutil
+import subprocess
+from datetime import datetime
+
+import pytest
+
+from ontos.io import git as io_git
+from ontos.io.git import BulkGitMtimeProvider, get_file_mtime, get_last_modified_dates
+
+
+def _commit(repo, message, date, *changes):
+    env = dict(os.environ, GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    for action, rel, *rest in changes:
+        path = repo / rel
+        if action == "write":
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rest[0])
+            subprocess.run(["git", "add", rel], cwd=repo, check=True)
+        elif action == "mv":
+            subprocess.run(["git", "mv", rel, rest[0]], cwd=repo, check=True)
+        elif action == "rm":
+            subprocess.run(["git", "rm", "-q", rel], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", message],
+        cwd=repo, check=True, env=env,
+    )
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    if shutil.which("git") is None:
+        pytest.skip("git not available")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    _commit(tmp_path, "one", "2024-01-01T10:00:00+00:00",
+            ("write", "docs/a.md", "a"), ("write", "docs/b.md", "b"),
+            ("write", "docs/with space.md", "s"), ("write", "old.md", "o"))
+    _commit(tmp_path, "two", "2024-02-01T10:00:00+02:00",
+            ("write", "docs/a.md", "a2"), ("mv", "old.md", "docs/renamed.md"))
+    _commit(tmp_path, "three", "2024-03-01T10:00:00-05:00",
+            ("write", "docs/nested/c.md", "c"), ("rm", "docs/b.md"),
+            ("write", "docs/b.md", "b again"))
+    (tmp_path / "docs" / "untracked.md").write_text("u")
+    monkeypatch.chdir(tmp_path / "docs")
+    return tmp_path
+
+
+def test_bulk_dates_match_per_file_lookup(history):
+    docs = history / "docs"
+    paths = sorted(docs.rglob("*.md")) + [docs / "missing.md"]
+    relative = [os.path.relpath(p) for p in paths]
+
+    bulk = get_last_modified_dates(paths)
+    bulk_relative = get_last_modified_dates(relative)
+
+    for path, rel in zip(paths, relative):
+        expected = get_file_mtime(path)
+        assert bulk.get(path) == expected, path
+        assert bulk_relative.get(rel) == expected, rel
+    assert docs / "untracked.md" not in bulk
+    assert bulk[docs / "a.md"] == datetime.fromisoformat("2024-02-01T10:00:00+02:00")
+
+
+def test_provider_runs_one_git_pass(history, monkeypatch):
+    docs = history / "docs"
+    paths = sorted(docs.rglob("*.md"))
+    calls = []
+    real_popen = subprocess.Popen
+
+    def counting_popen(args, **kwargs):
+        if "log" in args:
+            calls.append(args)
+        return real_popen(args, **kwargs)
+
+    monkeypatch.setattr(io_git.subprocess, "Popen", counting_popen)
+    provider = BulkGitMtimeProvider(paths)
+    results = {p: provider(p) for p in paths}
+
+    assert len(calls) == 1
+    assert results[docs / "nested" / "c.md"] == datetime.fromisoformat("2024-03-01T10:00:00-05:00")
+    assert results[docs / "untracked.md"] is None
+
+
+def test_provider_falls_back_for_unknown_paths(history, monkeypatch):
+    docs = history / "docs"
+    provider = BulkGitMtimeProvider([docs / "a.md"])
+    seen = []
+    monkeypatch.setattr(io_git, "get_file_mtime", lambda p: seen.append(p) or None)
+
+    provider(docs / "b.md")
+    assert seen == [docs / "b.md"]
+
+
+def test_no_repository_returns_empty(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(io_git, "get_git_root", lambda: None)
+    assert get_last_modified_dates([tmp_path / "a.md"]) == {}
+
+
+# --- Persistent store -----------------------------------------------------------
+
+def _track_log_calls(monkeypatch):
+    calls = []
+    real_popen = subprocess.Popen
+
+    def counting_popen(args, **kwargs):
+        if "log" in args:
+            calls.append(args)
+        return real_popen(args, **kwargs)
+
+    monkeypatch.setattr(io_git.subprocess, "Popen", counting_popen)
+    return calls
+
+
+def test_store_is_reused_and_updated_incrementally(history, monkeypatch):
+    from ontos.io.git_dates import load_git_dates
+
+    calls = _track_log_calls(monkeypatch)
+    root, dates = load_git_dates(history)
+    assert root == history.resolve()
+    assert dates["docs/a.md"] == "2024-02-01T10:00:00+02:00"
+    assert "docs/untracked.md" not in dates
+    assert len(calls) == 1 and not any(".." in a for a in calls[0])
+
+    # Unchanged HEAD: no git log at all
+    assert load_git_dates(history)[1] == dates
+    assert len(calls) == 1
+
+    # New commit: only the new range is read
+    _commit(history, "four", "2024-04-01T10:00:00+00:00", ("write", "docs/a.md", "a3"))
+    _, dates = load_git_dates(history)
+    assert len(calls) == 2 and any(".." in a for a in calls[1])
+    assert dates["docs/a.md"] == "2024-04-01T10:00:00+00:00"
+    assert dates["docs/nested/c.md"] == "2024-03-01T10:00:00-05:00"
+
+
+def test_store_rebuilds_after_history_rewrite(history, monkeypatch):
+    from ontos.io.git_dates import load_git_dates
+
+    load_git_dates(history)
+    _commit(history, "four", "2024-04-01T10:00:00+00:00", ("write", "docs/a.md", "a3"))
+    load_git_dates(history)
+
+    subprocess.run(["git", "reset", "-q", "--hard", "HEAD~2"], cwd=history, check=True)
+    calls = _track_log_calls(monkeypatch)
+    _, dates = load_git_dates(history)
+    assert len(calls) == 1 and not any(".." in a for a in calls[0])
+    assert dates["docs/a.md"] == "2024-02-01T10:00:00+02:00"
+    assert "docs/nested/c.md" not in dates
+
+
+def test_provider_with_store_matches_per_file_lookup(history):
+    docs = history / "docs"
+    paths = sorted(docs.rglob("*.md"))
+    expected = {p: get_file_mtime(p) for p in paths}
+
+    for _ in range(2):  # Cold store, then warm store
+        provider = BulkGitMtimeProvider(paths, project_root=history)
+        assert {p: provider(p) for p in paths} == expected
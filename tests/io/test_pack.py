@@ -0,0 +1,82 @@
+"""Tests for persistent pack estimates (ontos.io.pack)."""
+
+import os
+
+import pytest
+
+from ontos.io import cache
+from ontos.io import pack as stored
+from ontos.io.cache import get_cache_dir
+from ontos.io.index import load_document_index
+from ontos.io.tokens import load_bpe_counter
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_remembered", {})
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for doc_id in ("a", "b"):
+        (docs / f"{doc_id}.md").write_text(f"---\nid: {doc_id}\ntype: atom\n---\nBody of {doc_id}\n")
+    return tmp_path
+
+
+@pytest.fixture
+def measured(monkeypatch):
+    calls = []
+    original = stored.estimate_documents
+
+    def counting(docs, counter=None):
+        calls.extend(doc.id for doc in docs)
+        return original(docs, counter)
+
+    monkeypatch.setattr(stored, "estimate_documents", counting)
+    return calls
+
+
+def _refresh(root, use_cache=True, counter=None):
+    index = load_document_index(root, dirs=[root / "docs"], use_cache=False)
+    return stored.refresh_pack_estimates(root, index, index.documents.values(), use_cache, counter)
+
+
+def test_only_changed_documents_are_measured(project, measured):
+    first = _refresh(project)
+    assert sorted(measured) == ["a", "b"]
+    assert (get_cache_dir(project) / stored.PACK_CACHE_FILE).exists()
+
+    measured.clear()
+    cache._remembered.clear()  # A new process reads the stored table
+    assert _refresh(project) == first
+    assert measured == []
+
+    path = project / "docs" / "a.md"
+    st = path.stat()
+    path.write_text("---\nid: a\ntype: atom\n---\nA much longer body of a\n" * 5)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    estimates = _refresh(project)
+    assert measured == ["a"]
+    assert estimates["a"][1] > first["a"][1]
+
+
+def test_removed_documents_are_pruned(project):
+    _refresh(project)
+    (project / "docs" / "b.md").unlink()
+    assert list(_refresh(project)) == ["a"]
+    table = stored.read_cache_file(project, stored.PACK_CACHE_FILE)
+    assert [os.path.basename(path) for path in table["documents"]] == ["a.md"]
+
+
+def test_another_counter_remeasures(project, measured):
+    _refresh(project)
+    measured.clear()
+    estimates = _refresh(project, counter=load_bpe_counter())
+    assert sorted(measured) == ["a", "b"]
+    assert _refresh(project, counter=load_bpe_counter()) == estimates
+    assert len(measured) == 2
+
+
+def test_without_cache_nothing_is_written(project, measured):
+    _refresh(project, use_cache=False)
+    _refresh(project, use_cache=False)
+    assert len(measured) == 4
+    assert not (get_cache_dir(project) / stored.PACK_CACHE_FILE).exists()
@@ -0,0 +1,76 @@
+"""Tests for the persistent search index (ontos.io.search)."""
+
+import os
+
+import pytest
+
+from ontos.core import search
+from ontos.io import cache
+from ontos.io import search as stored
+from ontos.io.cache import get_cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh(monkeypatch):
+    monkeypatch.setattr(cache, "_remembered", {})
+    monkeypatch.setattr(search, "MERGE_MINIMUM", 2)
+
+
+def _shard_files(root):
+    return sorted(p.name for p in get_cache_dir(root).glob("search-*.json"))
+
+
+def _reload(root):
+    cache._remembered.clear()
+    return stored.load_search_index(root)
+
+
+def test_small_edits_only_rewrite_the_table(tmp_path):
+    index = stored.load_search_index(tmp_path)
+    index.put("a.md", "a", "alpha beta")
+    assert stored.save_search_index(tmp_path, index)
+    assert _shard_files(tmp_path) == []
+    assert [d for d, _ in _reload(tmp_path).search("alpha")] == ["a"]
+
+
+def test_merge_replaces_the_base(tmp_path):
+    index = stored.load_search_index(tmp_path)
+    for name in "abc":
+        index.put(f"{name}.md", name, f"alpha {name}")
+    assert stored.save_search_index(tmp_path, index)
+    first = _shard_files(tmp_path)
+    assert first and index.base_docs == 3
+
+    index = _reload(tmp_path)
+    assert [d for d, _ in index.search("alpha")] == ["a", "b", "c"]
+    for name in "abc":
+        index.remove(f"{name}.md")
+    index.put("d.md", "d", "alpha delta")
+    assert stored.save_search_index(tmp_path, index)
+    second = _shard_files(tmp_path)
+    assert second and not set(first) & set(second)
+
+    index = _reload(tmp_path)
+    assert [d for d, _ in index.search("alpha")] == ["d"]
+    assert index.search("b") == []
+
+
+def test_unreadable_table_starts_over(tmp_path):
+    index = stored.load_search_index(tmp_path)
+    index.put("a.md", "a", "alpha")
+    stored.save_search_index(tmp_path, index)
+    (get_cache_dir(tmp_path) / stored.SEARCH_CACHE_FILE).write_text("{broken")
+    assert _reload(tmp_path).docs == {}
+
+
+def test_memoized_until_the_table_changes(tmp_path):
+    index = stored.load_search_index(tmp_path)
+    index.put("a.md", "a", "alpha")
+    stored.save_search_index(tmp_path, index)
+    assert stored.load_search_index(tmp_path) is index
+
+    # Another process rewrote the table
+    os.utime(get_cache_dir(tmp_path) / stored.SEARCH_CACHE_FILE, ns=(0, 0))
+    reloaded = stored.load_search_index(tmp_path)
+    assert reloaded is not index
+    assert [d for d, _ in reloaded.search("alpha")] == ["a"]
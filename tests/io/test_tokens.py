@@ -0,0 +1,82 @@
+"""Tests for token counter setup and the persistent memo (ontos.io.tokens)."""
+
+import base64
+
+import pytest
+
+from ontos.core.config import OntosConfig, TokensConfig
+from ontos.core.tokens import MEMO_MIN_LENGTH, BPECounter, CachedCounter, HeuristicCounter
+from ontos.io import cache, tokens
+from ontos.io.cache import get_cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh(monkeypatch):
+    monkeypatch.setattr(cache, "_remembered", {})
+    monkeypatch.setattr(tokens, "_vocabularies", {})
+
+
+def _config(**settings):
+    return OntosConfig(tokens=TokensConfig(**{"counter": "bpe", **settings}))
+
+
+def test_bundled_vocabulary():
+    counter = tokens.load_bpe_counter()
+    assert isinstance(counter, BPECounter)
+    assert counter.name.startswith("bpe-ontos_bpe-")
+    assert 0 < counter.count("The dependency graph is rebuilt incrementally.") < 12
+    assert tokens.load_bpe_counter() is counter
+
+
+def test_heuristic_is_the_default(tmp_path):
+    counter = tokens.create_token_counter(tmp_path, OntosConfig())
+    assert isinstance(counter, HeuristicCounter)
+
+
+def test_configured_vocabulary(tmp_path):
+    vocabulary = tmp_path / "tiny.tiktoken"
+    vocabulary.write_bytes(b"".join(
+        base64.b64encode(bytes([b])) + b" %d\n" % b for b in range(256)
+    ))
+    counter = tokens.create_token_counter(tmp_path, _config(vocabulary="tiny.tiktoken"))
+    assert counter.name.startswith("bpe-tiny-")
+    assert counter.count("abc") == 3
+
+
+@pytest.mark.parametrize("content", [None, b"not a vocabulary\n", base64.b64encode(b"a") + b" 0\n"])
+def test_unusable_vocabulary_falls_back(tmp_path, content):
+    if content is not None:
+        (tmp_path / "vocab.tiktoken").write_bytes(content)
+    counter = tokens.create_token_counter(tmp_path, _config(vocabulary="vocab.tiktoken"))
+    assert isinstance(counter, HeuristicCounter)
+
+
+def test_heuristic_is_not_memoized(tmp_path):
+    counter = tokens.load_token_counter(tmp_path, _config(counter="heuristic"))
+    assert isinstance(counter, HeuristicCounter)
+
+
+def test_counts_are_memoized_across_processes(tmp_path, monkeypatch):
+    texts = ["word " * MEMO_MIN_LENGTH, "other " * MEMO_MIN_LENGTH, "short"]
+    first = tokens.count_tokens(tmp_path, texts, _config())
+    assert list(get_cache_dir(tmp_path).glob("tokens-bpe-*.json"))
+
+    counted = []
+    original = BPECounter.count_batch
+
+    def recording(self, batch):
+        batch = list(batch)
+        counted.extend(batch)
+        return original(self, batch)
+
+    monkeypatch.setattr(BPECounter, "count_batch", recording)
+    cache._remembered.clear()
+    assert tokens.count_tokens(tmp_path, texts, _config()) == first
+    assert counted == ["short"]
+
+
+def test_without_cache_nothing_is_written(tmp_path):
+    counter = tokens.load_token_counter(tmp_path, _config(), use_cache=False)
+    assert isinstance(counter, CachedCounter)
+    tokens.count_tokens(tmp_path, ["x" * MEMO_MIN_LENGTH], _config(), use_cache=False)
+    assert not get_cache_dir(tmp_path).exists() or not list(get_cache_dir(tmp_path).glob("tokens-*"))
@@ -0,0 +1,86 @@
+"""Tests for filesystem watching (ontos.io.watch)."""
+
+import pytest
+
+from ontos.io.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    WatchBatch,
+    create_watcher,
+    inotify_available,
+)
+
+requires_inotify = pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("---\nid: a\n---\n")
+    (tmp_path / "node_modules").mkdir()
+    return tmp_path
+
+
+def _make_changes(root):
+    docs = root / "docs"
+    (docs / "a.md").write_text("---\nid: a\nstatus: draft\n---\n")
+    (docs / "b.md").write_text("---\nid: b\n---\n")
+    (docs / "notes.txt").write_text("not a document")
+    (root / "node_modules" / "pkg.md").write_text("ignored")
+    (root / "map.md").write_text("excluded")
+
+
+def test_polling_watcher_reports_changed_documents(tree):
+    with PollingWatcher([tree], ignore_dirs=["node_modules"], exclude=[tree / "map.md"],
+                        interval=0.01) as watcher:
+        assert not watcher.next_batch(debounce=0.01, timeout=0.05)
+        _make_changes(tree)
+        batch = watcher.next_batch(debounce=0.01, timeout=2)
+        (tree / "docs" / "b.md").unlink()
+        removed = watcher.next_batch(debounce=0.01, timeout=2)
+
+    assert batch.paths == {tree / "docs" / "a.md", tree / "docs" / "b.md"}
+    assert removed.paths == {tree / "docs" / "b.md"}
+
+
+@requires_inotify
+def test_inotify_watcher_coalesces_a_burst(tree):
+    with InotifyWatcher([tree], ignore_dirs=["node_modules"], exclude=[tree / "map.md"]) as watcher:
+        _make_changes(tree)
+        batch = watcher.next_batch(debounce=0.05, timeout=2)
+        assert not watcher.next_batch(debounce=0.05, timeout=0.1)
+
+    assert batch.paths == {tree / "docs" / "a.md", tree / "docs" / "b.md"}
+    assert not batch.overflow
+
+
+@requires_inotify
+def test_inotify_watcher_follows_new_directories(tree):
+    with InotifyWatcher([tree]) as watcher:
+        sub = tree / "docs" / "new"
+        sub.mkdir()
+        (sub / "c.md").write_text("---\nid: c\n---\n")
+        first = watcher.next_batch(debounce=0.05, timeout=2)
+        (sub / "c.md").write_text("---\nid: c\nstatus: draft\n---\n")
+        second = watcher.next_batch(debounce=0.05, timeout=2)
+
+    assert {sub, sub / "c.md"} <= first.paths
+    assert second.paths == {sub / "c.md"}
+
+
+def test_create_watcher_backends(tree):
+    with create_watcher([tree], backend="poll") as watcher:
+        assert isinstance(watcher, PollingWatcher)
+    with create_watcher([tree]) as watcher:
+        expected = InotifyWatcher if inotify_available() else PollingWatcher
+        assert isinstance(watcher, expected)
+    with pytest.raises(ValueError):
+        create_watcher([tree], backend="fsevents")
+
+
+def test_watch_batch_merge():
+    batch = WatchBatch()
+    assert not batch
+    batch.merge(WatchBatch(overflow=True))
+    assert batch and batch.overflow and not batch.paths
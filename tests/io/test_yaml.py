@@ -0,0 +1,196 @@
+"""Differential tests: parse_flat_yaml must agree exactly with PyYAML."""
+
+import random
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ontos.core.frontmatter import parse_flat_yaml
+from ontos.io.yaml import parse_frontmatter_content, parse_yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CORPUS = [
+    "id: a\ntype: kernel\nstatus: active\n",
+    "\nid: a\n\n# comment\ntype: atom  # trailing comment\n",
+    "depends_on: [a, b, c]\n",
+    "depends_on: []\nimpacts: [ ]\n",
+    "depends_on: ['a b', \"c\", d e]\n",
+    "depends_on: [a, b]  # note\n",
+    "depends_on:\n  - a\n  - b\n",
+    "depends_on:\n- a\n- b\nnext: x\n",
+    "depends_on:\n  # leading comment\n  - a\n\n  - b\n",
+    "empty:\nother: x\n",
+    "empty: # just a comment\n",
+    "trailing_empty:",
+    "n: ~\nm: null\nk: Null\nj: NULL\n",
+    "b: [yes, No, TRUE, false, on, OFF, y, n]\n",
+    "ints: [0, 7, -3, +5, 10, 00, 0x1f, 1_000, 017]\n",
+    "floats: [1.0, .5, 1e3, .inf, -.Inf, .nan, 3.]\n",
+    "d: 2025-01-02\n",
+    "d: 2025-1-2\n",
+    "d: 2025-13-01\n",
+    "ts: 2025-01-02 10:00:00\n",
+    "ts: 2025-01-02T10:00:00Z\n",
+    "version: 3.0\n",
+    "version: '3.0'\n",
+    "s: 'it''s'\n",
+    "s: \"tab\\tescape\"\n",
+    "s: \"plain double\"\n",
+    "s: ''\n",
+    "s: \"\"\n",
+    "s: 'unterminated\n",
+    "s: 'a' trailing\n",
+    "s: 'a'#nospace\n",
+    "title: C# is a language\n",
+    "title: a #comment\n",
+    "title: foo [bar] {baz}\n",
+    "title: \u00fcber \u2014 caf\u00e9 \u2603\n",
+    "title: a: b\n",
+    "title: ends with:\n",
+    "title: http://example.com/x\n",
+    "title: multi   spaces  inside\n",
+    "key : spaced key\n",
+    "key:value\n",
+    "yes: bool key\n",
+    "on: [a]\n",
+    "1: numeric key\n",
+    "'quoted key': v\n",
+    "my-key_2: v\n",
+    "dup: 1\ndup: 2\n",
+    "dup:\n  - a\nother: b\ndup: c\n",
+    "nested:\n  a: b\n",
+    "folded: first\n  continued\n",
+    "block: |\n  text\n",
+    "folded: >\n  text\n",
+    "anchor: &a x\nref: *a\n",
+    "tagged: !!str 5\n",
+    "flow: {a: b}\n",
+    "flow: [a, [b]]\n",
+    "flow: [a,\n  b]\n",
+    "flow: [a,]\n",
+    "flow: [a: b]\n",
+    "flow: ['a', 'b' c]\n",
+    "items:\n  - a: b\n",
+    "items:\n  - - a\n",
+    "items:\n  -\n",
+    "items:\n  - a\n    continued\n",
+    "items:\n  - a\n   - b\n",
+    "merge: <<\n",
+    "val: =\n",
+    "q: ?x\n",
+    "dash: -x\n",
+    "dash: - x\n",
+    "  indented: x\n",
+    "tab:\tx\n",
+    "cr: x\r\nother: y\n",
+    "bom: \ufeffx\n",
+    "nel: a\x85b\n",
+    "nbsp: a\u00a0b\n",
+    "ctrl: a\x07b\n",
+    "...\n",
+    "%YAML 1.1\n",
+    "just a scalar\n",
+    "- a\n- b\n",
+    "",
+    "# only a comment\n",
+    "@reserved: x\n",
+    "v: `tick`\n",
+]
+
+
+def _typed(value):
+    """Make bool/int and date/datetime distinctions visible to ==."""
+    if isinstance(value, dict):
+        return {k: _typed(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_typed(v) for v in value]
+    return (type(value).__name__, value)
+
+
+def _reference(content):
+    try:
+        return yaml.load(content, Loader=yaml.SafeLoader)
+    except yaml.YAMLError:
+        return yaml.YAMLError
+
+
+def _check(content):
+    fast = parse_flat_yaml(content)
+    if fast is None:
+        return False
+    expected = _reference(content)
+    if expected is None:
+        expected = {}  # Empty document
+    assert expected is not yaml.YAMLError, f"flat parser accepted invalid YAML: {content!r}"
+    assert _typed(fast) == _typed(expected), content
+    assert list(fast) == list(expected), content
+    return True
+
+
+@pytest.mark.parametrize("content", CORPUS)
+def test_corpus_matches_pyyaml(content):
+    _check(content)
+
+
+def test_corpus_covers_common_frontmatter():
+    handled = [c for c in CORPUS if parse_flat_yaml(c) is not None]
+    assert len(handled) >= 30
+
+
+def test_repository_frontmatter_matches_pyyaml():
+    checked = 0
+    for path in sorted(REPO_ROOT.glob("**/*.md")):
+        if any(part.startswith(".") and part != ".ontos-internal" for part in path.parts):
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        if not text.startswith("---"):
+            continue
+        parts = text.split("---", 2)
+        if len(parts) < 3:
+            continue
+        checked += _check(parts[1])
+    assert checked > 0
+
+
+_FUZZ_KEYS = ["id", "type", "tags", "on", "x-y", "a_b", "1"]
+_FUZZ_SCALARS = [
+    "a", "a b", "yes", "No", "null", "~", "0", "-1", "+2", "07", "1.5", "2025-01-02",
+    "2025-02-30", "'q'", "'it''s'", "\"d\"", "\"e\\n\"", "a #c", "a#b", "a: b", "x:",
+    "-", "- a", "[a]", "[]", "[a, 'b', 2]", "[a,]", "{a}", "&x", "*x", "!t", "|", ">",
+    "\u00e9", "#c", "", "  ",
+]
+
+
+def test_fuzzed_documents_match_pyyaml():
+    rng = random.Random(1234)
+    accepted = 0
+    for _ in range(3000):
+        lines = []
+        for _ in range(rng.randint(1, 5)):
+            kind = rng.random()
+            key = rng.choice(_FUZZ_KEYS)
+            if kind < 0.6:
+                lines.append(f"{key}: {rng.choice(_FUZZ_SCALARS)}")
+            elif kind < 0.85:
+                indent = " " * rng.choice([0, 2, 2, 4])
+                lines.append(f"{key}:")
+                for _ in range(rng.randint(0, 3)):
+                    lines.append(f"{indent}- {rng.choice(_FUZZ_SCALARS)}")
+            else:
+                lines.append(rng.choice(["", "# c", "  # c", " stray", "- a"]))
+        accepted += _check("\n".join(lines) + rng.choice(["", "\n"]))
+    assert accepted > 300
+
+
+def test_parse_yaml_uses_pyyaml_for_complex_content():
+    content = "nested:\n  a: [1, 2]\nanchor: &x v\nref: *x\n"
+    assert parse_flat_yaml(content) is None
+    assert parse_yaml(content) == {"nested": {"a": [1, 2]}, "anchor": "v", "ref": "v"}
+
+
+def test_parse_frontmatter_content_unchanged():
+    fm, body = parse_frontmatter_content("---\nid: a\ndepends_on:\n  - b\n---\n\nBody\n")
+    assert fm == {"id": "a", "depends_on": ["b"]}
+    assert body == "Body\n"
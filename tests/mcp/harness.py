@@ -0,0 +1,144 @@
+"""Pipe-driven test harness for the Ontos MCP server.
+
+Starts ``python -m ontos.mcp`` as a subprocess, talks JSON-RPC over its
+stdin/stdout and records the wall-clock latency of every call.
+
+Run against a project to print a latency report:
+
+    python -m tests.mcp.harness [PROJECT_DIR] [--calls N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+class McpPipeClient:
+    """MCP client over the pipes of a server subprocess.
+
+    Args:
+        cwd: Project directory the server runs in
+        command: Server command line (default: this interpreter, -m ontos.mcp)
+    """
+
+    def __init__(self, cwd: Path, command: Optional[List[str]] = None):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PACKAGE_ROOT), env.get("PYTHONPATH")]))
+        self.process = subprocess.Popen(
+            command or [sys.executable, "-m", "ontos.mcp"],
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self._next_id = 0
+
+    def send(self, message: Any) -> None:
+        self.process.stdin.write(json.dumps(message) + "\n")
+        self.process.stdin.flush()
+
+    def receive(self) -> Dict[str, Any]:
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Server exited: {self.process.stderr.read()}")
+        return json.loads(line)
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None, label: Optional[str] = None) -> Dict[str, Any]:
+        """Send a request and return the full response, timing the round trip."""
+        self._next_id += 1
+        message = {"jsonrpc": "2.0", "id": self._next_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        started = time.perf_counter()
+        self.send(message)
+        response = self.receive()
+        self.latencies[label or method].append(time.perf_counter() - started)
+        assert response.get("id") == self._next_id, response
+        return response
+
+    def notify(self, method: str) -> None:
+        self.send({"jsonrpc": "2.0", "method": method})
+
+    def initialize(self) -> Dict[str, Any]:
+        response = self.request("initialize", {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "ontos-test-harness", "version": "0"},
+        })
+        self.notify("notifications/initialized")
+        return response["result"]
+
+    def call_tool(self, name: str, **arguments) -> Dict[str, Any]:
+        """Call a tool and return its MCP result (content, structuredContent, isError)."""
+        response = self.request("tools/call", {"name": name, "arguments": arguments}, label=name)
+        if "error" in response:
+            raise RuntimeError(response["error"]["message"])
+        return response["result"]
+
+    def report(self) -> str:
+        """Latency table: calls, median and max milliseconds per method/tool."""
+        lines = [f"{'call':<20} {'n':>5} {'median ms':>10} {'max ms':>10}"]
+        for label, samples in sorted(self.latencies.items()):
+            lines.append(
+                f"{label:<20} {len(samples):>5} "
+                f"{statistics.median(samples) * 1000:>10.2f} {max(samples) * 1000:>10.2f}"
+            )
+        return "\n".join(lines)
+
+    def close(self) -> int:
+        if self.process.stdin and not self.process.stdin.closed:
+            self.process.stdin.close()
+        try:
+            return self.process.wait(timeout=10)
+        finally:
+            self.process.stdout.close()
+            self.process.stderr.close()
+
+    def __enter__(self) -> "McpPipeClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.process.poll() is None:
+            self.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("project", nargs="?", type=Path, default=Path.cwd())
+    parser.add_argument("--calls", type=int, default=20, help="Calls per tool")
+    args = parser.parse_args()
+
+    with McpPipeClient(args.project) as client:
+        started = time.perf_counter()
+        client.initialize()
+        print(f"startup + initialize: {(time.perf_counter() - started) * 1000:.0f} ms")
+        tools = client.request("tools/list")["result"]["tools"]
+        docs = client.call_tool("list_documents", limit=1)["structuredContent"]["items"]
+        doc_id = docs[0]["id"] if docs else "missing"
+        for _ in range(args.calls):
+            client.call_tool("get_context_map", max_chars=4000)
+            client.call_tool("list_documents")
+            client.call_tool("get_dependencies", id=doc_id, transitive=True)
+            client.call_tool("get_dependents", id=doc_id, transitive=True)
+            client.call_tool("search_concept", concept="core")
+            client.call_tool("get_document", id=doc_id, max_chars=4000)
+        print(f"{len(tools)} tools")
+        print(client.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
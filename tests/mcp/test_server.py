@@ -0,0 +1,163 @@
+"""Tests for the Ontos MCP server (ontos.mcp)."""
+
+import json
+import statistics
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from ontos.io.index import WarmIndex
+from ontos.mcp import tools
+from ontos.mcp.server import INVALID_PARAMS, METHOD_NOT_FOUND, OntosMcpServer
+from tests.mcp.harness import McpPipeClient
+
+
+def _write(path, doc_id, doc_type="atom", depends_on=(), concepts=(), body=""):
+    lines = ["---", f"id: {doc_id}", f"type: {doc_type}", "status: active"]
+    if depends_on:
+        lines.append(f"depends_on: [{', '.join(depends_on)}]")
+    if concepts:
+        lines.append(f"concepts: [{', '.join(concepts)}]")
+    path.write_text("\n".join(lines) + "\n---\n" + body)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _write(docs / "kernel.md", "kernel", "kernel", concepts=["core"])
+    _write(docs / "strategy.md", "strategy", "strategy", depends_on=["kernel"])
+    _write(docs / "atom.md", "atom", depends_on=["strategy", "ghost"], concepts=["core", "api"],
+           body="Line\n" * 2000)
+    return tmp_path
+
+
+@pytest.fixture
+def server(project):
+    server = OntosMcpServer(project, warm=WarmIndex(project, watch_backend="poll"))
+    yield server
+    server.warm.close()
+
+
+def _call(server, name, **arguments):
+    response = server.handle({
+        "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    })
+    assert "error" not in response, response
+    return response["result"]
+
+
+def test_initialize_and_list_tools(server):
+    result = server.handle({"jsonrpc": "2.0", "id": 1, "method": "initialize",
+                            "params": {"protocolVersion": "2024-11-05"}})["result"]
+    assert result["protocolVersion"] == "2024-11-05"
+    assert result["serverInfo"]["name"] == "ontos"
+    assert server.handle({"jsonrpc": "2.0", "method": "notifications/initialized"}) is None
+
+    listed = server.handle({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})["result"]["tools"]
+    names = {tool["name"] for tool in listed}
+    assert names == {t.name for t in tools.TOOLS}
+    relation = next(t for t in listed if t["name"] == "get_dependencies")
+    assert relation["inputSchema"]["required"] == ["id"]
+
+
+def test_relations_and_concepts(server):
+    direct = _call(server, "get_dependencies", id="atom")["structuredContent"]
+    assert [d["id"] for d in direct["items"]] == ["strategy", "ghost"]
+    assert direct["items"][1] == {"id": "ghost", "missing": True}
+
+    transitive = _call(server, "get_dependencies", id="atom", transitive=True)["structuredContent"]
+    assert [d["id"] for d in transitive["items"]] == ["strategy", "ghost", "kernel"]
+
+    dependents = _call(server, "get_dependents", id="kernel", transitive=True)["structuredContent"]
+    assert [d["id"] for d in dependents["items"]] == ["strategy", "atom"]
+
+    core = _call(server, "search_concept", concept="core")["structuredContent"]
+    assert sorted(d["id"] for d in core["items"]) == ["atom", "kernel"]
+
+    unknown = _call(server, "get_dependents", id="nope")
+    assert unknown["isError"] and "Unknown document id" in unknown["content"][0]["text"]
+
+
+def test_list_pagination(server):
+    first = _call(server, "list_documents", limit=2)["structuredContent"]
+    assert first["total"] == 3 and len(first["items"]) == 2
+    rest = _call(server, "list_documents", limit=2, cursor=first["nextCursor"])["structuredContent"]
+    assert len(rest["items"]) == 1 and rest["nextCursor"] is None
+    kernels = _call(server, "list_documents", type="kernel")["structuredContent"]
+    assert [d["id"] for d in kernels["items"]] == ["kernel"]
+
+
+def test_page_byte_limit(monkeypatch):
+    monkeypatch.setattr(tools, "MAX_PAGE_BYTES", 100)
+    items = [{"id": f"doc_{i}", "pad": "x" * 20} for i in range(10)]
+    page = tools.paginate(items, None, 10)
+    assert 1 <= len(page["items"]) < 10
+    assert page["nextCursor"] == str(len(page["items"]))
+
+
+def test_document_body_is_sliced(server):
+    doc = _call(server, "get_document", id="atom", max_chars=1000)["structuredContent"]
+    assert doc["frontmatter"]["depends_on"] == ["strategy", "ghost"]
+    body = doc["body"]
+    assert body["totalChars"] == 10000
+    assert len(body["text"]) <= 1000 and body["text"].endswith("\n")
+
+    text, cursor = body["text"], body["nextCursor"]
+    while cursor is not None:
+        body = _call(server, "get_document", id="atom", max_chars=1000,
+                     cursor=cursor)["structuredContent"]["body"]
+        text, cursor = text + body["text"], body["nextCursor"]
+    assert text == "Line\n" * 2000
+
+
+def test_context_map(server):
+    result = _call(server, "get_context_map", max_chars=100_000)["structuredContent"]
+    assert result["nextCursor"] is None
+    assert all(doc_id in result["text"] for doc_id in ("kernel", "strategy", "atom"))
+    assert "Broken dependency: 'ghost'" in result["text"]
+
+
+def test_snapshot_follows_file_changes(server, project):
+    before = server.snapshot()
+    assert server.snapshot() is before
+
+    _write(project / "docs" / "new.md", "new_doc", depends_on=["kernel"])
+    dependents = _call(server, "get_dependents", id="kernel")["structuredContent"]
+    assert sorted(d["id"] for d in dependents["items"]) == ["new_doc", "strategy"]
+    assert server.snapshot() is not before
+
+
+def test_protocol_errors(server):
+    assert server.handle({"jsonrpc": "2.0", "id": 1, "method": "nope"})["error"]["code"] == METHOD_NOT_FOUND
+    bad_args = server.handle({"jsonrpc": "2.0", "id": 2, "method": "tools/call",
+                              "params": {"name": "list_documents", "arguments": {"limit": 10_000}}})
+    assert bad_args["error"]["code"] == INVALID_PARAMS
+    unknown = server.handle({"jsonrpc": "2.0", "id": 3, "method": "tools/call",
+                             "params": {"name": "rm_rf"}})
+    assert unknown["error"]["code"] == INVALID_PARAMS
+
+
+def test_stdio_session_over_pipes(project):
+    """Drive a real server process over pipes and check per-call latency."""
+    with McpPipeClient(project) as client:
+        assert client.initialize()["serverInfo"]["name"] == "ontos"
+        for _ in range(10):
+            result = client.call_tool("get_dependencies", id="atom", transitive=True)
+            assert json.loads(result["content"][0]["text"])["total"] == 3
+            client.call_tool("get_context_map", max_chars=2000)
+            client.call_tool("get_document", id="kernel")
+
+        client.process.stdin.write("not json\n")
+        client.process.stdin.flush()
+        assert client.receive()["error"]["code"] == -32700
+        client.send(["batch", "of", "junk"])
+        assert [r["error"]["code"] for r in client.receive()] == [-32600] * 3
+        assert client.close() == 0
+
+    for label in ("get_dependencies", "get_context_map", "get_document"):
+        # Served from memory: generous bound so slow CI machines pass
+        assert statistics.median(client.latencies[label]) < 0.5, client.report()
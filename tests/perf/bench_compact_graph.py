@@ -0,0 +1,114 @@
+"""Memory and traversal cost of CompactGraph against DependencyGraph.
+
+Builds both graphs from the same synthetic documents (a random DAG with
+a few cycles and broken links, see tests.perf.bench_graph) and reports:
+
+- memory: bytes held by the graph once built (tracemalloc), excluding the
+  input id and path strings both graphs share
+- build: time to build the graph
+- cycles / depths / orphans: first call of each query
+- upstream: everything that depends on the most depended-upon leaf
+- scan: reading every node's dependency list through ``graph.edges``
+
+    python -m tests.perf.bench_compact_graph [--nodes N] [--seed S]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def make_records(n: int, seed: int):
+    rng = random.Random(seed)
+    ids = [f"doc_{i:07d}" for i in range(n)]
+    records = []
+    for i, doc_id in enumerate(ids):
+        window = ids[i + 1:i + 51]
+        deps = rng.sample(window, min(len(window), rng.randint(0, 4)))
+        if rng.random() < 0.01:
+            deps.append(rng.choice(ids))  # May close a cycle
+        if rng.random() < 0.01:
+            deps.append(f"missing_{i}")
+        records.append((doc_id, rng.choice(["atom", "strategy", "kernel", "log"]), f"docs/{doc_id}.md", deps))
+    return records
+
+
+def build_dict_graph(records):
+    from ontos.core.graph import DependencyGraph
+
+    graph = DependencyGraph()
+    for doc_id, doc_type, filepath, deps in records:
+        graph.add_node(doc_id, doc_type, filepath, deps)
+    return graph
+
+
+def build_compact(records):
+    from ontos.core.compact_graph import CompactGraph
+
+    return CompactGraph(records)
+
+
+def measure(build, records):
+    """Build time (untraced) and memory held by a second, traced build."""
+    started = time.perf_counter()
+    graph = build(records)
+    build_ms = (time.perf_counter() - started) * 1000
+    del graph
+    gc.collect()
+    tracemalloc.start()
+    graph = build(records)
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return graph, held, build_ms
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000, help="Documents per graph")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic graph")
+    args = parser.parse_args()
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+    from ontos.core.compact_graph import _numpy
+
+    records = make_records(args.nodes, args.seed)
+    edges = sum(len(r[3]) for r in records)
+    leaf = records[-1][0]
+    print(f"{args.nodes} nodes, {edges} edges, numpy {'available' if _numpy() else 'not installed'}\n")
+    print(f"{'graph':<16} {'memory MB':>10} {'build ms':>9} {'cycles ms':>10} {'depths ms':>10} "
+          f"{'orphans ms':>11} {'upstream ms':>12} {'scan ms':>8}")
+
+    results = {}
+    for name, build in (("DependencyGraph", build_dict_graph), ("CompactGraph", build_compact)):
+        graph, held, build_ms = measure(build, records)
+        cycles, cycles_ms = timed(graph.cycle_groups)
+        depths, depths_ms = timed(graph.depths)
+        orphans, orphans_ms = timed(lambda: graph.orphans({"kernel", "log"}))
+        upstream, upstream_ms = timed(lambda: graph.upstream(leaf))
+        _, scan_ms = timed(lambda: sum(len(graph.edges[doc_id]) for doc_id in graph.nodes))
+        results[name] = (cycles, depths, orphans, sorted(upstream))
+        print(f"{name:<16} {held / 2**20:>10.1f} {build_ms:>9.0f} {cycles_ms:>10.0f} {depths_ms:>10.0f} "
+              f"{orphans_ms:>11.0f} {upstream_ms:>12.0f} {scan_ms:>8.0f}")
+        del graph
+
+    if results["DependencyGraph"] != results["CompactGraph"]:
+        print("\nresults differ", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
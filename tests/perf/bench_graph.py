@@ -0,0 +1,154 @@
+"""Cycle detection and depth computation on large dependency graphs.
+
+Builds synthetic graphs of --nodes documents and times, for each:
+
+- build: adding every node to a DependencyGraph
+- cycles / depths: first detect_cycles() and calculate_depths() call
+- update: one dependency edit followed by both queries again, which only
+  recomputes the part of the graph upstream of the edited node
+- legacy: the previous recursive DFS implementations, which fail with
+  RecursionError once a dependency chain is deeper than the recursion limit
+
+Graphs:
+
+- chain: n0 -> n1, n1 -> n2, ... (depth = nodes - 1)
+- dag: up to 4 dependencies on nearby higher-numbered nodes
+- cyclic: the dag plus 1% of edges pointing upwards, closing cycles
+
+    python -m tests.perf.bench_graph [--nodes N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def make_graphs(n: int, seed: int) -> Dict[str, Dict[str, List[str]]]:
+    rng = random.Random(seed)
+    ids = [f"n{i}" for i in range(n)]
+    # Dependencies point to later ids, so walking the nodes in order goes
+    # deep (as when dependents are listed before what they build on)
+    chain = {doc_id: ids[i + 1:i + 2] for i, doc_id in enumerate(ids)}
+    dag = {}
+    for i, doc_id in enumerate(ids):
+        window = ids[i + 1:i + 51]
+        dag[doc_id] = rng.sample(window, min(len(window), rng.randint(0, 4)))
+    cyclic = {doc_id: list(deps) for doc_id, deps in dag.items()}
+    for doc_id in rng.sample(ids, n // 100):
+        cyclic[doc_id].append(rng.choice(ids))
+    return {"chain": chain, "dag": dag, "cyclic": cyclic}
+
+
+def legacy_cycles(graph) -> List[List[str]]:
+    """detect_cycles() before the SCC rewrite."""
+    visited: Set[str] = set()
+    in_stack: Set[str] = set()
+    cycles: List[List[str]] = []
+
+    def dfs(node: str, path: List[str]) -> None:
+        if node in in_stack:
+            cycles.append(path[path.index(node):] + [node])
+            return
+        if node in visited:
+            return
+        visited.add(node)
+        in_stack.add(node)
+        path.append(node)
+        for neighbor in graph.edges.get(node, []):
+            if neighbor in graph.nodes:
+                dfs(neighbor, path)
+        path.pop()
+        in_stack.remove(node)
+
+    for node in graph.nodes:
+        if node not in visited:
+            dfs(node, [])
+    return cycles
+
+
+def legacy_depths(graph) -> Dict[str, int]:
+    """calculate_depths() before the SCC rewrite."""
+    depths: Dict[str, int] = {}
+    computing: Set[str] = set()
+
+    def get_depth(node: str) -> int:
+        if node in depths:
+            return depths[node]
+        if node in computing or node not in graph.nodes:
+            return 0
+        computing.add(node)
+        deps = graph.edges.get(node, [])
+        valid_deps = [d for d in deps if d in graph.nodes]
+        depth = 1 + max((get_depth(d) for d in valid_deps), default=0) if deps else 0
+        computing.remove(node)
+        depths[node] = depth
+        return depth
+
+    for node in graph.nodes:
+        get_depth(node)
+    return depths
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def legacy_ms(graph) -> str:
+    try:
+        _, cycles_ms = timed(legacy_cycles, graph)
+        _, depths_ms = timed(legacy_depths, graph)
+    except RecursionError:
+        return "RecursionError"
+    return f"{cycles_ms + depths_ms:.0f} ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100_000, help="Documents per graph")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the synthetic graphs")
+    args = parser.parse_args()
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+    from ontos.core.graph import DependencyGraph, calculate_depths, detect_cycles
+
+    print(f"{args.nodes} nodes, recursion limit {sys.getrecursionlimit()}\n")
+    print(f"{'graph':<8} {'edges':>8} {'groups':>7} {'max depth':>10} {'build ms':>9} "
+          f"{'cycles ms':>10} {'depths ms':>10} {'update ms':>10}  legacy cycles+depths")
+
+    for name, deps in make_graphs(args.nodes, args.seed).items():
+        graph = DependencyGraph()
+
+        def build():
+            for doc_id, depends_on in deps.items():
+                graph.add_node(doc_id, "atom", f"{doc_id}.md", depends_on)
+
+        _, build_ms = timed(build)
+        _, cycles_ms = timed(detect_cycles, graph)
+        depths, depths_ms = timed(calculate_depths, graph)
+
+        # Edit a node in the middle of the graph, then query again
+        middle = f"n{args.nodes // 2}"
+
+        def update():
+            graph.update_node(middle, "atom", f"{middle}.md", deps[middle][:1])
+            detect_cycles(graph)
+            calculate_depths(graph)
+
+        _, update_ms = timed(update)
+
+        edges = sum(len(d) for d in deps.values())
+        groups = len(graph.cycle_groups())
+        print(f"{name:<8} {edges:>8} {groups:>7} {max(depths.values()):>10} {build_ms:>9.0f} "
+              f"{cycles_ms:>10.0f} {depths_ms:>10.0f} {update_ms:>10.0f}  {legacy_ms(graph)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
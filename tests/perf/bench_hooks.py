@@ -0,0 +1,97 @@
+"""Latency of git hook shims.
+
+Times a hook shim from process start to exit, against a bare interpreter
+start (``python -c pass``), for:
+
+- the shim written by ``ontos init`` (fast in-process entry, ontos._hooks.entry)
+- the previous shim, which started the full CLI (``python -m ontos hook ...``)
+
+A disabled hook, or one with nothing to do, must stay within TARGET_MS of
+the bare interpreter start; the exit status is 1 otherwise.
+
+    python -m tests.perf.bench_hooks [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+# Budget over a bare interpreter start for hooks that have no work to do
+TARGET_MS = 10.0
+
+# Shim body before the fast entry (abridged to the method that ran)
+LEGACY_SHIM = '''import subprocess, sys
+sys.exit(subprocess.call([sys.executable, "-m", "ontos", "hook", "{hook_type}"] + sys.argv[1:]))
+'''
+
+
+def make_project(root: Path, pre_push: bool) -> None:
+    from ontos.commands.init import _write_shim_hook
+
+    (root / ".ontos.toml").write_text(
+        "[ontos]\nversion = \"3.0\"\n\n[paths]\ncontext_map = \"Ontos_Context_Map.md\"\n\n"
+        f"[hooks]\npre_push = {str(pre_push).lower()}\npre_commit = true\n"
+    )
+    (root / "Ontos_Context_Map.md").write_text("---\ntype: reference\n---\n")
+    hooks = root / "hooks"
+    hooks.mkdir()
+    for hook_type in ("pre-push", "pre-commit"):
+        _write_shim_hook(hooks / hook_type, hook_type)
+        (hooks / f"legacy-{hook_type}").write_text(LEGACY_SHIM.format(hook_type=hook_type))
+
+
+def time_command(cmd, cwd: Path, repeat: int) -> float:
+    env = dict(os.environ, PYTHONPATH=str(PACKAGE_ROOT))
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, stdin=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement (median is reported)")
+    args = parser.parse_args()
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        base = time_command([sys.executable, "-c", "pass"], Path(tmp), args.repeat)
+        print(f"bare interpreter start: {base:.1f} ms (median of {args.repeat})\n")
+        print(f"{'hook':<28} {'shim ms':>9} {'over bare':>10} {'old shim ms':>12}  target")
+
+        for label, pre_push, hook_type, has_work in (
+            ("pre-push (disabled)", False, "pre-push", False),
+            ("pre-commit (no checks)", True, "pre-commit", False),
+            ("pre-push (enabled)", True, "pre-push", True),
+        ):
+            project = Path(tmp) / label.split()[0] / str(pre_push)
+            project.mkdir(parents=True)
+            make_project(project, pre_push)
+            hooks = project / "hooks"
+            shim = time_command([sys.executable, str(hooks / hook_type), "origin"], project, args.repeat)
+            legacy = time_command(
+                [sys.executable, str(hooks / f"legacy-{hook_type}"), "origin"], project, args.repeat
+            )
+            if has_work:
+                verdict = "-"
+            elif shim - base <= TARGET_MS:
+                verdict = f"<= {TARGET_MS:.0f} ms ok"
+            else:
+                verdict = f"> {TARGET_MS:.0f} ms FAIL"
+                failed = True
+            print(f"{label:<28} {shim:>9.1f} {shim - base:>10.1f} {legacy:>12.1f}  {verdict}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Peak memory of `ontos map` on a large synthetic project.
+
+Writes --docs documents with --body-kb KB bodies, then runs map_command
+in-process under tracemalloc for the full map and a --budget pack,
+reporting peak traced memory against the total size of the bodies.
+Map output is written as it is generated and bodies are read one batch
+at a time, so the peak should track the number of documents (frontmatter,
+graph, table rows), not the size of their bodies.
+
+    python -m tests.perf.bench_map_memory [--docs N] [--body-kb K] [--budget T]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def write_project(root: Path, n: int, body_kb: int) -> int:
+    (root / ".ontos.toml").write_text('[ontos]\nversion = "3.0"\n')
+    docs = root / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\nKernel\n")
+    line = "Streaming keeps memory flat while the project grows. " * 4 + "\n"
+    body = line * max(1, body_kb * 1024 // len(line))
+    for i in range(n):
+        (docs / f"doc_{i:06d}.md").write_text(
+            f"---\nid: doc_{i:06d}\ntype: atom\nstatus: active\n"
+            f"depends_on: [kernel]\nsummary: Document {i}\n---\n{body}"
+        )
+    return n * len(body)
+
+
+def measure(run):
+    tracemalloc.start()
+    started = time.perf_counter()
+    code = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return code, peak, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=5_000, help="Documents in the project")
+    parser.add_argument("--body-kb", type=int, default=16, help="Body size of each document")
+    parser.add_argument("--budget", type=int, default=50_000, help="Token budget for the pack")
+    args = parser.parse_args()
+    sys.path.insert(0, str(PACKAGE_ROOT))
+    os.environ["ONTOS_NO_DAEMON"] = "1"
+
+    from ontos.commands.map import MapOptions, map_command
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        bodies = write_project(root, args.docs, args.body_kb)
+        print(f"{args.docs} documents, {bodies / 2**20:.0f} MB of bodies\n")
+        cwd = os.getcwd()
+        os.chdir(root)
+        try:
+            runs = [
+                ("map", MapOptions(quiet=True, no_cache=True, jobs=1)),
+                ("map --budget", MapOptions(quiet=True, no_cache=True, jobs=1, budget=args.budget)),
+            ]
+            print(f"{'run':<14} {'peak MB':>8} {'map MB':>7} {'s':>6}")
+            for name, options in runs:
+                _, peak, elapsed = measure(lambda: map_command(options))
+                size = (root / "Ontos_Context_Map.md").stat().st_size
+                print(f"{name:<14} {peak / 2**20:>8.1f} {size / 2**20:>7.1f} {elapsed:>6.1f}")
+        finally:
+            os.chdir(cwd)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Full-text search on a large synthetic corpus.
+
+Generates --docs documents of Zipf-distributed random words, indexes
+them and stores the index in a scratch project's .ontos/cache/, then
+reports:
+
+- build: tokenizing and indexing every document in memory
+- save: the first save, which merges everything into the base shards
+- size: bytes on disk (table + shards)
+- cold: loading the stored table and answering one query for the best 20
+  (a new process, which reads only the shards of the query's terms)
+- warm: the same query again in the same process (``ontos serve``)
+- update: re-indexing one edited document and saving (delta only)
+- merge: saving once enough edits piled up to rewrite the base
+
+    python -m tests.perf.bench_search [--docs N] [--words W] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def make_vocabulary(words: int, seed: int):
+    rng = random.Random(seed)
+    vocabulary = set()
+    while len(vocabulary) < words:
+        vocabulary.add("".join(rng.choices("etaoinshrdlcumwfgypbvkjxqz", k=rng.randint(2, 10))))
+    return sorted(vocabulary, key=lambda w: rng.random())
+
+
+def make_bodies(n: int, vocabulary, length: int, seed: int):
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(len(vocabulary))]
+    for i in range(n):
+        yield f"docs/doc_{i:06d}.md", f"doc_{i:06d}", " ".join(
+            rng.choices(vocabulary, weights, k=rng.randint(length // 2, length * 3 // 2))
+        )
+
+
+def make_queries(vocabulary):
+    common, mid, rare = vocabulary[2], vocabulary[200], vocabulary[5000]
+    return [
+        common,
+        f"{mid} {rare}",
+        f"{mid[:3]}*",
+        f'"{vocabulary[0]} {vocabulary[1]}"',
+        f"{common} {rare[:4]}*",
+    ]
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50_000, help="Documents in the corpus")
+    parser.add_argument("--words", type=int, default=20_000, help="Vocabulary size")
+    parser.add_argument("--length", type=int, default=200, help="Average words per document")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the corpus")
+    args = parser.parse_args()
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+    from ontos.core import search
+    from ontos.io import cache
+    from ontos.io import search as stored
+    from ontos.io.cache import get_cache_dir
+
+    vocabulary = make_vocabulary(args.words, args.seed)
+    bodies = list(make_bodies(args.docs, vocabulary, args.length, args.seed))
+    tokens = sum(body.count(" ") + 1 for _, _, body in bodies)
+    print(f"{args.docs} documents, {tokens} tokens, {args.words} distinct words\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        index = stored.load_search_index(root)
+
+        def build():
+            for path, doc_id, body in bodies:
+                index.put(path, doc_id, body, f"0.0/{len(body)}/0")
+
+        _, build_ms = timed(build)
+        _, save_ms = timed(lambda: stored.save_search_index(root, index))
+        files = list(get_cache_dir(root).glob("search*.json"))
+        size = sum(f.stat().st_size for f in files)
+        print(f"build {build_ms:.0f} ms, save {save_ms:.0f} ms, "
+              f"{size / 2**20:.1f} MB in {len(files)} files\n")
+
+        print(f"{'query':<24} {'results':>8} {'cold ms':>8} {'warm ms':>8}")
+        for query in make_queries(vocabulary):
+            cache._remembered.clear()
+
+            def cold():
+                return stored.load_search_index(root).search(query, limit=20)
+
+            _, cold_ms = timed(cold)
+            loaded = stored.load_search_index(root)
+            _, warm_ms = timed(lambda: loaded.search(query, limit=20))
+            matches = len(loaded.search(query))
+            print(f"{query:<24} {matches:>8} {cold_ms:>8.0f} {warm_ms:>8.0f}")
+
+        def update(i):
+            path, doc_id, body = bodies[i]
+            loaded.put(path, doc_id, body[::-1], f"1.0/{len(body)}/0")
+            stored.save_search_index(root, loaded)
+
+        update_ms = sorted(timed(lambda: update(i))[1] for i in range(0, 20 * 7, 7))
+        # Make the next save merge
+        search.MERGE_MINIMUM, search.MERGE_RATIO = 0, 0.0
+        _, merge_ms = timed(lambda: update(1))
+        print(f"\nupdate one document and save: {update_ms[len(update_ms) // 2]:.0f} ms "
+              f"(median of {len(update_ms)}); save with a merge: {merge_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Token counting on a large synthetic corpus.
+
+Generates --docs documents mixing prose, code and CJK text and counts
+them with each counter through the batch API, reporting:
+
+- heuristic: ~4 characters per token
+- bpe cold: byte-level BPE over the bundled vocabulary, empty memo
+  (a new process: loading the vocabulary is included)
+- bpe memo: the same documents again in a new process, served from the
+  memo in .ontos/cache/
+- bpe one edit: one document changed, everything else memoized
+
+    python -m tests.perf.bench_tokens [--docs N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+PROSE = (
+    "Every document declares its dependencies in frontmatter, and the map lists "
+    "them so an agent can find the decisions behind a change."
+).split()
+CODE = [
+    "def load(path):", "    return json.loads(path.read_text())", "for doc in index:",
+    "    graph.add_node(doc.id, doc.type)", "if not result.errors:", "    return 0",
+]
+CJK = "依存関係の図は変更のたびに増分更新される文書索引"
+
+
+def make_documents(n: int, seed: int):
+    rng = random.Random(seed)
+    for i in range(n):
+        parts = [" ".join(rng.choices(PROSE, k=rng.randint(100, 300)))]
+        if i % 3 == 0:
+            parts.append("```python\n" + "\n".join(rng.choices(CODE, k=20)) + "\n```")
+        if i % 10 == 0:
+            parts.append("".join(rng.choices(CJK, k=200)))
+        parts.append(f"Document {i}.")
+        yield "\n\n".join(parts)
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=10_000, help="Documents in the corpus")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the corpus")
+    args = parser.parse_args()
+    sys.path.insert(0, str(PACKAGE_ROOT))
+
+    from ontos.core.tokens import HeuristicCounter
+    from ontos.io import cache, tokens
+
+    texts = list(make_documents(args.docs, args.seed))
+    size = sum(len(text) for text in texts)
+    print(f"{args.docs} documents, {size / 2**20:.1f} MB of text\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+
+        def new_process():
+            cache._remembered.clear()
+            tokens._vocabularies.clear()
+
+        heuristic, heuristic_ms = timed(lambda: HeuristicCounter().count_batch(texts))
+        new_process()
+        bpe, cold_ms = timed(lambda: tokens.count_tokens(root, texts))
+        new_process()
+        again, memo_ms = timed(lambda: tokens.count_tokens(root, texts))
+        assert again == bpe
+        texts[0] += " One more sentence."
+        new_process()
+        _, edit_ms = timed(lambda: tokens.count_tokens(root, texts))
+
+    print(f"{'counter':<16} {'tokens':>12} {'ms':>8}")
+    print(f"{'heuristic':<16} {sum(heuristic):>12} {heuristic_ms:>8.0f}")
+    print(f"{'bpe cold':<16} {sum(bpe):>12} {cold_ms:>8.0f}")
+    print(f"{'bpe memo':<16} {sum(again):>12} {memo_ms:>8.0f}")
+    print(f"{'bpe one edit':<16} {'':>12} {edit_ms:>8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
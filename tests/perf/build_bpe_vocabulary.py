@@ -0,0 +1,145 @@
+"""Build the bundled BPE vocabulary (ontos/_tokenizer/ontos_bpe.tiktoken).
+
+Trains byte-level BPE merges on the Markdown and Python files tracked in
+a git checkout, pre-tokenized exactly like ontos.core.tokens.BPECounter,
+and writes them in tiktoken's rank file format:
+
+    python -m tests.perf.build_bpe_vocabulary [--root DIR] [--size N]
+
+Ranks start with the 256 single bytes, followed by every two-byte UTF-8
+character and the first two bytes of every three-byte character (most
+CJK text), so non-Latin text counts about one token per character (two
+for CJK) rather than one per byte. Learned merges fill the rest.
+
+The output depends only on the corpus, so rebuilding from the same
+commit reproduces the file.
+"""
+
+import argparse
+import base64
+import heapq
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ontos.core.tokens import _PIECE
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+OUTPUT = PROJECT_ROOT / "ontos" / "_tokenizer" / "ontos_bpe.tiktoken"
+DEFAULT_SIZE = 16384
+
+
+def base_tokens() -> List[bytes]:
+    """Single bytes, then two-byte characters and three-byte prefixes."""
+    tokens = [bytes([b]) for b in range(256)]
+    tokens += [bytes([lead, cont]) for lead in range(0xC2, 0xE0) for cont in range(0x80, 0xC0)]
+    tokens += [bytes([lead, cont]) for lead in range(0xE0, 0xF0) for cont in range(0x80, 0xC0)]
+    return tokens
+
+
+def split_symbols(piece: str) -> Tuple[bytes, ...]:
+    """Initial segmentation of a piece, as the base tokens merge it."""
+    symbols = []
+    for char in piece:
+        data = char.encode("utf-8")
+        if len(data) == 2:
+            symbols.append(data)
+        elif len(data) == 3:
+            symbols += [data[:2], data[2:]]
+        else:
+            symbols += [data[i:i + 1] for i in range(len(data))]
+    return tuple(symbols)
+
+
+def read_corpus(root: Path) -> Counter:
+    """Piece frequencies of the tracked Markdown and Python files."""
+    listed = subprocess.run(
+        ["git", "ls-files", "*.md", "*.py"], cwd=root, capture_output=True, text=True, check=True
+    ).stdout.split("\n")
+    pieces: Counter = Counter()
+    for name in sorted(filter(None, listed)):
+        try:
+            text = (root / name).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        pieces.update(_PIECE.findall(text))
+    return pieces
+
+
+def train(pieces: Counter, merges: int) -> List[bytes]:
+    """Learn up to ``merges`` merges, most frequent pair first."""
+    words: List[List[bytes]] = []
+    freqs: List[int] = []
+    for piece, freq in pieces.items():
+        symbols = split_symbols(piece)
+        if len(symbols) > 1:
+            words.append(list(symbols))
+            freqs.append(freq)
+
+    pair_counts: Dict[Tuple[bytes, bytes], int] = defaultdict(int)
+    pair_words: Dict[Tuple[bytes, bytes], set] = defaultdict(set)
+    for w, symbols in enumerate(words):
+        for pair in zip(symbols, symbols[1:]):
+            pair_counts[pair] += freqs[w]
+            pair_words[pair].add(w)
+    heap = [(-count, pair) for pair, count in pair_counts.items()]
+    heapq.heapify(heap)
+
+    learned: List[bytes] = []
+    known = set(base_tokens())
+    while heap and len(learned) < merges:
+        count, pair = heapq.heappop(heap)
+        if -count != pair_counts.get(pair, 0) or count == 0:
+            continue  # Stale entry
+        merged = pair[0] + pair[1]
+        if merged not in known:
+            known.add(merged)
+            learned.append(merged)
+        changed = set()
+        for w in pair_words.pop(pair, ()):
+            symbols, freq = words[w], freqs[w]
+            for old in zip(symbols, symbols[1:]):
+                pair_counts[old] -= freq
+                changed.add(old)
+            i, out = 0, []
+            while i < len(symbols):
+                if i + 1 < len(symbols) and (symbols[i], symbols[i + 1]) == pair:
+                    out.append(merged)
+                    i += 2
+                else:
+                    out.append(symbols[i])
+                    i += 1
+            words[w] = out
+            for new in zip(out, out[1:]):
+                pair_counts[new] += freq
+                pair_words[new].add(w)
+                changed.add(new)
+        pair_counts.pop(pair, None)
+        for p in changed:
+            if pair_counts.get(p, 0) > 0:
+                heapq.heappush(heap, (-pair_counts[p], p))
+    return learned
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", type=Path, default=PROJECT_ROOT,
+                        help="git checkout to train on (default: this one)")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Vocabulary size")
+    parser.add_argument("--output", type=Path, default=OUTPUT, help="File to write")
+    args = parser.parse_args()
+
+    tokens = base_tokens()
+    tokens += train(read_corpus(args.root), args.size - len(tokens))
+    args.output.write_bytes(b"".join(
+        base64.b64encode(token) + b" " + str(rank).encode() + b"\n"
+        for rank, token in enumerate(tokens)
+    ))
+    print(f"Wrote {len(tokens)} tokens to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
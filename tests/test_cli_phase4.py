@@ -167,3 +167,42 @@ class TestCLIInitCommand:
 
         assert result.returncode == 2
         assert "git" in result.stdout.lower()
+
+
+class TestCLIInProcessCommands:
+    """verify, query, consolidate, promote and migrate run in-process."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ONTOS_NO_DAEMON", "1")
+        return tmp_path
+
+    def test_no_subprocess(self, project, monkeypatch, capsys):
+        """Commands must not spawn a second interpreter."""
+        from ontos import cli
+
+        def fail(*args, **kwargs):
+            raise AssertionError(f"unexpected subprocess: {args}")
+
+        monkeypatch.setattr(subprocess, "run", fail)
+        monkeypatch.setattr(subprocess, "Popen", fail)
+        assert cli.main(["query", "--list-ids"]) == 0
+        assert "kernel" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("argv,expected", [
+        (["query", "--health"], "Graph Health Report"),
+        (["query", "--list-ids"], "kernel"),
+    ])
+    def test_json_flag_keeps_command_output(self, project, capsys, argv, expected):
+        """--json does not replace a command's own output with an error envelope."""
+        from ontos import cli
+
+        assert cli.main(["--json", *argv]) == 0
+        out = capsys.readouterr().out
+        assert expected in out
+        assert "E_JSON_UNSUPPORTED" not in out
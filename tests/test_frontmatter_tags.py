@@ -1,5 +1,5 @@
 import pytest
-from ontos.core.frontmatter import normalize_tags, normalize_aliases
+from ontos.core.frontmatter import normalize_tags, normalize_aliases, normalize_concepts
 
 def test_normalize_tags():
     # Only concepts
@@ -22,3 +22,10 @@ def test_normalize_aliases():
     # Auto-generation from id
     assert normalize_aliases({}, "auth_flow") == ["Auth Flow", "auth-flow"]
     assert normalize_aliases({}, "") == []
+
+def test_normalize_concepts():
+    assert normalize_concepts({"concepts": ["Auth", " API ", "auth"]}) == ["auth", "api"]
+    assert normalize_concepts({"concepts": "Billing"}) == ["billing"]
+    assert normalize_concepts({"concepts": [None, "", 3]}) == []
+    assert normalize_concepts({"concepts": {"a": 1}}) == []
+    assert normalize_concepts({}) == []
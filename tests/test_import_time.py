@@ -0,0 +1,73 @@
+"""Import-time budget for the `ontos` CLI entry point."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Project root
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Cumulative import time of the ontos modules for `ontos --version`, in
+# microseconds. Eager imports put this near 125ms; lazy loading keeps it
+# well below the budget, which leaves headroom for slow CI machines.
+IMPORT_BUDGET_US = 100_000
+
+# Modules that `ontos --version` must not load
+DEFERRED = ("yaml", "ontos.commands", "ontos.io", "ontos.core.graph", "ontos.core.types")
+
+
+def _import_times(*args, cwd=PROJECT_ROOT, env=None):
+    """Run ontos under -X importtime; return {module: (self_us, cumulative_us, depth)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "ontos", *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return times
+
+
+def test_version_defers_heavy_modules():
+    times = _import_times("--version")
+    assert "ontos.cli" in times
+    loaded = [
+        name for name in times
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in DEFERRED)
+    ]
+    assert loaded == []
+
+
+def test_version_import_budget():
+    # Best of three runs, so a single slow run does not fail the test
+    totals = []
+    for _ in range(3):
+        times = _import_times("--version")
+        totals.append(sum(
+            cumulative for name, (_, cumulative, depth) in times.items()
+            if depth == 0 and name.split(".")[0] == "ontos"
+        ))
+    assert min(totals) <= IMPORT_BUDGET_US, f"ontos imports took {min(totals)}us"
+
+
+def test_warm_cache_query_does_not_import_yaml(tmp_path):
+    (tmp_path / ".ontos.toml").write_text("[ontos]\nversion = \"3.0\"\n")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "kernel.md").write_text("---\nid: kernel\ntype: kernel\nstatus: active\n---\n")
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT), "ONTOS_NO_DAEMON": "1"}
+
+    _import_times("query", "--list-ids", cwd=tmp_path, env=env)  # Fills the cache
+    times = _import_times("query", "--list-ids", cwd=tmp_path, env=env)
+    assert "ontos.io.cache" in times
+    assert not any(name == "yaml" or name.startswith("yaml.") for name in times)
@@ -33,6 +33,7 @@ def test_matches_filter_advanced():
     # Concept matching
     assert matches_filter(doc, parse_filter("concept:auth")) is True
     assert matches_filter(doc, parse_filter("concept:security")) is False
+    assert matches_filter(doc, parse_filter("concept:AUTH")) is True
     
     # Glob matching on ID
     assert matches_filter(doc, parse_filter("id:auth_*")) is True
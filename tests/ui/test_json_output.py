@@ -10,6 +10,7 @@ import pytest
 
 from ontos.ui.json_output import (
     JsonOutputHandler,
+    NdjsonOutputHandler,
     emit_error,
     emit_json,
     emit_result,
@@ -72,6 +73,34 @@ class TestJsonOutputHandler:
         result = json.loads(output.getvalue())
         assert result["message"] == "Operation complete"
 
+    def test_record_emits_one_line_per_call(self):
+        """record() should emit single-line objects tagged with their kind."""
+        @dataclass
+        class Edge:
+            source: str
+            target: Path
+
+        output = StringIO()
+        handler = JsonOutputHandler(pretty=True, file=output)
+        handler.record("edge", Edge(source="a", target=Path("b")))
+        handler.record("document", {"id": "a"})
+        handler.record("summary")
+        lines = output.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"record": "edge", "source": "a", "target": "b"},
+            {"record": "document", "id": "a"},
+            {"record": "summary"},
+        ]
+
+    def test_ndjson_output_handler_records_errors_only(self):
+        """NdjsonOutputHandler should turn errors into records and drop the rest."""
+        output = StringIO()
+        handler = NdjsonOutputHandler(JsonOutputHandler(file=output))
+        handler.info("Searching")
+        handler.warning("Nothing found")
+        handler.error("Broken")
+        assert json.loads(output.getvalue()) == {"record": "error", "message": "Broken"}
+
 
 class TestToJson:
     """Tests for to_json converter."""